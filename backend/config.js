@@ -6,7 +6,15 @@ module.exports = {
     nodeUrl: process.env.APTOS_NODE_URL || 'https://fullnode.testnet.aptoslabs.com/v1',
     faucetUrl: process.env.APTOS_FAUCET_URL || 'https://faucet.testnet.aptoslabs.com',
     privateKey: process.env.APTOS_PRIVATE_KEY,
-    contractAddress: process.env.APTOS_CONTRACT_ADDRESS || '0x1'
+    contractAddress: process.env.APTOS_CONTRACT_ADDRESS || '0x1',
+    indexerUrl: process.env.APTOS_INDEXER_URL || 'https://api.testnet.aptoslabs.com/v1/graphql'
+  },
+  readModel: {
+    path: process.env.READ_MODEL_PATH || './data/sessions.json',
+    syncIntervalMs: parseInt(process.env.EVENT_SYNC_INTERVAL_MS) || 2000,
+    // Ledger version a fresh read model starts from; history the indexer no longer serves is skipped
+    startVersion: parseInt(process.env.READ_MODEL_START_VERSION) || 0,
+    syncEnabled: process.env.EVENT_SYNC_ENABLED !== 'false'
   },
   gateway: {
     feePercentage: parseInt(process.env.GATEWAY_FEE_PERCENTAGE) || 100,
@@ -2,10 +2,22 @@ const express = require('express');
 const { v4: uuidv4 } = require('uuid');
 const qrcode = require('qrcode');
 const aptosService = require('../services/aptos_service');
+const { SessionStore, STATUS_NAMES } = require('../services/session_store');
+const config = require('../config');
 
 const router = express.Router();
 
-let sessions = {}; // In-memory bill sessions demo (replace with DB in prod)
+// Persistent read model shared with the event sync started in server.js
+const store = new SessionStore(config.readModel.path);
+router.store = store;
+
+const addressesOf = (session) => session.participants.map((participant) => participant.address);
+
+const parseStatus = (value) => {
+  if (value === undefined) return null;
+  const named = STATUS_NAMES.indexOf(value);
+  return named >= 0 ? named : Number(value);
+};
 
 router.post('/create', async (req, res) => {
   try {
@@ -18,14 +30,12 @@ router.post('/create', async (req, res) => {
     const sessionId = uuidv4();
 
     // Create bill session object
-    sessions[sessionId] = {
-      totalAmount,
-      participantCount,
-      description: description || '',
-      participants: [],
-      finalized: false,
-      paidParticipants: []
-    };
+    store.update(sessionId, (session) => {
+      session.totalAmount = totalAmount;
+      session.remainingAmount = totalAmount;
+      session.participantCount = participantCount;
+      session.description = description || '';
+    });
 
     // Generate QR code for sessionId
     const qrCodeData = await qrcode.toDataURL(sessionId);
@@ -42,21 +52,22 @@ router.post('/:sessionId/join', (req, res) => {
     const { sessionId } = req.params;
     const { participantAddress } = req.body;
 
-    if (!sessions[sessionId]) {
+    const session = store.get(sessionId);
+    if (!session) {
       return res.status(404).json({ error: 'Session not found' });
     }
 
-    if (sessions[sessionId].participants.length >= sessions[sessionId].participantCount) {
+    if (session.participants.length >= session.participantCount) {
       return res.status(400).json({ error: 'Participant limit reached' });
     }
 
-    if (sessions[sessionId].participants.includes(participantAddress)) {
+    if (addressesOf(session).includes(participantAddress)) {
       return res.status(400).json({ error: 'Participant already added' });
     }
 
-    sessions[sessionId].participants.push(participantAddress);
+    const updated = store.update(sessionId, (entry) => store.participant(entry, participantAddress));
 
-    res.json({ message: 'Participant added', participants: sessions[sessionId].participants });
+    res.json({ message: 'Participant added', participants: addressesOf(updated) });
   } catch (err) {
     console.error('Join session error:', err);
     res.status(500).json({ error: 'Failed to join session' });
@@ -67,27 +78,74 @@ router.post('/:sessionId/finalize', (req, res) => {
   try {
     const { sessionId } = req.params;
 
-    if (!sessions[sessionId]) {
+    if (!store.get(sessionId)) {
       return res.status(404).json({ error: 'Session not found' });
     }
 
-    sessions[sessionId].finalized = true;
+    const session = store.update(sessionId, (entry) => {
+      entry.finalized = true;
+    });
 
-    res.json({ message: 'Session finalized', session: sessions[sessionId] });
+    res.json({ message: 'Session finalized', session });
   } catch (err) {
     console.error('Finalize error:', err);
     res.status(500).json({ error: 'Failed to finalize session' });
   }
 });
 
-router.get('/:sessionId/status', (req, res) => {
+// Served from the read model; the cached body and ETag change only when an event updates the session
+router.get('/:sessionId/status', async (req, res) => {
   const { sessionId } = req.params;
 
-  if (!sessions[sessionId]) {
-    return res.status(404).json({ error: 'Session not found' });
+  if (!store.get(sessionId)) {
+    // Not indexed yet: fall back to one on-chain view read and keep the result
+    try {
+      store.applyView(sessionId, await aptosService.getSessionStatus(sessionId));
+    } catch (err) {
+      return res.status(404).json({ error: 'Session not found' });
+    }
+  }
+
+  const view = store.statusView(sessionId);
+  res.set('ETag', view.etag);
+  if (req.get('If-None-Match') === view.etag) {
+    return res.status(304).end();
   }
+  res.type('application/json').send(view.body);
+});
+
+router.get('/history/:address', (req, res) => {
+  const { address } = req.params;
+  const status = parseStatus(req.query.status);
+
+  const sessions = store.history(address, status);
+  res.json({ address, count: sessions.length, sessions });
+});
+
+// Pages through the on-chain participant index; pass the returned nextCursor to continue
+router.get('/history/:address/sessions', async (req, res) => {
+  const { address } = req.params;
+  const archived = req.query.archived === 'true';
+  const cursor = Number(req.query.cursor || 0);
+
+  if (!Number.isInteger(cursor) || cursor < 0) {
+    return res.status(400).json({ error: 'Invalid cursor' });
+  }
+
+  try {
+    const page = await aptosService.getParticipantSessionsPage(address, archived, cursor);
+    res.json({ address, archived, ...page });
+  } catch (err) {
+    console.error('History page error:', err);
+    res.status(502).json({ error: 'Failed to read participant sessions' });
+  }
+});
+
+router.get('/', (req, res) => {
+  const status = parseStatus(req.query.status);
+  const sessions = status === null ? [...store.sessions.values()] : store.withStatus(status);
 
-  res.json(sessions[sessionId]);
+  res.json({ count: sessions.length, sessions });
 });
 
 module.exports = router;
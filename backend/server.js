@@ -2,6 +2,9 @@ const express = require('express');
 const cors = require('cors');
 const bodyParser = require('body-parser');
 const paymentRoutes = require('./controllers/payment_controller');
+const aptosService = require('./services/aptos_service');
+const { EventSync } = require('./services/event_sync');
+const config = require('./config');
 
 const app = express();
 
@@ -15,7 +18,20 @@ app.get('/health', (req, res) => {
   res.status(200).send({ status: 'healthy' });
 });
 
+const eventSync = new EventSync(aptosService, paymentRoutes.store, {
+  intervalMs: config.readModel.syncIntervalMs,
+  startVersion: config.readModel.startVersion
+});
+
 const PORT = process.env.PORT || 3000;
 app.listen(PORT, () => {
   console.log(`Backend server running on port ${PORT}`);
+  if (config.readModel.syncEnabled) {
+    eventSync.start();
+  }
+});
+
+process.on('SIGINT', () => {
+  eventSync.stop();
+  process.exit(0);
 });
@@ -1,6 +1,24 @@
 const { AptosClient, AptosAccount, FaucetClient, Types } = require('aptos');
 const config = require('../config');
 
+// This package's events after a (version, event_index) position, in ledger order
+const EVENTS_QUERY = `
+query BillEvents($types: [String!], $version: bigint, $index: bigint, $limit: Int) {
+  events(
+    where: {indexed_type: {_in: $types}, _or: [
+      {transaction_version: {_gt: $version}},
+      {transaction_version: {_eq: $version}, event_index: {_gt: $index}}
+    ]}
+    order_by: [{transaction_version: asc}, {event_index: asc}]
+    limit: $limit
+  ) {
+    transaction_version
+    event_index
+    type
+    data
+  }
+}`;
+
 class AptosService {
   constructor() {
     this.client = new AptosClient(config.aptos.nodeUrl);
@@ -11,6 +29,7 @@ class AptosService {
       ? new AptosAccount(Buffer.from(config.aptos.privateKey.replace('0x', ''), 'hex'))
       : null;
     this.contractAddress = config.aptos.contractAddress;
+    this.indexerUrl = config.aptos.indexerUrl;
   }
 
   async createBillSession(sessionId, totalAmount, participantCount) {
@@ -29,15 +48,45 @@ class AptosService {
     return { sessionId, finalized: true };
   }
 
-  async getSessionStatus(sessionId) {
-    // Placeholder: Query on-chain bill session status
+  async getModuleEvents(types, { version, eventIndex }, limit) {
+    // Module events have no handle on the fullnode; the indexer serves them by type
+    const response = await fetch(this.indexerUrl, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ query: EVENTS_QUERY, variables: { types, version, index: eventIndex, limit } })
+    });
+    if (!response.ok) throw new Error(`Indexer query failed with status ${response.status}`);
+    const { data, errors } = await response.json();
+    if (errors && errors.length) throw new Error(`Indexer query failed: ${errors[0].message}`);
+    return data.events.map((event) => ({
+      version: Number(event.transaction_version),
+      eventIndex: Number(event.event_index),
+      type: event.type,
+      data: event.data
+    }));
+  }
+
+  async getParticipantSessionsPage(address, archived = false, cursor = 0) {
+    // One page of the participant's session index, newest first; a next cursor of 0 ends the walk
+    const [sessionIds, createdAt, nextCursor] = await this.client.view({
+      function: `${this.contractAddress}::enhanced_bill_splitter::get_participant_sessions_page`,
+      type_arguments: [],
+      arguments: [address, archived, String(cursor)]
+    });
     return {
-      sessionId,
-      participants: [],
-      paidParticipants: [],
-      finalized: false
+      sessions: sessionIds.map((sessionId, i) => ({ sessionId, createdAt: Number(createdAt[i]) })),
+      nextCursor: Number(nextCursor)
     };
   }
+
+  async getSessionStatus(sessionId) {
+    // Queries get_bill_session on-chain; status reads are normally served by the session store
+    return this.client.view({
+      function: `${this.contractAddress}::bill_splitter::get_bill_session`,
+      type_arguments: [],
+      arguments: [sessionId]
+    });
+  }
 }
 
 module.exports = new AptosService();
@@ -0,0 +1,91 @@
+// Module event struct -> the kind SessionStore.applyEvent understands
+const EVENT_KINDS = {
+  SessionCreatedEvent: 'session_created',
+  ParticipantAddedEvent: 'participant_added',
+  BillApprovedEvent: 'bill_approved',
+  PaymentReceivedEvent: 'payment_received', // Each payment as it enters the escrow
+  BatchPaymentEvent: 'batch_payment',
+  BillSettledEvent: 'bill_settled'
+};
+const PAGE_SIZE = 100; // Largest page the hosted indexer API serves
+
+const normalizeAddress = (address) => `0x${address.toLowerCase().replace(/^0x/, '').padStart(64, '0')}`;
+// The indexer stores types with the address in short form
+const shortAddress = (address) => `0x${normalizeAddress(address).slice(2).replace(/^0+/, '') || '0'}`;
+
+/**
+ * Pages this package's bill_splitter module events into a SessionStore through the indexer
+ * GraphQL API, by event type, after the (version, event index) of the last event applied.
+ * Module events have no handle on the fullnode, and scanning its transaction feed for them never
+ * catches up on a busy network. History the indexer no longer keeps is simply absent, so a fresh
+ * store resumes from the oldest event still served.
+ * The store invalidates cached status responses as each event lands.
+ */
+class EventSync {
+  constructor(aptosService, store, { intervalMs = 2000, pageSize = PAGE_SIZE, startVersion = 0 } = {}) {
+    this.aptosService = aptosService;
+    this.store = store;
+    this.intervalMs = intervalMs;
+    this.pageSize = pageSize;
+    this.startVersion = startVersion;
+    this.modulePrefix = `${normalizeAddress(aptosService.contractAddress)}::bill_splitter::`;
+    this.types = Object.keys(EVENT_KINDS).map(
+      (struct) => `${shortAddress(aptosService.contractAddress)}::bill_splitter::${struct}`);
+    this.timer = null;
+    this.running = false;
+  }
+
+  eventKind(type) {
+    const [address, module, struct] = type.split('::');
+    if (!module || `${normalizeAddress(address)}::${module}::` !== this.modulePrefix) return null;
+    return EVENT_KINDS[struct] || null;
+  }
+
+  /** Drain events up to the indexer's head; returns the number of events applied */
+  async poll() {
+    let applied = 0;
+    let moved = false;
+    for (;;) {
+      const after = this.store.eventCursor ?? { version: this.startVersion, eventIndex: -1 };
+      const page = await this.aptosService.getModuleEvents(this.types, after, this.pageSize);
+      for (const event of page) {
+        // Overlapping page after a retry
+        if (event.version < after.version || (event.version === after.version && event.eventIndex <= after.eventIndex)) continue;
+        const kind = this.eventKind(event.type);
+        if (kind) {
+          this.store.applyEvent(kind, event);
+          applied += 1;
+        }
+        this.store.eventCursor = { version: event.version, eventIndex: event.eventIndex };
+        moved = true;
+      }
+      if (page.length < this.pageSize) break;
+    }
+    if (moved) this.store.flush();
+    return applied;
+  }
+
+  start() {
+    if (this.running) return;
+    this.running = true;
+    const tick = async () => {
+      let applied = 0;
+      try {
+        applied = await this.poll();
+      } catch (err) {
+        console.error('Event sync error:', err.message);
+      }
+      // Poll again straight away while catching up, otherwise wait for new blocks
+      if (this.running) this.timer = setTimeout(tick, applied ? 0 : this.intervalMs);
+    };
+    tick();
+  }
+
+  stop() {
+    this.running = false;
+    if (this.timer) clearTimeout(this.timer);
+    this.store.flush();
+  }
+}
+
+module.exports = { EventSync, EVENT_KINDS };
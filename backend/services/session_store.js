@@ -0,0 +1,263 @@
+const fs = require('fs');
+const path = require('path');
+const { EventEmitter } = require('events');
+
+// Mirrors the status constants in bill_splitter.move
+const STATUS = {
+  CREATED: 0,
+  PARTICIPANTS_ADDED: 1,
+  APPROVED: 2,
+  SETTLED: 3,
+  CANCELLED: 4
+};
+
+const STATUS_NAMES = ['created', 'participants_added', 'approved', 'settled', 'cancelled'];
+
+/**
+ * Persistent read model of bill sessions.
+ *
+ * Sessions are indexed by id, participant address and status so status and history
+ * queries never touch the chain. The model is fed by bill_splitter module events (see
+ * event_sync.js) and by the off-chain sessions the controller creates, and is snapshotted to a
+ * JSON file together with the last applied event's position so a restart resumes without replaying from zero.
+ */
+class SessionStore extends EventEmitter {
+  constructor(filePath = null, { flushDelayMs = 200 } = {}) {
+    super();
+    this.filePath = filePath;
+    this.flushDelayMs = flushDelayMs;
+    this.sessions = new Map();
+    this.byParticipant = new Map(); // address -> Set(sessionId)
+    this.byStatus = new Map(); // status -> Set(sessionId)
+    this.eventCursor = null; // { version, eventIndex } of the last applied event
+    this.views = new Map(); // sessionId -> serialized status response, dropped on change
+    this.flushTimer = null;
+    this.load();
+  }
+
+  load() {
+    if (!this.filePath || !fs.existsSync(this.filePath)) return;
+    const snapshot = JSON.parse(fs.readFileSync(this.filePath, 'utf8'));
+    this.eventCursor = snapshot.eventCursor ?? null;
+    for (const session of snapshot.sessions || []) {
+      this.sessions.set(session.sessionId, session);
+      this.index(session);
+    }
+  }
+
+  // Writes go to a temp file that is renamed into place, so a crash never leaves a torn snapshot
+  flush() {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    if (!this.filePath) return;
+    fs.mkdirSync(path.dirname(this.filePath), { recursive: true });
+    const tmp = `${this.filePath}.tmp`;
+    fs.writeFileSync(tmp, JSON.stringify({ eventCursor: this.eventCursor, sessions: [...this.sessions.values()] }));
+    fs.renameSync(tmp, this.filePath);
+  }
+
+  scheduleFlush() {
+    if (!this.filePath || this.flushTimer) return;
+    this.flushTimer = setTimeout(() => this.flush(), this.flushDelayMs);
+    this.flushTimer.unref();
+  }
+
+  // Indexes
+
+  index(session) {
+    for (const address of this.addressesOf(session)) {
+      if (!this.byParticipant.has(address)) this.byParticipant.set(address, new Set());
+      this.byParticipant.get(address).add(session.sessionId);
+    }
+    if (!this.byStatus.has(session.status)) this.byStatus.set(session.status, new Set());
+    this.byStatus.get(session.status).add(session.sessionId);
+  }
+
+  unindexStatus(session) {
+    const ids = this.byStatus.get(session.status);
+    if (ids) ids.delete(session.sessionId);
+  }
+
+  addressesOf(session) {
+    const addresses = session.participants.map((participant) => participant.address);
+    if (session.merchantAddress) addresses.push(session.merchantAddress);
+    return addresses;
+  }
+
+  // Writes
+
+  ensure(sessionId) {
+    let session = this.sessions.get(sessionId);
+    if (!session) {
+      session = {
+        sessionId,
+        description: '',
+        merchantAddress: null,
+        multisigAddress: null,
+        totalAmount: null,
+        participantCount: null,
+        requiredSignatures: null,
+        signaturesCollected: 0,
+        paymentsReceived: 0,
+        remainingAmount: null,
+        status: STATUS.CREATED,
+        finalized: false,
+        participants: [],
+        settledAt: null,
+        revision: 0
+      };
+      this.sessions.set(sessionId, session);
+      this.index(session);
+    }
+    return session;
+  }
+
+  /** Apply a change to one session, keeping indexes, cached views and the snapshot in step */
+  update(sessionId, mutate) {
+    const session = this.ensure(sessionId);
+    this.unindexStatus(session);
+    mutate(session);
+    session.finalized = session.finalized || session.status >= STATUS.APPROVED;
+    session.revision += 1;
+    this.index(session);
+    this.views.delete(sessionId);
+    this.scheduleFlush();
+    this.emit('change', session);
+    return session;
+  }
+
+  participant(session, address) {
+    let participant = session.participants.find((entry) => entry.address === address);
+    if (!participant) {
+      participant = { address, name: null, amountOwed: null, amountPaid: 0, hasPaid: false };
+      session.participants.push(participant);
+    }
+    return participant;
+  }
+
+  /**
+   * Apply one bill_splitter module event of the given kind (e.g. 'payment_received'). A sync
+   * started past a session's creation still sees its later events, so every update is an
+   * upsert and status only moves forward.
+   */
+  applyEvent(kind, event) {
+    const data = event.data;
+
+    this.update(data.session_id, (session) => {
+      switch (kind) {
+        case 'session_created':
+          session.merchantAddress = data.merchant_address;
+          session.multisigAddress = data.multisig_address;
+          session.totalAmount = Number(data.total_amount);
+          session.requiredSignatures = Number(data.required_signatures);
+          if (session.remainingAmount === null) session.remainingAmount = session.totalAmount;
+          break;
+        case 'participant_added': {
+          const participant = this.participant(session, data.participant_address);
+          participant.name = data.participant_name;
+          participant.amountOwed = Number(data.amount_owed);
+          break;
+        }
+        case 'bill_approved':
+          session.multisigAddress = data.multisig_address;
+          session.signaturesCollected = Math.max(session.signaturesCollected, Number(data.signatures_collected));
+          session.status = Math.max(session.status, STATUS.APPROVED);
+          break;
+        case 'payment_received': {
+          const participant = this.participant(session, data.participant_address);
+          const alreadyPaid = participant.hasPaid;
+          participant.amountPaid = Number(data.amount_paid);
+          participant.hasPaid = true;
+          if (participant.amountOwed === null) participant.amountOwed = participant.amountPaid;
+          if (!alreadyPaid) session.paymentsReceived += participant.amountPaid;
+          const remaining = Number(data.remaining_amount);
+          session.remainingAmount = session.remainingAmount === null
+            ? remaining
+            : Math.min(session.remainingAmount, remaining);
+          break;
+        }
+        case 'batch_payment': {
+          // Every payment of the bill, swept to the merchant by the settling transaction; the
+          // ones already applied from payment_received are not counted again
+          let total = 0;
+          data.payments.forEach((address, i) => {
+            const participant = this.participant(session, address);
+            const alreadyPaid = participant.hasPaid;
+            participant.amountPaid = Number(data.amounts[i]);
+            participant.hasPaid = true;
+            if (participant.amountOwed === null) participant.amountOwed = participant.amountPaid;
+            if (!alreadyPaid) total += participant.amountPaid;
+          });
+          session.paymentsReceived += total;
+          if (session.remainingAmount !== null) session.remainingAmount = Math.max(session.remainingAmount - total, 0);
+          break;
+        }
+        case 'bill_settled':
+          session.merchantAddress = session.merchantAddress || data.merchant_address;
+          session.remainingAmount = 0;
+          session.settledAt = Number(data.settled_at);
+          session.status = STATUS.SETTLED;
+          break;
+        default:
+          break;
+      }
+    });
+  }
+
+  /** Overwrite a session from the get_bill_session view (used when events are not available yet) */
+  applyView(sessionId, view) {
+    const [, merchant, multisig, total, description, status, required, signatures, payments] = view;
+    return this.update(sessionId, (session) => {
+      session.merchantAddress = merchant;
+      session.multisigAddress = multisig;
+      session.totalAmount = Number(total);
+      session.description = description;
+      session.status = Math.max(session.status, Number(status));
+      session.requiredSignatures = Number(required);
+      session.signaturesCollected = Number(signatures);
+      session.paymentsReceived = Number(payments);
+      session.remainingAmount = session.totalAmount - session.paymentsReceived;
+    });
+  }
+
+  // Reads
+
+  get(sessionId) {
+    return this.sessions.get(sessionId) || null;
+  }
+
+  /** Serialized status response, rebuilt only after the session changes */
+  statusView(sessionId) {
+    let view = this.views.get(sessionId);
+    if (view === undefined) {
+      const session = this.get(sessionId);
+      if (!session) return null;
+      view = {
+        etag: `"${sessionId}:${session.revision}"`,
+        body: JSON.stringify({
+          ...session,
+          statusName: STATUS_NAMES[session.status],
+          paidParticipants: session.participants.filter((p) => p.hasPaid).map((p) => p.address)
+        })
+      };
+      this.views.set(sessionId, view);
+    }
+    return view;
+  }
+
+  history(address, status = null) {
+    const ids = this.byParticipant.get(address);
+    if (!ids) return [];
+    return [...ids]
+      .map((id) => this.sessions.get(id))
+      .filter((session) => status === null || session.status === status);
+  }
+
+  withStatus(status) {
+    return [...(this.byStatus.get(status) || [])].map((id) => this.sessions.get(id));
+  }
+}
+
+module.exports = { SessionStore, STATUS, STATUS_NAMES };
@@ -0,0 +1,43 @@
+"""
+Test Account Records
+Shared account dataclass and Aptos CLI output parsing for the testing scripts
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+
+from ed25519 import SigningKey
+
+
+@dataclass
+class TestAccount:
+    address: str
+    private_key: str
+    balance: int = 0
+
+
+def parse_account_output(output: str) -> TestAccount:
+    """Parse account creation output to extract address and private key"""
+    lines = output.strip().split('\n')
+    address = None
+    private_key = None
+
+    for line in lines:
+        if 'Account address:' in line:
+            address = line.split(':')[-1].strip()
+        elif 'Private key:' in line:
+            private_key = line.split(':')[-1].strip()
+
+    return TestAccount(address=address, private_key=private_key)
+
+
+def derive_address(public_key: bytes) -> str:
+    """Default address of a single-key Ed25519 account: sha3-256(public_key || 0x00)"""
+    return "0x" + hashlib.sha3_256(public_key + b"\x00").hexdigest()
+
+
+def generate_account() -> TestAccount:
+    """New account from a random key, without the CLI (the account exists once it is funded)"""
+    key = SigningKey(os.urandom(32))
+    return TestAccount(address=derive_address(key.public_key), private_key="0x" + key.seed.hex())
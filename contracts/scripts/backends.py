@@ -0,0 +1,127 @@
+"""
+Transaction Backends
+Common interface the testers use to run entry functions, with the Aptos CLI implementation
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+from accounts import TestAccount
+from cli_runner import run_command
+from instrumentation import record_transactions
+
+
+@dataclass
+class TxResult:
+    success: bool
+    function: str
+    sender: str
+    hash: Optional[str] = None
+    gas_used: int = 0
+    vm_status: str = ""
+    events: List[Any] = field(default_factory=list)
+    duration: float = 0.0
+    output: str = ""
+
+
+@dataclass
+class TxRequest:
+    sender: TestAccount
+    function: str
+    args: Optional[List[str]] = None
+
+
+def parse_cli_arg(arg: str) -> Any:
+    """Convert an Aptos CLI typed argument (e.g. `u64:5`, `vector<address>:a,b`) to a Python value"""
+    arg_type, _, raw = arg.partition(":")
+    if arg_type.startswith("vector<") and arg_type.endswith(">"):
+        inner = arg_type[len("vector<"):-1]
+        items = [item for item in raw.split(",")] if raw else []
+        return [parse_cli_arg(f"{inner}:{item}") for item in items]
+    if arg_type in ("u8", "u16", "u32", "u64", "u128", "u256"):
+        return int(raw, 0)
+    if arg_type == "bool":
+        return raw.lower() == "true"
+    if arg_type == "address":
+        return normalize_address(raw)
+    if arg_type == "string":
+        return raw
+    raise ValueError(f"Unsupported argument type: {arg_type}")
+
+
+def normalize_address(address: str) -> str:
+    """Lower-case, 0x-prefixed, 64 hex digit form of an account address"""
+    digits = address.lower()
+    if digits.startswith("0x"):
+        digits = digits[2:]
+    return "0x" + digits.rjust(64, "0")
+
+
+class CliBackend:
+    """Run entry functions by launching `aptos move run` once per transaction"""
+
+    local = False
+
+    def __init__(
+        self,
+        network: str,
+        module_address: str,
+        aptos_cli: str = "aptos",
+        timeout: float = 120.0,
+    ):
+        self.network = network
+        self.module_address = module_address
+        self.aptos_cli = aptos_cli
+        self.timeout = timeout
+
+    def run(self, sender: TestAccount, function: str, args: List[str] = None) -> TxResult:
+        """Submit `module::function` with CLI-typed args signed by `sender`"""
+        command = [
+            self.aptos_cli, "move", "run",
+            "--function-id", f"{self.module_address}::{function}",
+        ]
+        if args:
+            command += ["--args"] + list(args)
+        command += [
+            "--private-key", sender.private_key,
+            "--network", self.network,
+            "--assume-yes",
+        ]
+
+        result = run_command(command, timeout=self.timeout, parse_json=True)
+        if result.timed_out:
+            return TxResult(False, function, sender.address, vm_status="CLI timed out",
+                            duration=result.duration)
+
+        details = result.payload
+        tx = TxResult(
+            success=result.success and details.get("success", True),
+            function=function,
+            sender=sender.address,
+            hash=details.get("transaction_hash"),
+            gas_used=int(details.get("gas_used", 0) or 0),
+            vm_status=details.get("vm_status", "") or result.error,
+            duration=result.duration,
+            output=result.stdout,
+        )
+        record_transactions([tx])
+        return tx
+
+    def run_many(self, requests: List[TxRequest]) -> List[TxResult]:
+        """One CLI process per transaction, in order"""
+        return [self.run(r.sender, r.function, r.args) for r in requests]
+
+    def view(self, function: str, args: List[str] = None) -> List[Any]:
+        """Call a #[view] function with `aptos move view`; values come back as the REST API returns them"""
+        command = [
+            self.aptos_cli, "move", "view",
+            "--function-id", f"{self.module_address}::{function}",
+        ]
+        if args:
+            command += ["--args"] + list(args)
+        command += ["--network", self.network]
+
+        result = run_command(command, timeout=self.timeout, parse_json=True)
+        if not result.success or not isinstance(result.parsed, dict) or "Result" not in result.parsed:
+            raise RuntimeError(f"{function} view failed: {result.error}")
+        return result.parsed["Result"]
@@ -0,0 +1,918 @@
+"""
+Bill Splitter Simulator
+Pure-Python reference engine for bill_splitter, enhanced_bill_splitter and usdc_utils.
+Follows the Move state machines (status transitions, abort codes, events) so the testers
+can run offline and benchmark scenario throughput without a network.
+"""
+
+import argparse
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from accounts import TestAccount
+from backends import TxRequest, TxResult, normalize_address, parse_cli_arg
+from instrumentation import record_transactions
+
+# Error codes (mirrors bill_splitter.move / enhanced_bill_splitter.move)
+E_BILL_SESSION_NOT_FOUND = 1
+E_UNAUTHORIZED = 2
+E_INVALID_STATUS = 3
+E_PARTICIPANT_NOT_FOUND = 4
+E_INSUFFICIENT_PAYMENT = 5
+E_ALREADY_PAID = 6
+E_NOT_ALL_SIGNATURES_COLLECTED = 7
+E_INVALID_AMOUNT = 8
+E_MULTISIG_CREATION_FAILED = 9
+E_TOO_MANY_PARTICIPANTS = 10
+E_BATCH_TOO_LARGE = 11
+E_SESSION_PRUNED = 12
+
+# Framework abort codes surfaced by the modules
+SMART_TABLE_E_ALREADY_EXIST = 0x80008
+OBJECT_E_OBJECT_EXISTS = 0x80001
+TABLE_E_ALREADY_EXISTS = (100 << 8) + 1
+VECTOR_E_INDEX_OUT_OF_BOUNDS = 0x20000
+COIN_E_INSUFFICIENT_BALANCE = 0x10006
+MULTISIG_E_DUPLICATE_OWNER = 0x10001
+MULTISIG_E_INVALID_SIGNATURES_REQUIRED = 0x1000B
+
+# Status constants
+STATUS_CREATED = 0
+STATUS_PARTICIPANTS_ADDED = 1
+STATUS_APPROVED = 2
+STATUS_SETTLED = 3
+STATUS_CANCELLED = 4
+
+MAX_PARTICIPANTS_DEFAULT = 1000
+MAX_BATCH_SIZE = 50
+MAX_PRUNE_BATCH = 50
+INDEX_PAGE_SIZE = 50
+MAX_PRUNE_PARTICIPANTS = 500  # enhanced_bill_splitter: participants one prune call may release
+
+APTOS_COIN = "0x1::aptos_coin::AptosCoin"
+USDC = "usdc_utils::USDC"
+
+# Simple cost model: a fixed base per transaction plus one unit per participant visited
+BASE_GAS = 500
+STEP_GAS = 10
+
+
+class MoveAbort(Exception):
+    def __init__(self, module: str, code: int):
+        super().__init__(f"Move abort in {module}: {code}")
+        self.module = module
+        self.code = code
+
+
+class VmError(Exception):
+    """Execution failure that is not a Move abort (e.g. ARITHMETIC_ERROR)"""
+
+
+@dataclass
+class SimEvent:
+    """A module event (#[event] struct emitted with event::emit)"""
+    type: str
+    data: Dict[str, Any]
+
+    @property
+    def name(self) -> str:
+        return self.type.rsplit("::", 1)[-1]
+
+
+class Participant:
+    __slots__ = ("address", "name", "amount_owed", "has_signed", "has_paid", "payment_timestamp")
+
+    def __init__(self, address: str, name: str, amount_owed: int):
+        self.address = address
+        self.name = name
+        self.amount_owed = amount_owed
+        self.has_signed = False
+        self.has_paid = False
+        self.payment_timestamp = 0  # enhanced_bill_splitter: the receipt's paid_at
+
+    def as_dict(self) -> Dict[str, Any]:
+        """bill_splitter::get_participants entry; payment times are only in PaymentReceivedEvent"""
+        return {"address": self.address, "name": self.name, "amount_owed": self.amount_owed,
+                "has_signed": self.has_signed, "has_paid": self.has_paid}
+
+
+def pack_participant_flags(participants: List[Participant]) -> Tuple[int, str, str]:
+    """(count, signed, paid) like get_participant_bitmaps: bit i % 8 of byte i / 8, as REST hex"""
+    signed = bytearray((len(participants) + 7) // 8)
+    paid = bytearray(len(signed))
+    for i, participant in enumerate(participants):
+        if participant.has_signed:
+            signed[i // 8] |= 1 << (i % 8)
+        if participant.has_paid:
+            paid[i // 8] |= 1 << (i % 8)
+    return len(participants), "0x" + signed.hex(), "0x" + paid.hex()
+
+
+def split_amount(total_amount: int, count: int) -> List[int]:
+    """Equal shares; the first `total_amount % count` participants owe one extra unit"""
+    individual_amount, remainder = divmod(total_amount, count)
+    return [individual_amount + 1 if i < remainder else individual_amount for i in range(count)]
+
+
+def object_address(source: str, seed: bytes) -> str:
+    """object::create_object_address: sha3-256(source || seed || OBJECT_FROM_SEED_ADDRESS_SCHEME)"""
+    return "0x" + hashlib.sha3_256(bytes.fromhex(source[2:]) + seed + b"\xfe").hexdigest()
+
+
+def session_object_address(module_address: str, session_id: str) -> str:
+    """Address of a bill_splitter session object, created under the module's factory object"""
+    factory = object_address(module_address, b"bill_splitter::sessions")
+    return object_address(factory, session_id.encode())
+
+
+class BillSession:
+    __slots__ = (
+        "session_id", "merchant_address", "multisig_address", "total_amount", "description",
+        "participants", "participant_lookup", "required_signatures", "current_signatures",
+        "status", "created_at", "approved_at", "settled_at", "payments_received", "paid_count",
+        "max_participants",
+    )
+
+    def __init__(self, session_id, merchant_address, multisig_address, total_amount, description,
+                 participants, required_signatures, created_at, participant_lookup=None,
+                 max_participants=0):
+        self.session_id = session_id
+        self.merchant_address = merchant_address
+        self.multisig_address = multisig_address
+        self.total_amount = total_amount
+        self.description = description
+        self.participants = participants
+        self.participant_lookup = participant_lookup
+        self.required_signatures = required_signatures
+        self.current_signatures = 0
+        self.status = STATUS_CREATED
+        self.created_at = created_at
+        self.approved_at = 0
+        self.settled_at = 0
+        self.payments_received = 0
+        self.paid_count = 0
+        self.max_participants = max_participants
+
+
+@dataclass
+class SessionSummary:
+    """What prune_sessions keeps of a settled or cancelled session"""
+    merchant_address: str
+    total_amount: int
+    payments_received: int
+    participant_count: int
+    status: int
+    created_at: int
+    settled_at: int
+
+    @classmethod
+    def of(cls, session: BillSession) -> "SessionSummary":
+        return cls(session.merchant_address, session.total_amount, session.payments_received,
+                   len(session.participants), session.status, session.created_at, session.settled_at)
+
+    def as_tuple(self) -> Tuple:
+        return (self.merchant_address, self.total_amount, self.payments_received, self.participant_count,
+                self.status, self.created_at, self.settled_at, True)
+
+
+def live_summary(session: BillSession) -> Tuple:
+    """get_session_summary of a session that has not been pruned"""
+    return SessionSummary.of(session).as_tuple()[:-1] + (False,)
+
+
+class Ledger:
+    """Coin balances per coin type; deposits create the store like a primary fungible store would"""
+
+    def __init__(self):
+        self.balances: Dict[str, Dict[str, int]] = {}
+
+    def balance(self, coin: str, address: str) -> int:
+        return self.balances.get(coin, {}).get(address, 0)
+
+    def deposit(self, coin: str, address: str, amount: int):
+        store = self.balances.setdefault(coin, {})
+        store[address] = store.get(address, 0) + amount
+
+    def withdraw(self, coin: str, address: str, amount: int):
+        store = self.balances.setdefault(coin, {})
+        if store.get(address, 0) < amount:
+            raise MoveAbort("coin", COIN_E_INSUFFICIENT_BALANCE)
+        store[address] -= amount
+
+
+class BillSplitterSim:
+    """State machine of bill_splitter.move: one object per session, an aggregator session
+    counter and module events, kept here as a single list in emission order. Payments wait
+    in the session's escrow until the payment that settles the bill sweeps it to the merchant.
+
+    On chain the registry is created by init_module; the simulator treats it as living at
+    the module address from the first call. Every entry function runs all of its checks
+    before mutating anything, so an abort never leaves partial state behind.
+    """
+
+    MODULE = "bill_splitter"
+
+    def __init__(self, module_address: str, ledger: Ledger, clock: Callable[[], int],
+                 events: Optional[List[SimEvent]] = None):
+        self.module_address = module_address
+        self.ledger = ledger
+        self.clock = clock
+        self.sessions: Dict[str, BillSession] = {}
+        self.summaries: Dict[str, SessionSummary] = {}  # pruned sessions; their objects stay
+        self.escrow: Dict[str, int] = {}  # session -> SessionEscrow coin value
+        self.session_counter = 0
+        self.events: List[SimEvent] = [] if events is None else events
+        self.steps = 0
+
+    def _emit(self, struct: str, data: Dict[str, Any]) -> SimEvent:
+        event = SimEvent(f"{self.module_address}::{self.MODULE}::{struct}", data)
+        self.events.append(event)
+        return event
+
+    def _abort(self, code: int):
+        raise MoveAbort(self.MODULE, code)
+
+    def _session(self, session_id: str) -> BillSession:
+        session = self.sessions.get(session_id)
+        if session is None:
+            self._abort(E_BILL_SESSION_NOT_FOUND)
+        return session
+
+    def _find(self, session: BillSession, address: str) -> Participant:
+        for participant in session.participants:
+            self.steps += 1
+            if participant.address == address:
+                return participant
+        self._abort(E_PARTICIPANT_NOT_FOUND)
+
+    # Entry functions
+
+    def create_bill_session(self, merchant: str, session_id: str, total_amount: int,
+                            description: str, participant_addresses: List[str],
+                            participant_names: List[str], required_signatures: int):
+        count = len(participant_addresses)
+        if total_amount <= 0 or count == 0:
+            self._abort(E_INVALID_AMOUNT)
+        if not (0 < required_signatures <= count):
+            self._abort(E_INVALID_AMOUNT)
+
+        shares = split_amount(total_amount, count)
+        participants = []
+        for i in range(count):
+            self.steps += 1
+            if i >= len(participant_names):
+                raise MoveAbort("vector", VECTOR_E_INDEX_OUT_OF_BOUNDS)
+            participants.append(Participant(participant_addresses[i], participant_names[i], shares[i]))
+
+        if session_id in self.sessions or session_id in self.summaries:
+            raise MoveAbort("object", OBJECT_E_OBJECT_EXISTS)
+        # create_multisig_account returns the creator's address for the MVP
+        self.sessions[session_id] = BillSession(
+            session_id, merchant, merchant, total_amount, description, participants,
+            required_signatures, self.clock(),
+        )
+        self.escrow[session_id] = 0
+        self.session_counter += 1
+        self._emit("SessionCreatedEvent", {
+            "session_id": session_id,
+            "merchant_address": merchant,
+            "multisig_address": merchant,
+            "total_amount": total_amount,
+            "required_signatures": required_signatures,
+        })
+        for participant in participants:
+            self._emit("ParticipantAddedEvent", {
+                "session_id": session_id,
+                "participant_address": participant.address,
+                "participant_name": participant.name,
+                "amount_owed": participant.amount_owed,
+            })
+
+    def update_participant_amount(self, merchant: str, session_id: str,
+                                  participant_address: str, new_amount: int):
+        session = self._session(session_id)
+        if session.merchant_address != merchant:
+            self._abort(E_UNAUTHORIZED)
+        if session.status != STATUS_CREATED:
+            self._abort(E_INVALID_STATUS)
+        participant_data = self._find(session, participant_address)
+        # total_amount stays the sum of the shares, so paying every share settles the bill
+        session.total_amount += new_amount - participant_data.amount_owed
+        participant_data.amount_owed = new_amount
+
+    def confirm_participants(self, merchant: str, session_id: str):
+        session = self._session(session_id)
+        if session.merchant_address != merchant:
+            self._abort(E_UNAUTHORIZED)
+        if session.status != STATUS_CREATED:
+            self._abort(E_INVALID_STATUS)
+        session.status = STATUS_PARTICIPANTS_ADDED
+
+    def sign_bill_agreement(self, participant: str, session_id: str):
+        session = self._session(session_id)
+        if session.status != STATUS_PARTICIPANTS_ADDED:
+            self._abort(E_INVALID_STATUS)
+
+        participant_data = self._find(session, participant)
+        if participant_data.has_signed:
+            self._abort(E_ALREADY_PAID)
+        participant_data.has_signed = True
+        session.current_signatures += 1
+
+        if session.current_signatures >= session.required_signatures:
+            session.status = STATUS_APPROVED
+            session.approved_at = self.clock()
+            self._emit("BillApprovedEvent", {
+                "session_id": session_id,
+                "multisig_address": session.multisig_address,
+                "signatures_collected": session.current_signatures,
+            })
+
+    def submit_payment(self, participant: str, session_id: str, payment_amount: int):
+        session = self._session(session_id)
+        if session.status != STATUS_APPROVED:
+            self._abort(E_INVALID_STATUS)
+
+        participant_data = self._find(session, participant)
+        if participant_data.has_paid:
+            self._abort(E_ALREADY_PAID)
+        amount_owed = participant_data.amount_owed
+        if payment_amount < amount_owed:
+            self._abort(E_INSUFFICIENT_PAYMENT)
+
+        self.ledger.withdraw(APTOS_COIN, participant, payment_amount)
+        self.escrow[session_id] += payment_amount
+
+        participant_data.has_paid = True
+        session.payments_received += amount_owed
+        session.paid_count += 1
+        self._emit("PaymentReceivedEvent", {
+            "session_id": session_id,
+            "participant_address": participant,
+            "amount_paid": amount_owed,
+            "remaining_amount": session.total_amount - session.payments_received,
+            "paid_at": self.clock(),
+        })
+
+        if session.paid_count == len(session.participants):
+            session.status = STATUS_SETTLED
+            session.settled_at = self.clock()
+            total = self.escrow[session_id]
+            self.escrow[session_id] = 0
+            self.ledger.deposit(APTOS_COIN, session.merchant_address, total)
+            self._emit("BatchPaymentEvent", {
+                "session_id": session_id,
+                "payments": [p.address for p in session.participants],
+                "amounts": [p.amount_owed for p in session.participants],
+                "total_amount_paid": total,
+                "timestamp": session.settled_at,
+            })
+            self._emit("BillSettledEvent", {
+                "session_id": session_id,
+                "total_collected": session.payments_received,
+                "merchant_address": session.merchant_address,
+                "settled_at": session.settled_at,
+            })
+
+    def prune_sessions(self, admin: str, session_ids: List[str]):
+        if len(session_ids) > MAX_PRUNE_BATCH:
+            self._abort(E_BATCH_TOO_LARGE)
+        if admin != self.module_address:
+            self._abort(E_UNAUTHORIZED)
+
+        pruned = []
+        for session_id in session_ids:
+            self.steps += 1
+            session = self.sessions.get(session_id)
+            if (session is not None and session.status in (STATUS_SETTLED, STATUS_CANCELLED)
+                    and not self.escrow[session_id]):
+                self.summaries[session_id] = SessionSummary.of(self.sessions.pop(session_id))
+                del self.escrow[session_id]
+                pruned.append(session_id)
+        self._emit("SessionsPrunedEvent", {"session_ids": pruned, "pruned_at": self.clock()})
+
+    # View functions
+
+    def get_bill_session(self, session_id: str) -> Tuple:
+        s = self._session(session_id)
+        return (s.session_id, s.merchant_address, s.multisig_address, s.total_amount,
+                s.description, s.status, s.required_signatures, s.current_signatures,
+                s.payments_received, s.created_at)
+
+    def get_session_summary(self, session_id: str) -> Tuple:
+        if session_id in self.summaries:
+            return self.summaries[session_id].as_tuple()
+        return live_summary(self._session(session_id))
+
+    def get_session_count(self) -> int:
+        return self.session_counter
+
+    def get_session_address(self, session_id: str) -> str:
+        return session_object_address(self.module_address, session_id)
+
+    def get_session_progress(self, session_id: str) -> Tuple[int, int, int, int]:
+        s = self._session(session_id)
+        return (len(s.participants), s.current_signatures, s.paid_count,
+                s.total_amount - s.payments_received)
+
+    def get_participants(self, session_id: str) -> List[Dict[str, Any]]:
+        return [p.as_dict() for p in self._session(session_id).participants]
+
+    def has_participant_signed(self, session_id: str, participant_address: str) -> bool:
+        for participant in self._session(session_id).participants:
+            self.steps += 1
+            if participant.address == participant_address:
+                return participant.has_signed
+        return False
+
+    def has_participant_paid(self, session_id: str, participant_address: str) -> bool:
+        for participant in self._session(session_id).participants:
+            self.steps += 1
+            if participant.address == participant_address:
+                return participant.has_paid
+        return False
+
+    def get_participant_bitmaps(self, session_id: str) -> Tuple[int, str, str]:
+        participants = self._session(session_id).participants
+        self.steps += len(participants)
+        return pack_participant_flags(participants)
+
+
+class EnhancedBillSplitterSim:
+    """State machine of enhanced_bill_splitter.move with its O(1) participant lookup table.
+
+    Payments wait in per-participant escrow (the PaymentLedger receipts) until the merchant
+    collects them or the settling payment sweeps the rest; session.paid_count and payments_received stand for the ledger aggregators.
+    Each participant's sessions are kept in pages of INDEX_PAGE_SIZE (session_id, created_at)
+    entries keyed by (participant, archived, page), like the registry's index tables.
+    """
+
+    MODULE = "enhanced_bill_splitter"
+
+    def __init__(self, module_address: str, ledger: Ledger, clock: Callable[[], int],
+                 events: Optional[List[SimEvent]] = None):
+        self.module_address = module_address
+        self.ledger = ledger
+        self.clock = clock
+        self.sessions: Dict[str, BillSession] = {}
+        self.session_counter = 0
+        self.participant_index: Dict[str, Dict[str, int]] = {}  # participant -> tails and counts
+        self.index_pages: Dict[Tuple[str, bool, int], List[Tuple[str, int]]] = {}
+        self.summaries: Dict[str, SessionSummary] = {}
+        self.multisig_nonces: Dict[str, int] = {}
+        self.escrow: Dict[str, Dict[str, int]] = {}  # session -> payer -> uncollected amount
+        self.events: List[SimEvent] = [] if events is None else events
+        self.steps = 0
+
+    def _emit(self, struct: str, data: Dict[str, Any]) -> SimEvent:
+        event = SimEvent(f"{self.module_address}::{self.MODULE}::{struct}", data)
+        self.events.append(event)
+        return event
+
+    def _abort(self, code: int):
+        raise MoveAbort(self.MODULE, code)
+
+    def _session(self, session_id: str) -> BillSession:
+        session = self.sessions.get(session_id)
+        if session is None:
+            self._abort(E_BILL_SESSION_NOT_FOUND)
+        return session
+
+    def _index_append(self, participant: str, entry: Tuple[str, int], archived: bool):
+        index = self.participant_index.setdefault(participant, {
+            "active_tail": 0, "archive_tail": 0, "active_count": 0, "archived_count": 0})
+        bucket = "archive" if archived else "active"
+        page = index[f"{bucket}_tail"]
+        if len(self.index_pages.get((participant, archived, page), [])) >= INDEX_PAGE_SIZE:
+            page += 1
+        index[f"{bucket}_tail"] = page
+        index["archived_count" if archived else "active_count"] += 1
+        self.index_pages.setdefault((participant, archived, page), []).append(entry)
+
+    def _index_find(self, participant: str, session_id: str, created_at: int) -> Optional[Tuple[int, int]]:
+        """(page, position) of an active session: walk back to the page spanning created_at"""
+        index = self.participant_index.get(participant)
+        if index is None:
+            return None
+        for page in range(index["active_tail"], -1, -1):
+            entries = self.index_pages.get((participant, False, page))
+            if not entries:
+                continue
+            self.steps += 1
+            if entries[-1][1] < created_at:
+                return None
+            if entries[0][1] <= created_at:
+                for position, entry in enumerate(entries):
+                    if entry[0] == session_id:
+                        return page, position
+                if entries[0][1] < created_at:
+                    return None
+        return None
+
+    def _index_remove(self, participant: str, page: int, position: int) -> Tuple[str, int]:
+        index = self.participant_index[participant]
+        index["active_count"] -= 1
+        entries = self.index_pages[(participant, False, page)]
+        entry = entries.pop(position)
+        if not entries and page != index["active_tail"]:
+            del self.index_pages[(participant, False, page)]
+        return entry
+
+    def _index_archive(self, participant: str, session_id: str, created_at: int):
+        found = self._index_find(participant, session_id, created_at)
+        if found is not None:
+            entry = self._index_remove(participant, *found)
+            self._index_append(participant, entry, True)
+
+    def _next_multisig_address(self, creator: str, owners: List[str], required: int) -> str:
+        if len(set(owners)) != len(owners) or creator in owners:
+            raise MoveAbort("multisig_account", MULTISIG_E_DUPLICATE_OWNER)
+        if not (0 < required <= len(owners) + 1):
+            raise MoveAbort("multisig_account", MULTISIG_E_INVALID_SIGNATURES_REQUIRED)
+        nonce = self.multisig_nonces.get(creator, 0)
+        digest = hashlib.sha3_256(f"{creator}:{nonce}".encode()).hexdigest()
+        return "0x" + digest
+
+    # Entry functions
+
+    def create_enhanced_bill_session(self, merchant: str, session_id: str, total_amount: int,
+                                     description: str, participant_addresses: List[str],
+                                     participant_names: List[str], required_signatures: int,
+                                     max_participants: int):
+        count = len(participant_addresses)
+        if count > max_participants or max_participants > MAX_PARTICIPANTS_DEFAULT:
+            self._abort(E_TOO_MANY_PARTICIPANTS)
+        if session_id in self.summaries:
+            self._abort(E_SESSION_PRUNED)
+
+        if count == 0:
+            raise VmError("ARITHMETIC_ERROR")
+
+        shares = split_amount(total_amount, count)
+        participants = []
+        lookup: Dict[str, int] = {}
+        for i in range(count):
+            self.steps += 1
+            address = participant_addresses[i]
+            if i >= len(participant_names):
+                raise MoveAbort("vector", VECTOR_E_INDEX_OUT_OF_BOUNDS)
+            if address in lookup:
+                raise MoveAbort("table", TABLE_E_ALREADY_EXISTS)
+            participants.append(Participant(address, participant_names[i], shares[i]))
+            lookup[address] = i
+
+        multisig_address = self._next_multisig_address(merchant, participant_addresses, required_signatures)
+        if session_id in self.sessions:
+            raise MoveAbort("smart_table", SMART_TABLE_E_ALREADY_EXIST)
+
+        self.multisig_nonces[merchant] = self.multisig_nonces.get(merchant, 0) + 1
+        for address in participant_addresses:
+            self._index_append(address, (session_id, self.clock()), False)
+        self.sessions[session_id] = BillSession(
+            session_id, merchant, multisig_address, total_amount, description, participants,
+            required_signatures, self.clock(), participant_lookup=lookup,
+            max_participants=max_participants,
+        )
+
+    def submit_payment_optimized(self, participant: str, session_id: str, payment_amount: int):
+        session = self._session(session_id)
+        if session.status != STATUS_APPROVED:
+            self._abort(E_INVALID_STATUS)
+        index = session.participant_lookup.get(participant)
+        self.steps += 1
+        if index is None:
+            self._abort(E_PARTICIPANT_NOT_FOUND)
+
+        participant_data = session.participants[index]
+        if participant_data.has_paid:
+            self._abort(E_ALREADY_PAID)
+        amount_owed = participant_data.amount_owed
+        if payment_amount < amount_owed:
+            self._abort(E_INSUFFICIENT_PAYMENT)
+
+        self.ledger.withdraw(USDC, participant, payment_amount)
+        self.escrow.setdefault(session_id, {})[participant] = payment_amount
+
+        participant_data.has_paid = True
+        participant_data.payment_timestamp = self.clock()
+        session.payments_received += amount_owed
+        session.paid_count += 1
+
+        if session.paid_count >= len(session.participants):
+            session.status = STATUS_SETTLED
+            session.settled_at = self.clock()
+            self._sweep_escrow(session, [p.address for p in session.participants])
+
+    def collect_payments(self, merchant: str, session_id: str, payers: List[str]):
+        if len(payers) > MAX_BATCH_SIZE:
+            self._abort(E_BATCH_TOO_LARGE)
+        session = self._session(session_id)
+        if session.merchant_address != merchant:
+            self._abort(E_UNAUTHORIZED)
+        self._sweep_escrow(session, payers)
+
+    def _sweep_escrow(self, session: BillSession, payers: List[str]):
+        """One deposit and one BatchPaymentEvent for the escrow of `payers`, if any is left"""
+        escrow = self.escrow.get(session.session_id, {})
+        collected_from, amounts = [], []
+        for payer in payers:
+            self.steps += 1
+            amount = escrow.get(payer, 0)
+            if amount > 0:
+                escrow[payer] = 0
+                collected_from.append(payer)
+                amounts.append(amount)
+        if not amounts:
+            return
+        self.ledger.deposit(USDC, session.merchant_address, sum(amounts))
+        self._emit("BatchPaymentEvent", {
+            "session_id": session.session_id,
+            "payments": collected_from,
+            "amounts": amounts,
+            "total_amount_paid": sum(amounts),
+            "timestamp": self.clock(),
+        })
+
+    def batch_sign_agreements(self, session_id: str, signer_addresses: List[str]):
+        if len(signer_addresses) > MAX_BATCH_SIZE:
+            self._abort(E_BATCH_TOO_LARGE)
+        session = self._session(session_id)
+        if session.status in (STATUS_SETTLED, STATUS_CANCELLED):
+            self._abort(E_INVALID_STATUS)
+
+        for address in signer_addresses:
+            self.steps += 1
+            index = session.participant_lookup.get(address)
+            if index is not None:
+                participant_data = session.participants[index]
+                if not participant_data.has_signed:
+                    participant_data.has_signed = True
+                    session.current_signatures += 1
+
+        if session.status < STATUS_APPROVED and session.current_signatures >= session.required_signatures:
+            session.status = STATUS_APPROVED
+            session.approved_at = self.clock()
+
+    def archive_session(self, session_id: str, participants: List[str]):
+        if len(participants) > MAX_BATCH_SIZE:
+            self._abort(E_BATCH_TOO_LARGE)
+        session = self._session(session_id)
+        if session.status not in (STATUS_SETTLED, STATUS_CANCELLED):
+            self._abort(E_INVALID_STATUS)
+
+        for address in participants:
+            self.steps += 1
+            self._index_archive(address, session_id, session.created_at)
+
+    def prune_sessions(self, admin: str, session_ids: List[str]):
+        if len(session_ids) > MAX_BATCH_SIZE:
+            self._abort(E_BATCH_TOO_LARGE)
+        if admin != self.module_address:
+            self._abort(E_UNAUTHORIZED)
+
+        pruned, budget = [], MAX_PRUNE_PARTICIPANTS
+        for session_id in session_ids:
+            self.steps += 1
+            session = self.sessions.get(session_id)
+            if (session is None or session.status not in (STATUS_SETTLED, STATUS_CANCELLED)
+                    or any(self.escrow.get(session_id, {}).values())
+                    or len(session.participants) > budget):
+                continue
+            budget -= len(session.participants)
+            del self.sessions[session_id]
+            self.escrow.pop(session_id, None)
+            for participant in session.participants:
+                self.steps += 1
+                self._index_archive(participant.address, session_id, session.created_at)
+            self.summaries[session_id] = SessionSummary.of(session)
+            pruned.append(session_id)
+        self._emit("SessionsPrunedEvent", {"session_ids": pruned, "pruned_at": self.clock()})
+
+    # View functions
+
+    def get_payment_totals(self, session_id: str) -> Tuple[int, int, int]:
+        s = self._session(session_id)
+        return s.paid_count, s.payments_received, sum(self.escrow.get(session_id, {}).values())
+
+    def get_participant_sessions_page(self, participant_addr: str, archived: bool,
+                                      cursor: int) -> Tuple[List[str], List[int], int]:
+        """Newest non-empty page below `cursor` (0 = newest), newest first, with the next cursor"""
+        index = self.participant_index.get(participant_addr)
+        if index is None:
+            return [], [], 0
+        page = cursor or index["archive_tail" if archived else "active_tail"] + 1
+        while page > 0:
+            page -= 1
+            self.steps += 1
+            entries = self.index_pages.get((participant_addr, archived, page))
+            if entries:
+                newest_first = entries[::-1]
+                return [e[0] for e in newest_first], [e[1] for e in newest_first], page
+        return [], [], 0
+
+    def get_participant_session_counts(self, participant_addr: str) -> Tuple[int, int]:
+        index = self.participant_index.get(participant_addr)
+        if index is None:
+            return 0, 0
+        return index["active_count"], index["archived_count"]
+
+    def get_session_summary(self, session_id: str) -> Tuple:
+        if session_id in self.summaries:
+            return self.summaries[session_id].as_tuple()
+        return live_summary(self._session(session_id))
+
+    def get_session_stats(self, session_id: str) -> Tuple[int, int, int, int, int]:
+        s = self._session(session_id)
+        return (len(s.participants), s.current_signatures, s.required_signatures,
+                s.payments_received, s.status)
+
+    def get_participant_bitmaps(self, session_id: str) -> Tuple[int, str, str]:
+        participants = self._session(session_id).participants
+        self.steps += len(participants)
+        return pack_participant_flags(participants)
+
+
+class UsdcSim:
+    """Test token helpers from usdc_utils.move"""
+
+    MODULE = "usdc_utils"
+
+    def __init__(self, ledger: Ledger):
+        self.ledger = ledger
+        self.initialized = False
+
+    def initialize_usdc(self, admin: str):
+        self.initialized = True
+
+    def mint_usdc_for_testing(self, admin: str, recipient: str, amount: int):
+        self.ledger.deposit(USDC, recipient, amount)
+
+    def batch_mint_usdc_for_testing(self, admin: str, recipients: List[str], amounts: List[int]):
+        if len(recipients) != len(amounts):
+            raise MoveAbort(self.MODULE, 3)  # E_INVALID_AMOUNT
+        for recipient, amount in zip(recipients, amounts):
+            self.mint_usdc_for_testing(admin, recipient, amount)
+
+    def register_usdc(self, account: str):
+        self.ledger.balances.setdefault(USDC, {}).setdefault(account, 0)
+
+    def transfer_usdc(self, sender: str, recipient: str, amount: int):
+        self.ledger.withdraw(USDC, sender, amount)
+        self.ledger.deposit(USDC, recipient, amount)
+
+    def get_usdc_balance(self, account_addr: str) -> int:
+        return self.ledger.balance(USDC, account_addr)
+
+
+class BillSplitterSimulator:
+    """All simulated modules sharing one ledger and clock"""
+
+    def __init__(self, module_address: str = "0x42", clock: Callable[[], int] = None):
+        self.module_address = normalize_address(module_address)
+        self.clock = clock or (lambda: int(time.time()))
+        self.ledger = Ledger()
+        self.events: List[SimEvent] = []  # Module events of every module, in emission order
+        self.bill_splitter = BillSplitterSim(self.module_address, self.ledger, self.clock, self.events)
+        self.enhanced_bill_splitter = EnhancedBillSplitterSim(self.module_address, self.ledger, self.clock,
+                                                              self.events)
+        self.usdc_utils = UsdcSim(self.ledger)
+
+    def module(self, name: str):
+        module = getattr(self, name, None)
+        if module is None or not hasattr(module, "MODULE"):
+            raise ValueError(f"Unknown module: {name}")
+        return module
+
+    @property
+    def steps(self) -> int:
+        return self.bill_splitter.steps + self.enhanced_bill_splitter.steps
+
+
+# Entry functions without a &signer parameter receive no sender argument
+SIGNERLESS_FUNCTIONS = {"enhanced_bill_splitter::batch_sign_agreements", "enhanced_bill_splitter::archive_session"}
+
+
+class SimulatorBackend:
+    """Backend that executes entry functions against an in-process BillSplitterSimulator"""
+
+    local = True
+
+    def __init__(self, simulator: Optional[BillSplitterSimulator] = None, module_address: str = "0x42",
+                 initial_apt: int = 100_000_000):
+        self.simulator = simulator or BillSplitterSimulator(module_address)
+        self.module_address = self.simulator.module_address
+        self.initial_apt = initial_apt
+        self._tx_counter = 0
+        self._lock = threading.Lock()
+
+    def new_account(self) -> TestAccount:
+        """Create a funded local account; the private key is only used as an identifier"""
+        address = "0x" + os.urandom(32).hex()
+        self.simulator.ledger.deposit(APTOS_COIN, address, self.initial_apt)
+        return TestAccount(address=address, private_key="0x" + os.urandom(32).hex())
+
+    def run(self, sender: TestAccount, function: str, args: List[str] = None) -> TxResult:
+        """Execute `module::function` with CLI-typed args as `sender`, atomically"""
+        module_name, _, function_name = function.partition("::")
+        values = [parse_cli_arg(arg) for arg in (args or [])]
+        sender_address = normalize_address(sender.address)
+        if function not in SIGNERLESS_FUNCTIONS:
+            values.insert(0, sender_address)
+
+        start = time.perf_counter()
+        module = getattr(self.simulator, module_name, None)
+        if not hasattr(module, "MODULE") or function_name.startswith("_") or not hasattr(module, function_name):
+            status = "LINKER_ERROR" if not hasattr(module, "MODULE") else "FUNCTION_RESOLUTION_FAILURE"
+            return TxResult(False, function, sender_address, vm_status=status,
+                            duration=time.perf_counter() - start)
+        with self._lock:
+            steps_before = self.simulator.steps
+            events_before = len(self.simulator.events)
+            try:
+                getattr(module, function_name)(*values)
+                success, vm_status = True, "Executed successfully"
+            except (MoveAbort, VmError) as error:
+                success, vm_status = False, str(error)
+            steps = self.simulator.steps - steps_before
+            events = self.simulator.events[events_before:] if success else []
+            self._tx_counter += 1
+            tx_number = self._tx_counter
+
+        result = TxResult(
+            success=success,
+            function=function,
+            sender=sender_address,
+            hash="0x" + hashlib.sha3_256(f"sim:{tx_number}".encode()).hexdigest(),
+            gas_used=BASE_GAS + STEP_GAS * steps,
+            vm_status=vm_status,
+            events=events,
+            duration=time.perf_counter() - start,
+        )
+        record_transactions([result])
+        return result
+
+    def run_many(self, requests: List[TxRequest]) -> List[TxResult]:
+        return [self.run(r.sender, r.function, r.args) for r in requests]
+
+    def view(self, function: str, args: List[str] = None) -> Any:
+        """Call a #[view] function with CLI-typed args"""
+        module_name, _, function_name = function.partition("::")
+        values = [parse_cli_arg(arg) for arg in (args or [])]
+        with self._lock:
+            return getattr(self.simulator.module(module_name), function_name)(*values)
+
+
+
+def benchmark(sessions: int = 100_000, participants: int = 5) -> Dict[str, float]:
+    """Drive full create -> confirm -> sign -> pay lifecycles directly against the engine"""
+    simulator = BillSplitterSimulator(clock=lambda: 0)
+    bill = simulator.bill_splitter
+    merchant = normalize_address("0xm")
+    addresses = [normalize_address(hex(0x1000 + i)) for i in range(participants)]
+    names = [f"Participant_{i}" for i in range(participants)]
+    total = 1_000_000 * participants
+    for address in addresses:
+        simulator.ledger.deposit(APTOS_COIN, address, total * sessions)
+
+    start = time.perf_counter()
+    for n in range(sessions):
+        session_id = f"BENCH_{n}"
+        bill.create_bill_session(merchant, session_id, total, "bench", addresses, names, participants)
+        bill.confirm_participants(merchant, session_id)
+        for address in addresses:
+            bill.sign_bill_agreement(address, session_id)
+        for address in addresses:
+            bill.submit_payment(address, session_id, 1_000_000)
+    elapsed = time.perf_counter() - start
+
+    settled = sum(1 for s in bill.sessions.values() if s.status == STATUS_SETTLED)
+    transactions = sessions * (2 + 2 * participants)
+    return {
+        "sessions": sessions,
+        "settled": settled,
+        "elapsed": elapsed,
+        "sessions_per_second": sessions / elapsed,
+        "transactions_per_second": transactions / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the in-process bill splitter simulator")
+    parser.add_argument("--sessions", type=int, default=100_000)
+    parser.add_argument("--participants", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"⚡ Simulating {args.sessions} bill lifecycles with {args.participants} participants...")
+    result = benchmark(args.sessions, args.participants)
+    print(f"✅ {result['settled']}/{result['sessions']} sessions settled in {result['elapsed']:.2f}s")
+    print(f"📈 {result['sessions_per_second']:,.0f} sessions/s "
+          f"({result['sessions_per_second'] * 60:,.0f}/min), "
+          f"{result['transactions_per_second']:,.0f} tx/s")
+
+
+if __name__ == "__main__":
+    main()
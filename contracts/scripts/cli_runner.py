@@ -0,0 +1,148 @@
+"""
+Async CLI Runner
+One place to launch the aptos CLI: explicit cwd (never os.chdir), no shell, a semaphore-bounded
+number of concurrent processes, per-command timeouts and structured results
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from instrumentation import charge_subprocess
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 120.0
+
+
+@dataclass
+class CommandResult:
+    command: List[str]
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float
+    cwd: Optional[str] = None
+    timed_out: bool = False
+    parsed: Any = None
+
+    @property
+    def success(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        """The `Result` object of the CLI's JSON output, or {} when there is none"""
+        result = self.parsed.get("Result") if isinstance(self.parsed, dict) else None
+        return result if isinstance(result, dict) else {}
+
+    @property
+    def error(self) -> str:
+        """The CLI's JSON `Error`, falling back to stderr"""
+        if isinstance(self.parsed, dict) and self.parsed.get("Error"):
+            return str(self.parsed["Error"])
+        return self.stderr.strip()
+
+
+def parse_json_output(stdout: str) -> Any:
+    """The aptos CLI prints one JSON document, sometimes after progress lines"""
+    lines = stdout.strip().splitlines()
+    for index, line in enumerate(lines):
+        if index == 0 or line.startswith(("{", "[")):
+            try:
+                return json.loads("\n".join(lines[index:]))
+            except ValueError:
+                continue
+    return None
+
+
+class AsyncCliRunner:
+    """Launch commands as child processes; at most `max_concurrency` run at once"""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cwd = cwd
+        self.env = env
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run(
+        self,
+        command: Sequence[str],
+        cwd: Optional[str] = None,
+        timeout: Optional[float] = None,
+        parse_json: bool = False,
+    ) -> CommandResult:
+        command = [str(part) for part in command]
+        cwd = cwd or self.cwd
+        timeout = self.timeout if timeout is None else timeout
+        async with self._limit():
+            start = time.perf_counter()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    cwd=cwd,
+                    env=self._environment(),
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except OSError as error:
+                return CommandResult(command, -1, "", str(error), time.perf_counter() - start, cwd)
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                duration = time.perf_counter() - start
+                charge_subprocess(duration)
+                return CommandResult(command, -1, "", f"{' '.join(command[:3])} timed out after {timeout}s",
+                                     duration, cwd, timed_out=True)
+            duration = time.perf_counter() - start
+        charge_subprocess(duration)
+        result = CommandResult(command, process.returncode, stdout.decode(errors="replace"),
+                               stderr.decode(errors="replace"), duration, cwd)
+        if parse_json:
+            result.parsed = parse_json_output(result.stdout)
+        return result
+
+    async def run_all(self, commands: Sequence[Sequence[str]], **kwargs) -> List[CommandResult]:
+        """Run every command concurrently (bounded by the semaphore); results keep input order"""
+        return list(await asyncio.gather(*(self.run(command, **kwargs) for command in commands)))
+
+    def _limit(self) -> asyncio.Semaphore:
+        # Semaphores belong to an event loop; each asyncio.run() gets a fresh one
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    def _environment(self) -> Optional[Dict[str, str]]:
+        if self.env is None:
+            return None
+        return {**os.environ, **self.env}
+
+
+def run_command(command: Sequence[str], cwd: Optional[str] = None, timeout: float = DEFAULT_TIMEOUT,
+                parse_json: bool = False) -> CommandResult:
+    """Blocking wrapper for one command; safe to call from worker threads"""
+    return asyncio.run(AsyncCliRunner(1, timeout).run(command, cwd=cwd, parse_json=parse_json))
+
+
+def run_commands(commands: Sequence[Sequence[str]], cwd: Optional[str] = None,
+                 timeout: float = DEFAULT_TIMEOUT, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 parse_json: bool = False) -> List[CommandResult]:
+    """Blocking wrapper that runs `commands` concurrently and returns results in order"""
+    runner = AsyncCliRunner(max_concurrency, timeout, cwd)
+    return asyncio.run(runner.run_all(commands, parse_json=parse_json))
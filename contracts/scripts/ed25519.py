@@ -0,0 +1,144 @@
+"""
+Ed25519 Signing
+Minimal RFC 8032 implementation for signing Aptos transactions without extra dependencies.
+PyNaCl is used instead when it is installed.
+"""
+
+import hashlib
+from typing import Tuple
+
+try:
+    from nacl.signing import SigningKey as _NaclSigningKey
+except ImportError:  # PyNaCl is optional
+    _NaclSigningKey = None
+
+_P = 2 ** 255 - 19
+_L = 2 ** 252 + 27742317777372353535851937790883648493
+_D = -121665 * pow(121666, _P - 2, _P) % _P
+_SQRT_M1 = pow(2, (_P - 1) // 4, _P)
+
+Point = Tuple[int, int, int, int]  # Extended coordinates (X, Y, Z, T)
+
+
+def _add(p: Point, q: Point) -> Point:
+    a = (p[1] - p[0]) * (q[1] - q[0]) % _P
+    b = (p[1] + p[0]) * (q[1] + q[0]) % _P
+    c = 2 * p[3] * q[3] * _D % _P
+    d = 2 * p[2] * q[2] % _P
+    e, f, g, h = b - a, d - c, d + c, b + a
+    return (e * f % _P, g * h % _P, f * g % _P, e * h % _P)
+
+
+def _multiply(scalar: int, point: Point) -> Point:
+    result = (0, 1, 1, 0)
+    while scalar > 0:
+        if scalar & 1:
+            result = _add(result, point)
+        point = _add(point, point)
+        scalar >>= 1
+    return result
+
+
+def _recover_x(y: int, sign: int) -> int:
+    if y >= _P:
+        raise ValueError("invalid point")
+    x2 = (y * y - 1) * pow(_D * y * y + 1, _P - 2, _P)
+    if x2 == 0:
+        if sign:
+            raise ValueError("invalid point")
+        return 0
+    x = pow(x2, (_P + 3) // 8, _P)
+    if (x * x - x2) % _P != 0:
+        x = x * _SQRT_M1 % _P
+    if (x * x - x2) % _P != 0:
+        raise ValueError("invalid point")
+    if (x & 1) != sign:
+        x = _P - x
+    return x
+
+
+_BY = 4 * pow(5, _P - 2, _P) % _P
+_BX = _recover_x(_BY, 0)
+_BASE: Point = (_BX, _BY, 1, _BX * _BY % _P)
+
+
+def _compress(point: Point) -> bytes:
+    z_inv = pow(point[2], _P - 2, _P)
+    x = point[0] * z_inv % _P
+    y = point[1] * z_inv % _P
+    return (y | ((x & 1) << 255)).to_bytes(32, "little")
+
+
+def _decompress(data: bytes) -> Point:
+    y = int.from_bytes(data, "little")
+    sign = y >> 255
+    y &= (1 << 255) - 1
+    x = _recover_x(y, sign)
+    return (x, y, 1, x * y % _P)
+
+
+def _equal(p: Point, q: Point) -> bool:
+    return (p[0] * q[2] - q[0] * p[2]) % _P == 0 and (p[1] * q[2] - q[1] * p[2]) % _P == 0
+
+
+def _sha512_int(data: bytes) -> int:
+    return int.from_bytes(hashlib.sha512(data).digest(), "little")
+
+
+def _expand(seed: bytes) -> Tuple[int, bytes]:
+    digest = hashlib.sha512(seed).digest()
+    scalar = int.from_bytes(digest[:32], "little")
+    scalar &= (1 << 254) - 8
+    scalar |= 1 << 254
+    return scalar, digest[32:]
+
+
+class SigningKey:
+    """Ed25519 private key created from its 32-byte seed"""
+
+    def __init__(self, seed: bytes):
+        if len(seed) != 32:
+            raise ValueError("Ed25519 private keys are 32 bytes")
+        self.seed = seed
+        if _NaclSigningKey is not None:
+            self._nacl = _NaclSigningKey(seed)
+            self.public_key = bytes(self._nacl.verify_key)
+        else:
+            self._nacl = None
+            self._scalar, self._prefix = _expand(seed)
+            self.public_key = _compress(_multiply(self._scalar, _BASE))
+
+    @classmethod
+    def from_hex(cls, private_key: str) -> "SigningKey":
+        """Accept `0x...` hex as well as the CLI's `ed25519-priv-0x...` form"""
+        key = private_key.strip()
+        if key.startswith("ed25519-priv-"):
+            key = key[len("ed25519-priv-"):]
+        if key.startswith("0x"):
+            key = key[2:]
+        return cls(bytes.fromhex(key))
+
+    def sign(self, message: bytes) -> bytes:
+        if self._nacl is not None:
+            return self._nacl.sign(message).signature
+        r = _sha512_int(self._prefix + message) % _L
+        r_encoded = _compress(_multiply(r, _BASE))
+        k = _sha512_int(r_encoded + self.public_key + message) % _L
+        s = (r + k * self._scalar) % _L
+        return r_encoded + s.to_bytes(32, "little")
+
+
+def verify(public_key: bytes, message: bytes, signature: bytes) -> bool:
+    """Check an Ed25519 signature"""
+    if len(public_key) != 32 or len(signature) != 64:
+        return False
+    try:
+        a = _decompress(public_key)
+        r = _decompress(signature[:32])
+    except ValueError:
+        return False
+    s = int.from_bytes(signature[32:], "little")
+    if s >= _L:
+        return False
+    k = _sha512_int(signature[:32] + public_key + message) % _L
+    return _equal(_multiply(s, _BASE), _add(r, _multiply(k, a)))
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Bill Splitter Event Indexer
+Pages bill_splitter module events by type from the Aptos indexer's GraphQL API into a local
+SQLite store, resuming after the last event it applied so a restarted indexer picks up where
+it stopped.
+"""
+
+import argparse
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from backends import normalize_address
+from submission import HttpTransport, TransportError
+
+# Module event struct -> the kind the store applies
+EVENT_KINDS = {
+    "SessionCreatedEvent": "session_created",
+    "ParticipantAddedEvent": "participant_added",
+    "BillApprovedEvent": "bill_approved",
+    "PaymentReceivedEvent": "payment_received",  # Each payment as it enters the escrow
+    "BatchPaymentEvent": "batch_payment",
+    "BillSettledEvent": "bill_settled",
+}
+# enhanced_bill_splitter only reports sessions when their escrow moves; the store keeps their ids
+# so session_gc can sweep them
+ENHANCED_EVENT_KINDS = {
+    "BatchPaymentEvent": "enhanced_batch_payment",
+}
+DEFAULT_PAGE_SIZE = 100  # Largest page the hosted indexer API serves
+DEFAULT_DB_PATH = "bill_events.db"
+DEFAULT_INDEXER_URL = "https://api.devnet.aptoslabs.com/v1/graphql"
+
+# Events of the given types after a (version, event_index) position, in ledger order. The
+# position is an event, not a version: one transaction can emit more events than fit in a page.
+EVENTS_QUERY = """
+query BillEvents($types: [String!], $version: bigint, $index: bigint, $limit: Int) {
+  events(
+    where: {indexed_type: {_in: $types}, _or: [
+      {transaction_version: {_gt: $version}},
+      {transaction_version: {_eq: $version}, event_index: {_gt: $index}}
+    ]}
+    order_by: [{transaction_version: asc}, {event_index: asc}]
+    limit: $limit
+  ) {
+    transaction_version
+    event_index
+    type
+    data
+  }
+}
+"""
+
+STATUS_CREATED = 0
+STATUS_APPROVED = 2
+STATUS_SETTLED = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    version INTEGER NOT NULL,
+    event_index INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    type TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (version, event_index)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    merchant_address TEXT,
+    multisig_address TEXT,
+    total_amount INTEGER,
+    required_signatures INTEGER,
+    signatures_collected INTEGER NOT NULL DEFAULT 0,
+    payments_received INTEGER NOT NULL DEFAULT 0,
+    remaining_amount INTEGER,
+    status INTEGER NOT NULL DEFAULT 0,
+    settled_at INTEGER
+);
+CREATE TABLE IF NOT EXISTS participants (
+    session_id TEXT NOT NULL,
+    address TEXT NOT NULL,
+    name TEXT,
+    amount_owed INTEGER,
+    amount_paid INTEGER NOT NULL DEFAULT 0,
+    has_paid INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session_id, address)
+);
+CREATE INDEX IF NOT EXISTS participants_by_address ON participants (address);
+CREATE TABLE IF NOT EXISTS enhanced_sessions (
+    session_id TEXT PRIMARY KEY,
+    last_payment_at INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class PollSummary:
+    """Events applied by one pass up to the indexer's head"""
+    applied: Dict[str, int] = field(default_factory=lambda: {
+        kind: 0 for kind in [*EVENT_KINDS.values(), *ENHANCED_EVENT_KINDS.values()]})
+    pages: int = 0
+    duration: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return sum(self.applied.values())
+
+    def describe(self) -> str:
+        counts = ", ".join(f"{kind}={count}" for kind, count in self.applied.items() if count)
+        return (f"{self.total} events in {self.pages} pages "
+                f"({self.duration:.2f}s){': ' + counts if counts else ''}")
+
+
+def event_kind(event_type: str, module_address: str) -> Optional[str]:
+    """Kind of a bill_splitter (or tracked enhanced_bill_splitter) module event, None for any other event"""
+    parts = event_type.split("::")
+    if len(parts) != 3 or parts[1] not in ("bill_splitter", "enhanced_bill_splitter"):
+        return None
+    if normalize_address(parts[0]) != normalize_address(module_address):
+        return None
+    kinds = EVENT_KINDS if parts[1] == "bill_splitter" else ENHANCED_EVENT_KINDS
+    return kinds.get(parts[2])
+
+
+def event_types(module_address: str) -> List[str]:
+    """Fully qualified types of every tracked event, with the address in the short form the
+    indexer stores types in"""
+    address = "0x" + (normalize_address(module_address)[2:].lstrip("0") or "0")
+    return [f"{address}::{module}::{struct}"
+            for module, kinds in (("bill_splitter", EVENT_KINDS), ("enhanced_bill_splitter", ENHANCED_EVENT_KINDS))
+            for struct in kinds]
+
+
+class GraphqlEventSource:
+    """Pages this package's module events through the indexer GraphQL API.
+
+    Module events have no handle to page on the fullnode, and scanning its transaction feed for
+    them never catches up on a busy network, so events are queried by type instead. History the
+    indexer no longer keeps is simply absent: a store positioned before it resumes from the
+    oldest event still served.
+    """
+
+    def __init__(self, transport: HttpTransport, module_address: str):
+        self.transport = transport
+        self.module_address = module_address
+        self.types = event_types(module_address)
+
+    def fetch(self, after: Tuple[int, int], limit: int) -> List[Dict[str, Any]]:
+        """Up to `limit` events after the (version, event_index) position"""
+        version, index = after
+        response = self.transport.post("", {"query": EVENTS_QUERY, "variables": {
+            "types": self.types, "version": version, "index": index, "limit": limit}}) or {}
+        if response.get("errors"):
+            raise TransportError(f"indexer query failed: {response['errors'][0].get('message')}",
+                                 body=response)
+        return [{"version": int(event["transaction_version"]), "event_index": int(event["event_index"]),
+                 "type": event["type"], "data": event["data"]}
+                for event in (response.get("data") or {}).get("events") or []]
+
+
+class EventStore:
+    """SQLite materialization of bill sessions built from bill_splitter module events.
+
+    Each event is recorded in the same SQLite transaction that applies it, and the last recorded
+    event is the position the next page is read after, so after a crash the store and its
+    position always agree and nothing is applied twice.
+    """
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.conn.close()
+
+    def position(self, start_version: int = 0) -> Tuple[int, int]:
+        """(version, event_index) of the last applied event; a fresh store sits just before
+        `start_version`"""
+        row = self.conn.execute(
+            "SELECT version, event_index FROM events ORDER BY version DESC, event_index DESC LIMIT 1").fetchone()
+        return (row[0], row[1]) if row else (start_version, -1)
+
+    def apply_page(self, events: List[Dict[str, Any]], module_address: str) -> Dict[str, int]:
+        """Apply a page of module events atomically, skipping any at or before the stored
+        position; returns the events applied per kind"""
+        applied: Dict[str, int] = {}
+        with self._lock, self.conn:
+            position = self.position(-1)
+            for event in events:
+                key = (int(event["version"]), int(event["event_index"]))
+                kind = event_kind(event.get("type", ""), module_address)
+                if key <= position or kind is None:
+                    continue  # Overlapping page after a retry, or another module's event
+                self.conn.execute(
+                    "INSERT INTO events (version, event_index, kind, type, data) VALUES (?, ?, ?, ?, ?)",
+                    (*key, kind, event["type"], json.dumps(event.get("data", {}))))
+                self._apply(kind, event.get("data", {}))
+                applied[kind] = applied.get(kind, 0) + 1
+                position = key
+        return applied
+
+    def _apply(self, kind: str, data: Dict[str, Any]):
+        # Events arrive in ledger order, but a store started past a session's creation still sees
+        # its later events; every update is an upsert and status only moves forward.
+        session_id = data["session_id"]
+        if kind == "enhanced_batch_payment":
+            self.conn.execute(
+                "INSERT INTO enhanced_sessions (session_id, last_payment_at) VALUES (?, ?) "
+                "ON CONFLICT(session_id) DO UPDATE SET last_payment_at = excluded.last_payment_at",
+                (session_id, int(data["timestamp"])))
+            return
+        self.conn.execute("INSERT OR IGNORE INTO sessions (session_id) VALUES (?)", (session_id,))
+
+        if kind == "session_created":
+            self.conn.execute(
+                "UPDATE sessions SET merchant_address = ?, multisig_address = ?, total_amount = ?, "
+                "required_signatures = ?, remaining_amount = COALESCE(remaining_amount, ?) WHERE session_id = ?",
+                (data["merchant_address"], data["multisig_address"], int(data["total_amount"]),
+                 int(data["required_signatures"]), int(data["total_amount"]), session_id))
+        elif kind == "participant_added":
+            self.conn.execute(
+                "INSERT INTO participants (session_id, address, name, amount_owed) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(session_id, address) DO UPDATE SET name = excluded.name, "
+                "amount_owed = excluded.amount_owed",
+                (session_id, data["participant_address"], data["participant_name"], int(data["amount_owed"])))
+        elif kind == "bill_approved":
+            self.conn.execute(
+                "UPDATE sessions SET multisig_address = ?, signatures_collected = MAX(signatures_collected, ?), "
+                "status = MAX(status, ?) WHERE session_id = ?",
+                (data["multisig_address"], int(data["signatures_collected"]), STATUS_APPROVED, session_id))
+        elif kind == "payment_received":
+            amount = int(data["amount_paid"])
+            paid = self._paid(session_id, [data["participant_address"]])
+            self.conn.execute(
+                "INSERT INTO participants (session_id, address, amount_owed, amount_paid, has_paid) "
+                "VALUES (?, ?, ?, ?, 1) ON CONFLICT(session_id, address) DO UPDATE SET "
+                "amount_paid = excluded.amount_paid, has_paid = 1",
+                (session_id, data["participant_address"], amount, amount))
+            remaining = int(data["remaining_amount"])
+            self.conn.execute(
+                "UPDATE sessions SET payments_received = payments_received + ?, "
+                "remaining_amount = MIN(COALESCE(remaining_amount, ?), ?) WHERE session_id = ?",
+                (0 if paid else amount, remaining, remaining, session_id))
+        elif kind == "batch_payment":
+            # Every payment of the bill, swept to the merchant by the settling transaction; the
+            # ones already seen as PaymentReceivedEvents are not counted again
+            amounts = [int(amount) for amount in data["amounts"]]
+            paid = self._paid(session_id, data["payments"])
+            new = sum(amount for payer, amount in zip(data["payments"], amounts) if payer not in paid)
+            self.conn.executemany(
+                "INSERT INTO participants (session_id, address, amount_owed, amount_paid, has_paid) "
+                "VALUES (?, ?, ?, ?, 1) ON CONFLICT(session_id, address) DO UPDATE SET "
+                "amount_paid = excluded.amount_paid, has_paid = 1",
+                [(session_id, payer, amount, amount) for payer, amount in zip(data["payments"], amounts)])
+            self.conn.execute(
+                "UPDATE sessions SET payments_received = payments_received + ?, "
+                "remaining_amount = MAX(COALESCE(remaining_amount, 0) - ?, 0) WHERE session_id = ?",
+                (new, new, session_id))
+        elif kind == "bill_settled":
+            self.conn.execute(
+                "UPDATE sessions SET merchant_address = COALESCE(merchant_address, ?), remaining_amount = 0, "
+                "settled_at = ?, status = ? WHERE session_id = ?",
+                (data["merchant_address"], int(data["settled_at"]), STATUS_SETTLED, session_id))
+
+    def _paid(self, session_id: str, addresses: List[str]) -> Set[str]:
+        """Which of these participants the store already has as paid"""
+        if not addresses:
+            return set()
+        placeholders = ",".join("?" * len(addresses))
+        return {row[0] for row in self.conn.execute(
+            f"SELECT address FROM participants WHERE session_id = ? AND has_paid = 1 "
+            f"AND address IN ({placeholders})", (session_id, *addresses))}
+
+    # Read side
+
+    def session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT * FROM sessions WHERE session_id = ?", (session_id,)).fetchone()
+        if row is None:
+            return None
+        session = dict(row)
+        session["participants"] = [dict(participant) for participant in self.conn.execute(
+            "SELECT address, name, amount_owed, amount_paid, has_paid FROM participants "
+            "WHERE session_id = ? ORDER BY address", (session_id,))]
+        return session
+
+    def sessions(self, status: Optional[int] = None) -> List[Dict[str, Any]]:
+        if status is None:
+            rows = self.conn.execute("SELECT * FROM sessions ORDER BY session_id")
+        else:
+            rows = self.conn.execute("SELECT * FROM sessions WHERE status = ? ORDER BY session_id", (status,))
+        return [dict(row) for row in rows]
+
+    def participant_sessions(self, address: str) -> List[str]:
+        return [row[0] for row in self.conn.execute(
+            "SELECT session_id FROM participants WHERE address = ? ORDER BY session_id", (address,))]
+
+    def event_count(self, kind: Optional[str] = None) -> int:
+        if kind is None:
+            return self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM events WHERE kind = ?", (kind,)).fetchone()[0]
+
+
+class EventIndexer:
+    """Follows the module's events from the store's position"""
+
+    def __init__(self, source, store: EventStore, page_size: int = DEFAULT_PAGE_SIZE, start_version: int = 0):
+        self.source = source
+        self.store = store
+        self.page_size = page_size
+        self.start_version = start_version
+
+    def poll(self) -> PollSummary:
+        """Drain events up to the indexer's head"""
+        summary = PollSummary()
+        started = time.perf_counter()
+        while True:
+            page = self.source.fetch(self.store.position(self.start_version), self.page_size)
+            if not page:
+                break
+            summary.pages += 1
+            for kind, count in self.store.apply_page(page, self.source.module_address).items():
+                summary.applied[kind] += count
+            if len(page) < self.page_size:
+                break
+        summary.duration = time.perf_counter() - started
+        return summary
+
+    def run(self, interval: float = 2.0, stop: Optional[threading.Event] = None, verbose: bool = True):
+        """Poll until `stop` is set, sleeping only when a pass found nothing new"""
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                summary = self.poll()
+            except TransportError as error:
+                if verbose:
+                    print(f"⚠️ Poll failed, retrying: {error}")
+                stop.wait(interval)
+                continue
+            if summary.total:
+                if verbose:
+                    print(f"📝 Indexed {summary.describe()}")
+            else:
+                stop.wait(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index bill_splitter events into SQLite")
+    parser.add_argument("--indexer-url", default=DEFAULT_INDEXER_URL, help="Aptos indexer GraphQL endpoint")
+    parser.add_argument("--module-address", required=True, help="Address the bill_split package is published at")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite database path")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--start-version", type=int, default=0,
+                        help="Ledger version a fresh store starts from; history the indexer no longer "
+                             "serves is skipped")
+    parser.add_argument("--follow", action="store_true", help="Keep polling for new events")
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between idle polls")
+    args = parser.parse_args()
+
+    store = EventStore(args.db)
+    source = GraphqlEventSource(HttpTransport(args.indexer_url), args.module_address)
+    indexer = EventIndexer(source, store, page_size=args.page_size, start_version=args.start_version)
+    version, index = store.position(args.start_version)
+    print(f"🔎 Resuming after event {index} of ledger version {version}")
+
+    try:
+        if args.follow:
+            indexer.run(args.interval)
+        else:
+            print(f"✅ Indexed {indexer.poll().describe()}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sessions = store.sessions()
+        settled = sum(1 for session in sessions if session["status"] == STATUS_SETTLED)
+        print(f"📊 {len(sessions)} sessions indexed, {settled} settled")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
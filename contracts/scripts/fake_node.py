@@ -0,0 +1,582 @@
+"""
+Local Fake Aptos Node
+Serves the REST endpoints the testers use (accounts, transaction submission and waiting, views,
+transactions with their module events and a faucet), plus the indexer's GraphQL events query, from
+an in-memory ledger backed by the bill splitter simulator, so the real REST submission path runs
+without a network
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from accounts import derive_address
+from backends import normalize_address
+from bill_simulator import APTOS_COIN, BASE_GAS, STEP_GAS, BillSplitterSimulator, MoveAbort, VmError
+from ed25519 import verify
+from keystore import FAUCET_AMOUNT
+from move_sharding import MODULE_PATTERN
+
+CONTRACTS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+CHAIN_ID = 4  # the chain id of a local testnet
+FAUCET_ADDRESS = normalize_address("0xa550c18")
+COIN_STORE = f"0x1::coin::CoinStore<{APTOS_COIN}>"
+RAW_TRANSACTION_SALT = hashlib.sha3_256(b"APTOS::RawTransaction").digest()
+MAX_PARKED_PER_ACCOUNT = 100
+
+FUNCTION_PATTERN = re.compile(
+    r"(#\[view\][^\n]*\n(?:\s*///[^\n]*\n)*)?\s*public\s+(entry\s+)?fun\s+(\w+)\s*(?:<[^>]*>)?\s*\(([^)]*)\)"
+)
+
+
+@dataclass
+class FunctionAbi:
+    module: str
+    name: str
+    params: List[str]
+    signer: bool
+    entry: bool
+    view: bool
+
+
+def load_abi(package_dir: str = CONTRACTS_DIR) -> Dict[str, FunctionAbi]:
+    """`module::function` -> parameter types of the package's entry and view functions"""
+    abi = {}
+    for path in sorted(os.listdir(os.path.join(package_dir, "sources"))):
+        if not path.endswith(".move"):
+            continue
+        with open(os.path.join(package_dir, "sources", path)) as f:
+            source = f.read()
+        module = next((m.group(1) for m in map(MODULE_PATTERN.match, source.splitlines()) if m), None)
+        for match in FUNCTION_PATTERN.finditer(source):
+            view, entry, name, params = match.groups()
+            if not (view or entry):
+                continue
+            types = [param.split(":", 1)[1].strip() for param in params.split(",") if ":" in param]
+            signer = bool(types) and types[0].replace(" ", "") == "&signer"
+            abi[f"{module}::{name}"] = FunctionAbi(module, name, types[1:] if signer else types,
+                                                   signer, bool(entry), bool(view))
+    return abi
+
+
+def decode_argument(move_type: str, value: Any) -> Any:
+    """JSON argument -> simulator value (u64s arrive as strings, addresses in any hex form)"""
+    if move_type.startswith("vector<") and move_type.endswith(">"):
+        if not isinstance(value, list):
+            raise ValueError(f"expected a list for {move_type}")
+        return [decode_argument(move_type[len("vector<"):-1], item) for item in value]
+    if move_type in ("u8", "u16", "u32", "u64", "u128", "u256"):
+        return int(value)
+    if move_type == "bool":
+        if not isinstance(value, bool):
+            raise ValueError("expected a bool")
+        return value
+    if move_type == "address":
+        return normalize_address(str(value))
+    if move_type in ("String", "string::String", "std::string::String"):
+        return str(value)
+    raise ValueError(f"unsupported argument type {move_type}")
+
+
+def encode_value(value: Any) -> Any:
+    """Simulator value -> REST JSON (integers as strings, like u64 on the API)"""
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: encode_value(item) for key, item in value.items()}
+    return value
+
+
+class NodeError(Exception):
+    """Request rejected with an HTTP status and an Aptos-style error code"""
+
+    def __init__(self, status: int, message: str, error_code: str = "invalid_input", vm_error_code: str = None):
+        super().__init__(message)
+        self.status = status
+        self.error_code = error_code
+        self.vm_error_code = vm_error_code
+
+    def body(self) -> Dict[str, Any]:
+        body = {"message": str(self), "error_code": self.error_code}
+        if self.vm_error_code:
+            body["vm_error_code"] = self.vm_error_code
+        return body
+
+
+class FakeAptosNode:
+    """In-memory chain: accounts, a per-sender mempool, committed transactions by version and the
+    simulator's modules published at `module_address`.
+
+    Transactions execute as soon as their sequence number is next for the sender, so a wait never
+    blocks. Signature checks are optional because pure-Python Ed25519 verification costs several
+    milliseconds; the authentication key is always checked.
+    """
+
+    def __init__(
+        self,
+        module_address: str = "0x42",
+        package_dir: str = CONTRACTS_DIR,
+        verify_signatures: bool = False,
+        faucet_amount: int = FAUCET_AMOUNT,
+        clock=None,
+    ):
+        self.clock = clock or time.time
+        self.simulator = BillSplitterSimulator(module_address, clock=lambda: int(self.clock()))
+        self.module_address = self.simulator.module_address
+        self.abi = load_abi(package_dir)
+        self.verify_signatures = verify_signatures
+        self.faucet_amount = faucet_amount
+        self.sequence_numbers: Dict[str, int] = {}
+        self.mempool: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self.transactions: List[Dict[str, Any]] = []
+        self.by_hash: Dict[str, Dict[str, Any]] = {}
+        self.indexer_oldest_version = 0  # Raise to serve events the way an indexer with pruned history does
+        self._lock = threading.RLock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # Server lifecycle
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in a background thread; returns the /v1 base URL (the faucet shares the port)"""
+        node = self
+
+        class Handler(NodeRequestHandler):
+            pass
+        Handler.node = node
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def root_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def url(self) -> str:
+        return f"{self.root_url}/v1"
+
+    def __enter__(self) -> "FakeAptosNode":
+        if self._server is None:
+            self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # Accounts and faucet
+
+    def ledger_info(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "chain_id": CHAIN_ID,
+                "epoch": "1",
+                "ledger_version": str(max(len(self.transactions) - 1, 0)),
+                "oldest_ledger_version": "0",
+                "ledger_timestamp": str(int(self.clock() * 1_000_000)),
+                "node_role": "full_node",
+                "block_height": str(len(self.transactions)),
+            }
+
+    def get_account(self, address: str) -> Dict[str, Any]:
+        address = normalize_address(address)
+        with self._lock:
+            if address not in self.sequence_numbers:
+                raise NodeError(404, f"Account not found by Address({address})", "account_not_found")
+            return {"sequence_number": str(self.sequence_numbers[address]), "authentication_key": address}
+
+    def get_resource(self, address: str, resource_type: str) -> Dict[str, Any]:
+        self.get_account(address)
+        if resource_type.replace(" ", "") != COIN_STORE:
+            raise NodeError(404, f"Resource not found: {resource_type}", "resource_not_found")
+        balance = self.simulator.ledger.balance(APTOS_COIN, normalize_address(address))
+        return {"type": COIN_STORE, "data": {"coin": {"value": str(balance)}, "frozen": False}}
+
+    def fund(self, address: str, amount: Optional[int] = None) -> str:
+        """Faucet: create the account if needed and deposit APT; returns the funding tx hash"""
+        address = normalize_address(address)
+        amount = self.faucet_amount if amount is None else amount
+        with self._lock:
+            self.sequence_numbers.setdefault(address, 0)
+            self.simulator.ledger.deposit(APTOS_COIN, address, amount)
+            tx_hash = "0x" + hashlib.sha3_256(f"faucet:{len(self.transactions)}:{address}".encode()).hexdigest()
+            self._commit({
+                "hash": tx_hash,
+                "sender": FAUCET_ADDRESS,
+                "sequence_number": str(len(self.transactions)),
+                "payload": {"type": "entry_function_payload", "function": "0x1::aptos_account::transfer",
+                            "type_arguments": [], "arguments": [address, str(amount)]},
+            }, True, "Executed successfully", 0, [])
+        return tx_hash
+
+    # Transactions
+
+    def encode_submission(self, transaction: Dict[str, Any]) -> str:
+        return "0x" + self._signing_message(transaction).hex()
+
+    def submit(self, transaction: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate like a fullnode's mempool, park the transaction and run whatever is ready"""
+        try:
+            sender = normalize_address(transaction["sender"])
+            sequence_number = int(transaction["sequence_number"])
+            max_gas = int(transaction["max_gas_amount"])
+            gas_price = int(transaction["gas_unit_price"])
+            expiration = int(transaction["expiration_timestamp_secs"])
+            public_key = bytes.fromhex(transaction["signature"]["public_key"][2:])
+            signature = bytes.fromhex(transaction["signature"]["signature"][2:])
+        except (KeyError, TypeError, ValueError) as error:
+            raise NodeError(400, f"Invalid transaction: {error}")
+        message = self._signing_message(transaction)
+        self._decode_payload(transaction["payload"])
+
+        if derive_address(public_key) != sender:
+            raise NodeError(400, "Invalid transaction: INVALID_AUTH_KEY", vm_error_code="INVALID_AUTH_KEY")
+        if self.verify_signatures and not verify(public_key, message, signature):
+            raise NodeError(400, "Invalid transaction: INVALID_SIGNATURE", vm_error_code="INVALID_SIGNATURE")
+
+        tx_hash = "0x" + hashlib.sha3_256(message + signature).hexdigest()
+        pending = {key: transaction[key] for key in
+                   ("sender", "sequence_number", "max_gas_amount", "gas_unit_price",
+                    "expiration_timestamp_secs", "payload", "signature")}
+        pending.update(hash=tx_hash, sender=sender)
+
+        with self._lock:
+            if sender not in self.sequence_numbers:
+                raise NodeError(400, "Invalid transaction: SENDING_ACCOUNT_DOES_NOT_EXIST",
+                                vm_error_code="SENDING_ACCOUNT_DOES_NOT_EXIST")
+            if expiration <= self.clock():
+                raise NodeError(400, "Invalid transaction: TRANSACTION_EXPIRED", vm_error_code="TRANSACTION_EXPIRED")
+            if sequence_number < self.sequence_numbers[sender]:
+                raise NodeError(400, "Invalid transaction: SEQUENCE_NUMBER_TOO_OLD",
+                                vm_error_code="SEQUENCE_NUMBER_TOO_OLD")
+            if self.simulator.ledger.balance(APTOS_COIN, sender) < max_gas * gas_price:
+                raise NodeError(400, "Invalid transaction: INSUFFICIENT_BALANCE_FOR_TRANSACTION_FEE",
+                                vm_error_code="INSUFFICIENT_BALANCE_FOR_TRANSACTION_FEE")
+            parked = self.mempool.setdefault(sender, {})
+            existing = parked.get(sequence_number)
+            if existing is not None and existing["hash"] != tx_hash:
+                raise NodeError(400, "Transaction already in mempool with a different payload",
+                                "transaction_in_mempool")
+            if len(parked) >= MAX_PARKED_PER_ACCOUNT and existing is None:
+                raise NodeError(400, "Mempool is full for this account", "mempool_is_full")
+            parked[sequence_number] = pending
+            self.by_hash[tx_hash] = {**pending, "type": "pending_transaction"}
+            self._drain(sender)
+            return self.by_hash[tx_hash]
+
+    def transaction_by_hash(self, tx_hash: str) -> Dict[str, Any]:
+        with self._lock:
+            self._expire()
+            tx = self.by_hash.get(tx_hash)
+            if tx is None:
+                raise NodeError(404, f"Transaction not found by Transaction hash({tx_hash})",
+                                "transaction_not_found")
+            return tx
+
+    def transaction_by_version(self, version: int) -> Dict[str, Any]:
+        with self._lock:
+            if not 0 <= version < len(self.transactions):
+                raise NodeError(404, f"Transaction not found by Ledger version({version})",
+                                "transaction_not_found")
+            return self.transactions[version]
+
+    def list_transactions(self, start: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self.transactions[start:start + limit]
+
+    def account_transactions(self, address: str, start: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """Committed transactions the account sent, from sequence number `start` on"""
+        sender = normalize_address(address)
+        with self._lock:
+            sent = [tx for tx in self.transactions
+                    if tx.get("sender") == sender and int(tx["sequence_number"]) >= start]
+            return sent[:limit]
+
+    # Indexer
+
+    def indexer_events(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer the events query the event indexer sends (see event_indexer.EVENTS_QUERY) from its
+        variables: event types, a (version, event_index) position to read after and a limit"""
+        variables = (body or {}).get("variables") or {}
+        types = {_normalize_type(event_type) for event_type in variables.get("types") or []}
+        after = (int(variables.get("version", -1)), int(variables.get("index", -1)))
+        limit = int(variables.get("limit", 100))
+        events = []
+        with self._lock:
+            for version in range(max(after[0], self.indexer_oldest_version, 0), len(self.transactions)):
+                for index, event in enumerate(self.transactions[version]["events"]):
+                    if (version, index) <= after or _normalize_type(event["type"]) not in types:
+                        continue
+                    events.append({"transaction_version": version, "event_index": index,
+                                   "type": event["type"], "data": event["data"]})
+                    if len(events) == limit:
+                        return {"data": {"events": events}}
+        return {"data": {"events": events}}
+
+    # Views
+
+    def view(self, request: Dict[str, Any]) -> List[Any]:
+        module, name, values, abi = self._resolve(request.get("function", ""), request.get("arguments", []))
+        if not abi.view:
+            raise NodeError(400, f"{module}::{name} is not a view function")
+        with self._lock:
+            try:
+                result = getattr(self.simulator.module(module), name)(*values)
+            except (MoveAbort, VmError) as error:
+                raise NodeError(400, f"Invalid view function: {error}", "invalid_input",
+                                vm_error_code="ABORTED")
+        return encode_value(list(result) if isinstance(result, tuple) else [result])
+
+    # Internals
+
+    def _signing_message(self, transaction: Dict[str, Any]) -> bytes:
+        raw = {key: transaction.get(key) for key in
+               ("sender", "sequence_number", "max_gas_amount", "gas_unit_price",
+                "expiration_timestamp_secs", "payload")}
+        raw["chain_id"] = CHAIN_ID
+        return RAW_TRANSACTION_SALT + json.dumps(raw, sort_keys=True, separators=(",", ":")).encode()
+
+    def _decode_payload(self, payload: Dict[str, Any]):
+        if not isinstance(payload, dict) or payload.get("type") != "entry_function_payload":
+            raise NodeError(400, "Only entry_function_payload transactions are supported")
+        return self._resolve(payload.get("function", ""), payload.get("arguments", []), entry=True)
+
+    def _resolve(self, function: str, arguments: List[Any], entry: bool = False
+                 ) -> Tuple[str, str, List[Any], Optional[FunctionAbi]]:
+        """Split and decode `0xaddr::module::function`; unknown functions fail at execution like
+        they do on chain, so only argument errors are rejected here"""
+        parts = function.split("::")
+        if len(parts) != 3:
+            raise NodeError(400, f"Invalid function: {function}")
+        address, module, name = parts
+        abi = self.abi.get(f"{module}::{name}")
+        if normalize_address(address) != self.module_address or abi is None:
+            if entry:
+                return module, name, [], None
+            raise NodeError(400, f"Function not found: {function}", "invalid_input")
+        if len(arguments) != len(abi.params):
+            raise NodeError(400, f"{function} expects {len(abi.params)} arguments, got {len(arguments)}")
+        try:
+            values = [decode_argument(t, v) for t, v in zip(abi.params, arguments)]
+        except (TypeError, ValueError) as error:
+            raise NodeError(400, f"Invalid argument for {function}: {error}")
+        return module, name, values, abi
+
+    def _drain(self, sender: str):
+        parked = self.mempool.get(sender, {})
+        while self.sequence_numbers[sender] in parked:
+            self._execute(parked.pop(self.sequence_numbers[sender]))
+
+    def _expire(self):
+        now = self.clock()
+        for sender, parked in self.mempool.items():
+            for sequence_number, tx in list(parked.items()):
+                if int(tx["expiration_timestamp_secs"]) <= now:
+                    del parked[sequence_number]
+                    self.by_hash.pop(tx["hash"], None)
+
+    def _execute(self, tx: Dict[str, Any]):
+        sender = tx["sender"]
+        module, name, values, abi = self._decode_payload(tx["payload"])
+        method = None
+        if abi is not None and abi.entry:
+            method = getattr(getattr(self.simulator, module, None), name, None)
+        steps_before = self.simulator.steps
+        events_before = len(self.simulator.events)
+        if method is None:
+            success = False
+            status = "LINKER_ERROR" if not hasattr(self.simulator, module) else "FUNCTION_RESOLUTION_FAILURE"
+        else:
+            try:
+                method(*([sender] if abi.signer else []), *values)
+                success, status = True, "Executed successfully"
+            except (MoveAbort, VmError) as error:
+                success, status = False, str(error)
+        events = []
+        if success:
+            events = [self._event_json(event) for event in self.simulator.events[events_before:]]
+
+        gas_used = BASE_GAS + STEP_GAS * (self.simulator.steps - steps_before)
+        fee = min(gas_used * int(tx["gas_unit_price"]), self.simulator.ledger.balance(APTOS_COIN, sender))
+        self.simulator.ledger.withdraw(APTOS_COIN, sender, fee)
+        self.sequence_numbers[sender] += 1
+        self._commit(tx, success, status, gas_used, events)
+
+    def _commit(self, tx: Dict[str, Any], success: bool, vm_status: str, gas_used: int,
+                events: List[Dict[str, Any]]):
+        version = len(self.transactions)
+        for event in events:
+            event["version"] = str(version)
+        committed = {
+            **tx,
+            "type": "user_transaction",
+            "version": str(version),
+            "success": success,
+            "vm_status": vm_status,
+            "gas_used": str(gas_used),
+            "events": events,
+            "timestamp": str(int(self.clock() * 1_000_000)),
+        }
+        self.transactions.append(committed)
+        self.by_hash[tx["hash"]] = committed
+
+    def _event_json(self, event) -> Dict[str, Any]:
+        # Module events carry no handle: the API reports a zero GUID and sequence number
+        return {
+            "guid": {"creation_number": "0", "account_address": "0x0"},
+            "sequence_number": "0",
+            "type": event.type,
+            "data": encode_value(event.data),
+        }
+
+
+class NodeRequestHandler(BaseHTTPRequestHandler):
+    """Routes REST paths to a FakeAptosNode"""
+
+    node: FakeAptosNode = None
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; without TCP_NODELAY each reply waits on a delayed ACK
+    disable_nagle_algorithm = True
+
+    ROUTES = [
+        ("GET", r"/v1/?", lambda node, m, q, b: node.ledger_info()),
+        ("GET", r"/v1/accounts/([^/]+)", lambda node, m, q, b: node.get_account(m[0])),
+        ("GET", r"/v1/accounts/([^/]+)/resource/(.+)", lambda node, m, q, b: node.get_resource(m[0], m[1])),
+        ("GET", r"/v1/accounts/([^/]+)/transactions",
+         lambda node, m, q, b: node.account_transactions(m[0], _int(q, "start", 0), _int(q, "limit", 100))),
+        ("POST", r"/v1/transactions/encode_submission", lambda node, m, q, b: node.encode_submission(b)),
+        ("POST", r"/v1/transactions", lambda node, m, q, b: node.submit(b)),
+        ("GET", r"/v1/transactions",
+         lambda node, m, q, b: node.list_transactions(_int(q, "start", 0), _int(q, "limit", 100))),
+        ("GET", r"/v1/transactions/(?:by_hash|wait_by_hash)/(0x[0-9a-fA-F]+)",
+         lambda node, m, q, b: node.transaction_by_hash(m[0])),
+        ("GET", r"/v1/transactions/by_version/(\d+)", lambda node, m, q, b: node.transaction_by_version(int(m[0]))),
+        ("POST", r"/v1/view", lambda node, m, q, b: node.view(b)),
+        ("POST", r"/v1/graphql", lambda node, m, q, b: node.indexer_events(b)),
+        # Faucet: `POST /mint?address=&amount=` (returns hashes) and `POST /fund` with a JSON body
+        ("POST", r"/mint", lambda node, m, q, b: [node.fund(q["address"][0], _int(q, "amount", None))]),
+        ("POST", r"/fund", lambda node, m, q, b: {"txn_hashes": [node.fund(b["address"], b.get("amount"))]}),
+    ]
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self, method: str):
+        url = urllib.parse.urlsplit(self.path)
+        path = urllib.parse.unquote(url.path)
+        query = urllib.parse.parse_qs(url.query)
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length)) if length else None
+        except ValueError:
+            return self._reply(400, {"message": "Invalid JSON body", "error_code": "invalid_input"})
+        for route_method, pattern, handler in self.ROUTES:
+            match = re.fullmatch(pattern, path)
+            if route_method == method and match:
+                try:
+                    return self._reply(200, handler(self.node, match.groups(), query, body))
+                except NodeError as error:
+                    return self._reply(error.status, error.body())
+                except (KeyError, TypeError, ValueError) as error:
+                    return self._reply(400, {"message": f"Invalid request: {error}", "error_code": "invalid_input"})
+        self._reply(404, {"message": f"Unknown endpoint {method} {path}", "error_code": "web_framework_error"})
+
+    def _reply(self, status: int, body: Any):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _int(query: Dict[str, List[str]], key: str, default: Optional[int]) -> Optional[int]:
+    return int(query[key][0]) if key in query else default
+
+
+def _normalize_type(event_type: str) -> str:
+    address, _, rest = event_type.partition("::")
+    return f"{normalize_address(address)}::{rest}"
+
+
+def benchmark(transactions: int = 2000, senders: int = 50, workers: int = 16) -> Dict[str, float]:
+    """Drive USDC mints through the real REST submission engine against a local node"""
+    from accounts import generate_account
+    from backends import TxRequest
+    from submission import HttpTransport, SubmissionEngine
+
+    with FakeAptosNode() as node:
+        accounts = [generate_account() for _ in range(senders)]
+        for account in accounts:
+            node.fund(account.address)
+        engine = SubmissionEngine(HttpTransport(node.url, pool_size=workers), node.module_address,
+                                  max_workers=workers)
+        requests = [
+            TxRequest(accounts[i % senders], "usdc_utils::mint_usdc_for_testing",
+                      [f"address:{accounts[i % senders].address}", "u64:1"])
+            for i in range(transactions)
+        ]
+        start = time.perf_counter()
+        results = engine.submit_batch(requests)
+        elapsed = time.perf_counter() - start
+    succeeded = sum(1 for result in results if result.success)
+    return {
+        "transactions": transactions,
+        "succeeded": succeeded,
+        "elapsed": elapsed,
+        "transactions_per_second": succeeded / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local fake Aptos node backed by the bill splitter simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--module-address", default="0x42")
+    parser.add_argument("--verify-signatures", action="store_true")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="submit N transactions over REST and exit")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.benchmark)
+        print(f"✅ {result['succeeded']}/{result['transactions']} transactions in {result['elapsed']:.2f}s "
+              f"-> {result['transactions_per_second']:,.0f} tx/s")
+        return
+    node = FakeAptosNode(args.module_address, verify_signatures=args.verify_signatures)
+    url = node.start(args.host, args.port)
+    print(f"🛰️  Fake Aptos node at {url} (faucet {node.root_url}), modules at {node.module_address}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        node.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+"""
+Test Harness Instrumentation
+Per-step wall time, subprocess count, CLI vs Python time, gas and transaction hashes,
+written as JSON Lines or JUnit XML alongside the console output
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+
+
+@dataclass
+class StepRecord:
+    suite: str
+    name: str
+    status: str = PASSED
+    wall_time: float = 0.0
+    cli_time: float = 0.0
+    subprocesses: int = 0
+    transactions: int = 0
+    gas_used: int = 0
+    tx_hashes: List[str] = field(default_factory=list)
+    message: str = ""
+    started_at: str = ""
+    run_id: str = ""
+
+    @property
+    def python_time(self) -> float:
+        """Wall time not spent waiting on child processes"""
+        return max(0.0, self.wall_time - self.cli_time)
+
+    @property
+    def passed(self) -> bool:
+        return self.status == PASSED
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["python_time"] = self.python_time
+        return data
+
+
+# Steps currently being timed, per thread; subprocesses and transactions are charged to the
+# innermost one. Worker threads see the steps open where their work was submitted (carry_steps).
+_local = threading.local()
+_lock = threading.Lock()
+
+
+def _active() -> List[StepRecord]:
+    if not hasattr(_local, "steps"):
+        _local.steps = []
+    return _local.steps
+
+
+def _charge(update: Callable[[StepRecord], None]):
+    active = _active()
+    if active:
+        with _lock:  # Workers carrying the same step charge it concurrently
+            update(active[-1])
+
+
+def carry_steps(function: Callable) -> Callable:
+    """Wrap `function` for a worker pool so that what it runs is charged to the steps open here"""
+    steps = list(_active())
+
+    def run(*args, **kwargs):
+        previous = _active()
+        _local.steps = list(steps)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.steps = previous
+    return run
+
+
+def charge_subprocess(elapsed: float):
+    """Count one child process and its duration against the active step"""
+    def update(step: StepRecord):
+        step.subprocesses += 1
+        step.cli_time += elapsed
+    _charge(update)
+
+
+def record_transactions(results):
+    """Charge gas and hashes of executed transactions (TxResult-like objects) to the active step"""
+    results = list(results)
+
+    def update(step: StepRecord):
+        for result in results:
+            step.transactions += 1
+            step.gas_used += result.gas_used or 0
+            if result.hash:
+                step.tx_hashes.append(result.hash)
+    _charge(update)
+
+
+class Recorder:
+    """Collects StepRecords for one harness run and writes them out"""
+
+    def __init__(self, suite: str, jsonl_path: Optional[str] = None, junit_path: Optional[str] = None):
+        self.suite = suite
+        self.jsonl_path = jsonl_path
+        self.junit_path = junit_path
+        self.run_id = uuid.uuid4().hex[:12]
+        self.records: List[StepRecord] = []
+
+    @classmethod
+    def from_args(cls, suite: str, args) -> "Recorder":
+        return cls(suite, getattr(args, "jsonl", None), getattr(args, "junit", None))
+
+    @contextmanager
+    def step(self, name: str):
+        """Time a step; the body sets `record.status`/`record.message` or raises"""
+        record = StepRecord(self.suite, name, run_id=self.run_id,
+                            started_at=datetime.now(timezone.utc).isoformat())
+        _active().append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception as error:
+            record.status = ERROR
+            record.message = f"{type(error).__name__}: {error}"
+            raise
+        finally:
+            record.wall_time = time.perf_counter() - start
+            _active().remove(record)
+            self.records.append(record)
+
+    def run_test(self, name: str, test: Callable[[], Any]) -> StepRecord:
+        """Run a harness test function that returns a truthy value on success"""
+        try:
+            with self.step(name) as record:
+                if not test():
+                    record.status = FAILED
+        except Exception as error:
+            print(f"✗ {name} failed with error: {error}")
+        return self.records[-1]
+
+    @property
+    def results(self) -> Dict[str, bool]:
+        return {record.name: record.passed for record in self.records}
+
+    def summary(self) -> str:
+        lines = [f"{'step':<28}{'status':>8}{'wall s':>9}{'cli s':>9}{'py s':>9}{'procs':>7}{'txs':>6}{'gas':>10}"]
+        for r in self.records:
+            lines.append(
+                f"{r.name[:27]:<28}{r.status:>8}{r.wall_time:>9.2f}{r.cli_time:>9.2f}{r.python_time:>9.2f}"
+                f"{r.subprocesses:>7}{r.transactions:>6}{r.gas_used:>10}"
+            )
+        return "\n".join(lines)
+
+    def write(self):
+        """Write to whichever outputs were configured"""
+        if self.jsonl_path:
+            self.write_jsonl(self.jsonl_path)
+            print(f"📝 Step results appended to {self.jsonl_path}")
+        if self.junit_path:
+            self.write_junit(self.junit_path)
+            print(f"📝 JUnit report written to {self.junit_path}")
+
+    def write_jsonl(self, path: str):
+        """Append one line per step so successive runs accumulate in one file"""
+        with open(path, "a") as f:
+            for record in self.records:
+                f.write(json.dumps(record.to_dict()) + "\n")
+
+    def write_junit(self, path: str):
+        suite = ET.Element("testsuite", {
+            "name": self.suite,
+            "tests": str(len(self.records)),
+            "failures": str(sum(1 for r in self.records if r.status == FAILED)),
+            "errors": str(sum(1 for r in self.records if r.status == ERROR)),
+            "time": f"{sum(r.wall_time for r in self.records):.3f}",
+            "timestamp": self.records[0].started_at if self.records else "",
+        })
+        for record in self.records:
+            case = ET.SubElement(suite, "testcase", {
+                "classname": self.suite, "name": record.name, "time": f"{record.wall_time:.3f}",
+            })
+            properties = ET.SubElement(case, "properties")
+            for key in ("cli_time", "python_time", "subprocesses", "transactions", "gas_used", "run_id"):
+                value = getattr(record, key)
+                ET.SubElement(properties, "property", {
+                    "name": key, "value": f"{value:.3f}" if isinstance(value, float) else str(value),
+                })
+            if record.status == FAILED:
+                ET.SubElement(case, "failure", {"message": record.message or "step returned False"})
+            elif record.status == ERROR:
+                ET.SubElement(case, "error", {"message": record.message})
+            if record.tx_hashes:
+                ET.SubElement(case, "system-out").text = "\n".join(record.tx_hashes)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def add_output_arguments(parser):
+    """--jsonl/--junit flags shared by the harness scripts"""
+    parser.add_argument("--jsonl", default=os.environ.get("BILL_SPLIT_RESULTS_JSONL"),
+                        help="append per-step results as JSON Lines")
+    parser.add_argument("--junit", default=os.environ.get("BILL_SPLIT_RESULTS_JUNIT"),
+                        help="write per-step results as JUnit XML")
+    return parser
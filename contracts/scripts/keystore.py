@@ -0,0 +1,155 @@
+"""
+Persistent Test Account Keystore
+Caches provisioned admin, merchant and participant accounts per network so repeat runs can reuse them
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict
+from typing import Callable, Dict, List, Optional
+
+from accounts import TestAccount
+
+DEFAULT_KEYSTORE_PATH = os.environ.get(
+    "BILL_SPLIT_KEYSTORE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".test_keystore.json"),
+)
+
+FAUCET_AMOUNT = 100_000_000  # 1 APT in octas per faucet call
+MIN_APT_BALANCE = 20_000_000  # Top up accounts that drop below 0.2 APT
+MAX_ACCOUNT_AGE = 7 * 24 * 3600  # Devnet resets weekly; older entries are likely gone
+
+KEYSTORE_VERSION = 1
+
+
+class AccountKeystore:
+    """JSON-backed cache of TestAccount records keyed by network"""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_KEYSTORE_PATH,
+        network: str = "testnet",
+        min_balance: int = MIN_APT_BALANCE,
+        max_age: float = MAX_ACCOUNT_AGE,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.network = network
+        self.min_balance = min_balance
+        self.max_age = max_age
+        self.clock = clock
+        self._data = self._load()
+
+    # Role accounts (admin, merchant)
+
+    def get_role(self, role: str) -> Optional[TestAccount]:
+        entry = self._network()["roles"].get(role)
+        return self._touch(entry) if entry else None
+
+    def put_role(self, role: str, account: TestAccount, apt_balance: int = 0):
+        self._network()["roles"][role] = self._entry(account, apt_balance)
+
+    # Participant pool
+
+    def participants(self, count: int) -> List[TestAccount]:
+        """Return up to `count` cached participant accounts"""
+        entries = self._network()["participants"][:count]
+        return [self._touch(entry) for entry in entries]
+
+    def add_participants(self, accounts: List[TestAccount], apt_balance: int = 0):
+        known = {entry["address"] for entry in self._network()["participants"]}
+        for account in accounts:
+            if account.address not in known:
+                self._network()["participants"].append(self._entry(account, apt_balance))
+                known.add(account.address)
+
+    # Balances
+
+    def apt_balance(self, address: str) -> int:
+        entry = self._find(address)
+        return entry["apt_balance"] if entry else 0
+
+    def needs_top_up(self, address: str) -> bool:
+        return self.apt_balance(address) < self.min_balance
+
+    def record_apt_balance(self, address: str, balance: int):
+        entry = self._find(address)
+        if entry:
+            entry["apt_balance"] = balance
+
+    def record_funding(self, address: str, amount: int = FAUCET_AMOUNT):
+        entry = self._find(address)
+        if entry:
+            entry["apt_balance"] += amount
+
+    def update_balance(self, account: TestAccount):
+        """Persist the test token balance tracked on a TestAccount"""
+        entry = self._find(account.address)
+        if entry:
+            entry["balance"] = account.balance
+
+    # Maintenance
+
+    def evict_stale(self) -> int:
+        """Drop entries not used within max_age; returns how many were removed"""
+        cutoff = self.clock() - self.max_age
+        network = self._network()
+        before = len(network["participants"]) + len(network["roles"])
+        network["participants"] = [e for e in network["participants"] if e["last_used"] >= cutoff]
+        network["roles"] = {r: e for r, e in network["roles"].items() if e["last_used"] >= cutoff}
+        return before - len(network["participants"]) - len(network["roles"])
+
+    def evict(self, address: str):
+        network = self._network()
+        network["participants"] = [e for e in network["participants"] if e["address"] != address]
+        network["roles"] = {r: e for r, e in network["roles"].items() if e["address"] != address}
+
+    def clear(self):
+        self._data["networks"].pop(self.network, None)
+
+    def save(self):
+        """Atomically write the keystore, readable only by the current user"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    # Internals
+
+    def _load(self) -> Dict:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict) or data.get("version") != KEYSTORE_VERSION:
+            data = {"version": KEYSTORE_VERSION, "networks": {}}
+        return data
+
+    def _network(self) -> Dict:
+        return self._data["networks"].setdefault(self.network, {"roles": {}, "participants": []})
+
+    def _find(self, address: str) -> Optional[Dict]:
+        network = self._network()
+        for entry in list(network["roles"].values()) + network["participants"]:
+            if entry["address"] == address:
+                return entry
+        return None
+
+    def _entry(self, account: TestAccount, apt_balance: int) -> Dict:
+        now = self.clock()
+        entry = asdict(account)
+        entry.update(apt_balance=apt_balance, created_at=now, last_used=now)
+        return entry
+
+    def _touch(self, entry: Dict) -> TestAccount:
+        entry["last_used"] = self.clock()
+        return TestAccount(
+            address=entry["address"],
+            private_key=entry["private_key"],
+            balance=entry.get("balance", 0),
+        )
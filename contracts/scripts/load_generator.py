@@ -0,0 +1,313 @@
+"""
+Bill Session Load Generator
+Starts bill lifecycles (create -> confirm -> sign -> pay) at a target rate against any
+backend and reports per-stage latency percentiles and sustained throughput
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from accounts import TestAccount
+from backends import TxRequest, TxResult
+from instrumentation import carry_steps
+
+STAGES = ("queue", "create", "confirm", "sign", "pay", "lifecycle")
+
+
+class StageError(Exception):
+    """A backend error raised while a lifecycle was in `stage`"""
+
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(f"{stage}: {error}")
+        self.stage = stage
+
+
+class Distribution:
+    """Sampling spec parsed from `fixed:5`, `uniform:3-10`, `choice:3,5,20` or `exp:0.2` (mean)"""
+
+    KINDS = ("fixed", "uniform", "choice", "exp")
+
+    def __init__(self, kind: str, values: List[float], integer: bool = False):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown distribution: {kind}")
+        self.kind = kind
+        self.values = values
+        self.integer = integer
+
+    @classmethod
+    def parse(cls, spec: str, integer: bool = False) -> "Distribution":
+        kind, _, raw = spec.partition(":")
+        if not raw:
+            kind, raw = "fixed", kind
+        separator = "-" if kind == "uniform" else ","
+        values = [float(value) for value in raw.split(separator)]
+        if kind == "uniform" and (len(values) != 2 or values[0] > values[1]):
+            raise ValueError(f"uniform needs low-high: {spec}")
+        return cls(kind, values, integer)
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            value = self.values[0]
+        elif self.kind == "uniform":
+            low, high = self.values
+            value = rng.randint(int(low), int(high)) if self.integer else rng.uniform(low, high)
+        elif self.kind == "choice":
+            value = rng.choice(self.values)
+        else:
+            value = rng.expovariate(1.0 / self.values[0]) if self.values[0] > 0 else 0.0
+        return int(value) if self.integer else value
+
+    def __repr__(self) -> str:
+        return f"{self.kind}:{self.values}"
+
+
+@dataclass
+class LoadConfig:
+    rate: float = 10.0  # sessions started per second
+    sessions: int = 100
+    participants: Distribution = field(default_factory=lambda: Distribution("uniform", [3, 8], integer=True))
+    threshold_ratio: float = 0.67
+    payment_delay: Distribution = field(default_factory=lambda: Distribution("fixed", [0.0]))
+    share: int = 1_000  # amount owed per participant, in octas
+    workers: int = 32
+    seed: Optional[int] = None
+
+
+@dataclass
+class StageStats:
+    count: int
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class LoadReport:
+    config: Dict[str, object]
+    started: int
+    completed: int
+    failures: Dict[str, int]
+    elapsed: float
+    transactions: int
+    stages: Dict[str, StageStats]
+
+    @property
+    def throughput(self) -> float:
+        """Completed lifecycles per second over the whole run"""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        lines = [
+            f"{self.completed}/{self.started} lifecycles completed in {self.elapsed:.2f}s "
+            f"-> {self.throughput:.1f} sessions/s sustained "
+            f"(target {self.config['rate']}/s, {self.transactions} transactions)",
+            f"{'stage':<10}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+        ]
+        for stage, stats in self.stages.items():
+            lines.append(
+                f"{stage:<10}{stats.count:>7}{stats.p50 * 1000:>10.2f}{stats.p95 * 1000:>10.2f}"
+                f"{stats.p99 * 1000:>10.2f}{stats.max * 1000:>10.2f}"
+            )
+        if self.failures:
+            lines.append("failures: " + ", ".join(f"{stage}={count}" for stage, count in self.failures.items()))
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, object]:
+        data = asdict(self)
+        data["throughput"] = self.throughput
+        return data
+
+
+class LoadGenerator:
+    """Open-loop generator: lifecycles start on schedule whether or not earlier ones finished,
+    so a saturated backend shows up as growing queue and stage latencies"""
+
+    def __init__(
+        self,
+        backend,
+        merchant: TestAccount,
+        config: LoadConfig,
+        account_factory: Optional[Callable[[], TestAccount]] = None,
+        accounts: Optional[List[TestAccount]] = None,
+    ):
+        if account_factory is None and not accounts:
+            raise ValueError("Provide participant accounts or an account_factory")
+        self.backend = backend
+        self.merchant = merchant
+        self.config = config
+        self.account_factory = account_factory
+        self.accounts = accounts or []
+        self.rng = random.Random(config.seed)
+        self.run_id = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._timings: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+        self._failures: Dict[str, int] = {}
+        self._transactions = 0
+        self._completed = 0
+
+    def run(self) -> LoadReport:
+        plans = [self._plan(index) for index in range(self.config.sessions)]
+        start = time.perf_counter()
+        futures = []
+        lifecycle = carry_steps(self._lifecycle)
+        with ThreadPoolExecutor(max_workers=self.config.workers) as pool:
+            for index, plan in enumerate(plans):
+                scheduled = start + index / self.config.rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(lifecycle, plan, scheduled))
+        elapsed = time.perf_counter() - start
+        for future in futures:
+            try:
+                future.result()
+            except StageError as error:
+                self._fail(error.stage)
+            except Exception:
+                self._fail("lifecycle")
+
+        stages = {}
+        for stage in STAGES:
+            values = sorted(self._timings[stage])
+            stages[stage] = StageStats(len(values), percentile(values, 0.50), percentile(values, 0.95),
+                                       percentile(values, 0.99), values[-1] if values else 0.0)
+        config = asdict(self.config)
+        config["participants"] = repr(self.config.participants)
+        config["payment_delay"] = repr(self.config.payment_delay)
+        return LoadReport(config, len(plans), self._completed, dict(self._failures), elapsed,
+                          self._transactions, stages)
+
+    def _plan(self, index: int) -> Dict[str, object]:
+        """Draw everything random up front so worker threads never share the RNG"""
+        count = max(1, int(self.config.participants.sample(self.rng)))
+        if self.accounts:
+            participants = self.rng.sample(self.accounts, min(count, len(self.accounts)))
+        else:
+            participants = [self.account_factory() for _ in range(count)]
+        return {
+            "session_id": f"LOAD_{self.run_id}_{index}",
+            "participants": participants,
+            "required": max(1, math.ceil(self.config.threshold_ratio * len(participants))),
+            "delays": sorted((self.config.payment_delay.sample(self.rng), n) for n in range(len(participants))),
+        }
+
+    def _lifecycle(self, plan: Dict[str, object], scheduled: float):
+        started = time.perf_counter()
+        self._record("queue", started - scheduled)
+        session_id = plan["session_id"]
+        participants: List[TestAccount] = plan["participants"]
+        required = plan["required"]
+        share = self.config.share
+
+        addresses = ",".join(p.address for p in participants)
+        names = ",".join(f"Guest_{n}" for n in range(len(participants)))
+        if not self._stage("create", [TxRequest(self.merchant, "bill_splitter::create_bill_session", [
+            f"string:{session_id}", f"u64:{share * len(participants)}", "string:Load test",
+            f"vector<address>:{addresses}", f"vector<string>:{names}", f"u64:{required}",
+        ])]):
+            return
+        if not self._stage("confirm", [TxRequest(self.merchant, "bill_splitter::confirm_participants",
+                                                 [f"string:{session_id}"])]):
+            return
+        if not self._stage("sign", [
+            TxRequest(p, "bill_splitter::sign_bill_agreement", [f"string:{session_id}"])
+            for p in participants[:required]
+        ]):
+            return
+
+        # Payments go out as their sampled delay (from approval) elapses
+        pay_start = time.perf_counter()
+        delays = list(plan["delays"])
+        while delays:
+            wait = delays[0][0] - (time.perf_counter() - pay_start)
+            if wait > 0:
+                time.sleep(wait)
+            elapsed = time.perf_counter() - pay_start
+            due = [n for delay, n in delays if delay <= elapsed]
+            delays = [(delay, n) for delay, n in delays if delay > elapsed]
+            results = self._submit("pay", [
+                TxRequest(participants[n], "bill_splitter::submit_payment", [f"string:{session_id}", f"u64:{share}"])
+                for n in due
+            ])
+            if not all(result.success for result in results):
+                self._fail("pay")
+                return
+        self._record("pay", time.perf_counter() - pay_start)
+        self._record("lifecycle", time.perf_counter() - scheduled)
+        with self._lock:
+            self._completed += 1
+
+    def _stage(self, stage: str, requests: List[TxRequest]) -> bool:
+        start = time.perf_counter()
+        results = self._submit(stage, requests)
+        if not all(result.success for result in results):
+            self._fail(stage)
+            return False
+        self._record(stage, time.perf_counter() - start)
+        return True
+
+    def _submit(self, stage: str, requests: List[TxRequest]) -> List[TxResult]:
+        try:
+            results = self.backend.run_many(requests)
+        except Exception as error:
+            raise StageError(stage, error) from error
+        with self._lock:
+            self._transactions += len(results)
+        return results
+
+    def _record(self, stage: str, seconds: float):
+        with self._lock:
+            self._timings[stage].append(seconds)
+
+    def _fail(self, stage: str):
+        with self._lock:
+            self._failures[stage] = self._failures.get(stage, 0) + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bill session load generator (in-process simulator)")
+    parser.add_argument("--rate", type=float, default=200.0, help="target sessions per second")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--participants", default="uniform:3-8", help="participant count distribution")
+    parser.add_argument("--threshold", type=float, default=0.67, help="required signatures / participants")
+    parser.add_argument("--payment-delay", default="fixed:0", help="seconds from approval to each payment")
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    from bill_simulator import SimulatorBackend
+
+    backend = SimulatorBackend()
+    config = LoadConfig(
+        rate=args.rate,
+        sessions=args.sessions,
+        participants=Distribution.parse(args.participants, integer=True),
+        threshold_ratio=args.threshold,
+        payment_delay=Distribution.parse(args.payment_delay),
+        workers=args.workers,
+        seed=args.seed,
+    )
+    report = LoadGenerator(backend, backend.new_account(), config, account_factory=backend.new_account).run()
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.describe())
+
+
+if __name__ == "__main__":
+    main()
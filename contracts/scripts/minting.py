@@ -0,0 +1,124 @@
+"""
+Batched Test Token Minting
+Packs recipients into usdc_utils::batch_mint_usdc_for_testing calls sized to fit the
+transaction gas and size limits, bisecting chunks that fail to isolate bad recipients
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from accounts import TestAccount
+from backends import TxRequest, TxResult
+from submission import DEFAULT_MAX_GAS_AMOUNT
+
+BATCH_MINT_FUNCTION = "usdc_utils::batch_mint_usdc_for_testing"
+
+# Rough per-call costs: one coin mint plus one deposit per recipient, and a fixed overhead
+# for the transaction itself. Over-estimating only makes chunks smaller.
+GAS_PER_RECIPIENT = 600
+BASE_TRANSACTION_GAS = 2_000
+
+MAX_TRANSACTION_BYTES = 64 * 1024  # Regular (non-governance) transaction size limit
+TRANSACTION_OVERHEAD_BYTES = 1_024  # Signature, authenticator, function id, headers
+BYTES_PER_RECIPIENT = 32 + 8  # BCS address + u64 amount
+MAX_CHUNK_SIZE = 500
+
+
+def choose_chunk_size(
+    max_gas_amount: int = DEFAULT_MAX_GAS_AMOUNT,
+    gas_per_recipient: int = GAS_PER_RECIPIENT,
+    max_transaction_bytes: int = MAX_TRANSACTION_BYTES,
+) -> int:
+    """Largest number of recipients that fits both the gas budget and the transaction size limit"""
+    by_gas = (max_gas_amount - BASE_TRANSACTION_GAS) // gas_per_recipient
+    by_size = (max_transaction_bytes - TRANSACTION_OVERHEAD_BYTES) // BYTES_PER_RECIPIENT
+    return max(1, min(by_gas, by_size, MAX_CHUNK_SIZE))
+
+
+@dataclass
+class MintOutcome:
+    address: str
+    amount: int
+    success: bool = False
+    hash: Optional[str] = None
+    vm_status: str = ""
+
+
+@dataclass
+class MintReport:
+    outcomes: List[MintOutcome]
+    transactions: int
+    gas_used: int
+    bisections: int
+    elapsed: float
+    results: List[TxResult] = field(default_factory=list, repr=False)
+
+    @property
+    def minted(self) -> int:
+        return sum(1 for outcome in self.outcomes if outcome.success)
+
+    @property
+    def failed(self) -> List[MintOutcome]:
+        return [outcome for outcome in self.outcomes if not outcome.success]
+
+    def describe(self) -> str:
+        return (
+            f"{self.minted}/{len(self.outcomes)} accounts minted in {self.transactions} transactions "
+            f"({self.bisections} chunks bisected, {self.gas_used} gas) in {self.elapsed:.2f}s"
+        )
+
+
+class BatchMinter:
+    """Mint test USDC for many accounts with as few transactions as possible"""
+
+    def __init__(self, backend, admin: TestAccount, chunk_size: Optional[int] = None):
+        self.backend = backend
+        self.admin = admin
+        self.chunk_size = chunk_size or choose_chunk_size()
+
+    def mint(self, accounts: List[TestAccount], amount: int) -> MintReport:
+        """Mint `amount` for every account; outcomes are returned in account order"""
+        return self.mint_amounts({account.address: amount for account in accounts})
+
+    def mint_amounts(self, amounts: Dict[str, int]) -> MintReport:
+        start = time.perf_counter()
+        outcomes = [MintOutcome(address, amount) for address, amount in amounts.items()]
+        results: List[TxResult] = []
+        bisections = 0
+
+        # All chunks of a round go out together; failed chunks are split in half for the next
+        # round until the failing recipients are isolated on their own
+        pending = [
+            outcomes[i:i + self.chunk_size] for i in range(0, len(outcomes), self.chunk_size)
+        ]
+        while pending:
+            round_results = self.backend.run_many([self._request(chunk) for chunk in pending])
+            results.extend(round_results)
+            retry = []
+            for chunk, result in zip(pending, round_results):
+                if result.success or len(chunk) == 1:
+                    for outcome in chunk:
+                        outcome.success = result.success
+                        outcome.hash = result.hash
+                        outcome.vm_status = result.vm_status
+                else:
+                    bisections += 1
+                    middle = len(chunk) // 2
+                    retry += [chunk[:middle], chunk[middle:]]
+            pending = retry
+
+        return MintReport(
+            outcomes=outcomes,
+            transactions=len(results),
+            gas_used=sum(result.gas_used for result in results),
+            bisections=bisections,
+            elapsed=time.perf_counter() - start,
+            results=results,
+        )
+
+    def _request(self, chunk: List[MintOutcome]) -> TxRequest:
+        return TxRequest(self.admin, BATCH_MINT_FUNCTION, [
+            "vector<address>:" + ",".join(outcome.address for outcome in chunk),
+            "vector<u64>:" + ",".join(str(outcome.amount) for outcome in chunk),
+        ])
@@ -0,0 +1,253 @@
+"""
+Move Build Cache
+Content-addressed cache for `aptos move compile`/`aptos move test`: results and the build/
+directory are stored under a hash of Move.toml, sources/*.move and tests/*.move, so unchanged
+sources never reach the CLI twice
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from cli_runner import run_command
+
+CONTRACTS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+DEFAULT_CACHE_DIR = os.environ.get("BILL_SPLIT_MOVE_CACHE", os.path.join(CONTRACTS_DIR, ".move_cache"))
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_ENTRIES = 32
+
+# Compiler diagnostics are a property of the sources, so these failures are safe to cache.
+# Anything else (missing CLI, dependency fetch errors, timeouts) is retried next time.
+DETERMINISTIC_FAILURE_MARKERS = ("error[E", "Test result: FAILED")
+
+
+def package_inputs(package_dir: str) -> List[str]:
+    """Files whose contents determine compile and test results, in a stable order"""
+    files = [os.path.join(package_dir, "Move.toml")]
+    for pattern in ("sources/*.move", "tests/*.move"):
+        files += sorted(glob.glob(os.path.join(package_dir, pattern)))
+    return [path for path in files if os.path.isfile(path)]
+
+
+def source_fingerprint(package_dir: str) -> str:
+    digest = hashlib.sha256()
+    for path in package_inputs(package_dir):
+        digest.update(os.path.relpath(path, package_dir).replace(os.sep, "/").encode())
+        digest.update(b"\0")
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def command_key(command: List[str]) -> str:
+    """Cache key for a CLI invocation; the executable path is irrelevant"""
+    return " ".join(command[1:])
+
+
+@dataclass
+class CachedRun:
+    command: str
+    returncode: int
+    stdout: str
+    stderr: str
+    duration: float
+    fingerprint: str
+    cached: bool = False
+
+    @property
+    def success(self) -> bool:
+        return self.returncode == 0
+
+
+class MoveBuildCache:
+    """Cache entries live in `<root>/<fingerprint>/` with verdicts.json and a build/ snapshot"""
+
+    def __init__(
+        self,
+        root: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        enabled: bool = True,
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.enabled = enabled and os.environ.get("BILL_SPLIT_NO_MOVE_CACHE") is None
+        self.hits = 0
+        self.misses = 0
+
+    def run(self, command: List[str], package_dir: str = CONTRACTS_DIR, timeout: float = 120.0,
+            key: Optional[str] = None, snapshot_build: bool = True) -> CachedRun:
+        """Return the cached result of `command` for the current sources, or run and cache it.
+
+        `key` overrides the cache key for commands with run-specific arguments (such as a
+        temporary --output-dir); `snapshot_build=False` caches the verdict without build/.
+        """
+        package_dir = os.path.abspath(package_dir)
+        fingerprint = source_fingerprint(package_dir)
+        key = key or command_key(command)
+
+        if self.enabled:
+            verdict = self._verdicts(fingerprint).get(key)
+            if verdict is not None:
+                self.hits += 1
+                if snapshot_build:
+                    self._restore_build(fingerprint, package_dir)
+                self._touch(fingerprint)
+                return CachedRun(**verdict, cached=True)
+        self.misses += 1
+
+        result = run_command(command, cwd=package_dir, timeout=timeout)
+        if result.timed_out:
+            return CachedRun(key, -1, "", f"{key} timed out after {timeout}s", result.duration, fingerprint)
+        run = CachedRun(key, result.returncode, result.stdout, result.stderr, result.duration, fingerprint)
+
+        output = run.stdout + run.stderr
+        if self.enabled and (run.success or any(marker in output for marker in DETERMINISTIC_FAILURE_MARKERS)):
+            # Sources may have been edited while the CLI ran; never file a result under a stale hash
+            if source_fingerprint(package_dir) == fingerprint:
+                self._store(fingerprint, run, package_dir, snapshot_build)
+        return run
+
+    def invalidate(self, fingerprint: Optional[str] = None, package_dir: Optional[str] = None):
+        """Drop one entry (by fingerprint, or the current sources of `package_dir`)"""
+        if fingerprint is None:
+            fingerprint = source_fingerprint(package_dir or CONTRACTS_DIR)
+        shutil.rmtree(self._entry(fingerprint), ignore_errors=True)
+
+    def clear(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def entries(self) -> List[Dict[str, object]]:
+        """Entries with their size and last use, least recently used first"""
+        if not os.path.isdir(self.root):
+            return []
+        entries = []
+        for name in os.listdir(self.root):
+            path = self._entry(name)
+            if not os.path.isdir(path):
+                continue
+            entries.append({
+                "fingerprint": name,
+                "bytes": _tree_size(path),
+                "last_used": self._read(path).get("last_used", 0.0),
+                "commands": sorted(self._read(path).get("verdicts", {})),
+            })
+        return sorted(entries, key=lambda entry: entry["last_used"])
+
+    def prune(self) -> List[str]:
+        """Evict least recently used entries until both the size and count caps hold"""
+        entries = self.entries()
+        total = sum(entry["bytes"] for entry in entries)
+        evicted = []
+        while entries and (total > self.max_bytes or len(entries) > self.max_entries):
+            oldest = entries.pop(0)
+            shutil.rmtree(self._entry(oldest["fingerprint"]), ignore_errors=True)
+            total -= oldest["bytes"]
+            evicted.append(oldest["fingerprint"])
+        return evicted
+
+    def _store(self, fingerprint: str, run: CachedRun, package_dir: str, snapshot_build: bool = True):
+        path = self._entry(fingerprint)
+        os.makedirs(path, exist_ok=True)
+        meta = self._read(path)
+        verdict = asdict(run)
+        verdict.pop("cached")
+        meta.setdefault("verdicts", {})[run.command] = verdict
+        meta["last_used"] = time.time()
+
+        build_dir = os.path.join(package_dir, "build")
+        if snapshot_build and run.success and os.path.isdir(build_dir):
+            with open(os.path.join(build_dir, ".fingerprint"), "w") as f:
+                f.write(fingerprint)
+            snapshot = os.path.join(path, "build")
+            staging = snapshot + ".tmp"
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.copytree(build_dir, staging)
+            shutil.rmtree(snapshot, ignore_errors=True)
+            os.replace(staging, snapshot)
+        self._write(path, meta)
+        self.prune()
+
+    def _restore_build(self, fingerprint: str, package_dir: str):
+        """Put the cached build/ back unless the package already holds this fingerprint's build"""
+        snapshot = os.path.join(self._entry(fingerprint), "build")
+        build_dir = os.path.join(package_dir, "build")
+        marker = os.path.join(build_dir, ".fingerprint")
+        if not os.path.isdir(snapshot):
+            return
+        if os.path.isfile(marker):
+            with open(marker) as f:
+                if f.read().strip() == fingerprint:
+                    return
+        shutil.rmtree(build_dir, ignore_errors=True)
+        shutil.copytree(snapshot, build_dir)
+        with open(marker, "w") as f:
+            f.write(fingerprint)
+
+    def _verdicts(self, fingerprint: str) -> Dict[str, Dict[str, object]]:
+        return self._read(self._entry(fingerprint)).get("verdicts", {})
+
+    def _touch(self, fingerprint: str):
+        path = self._entry(fingerprint)
+        meta = self._read(path)
+        meta["last_used"] = time.time()
+        self._write(path, meta)
+
+    def _entry(self, fingerprint: str) -> str:
+        return os.path.join(self.root, fingerprint)
+
+    def _read(self, path: str) -> Dict[str, object]:
+        try:
+            with open(os.path.join(path, "verdicts.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, path: str, meta: Dict[str, object]):
+        tmp = os.path.join(path, "verdicts.json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, os.path.join(path, "verdicts.json"))
+
+
+def _tree_size(path: str) -> int:
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                pass
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or invalidate the Move build cache")
+    parser.add_argument("--package-dir", default=CONTRACTS_DIR)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--invalidate", action="store_true", help="drop the entry for the current sources")
+    parser.add_argument("--clear", action="store_true", help="drop every entry")
+    args = parser.parse_args()
+
+    cache = MoveBuildCache(args.cache_dir)
+    if args.clear:
+        cache.clear()
+        print(f"🧹 Cleared {args.cache_dir}")
+    elif args.invalidate:
+        cache.invalidate(package_dir=args.package_dir)
+        print(f"🧹 Invalidated {source_fingerprint(args.package_dir)[:12]}")
+    current = source_fingerprint(args.package_dir)
+    for entry in cache.entries():
+        flag = " (current)" if entry["fingerprint"] == current else ""
+        print(f"  {entry['fingerprint'][:12]}{flag} {entry['bytes'] / 1024:.0f} KiB: {', '.join(entry['commands'])}")
+
+
+if __name__ == "__main__":
+    main()
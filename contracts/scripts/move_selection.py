@@ -0,0 +1,195 @@
+"""
+Incremental Move Test Selection
+Builds the `bill_split::` module graph from sources/ and tests/ and selects only the tests whose
+transitive dependencies changed since they last passed
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from move_cache import CONTRACTS_DIR, DEFAULT_CACHE_DIR, MoveBuildCache
+from move_sharding import MODULE_PATTERN, MoveTest, ShardedRun, ShardedTestRunner, discover_tests
+
+# Both `use bill_split::usdc_utils::USDC;` and inline `bill_split::bill_splitter::create(...)`
+REFERENCE_PATTERN = re.compile(r"\bbill_split::(\w+)")
+DEFAULT_STATE_PATH = os.path.join(DEFAULT_CACHE_DIR, "last_green.json")
+
+
+@dataclass
+class ModuleInfo:
+    name: str
+    path: str
+    digest: str
+    uses: Set[str] = field(default_factory=set)
+
+
+def module_graph(package_dir: str = CONTRACTS_DIR) -> Dict[str, ModuleInfo]:
+    """Module name -> file, content hash and the package modules it references"""
+    modules = {}
+    for path in sorted(glob.glob(os.path.join(package_dir, "sources", "*.move")) +
+                       glob.glob(os.path.join(package_dir, "tests", "*.move"))):
+        with open(path, "rb") as f:
+            source = f.read()
+        digest = hashlib.sha256(source).hexdigest()
+        current = None
+        for line in source.decode().splitlines():
+            line = line.split("//", 1)[0]
+            match = MODULE_PATTERN.match(line)
+            if match:
+                current = modules[match.group(1)] = ModuleInfo(
+                    match.group(1), os.path.relpath(path, package_dir), digest)
+                continue
+            if current is not None:
+                current.uses.update(REFERENCE_PATTERN.findall(line))
+    for info in modules.values():
+        info.uses.discard(info.name)
+    return modules
+
+
+def dependency_closure(graph: Dict[str, ModuleInfo], module: str) -> Set[str]:
+    """`module` plus everything it reaches through `bill_split::` references"""
+    closure = set()
+    pending = [module]
+    while pending:
+        name = pending.pop()
+        if name in closure or name not in graph:
+            continue
+        closure.add(name)
+        pending.extend(graph[name].uses)
+    return closure
+
+
+def closure_digest(graph: Dict[str, ModuleInfo], module: str, manifest: str) -> str:
+    """Hash of Move.toml and every file a test's module depends on"""
+    digest = hashlib.sha256(manifest.encode())
+    for name in sorted(dependency_closure(graph, module)):
+        digest.update(f"{name}:{graph[name].digest}".encode())
+    return digest.hexdigest()
+
+
+def manifest_digest(package_dir: str) -> str:
+    try:
+        with open(os.path.join(package_dir, "Move.toml"), "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+
+@dataclass
+class Selection:
+    tests: List[MoveTest]
+    skipped: List[MoveTest]
+    changed_modules: List[str]
+
+    def describe(self) -> str:
+        changed = ", ".join(self.changed_modules) or "none"
+        return (f"{len(self.tests)} Move tests selected, {len(self.skipped)} unchanged since their "
+                f"last green run (changed modules: {changed})")
+
+
+class IncrementalSelector:
+    """Remembers, per test, the dependency digest it last passed against"""
+
+    def __init__(self, package_dir: str = CONTRACTS_DIR, state_path: str = DEFAULT_STATE_PATH):
+        self.package_dir = os.path.abspath(package_dir)
+        self.state_path = state_path
+
+    def select(self, force_all: bool = False) -> Selection:
+        graph = module_graph(self.package_dir)
+        manifest = manifest_digest(self.package_dir)
+        state = {} if force_all else self._load()
+        green = state.get("tests", {})
+        recorded_modules = state.get("modules", {})
+
+        tests, skipped = [], []
+        for test in discover_tests(self.package_dir):
+            if green.get(test.name) == closure_digest(graph, test.module, manifest):
+                skipped.append(test)
+            else:
+                tests.append(test)
+        changed = sorted(
+            name for name in set(graph) | set(recorded_modules)
+            if recorded_modules.get(name) != (graph[name].digest if name in graph else None)
+        )
+        return Selection(tests, skipped, changed)
+
+    def record(self, run: ShardedRun):
+        """Mark passed tests green at the current sources; failed or missing tests stay selected"""
+        graph = module_graph(self.package_dir)
+        manifest = manifest_digest(self.package_dir)
+        state = self._load()
+        green = state.setdefault("tests", {})
+        for name in run.passed:
+            green[name] = closure_digest(graph, name.split("::")[0], manifest)
+        for name in run.failed + run.missing:
+            green.pop(name, None)
+        state["modules"] = {name: info.digest for name, info in graph.items()}
+        self._save(state)
+
+    def reset(self):
+        try:
+            os.remove(self.state_path)
+        except OSError:
+            pass
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, state: Dict[str, Dict[str, str]]):
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp, self.state_path)
+
+
+def run_changed(runner: ShardedTestRunner, selector: IncrementalSelector,
+                force_all: bool = False) -> Optional[ShardedRun]:
+    """Run the selected tests and record the outcome; None when nothing needs to run"""
+    selection = selector.select(force_all)
+    print(f"🔎 {selection.describe()}")
+    if not selection.tests:
+        return None
+    run = runner.run(selection.tests)
+    selector.record(run)
+    return run
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run only the Move tests affected by source changes")
+    parser.add_argument("--package-dir", default=CONTRACTS_DIR)
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH, help="last green run state file")
+    parser.add_argument("--all", action="store_true", help="ignore the last green run")
+    parser.add_argument("--graph", action="store_true", help="print the module graph and exit")
+    parser.add_argument("--jobs", type=int)
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds per shard")
+    args = parser.parse_args()
+
+    if args.graph:
+        for name, info in sorted(module_graph(args.package_dir).items()):
+            print(f"{name} ({info.path}) -> {', '.join(sorted(info.uses)) or '-'}")
+        return
+    selector = IncrementalSelector(args.package_dir, args.state)
+    runner = ShardedTestRunner(args.package_dir, jobs=args.jobs, shard_timeout=args.timeout,
+                               cache=MoveBuildCache())
+    run = run_changed(runner, selector, args.all)
+    if run is None:
+        print("✅ Nothing to re-run")
+        return
+    print(run.describe())
+    sys.exit(0 if run.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Sharded Move Test Runner
+Lists the #[test] functions in the package, runs them as `aptos move test --filter` shards
+across a pool of CLI processes with per-shard timeouts, and merges the results
+"""
+
+import argparse
+import glob
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from instrumentation import carry_steps
+from move_cache import CONTRACTS_DIR, MoveBuildCache
+
+MODULE_PATTERN = re.compile(r"^\s*module\s+(?:[\w@]+::)?(\w+)\s*\{")
+TEST_ATTRIBUTE = re.compile(r"^\s*#\[\s*test\s*(?:\(|\])")
+FUNCTION_PATTERN = re.compile(r"\bfun\s+(\w+)")
+RESULT_LINE = re.compile(r"\[\s*(PASS|FAIL|TIMEOUT)\s*\]\s+(?:\S+::)?(\w+::\w+)\s*$")
+
+
+@dataclass(frozen=True)
+class MoveTest:
+    module: str
+    function: str
+    path: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.module}::{self.function}"
+
+
+def discover_tests(package_dir: str = CONTRACTS_DIR) -> List[MoveTest]:
+    """Find `#[test]` functions in sources/ and tests/ (doc comments and other attributes may
+    sit between the attribute and the function)"""
+    tests = []
+    for path in sorted(glob.glob(os.path.join(package_dir, "sources", "*.move")) +
+                       glob.glob(os.path.join(package_dir, "tests", "*.move"))):
+        module = None
+        pending = False
+        with open(path) as f:
+            for line in f:
+                match = MODULE_PATTERN.match(line)
+                if match:
+                    module = match.group(1)
+                    continue
+                if TEST_ATTRIBUTE.match(line):
+                    pending = True
+                    continue
+                if pending:
+                    function = FUNCTION_PATTERN.search(line)
+                    if function and module:
+                        tests.append(MoveTest(module, function.group(1), os.path.relpath(path, package_dir)))
+                        pending = False
+    return tests
+
+
+@dataclass
+class Shard:
+    filter: str
+    tests: List[str]
+
+
+def plan_shards(tests: List[MoveTest], granularity: str = "test") -> List[Shard]:
+    """One --filter per test or per module.
+
+    `--filter` is a substring match, so a filter can pick up more tests than its own
+    (`scaling_basic_5` also matches `scaling_basic_500`). Each test is assigned to the first
+    shard whose filter matches it and never gets a shard of its own.
+    """
+    names = [test.name for test in tests]
+    if granularity == "module":
+        filters = list(dict.fromkeys(f"{test.module}::" for test in tests))
+    elif granularity == "test":
+        filters = names
+    else:
+        raise ValueError(f"Unknown granularity: {granularity}")
+
+    covered = set()
+    shards = []
+    for pattern in filters:
+        if granularity == "test" and pattern in covered:
+            continue
+        matched = [name for name in names if pattern in name and name not in covered]
+        if matched:
+            covered.update(matched)
+            shards.append(Shard(pattern, matched))
+    return shards
+
+
+@dataclass
+class ShardResult:
+    shard: Shard
+    passed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    timed_out: bool = False
+    cached: bool = False
+    returncode: int = 0
+    output: str = ""
+
+
+@dataclass
+class ShardedRun:
+    shards: List[ShardResult]
+    elapsed: float
+    jobs: int
+
+    @property
+    def passed(self) -> List[str]:
+        return sorted({name for shard in self.shards for name in shard.passed})
+
+    @property
+    def failed(self) -> List[str]:
+        return sorted({name for shard in self.shards for name in shard.failed})
+
+    @property
+    def missing(self) -> List[str]:
+        """Tests a shard was expected to run but never reported (crash, timeout, filter miss)"""
+        reported = set(self.passed) | set(self.failed)
+        return sorted({name for shard in self.shards for name in shard.shard.tests} - reported)
+
+    @property
+    def timed_out(self) -> List[ShardResult]:
+        return [shard for shard in self.shards if shard.timed_out]
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.shards) and not self.failed and not self.missing
+
+    def slowest(self, count: int = 5) -> List[ShardResult]:
+        return sorted(self.shards, key=lambda shard: shard.duration, reverse=True)[:count]
+
+    def describe(self) -> str:
+        total = len(self.passed) + len(self.failed) + len(self.missing)
+        lines = [
+            f"{len(self.passed)}/{total} Move tests passed in {len(self.shards)} shards "
+            f"({self.jobs} jobs) in {self.elapsed:.1f}s"
+        ]
+        for name in self.failed:
+            lines.append(f"  ✗ {name}")
+        for name in self.missing:
+            lines.append(f"  ? {name} (no result)")
+        for shard in self.timed_out:
+            lines.append(f"  ⏱ shard {shard.shard.filter} timed out after {shard.duration:.1f}s")
+        lines.append("Slowest shards:")
+        for shard in self.slowest():
+            cached = " (cached)" if shard.cached else ""
+            lines.append(f"  {shard.duration:8.2f}s  {shard.shard.filter} [{len(shard.shard.tests)} tests]{cached}")
+        return "\n".join(lines)
+
+
+def parse_results(output: str) -> Dict[str, str]:
+    """`module::function` -> PASS/FAIL/TIMEOUT from the CLI's per-test lines"""
+    results = {}
+    for line in output.splitlines():
+        match = RESULT_LINE.search(line.strip())
+        if match:
+            results[match.group(2)] = match.group(1)
+    return results
+
+
+class ShardedTestRunner:
+    """Each worker thread owns an --output-dir so concurrent CLI processes never share build/"""
+
+    def __init__(
+        self,
+        package_dir: str = CONTRACTS_DIR,
+        aptos_cli: str = "aptos",
+        jobs: Optional[int] = None,
+        shard_timeout: float = 120.0,
+        granularity: str = "test",
+        cache: Optional[MoveBuildCache] = None,
+        extra_args: Optional[List[str]] = None,
+    ):
+        self.package_dir = os.path.abspath(package_dir)
+        self.aptos_cli = aptos_cli
+        self.jobs = jobs or max(1, (os.cpu_count() or 2) // 2)
+        self.shard_timeout = shard_timeout
+        self.granularity = granularity
+        self.cache = cache or MoveBuildCache(enabled=False)
+        self.extra_args = extra_args if extra_args is not None else ["--dev"]
+        self._local = threading.local()
+
+    def run(self, tests: Optional[List[MoveTest]] = None) -> ShardedRun:
+        tests = discover_tests(self.package_dir) if tests is None else tests
+        shards = plan_shards(tests, self.granularity)
+        workdir = tempfile.mkdtemp(prefix="move-shards-")
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.jobs, max(1, len(shards)))) as pool:
+                results = list(pool.map(carry_steps(lambda shard: self._run_shard(shard, workdir)), shards))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        return ShardedRun(results, time.perf_counter() - start, self.jobs)
+
+    def _run_shard(self, shard: Shard, workdir: str) -> ShardResult:
+        output_dir = getattr(self._local, "output_dir", None)
+        if output_dir is None:
+            output_dir = self._local.output_dir = tempfile.mkdtemp(dir=workdir)
+        arguments = ["move", "test", *self.extra_args, "--filter", shard.filter]
+        command = [self.aptos_cli, *arguments[:2], "--package-dir", self.package_dir,
+                   "--output-dir", output_dir, *arguments[2:]]
+
+        run = self.cache.run(command, self.package_dir, timeout=self.shard_timeout,
+                             key=" ".join(arguments), snapshot_build=False)
+        output = run.stdout + run.stderr
+        verdicts = parse_results(output)
+        result = ShardResult(
+            shard=shard,
+            passed=[name for name in shard.tests if verdicts.get(name) == "PASS"],
+            failed=[name for name in shard.tests if verdicts.get(name) in ("FAIL", "TIMEOUT")],
+            duration=run.duration,
+            timed_out=run.returncode == -1 and "timed out" in run.stderr,
+            cached=run.cached,
+            returncode=run.returncode,
+            output=output,
+        )
+        if run.returncode == 0 and not result.failed and "Test result: OK" in output:
+            # Older CLIs print no per-test lines on success; a clean run passes the whole shard
+            result.passed = [name for name in shard.tests if verdicts.get(name, "PASS") == "PASS"]
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Move unit tests as parallel --filter shards")
+    parser.add_argument("--package-dir", default=CONTRACTS_DIR)
+    parser.add_argument("--jobs", type=int, help="concurrent aptos processes")
+    parser.add_argument("--timeout", type=float, default=120.0, help="seconds per shard")
+    parser.add_argument("--granularity", choices=["test", "module"], default="test")
+    parser.add_argument("--list", action="store_true", help="only list discovered tests")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    tests = discover_tests(args.package_dir)
+    if args.list:
+        for test in tests:
+            print(f"{test.name}  ({test.path})")
+        return
+    runner = ShardedTestRunner(args.package_dir, jobs=args.jobs, shard_timeout=args.timeout,
+                               granularity=args.granularity,
+                               cache=MoveBuildCache(enabled=not args.no_cache))
+    result = runner.run(tests)
+    print(result.describe())
+    sys.exit(0 if result.ok else 1)
+
+
+if __name__ == "__main__":
+    main()
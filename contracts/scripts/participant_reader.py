@@ -0,0 +1,139 @@
+"""
+Batched Participant Reader
+Answers per-participant signed/paid queries for bill_splitter sessions from one batched
+view read per session instead of one has_participant_signed/has_participant_paid call each.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backends import normalize_address
+
+DEFAULT_TTL = 2.0
+
+
+@dataclass
+class ParticipantState:
+    address: str
+    index: int
+    name: str
+    amount_owed: int
+    signed: bool
+    paid: bool
+
+
+@dataclass
+class _SessionEntry:
+    roster: List[ParticipantState]
+    index: Dict[str, int]
+    fetched_at: float
+
+
+def unpack_bitmap(bitmap: Any, count: int) -> List[bool]:
+    """Decode a vector<u8> bitmap (REST hex string or bytes); bit i % 8 of byte i / 8"""
+    if isinstance(bitmap, str):
+        data = bytes.fromhex(bitmap[2:] if bitmap.startswith("0x") else bitmap)
+    else:
+        data = bytes(bitmap)
+    return [bool(data[i // 8] >> (i % 8) & 1) for i in range(count)]
+
+
+class ParticipantReader:
+    """Short-TTL cache of the participant flags of each session.
+
+    The first read of a session decodes get_participants once to learn names, amounts and the
+    address -> index order; once the TTL lapses only the get_participant_bitmaps view is read
+    again (two bits per participant). A participant count change re-reads the full roster.
+    """
+
+    def __init__(self, backend, ttl: float = DEFAULT_TTL, clock: Callable[[], float] = time.monotonic):
+        self.backend = backend
+        self.ttl = ttl
+        self.clock = clock
+        self.views = 0
+        self._sessions: Dict[str, _SessionEntry] = {}
+        self._lock = threading.Lock()
+
+    def participants(self, session_id: str) -> List[ParticipantState]:
+        return list(self._entry(session_id).roster)
+
+    def state(self, session_id: str, address: str) -> Optional[ParticipantState]:
+        entry = self._entry(session_id)
+        index = entry.index.get(normalize_address(address))
+        return entry.roster[index] if index is not None else None
+
+    def states(self, session_id: str, addresses: List[str]) -> Dict[str, Optional[ParticipantState]]:
+        """Any number of participants answered from a single refresh"""
+        entry = self._entry(session_id)
+        found = {}
+        for address in addresses:
+            index = entry.index.get(normalize_address(address))
+            found[address] = entry.roster[index] if index is not None else None
+        return found
+
+    def has_signed(self, session_id: str, address: str) -> bool:
+        state = self.state(session_id, address)
+        return state.signed if state else False  # Unknown participants read false, like the Move view
+
+    def has_paid(self, session_id: str, address: str) -> bool:
+        state = self.state(session_id, address)
+        return state.paid if state else False
+
+    def invalidate(self, session_id: Optional[str] = None):
+        """Drop cached flags after a local write so the next read refreshes"""
+        with self._lock:
+            if session_id is None:
+                self._sessions.clear()
+            elif session_id in self._sessions:
+                self._sessions[session_id].fetched_at = float("-inf")
+
+    # Internals
+
+    def _entry(self, session_id: str) -> _SessionEntry:
+        # Reads for one session are served under the lock, so concurrent callers share one refresh
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            now = self.clock()
+            if entry is not None and now - entry.fetched_at < self.ttl:
+                return entry
+            if entry is not None:
+                count, signed, paid = self._bitmaps(session_id)
+                if count == len(entry.roster):
+                    # Fresh objects, so states handed out earlier stay consistent snapshots
+                    entry.roster = [replace(state, signed=is_signed, paid=is_paid)
+                                    for state, is_signed, is_paid in zip(entry.roster, signed, paid)]
+                    entry.fetched_at = now
+                    return entry
+            entry = self._load_roster(session_id, now)
+            self._sessions[session_id] = entry
+            return entry
+
+    def _load_roster(self, session_id: str, now: float) -> _SessionEntry:
+        participants = self._view("bill_splitter::get_participants", [f"string:{session_id}"])[0]
+        roster = [
+            ParticipantState(
+                address=normalize_address(participant["address"]),
+                index=i,
+                name=participant["name"],
+                amount_owed=int(participant["amount_owed"]),
+                signed=bool(participant["has_signed"]),
+                paid=bool(participant["has_paid"]),
+            )
+            for i, participant in enumerate(participants)
+        ]
+        return _SessionEntry(roster, {state.address: state.index for state in roster}, now)
+
+    def _bitmaps(self, session_id: str) -> Tuple[int, List[bool], List[bool]]:
+        count, signed, paid = self._view("bill_splitter::get_participant_bitmaps", [f"string:{session_id}"])
+        count = int(count)
+        return count, unpack_bitmap(signed, count), unpack_bitmap(paid, count)
+
+    def _view(self, function: str, args: List[str]) -> List[Any]:
+        """Return values as a list: REST answers with one, the simulator with a tuple or a value"""
+        self.views += 1
+        result = self.backend.view(function, args)
+        if isinstance(result, tuple):
+            return list(result)
+        return result if not getattr(self.backend, "local", False) else [result]
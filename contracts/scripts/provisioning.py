@@ -0,0 +1,202 @@
+"""
+Concurrent Account Provisioning
+Creates and funds test accounts through the Aptos CLI (or a faucet's HTTP API) with a bounded
+worker pool
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from accounts import TestAccount, generate_account, parse_account_output
+from cli_runner import run_command
+from instrumentation import carry_steps
+from keystore import FAUCET_AMOUNT
+from submission import HttpTransport, TransportError
+
+
+@dataclass
+class ProvisioningSummary:
+    requested: int
+    created: int
+    funded: int
+    attempts: int
+    elapsed: float
+
+    @property
+    def failed(self) -> int:
+        return self.requested - self.created
+
+    @property
+    def accounts_per_second(self) -> float:
+        return self.created / self.elapsed if self.elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"{self.created}/{self.requested} accounts ready "
+            f"({self.funded} funded, {self.attempts} calls) in {self.elapsed:.2f}s "
+            f"-> {self.accounts_per_second:.2f} accounts/s"
+        )
+
+
+class AccountProvisioner:
+    """Create and fund accounts with a configurable number of concurrent CLI calls"""
+
+    def __init__(
+        self,
+        network: str = "testnet",
+        aptos_cli: str = "aptos",
+        concurrency: int = 8,
+        retries: int = 2,
+        timeout: float = 60.0,
+        retry_delay: float = 0.5,
+        fund: bool = True,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.network = network
+        self.aptos_cli = aptos_cli
+        self.concurrency = concurrency
+        self.retries = retries
+        self.timeout = timeout
+        self.retry_delay = retry_delay
+        self.fund = fund
+
+    def provision(self, count: int) -> Tuple[List[TestAccount], ProvisioningSummary]:
+        """Provision `count` accounts, returning them in request order with a throughput summary"""
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, max(count, 1))) as pool:
+            outcomes = list(pool.map(carry_steps(self._provision_one), range(count)))
+
+        accounts = [account for account, _, _ in outcomes if account is not None]
+        summary = ProvisioningSummary(
+            requested=count,
+            created=len(accounts),
+            funded=sum(1 for account, funded, _ in outcomes if account is not None and funded),
+            attempts=sum(attempts for _, _, attempts in outcomes),
+            elapsed=time.perf_counter() - start,
+        )
+        return accounts, summary
+
+    def create_account(self) -> Tuple[Optional[TestAccount], int]:
+        """Create a single account, retrying on failure or timeout"""
+        attempts = 0
+        for attempt in range(self.retries + 1):
+            attempts += 1
+            ok, stdout = self._run(["account", "create", "--network", self.network])
+            if ok:
+                account = parse_account_output(stdout)
+                if account.address and account.private_key:
+                    return account, attempts
+            self._backoff(attempt)
+        return None, attempts
+
+    def fund_account(self, address: str) -> Tuple[bool, int]:
+        """Fund an account from the faucet, retrying on failure or timeout"""
+        attempts = 0
+        for attempt in range(self.retries + 1):
+            attempts += 1
+            ok, _ = self._run([
+                "account", "fund-with-faucet",
+                "--account", address,
+                "--network", self.network
+            ])
+            if ok:
+                return True, attempts
+            self._backoff(attempt)
+        return False, attempts
+
+    def fund_many(self, addresses: List[str]) -> Dict[str, bool]:
+        """Fund several existing accounts concurrently"""
+        if not addresses:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(addresses))) as pool:
+            results = list(pool.map(carry_steps(self.fund_account), addresses))
+        return {address: funded for address, (funded, _) in zip(addresses, results)}
+
+    def fetch_apt_balance(self, address: str) -> Optional[int]:
+        """Read the on-chain APT balance of an account, or None if it cannot be read"""
+        ok, stdout = self._run([
+            "account", "balance",
+            "--account", address,
+            "--network", self.network
+        ])
+        if not ok:
+            return None
+        try:
+            return int(json.loads(stdout)["Result"][0]["balance"])
+        except (ValueError, KeyError, IndexError, TypeError):
+            return None
+
+    def _provision_one(self, index: int) -> Tuple[Optional[TestAccount], bool, int]:
+        account, attempts = self.create_account()
+        if account is None:
+            print(f"  ❌ Failed to create test account {index+1} after {attempts} attempts")
+            return None, False, attempts
+
+        funded = False
+        if self.fund:
+            funded, fund_attempts = self.fund_account(account.address)
+            attempts += fund_attempts
+            if not funded:
+                print(f"  ⚠️  Could not fund test account {index+1}: {account.address[:10]}...")
+
+        print(f"  ✅ Created test account {index+1}: {account.address[:10]}...")
+        return account, funded, attempts
+
+    def _run(self, args: List[str]) -> Tuple[bool, str]:
+        result = run_command([self.aptos_cli] + args, timeout=self.timeout)
+        return result.success, result.stdout
+
+    def _backoff(self, attempt: int):
+        if attempt < self.retries and self.retry_delay > 0:
+            time.sleep(self.retry_delay * (2 ** attempt))
+
+
+class FaucetProvisioner(AccountProvisioner):
+    """Create accounts from locally generated keys and fund them through a faucet's HTTP API.
+
+    Needs no CLI, so it works against a local node (scripts/fake_node.py) as well as a testnet
+    faucet.
+    """
+
+    def __init__(
+        self,
+        node_url: str,
+        faucet_url: str,
+        concurrency: int = 8,
+        retries: int = 2,
+        timeout: float = 60.0,
+        retry_delay: float = 0.5,
+        amount: int = FAUCET_AMOUNT,
+        fund: bool = True,
+    ):
+        super().__init__("custom", concurrency=concurrency, retries=retries, timeout=timeout,
+                         retry_delay=retry_delay, fund=fund)
+        self.node = HttpTransport(node_url, pool_size=concurrency, timeout=timeout)
+        self.faucet = HttpTransport(faucet_url, pool_size=concurrency, timeout=timeout)
+        self.amount = amount
+
+    def create_account(self) -> Tuple[Optional[TestAccount], int]:
+        """Keys are generated locally; the account appears on chain once it is funded"""
+        return generate_account(), 1
+
+    def fund_account(self, address: str) -> Tuple[bool, int]:
+        attempts = 0
+        for attempt in range(self.retries + 1):
+            attempts += 1
+            try:
+                self.faucet.post("/mint", params={"address": address, "amount": self.amount})
+                return True, attempts
+            except TransportError:
+                self._backoff(attempt)
+        return False, attempts
+
+    def fetch_apt_balance(self, address: str) -> Optional[int]:
+        try:
+            resource = self.node.get(f"/accounts/{address}/resource/0x1::coin::CoinStore<0x1::aptos_coin::AptosCoin>")
+            return int(resource["data"]["coin"]["value"])
+        except (TransportError, KeyError, TypeError, ValueError):
+            return None
@@ -0,0 +1,301 @@
+"""
+Participant Scaling Benchmark
+Sweeps participant counts and records cost and time per operation for bill_splitter (linear
+participant scans) and enhanced_bill_splitter (participant_lookup table), with CSV/JSON output
+and a regression check against a saved baseline. On the simulator the cost is its step model
+(model_cost), not gas; gas_used is only filled from a network backend
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+from accounts import TestAccount
+from bill_simulator import BASE_GAS, STEP_GAS, SimulatorBackend
+from cli_runner import run_commands
+
+PARTICIPANT_COUNTS = (5, 20, 100, 500, 1000)
+SHARE = 1_000
+CONTRACTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+
+@dataclass
+class Measurement:
+    module: str
+    operation: str
+    participants: int
+    gas_used: Optional[int]
+    time_ms: float
+    samples: int
+    source: str = "simulator"
+    model_cost: Optional[int] = None  # simulator BASE_GAS + STEP_GAS * steps; not measured gas
+
+    @property
+    def key(self) -> Tuple[str, str, int]:
+        return (self.module, self.operation, self.participants)
+
+
+@dataclass
+class Regression:
+    measurement: Measurement
+    metric: str
+    baseline: float
+    current: float
+
+    def describe(self) -> str:
+        change = (self.current / self.baseline - 1) * 100 if self.baseline else float("inf")
+        return (
+            f"{self.measurement.module}::{self.measurement.operation} @ {self.measurement.participants}: "
+            f"{self.metric} {self.baseline:g} -> {self.current:g} (+{change:.1f}%)"
+        )
+
+
+def synthetic_addresses(count: int) -> List[str]:
+    """Participants that never sign; only the last one in each session needs a key"""
+    return [f"0x{0x1000 + i:064x}" for i in range(count)]
+
+
+class ScalingBenchmark:
+    """Run each operation against the last participant (worst case for a linear scan)"""
+
+    def __init__(self, backend=None, repeats: int = 3):
+        self.backend = backend or SimulatorBackend()
+        self.repeats = repeats
+        self.merchant = self._account()
+        self._session_counter = 0
+
+    def run(self, counts=PARTICIPANT_COUNTS) -> List[Measurement]:
+        measurements = []
+        for count in counts:
+            measurements += self.measure_basic(count)
+            measurements += self.measure_enhanced(count)
+        return measurements
+
+    def measure_basic(self, count: int) -> List[Measurement]:
+        samples: Dict[str, List[Tuple[Optional[int], float]]] = {}
+        for _ in range(self.repeats):
+            session_id = self._session_id("BASIC", count)
+            payer = self._account()
+            addresses = synthetic_addresses(count - 1) + [payer.address]
+            steps = [
+                ("create_bill_session", self.merchant, [
+                    f"string:{session_id}", f"u64:{SHARE * count}", "string:Scaling",
+                    f"vector<address>:{','.join(addresses)}",
+                    f"vector<string>:{','.join(['Participant'] * count)}", "u64:1",
+                ]),
+                ("update_participant_amount", self.merchant,
+                 [f"string:{session_id}", f"address:{payer.address}", f"u64:{SHARE}"]),
+                ("confirm_participants", self.merchant, [f"string:{session_id}"]),
+                ("sign_bill_agreement", payer, [f"string:{session_id}"]),
+                ("submit_payment", payer, [f"string:{session_id}", f"u64:{SHARE}"]),
+            ]
+            for operation, sender, args in steps:
+                self._sample(samples, operation, self._run(sender, f"bill_splitter::{operation}", args))
+            for view in ("has_participant_signed", "has_participant_paid"):
+                self._sample(samples, view, self._view(f"bill_splitter::{view}",
+                                                       [f"string:{session_id}", f"address:{payer.address}"]))
+            self._sample(samples, "get_participant_bitmaps",
+                         self._view("bill_splitter::get_participant_bitmaps", [f"string:{session_id}"]))
+        return self._summarize("bill_splitter", count, samples)
+
+    def measure_enhanced(self, count: int) -> List[Measurement]:
+        samples: Dict[str, List[Tuple[Optional[int], float]]] = {}
+        for _ in range(self.repeats):
+            session_id = self._session_id("ENHANCED", count)
+            payer = self._account()
+            self.backend.run(self.merchant, "usdc_utils::mint_usdc_for_testing",
+                             [f"address:{payer.address}", f"u64:{SHARE}"])
+            addresses = synthetic_addresses(count - 1) + [payer.address]
+            steps = [
+                ("create_enhanced_bill_session", self.merchant, [
+                    f"string:{session_id}", f"u64:{SHARE * count}", "string:Scaling",
+                    f"vector<address>:{','.join(addresses)}",
+                    f"vector<string>:{','.join(['Participant'] * count)}", "u64:1", "u64:1000",
+                ]),
+                ("batch_sign_agreements", self.merchant,
+                 [f"string:{session_id}", f"vector<address>:{payer.address}"]),
+                ("submit_payment_optimized", payer, [f"string:{session_id}", f"u64:{SHARE}"]),
+            ]
+            for operation, sender, args in steps:
+                self._sample(samples, operation, self._run(sender, f"enhanced_bill_splitter::{operation}", args))
+            self._sample(samples, "get_session_stats",
+                         self._view("enhanced_bill_splitter::get_session_stats", [f"string:{session_id}"]))
+        return self._summarize("enhanced_bill_splitter", count, samples)
+
+    def _run(self, sender: TestAccount, function: str, args: List[str]) -> Tuple[Optional[int], float]:
+        result = self.backend.run(sender, function, args)
+        if not result.success:
+            raise RuntimeError(f"{function} failed: {result.vm_status}")
+        return result.gas_used, result.duration
+
+    def _view(self, function: str, args: List[str]) -> Tuple[Optional[int], float]:
+        """Views are not transactions, so only the simulator's step model gives them a cost"""
+        simulator = getattr(self.backend, "simulator", None)
+        steps_before = simulator.steps if simulator else 0
+        start = time.perf_counter()
+        self.backend.view(function, args)
+        duration = time.perf_counter() - start
+        gas = BASE_GAS + STEP_GAS * (simulator.steps - steps_before) if simulator else None
+        return gas, duration
+
+    def _sample(self, samples, operation: str, sample: Tuple[Optional[int], float]):
+        samples.setdefault(operation, []).append(sample)
+
+    def _summarize(self, module: str, count: int, samples) -> List[Measurement]:
+        local = getattr(self.backend, "local", False)
+        measurements = []
+        for operation, values in samples.items():
+            costs = [g for g, _ in values if g is not None]
+            cost = int(statistics.median(costs)) if costs else None
+            measurements.append(Measurement(
+                module=module,
+                operation=operation,
+                participants=count,
+                gas_used=None if local else cost,
+                time_ms=statistics.median(d for _, d in values) * 1000,
+                samples=len(values),
+                source="simulator" if local else "network",
+                model_cost=cost if local else None,
+            ))
+        return measurements
+
+    def _session_id(self, prefix: str, count: int) -> str:
+        self._session_counter += 1
+        return f"SCALING_{prefix}_{count}_{self._session_counter}_{int(time.time())}"
+
+    def _account(self) -> TestAccount:
+        return self.backend.new_account()
+
+
+def run_move_tests(counts=PARTICIPANT_COUNTS, aptos_cli: str = "aptos",
+                   package_dir: str = CONTRACTS_DIR, timeout: float = 600.0) -> List[Measurement]:
+    """Time the scaling_bench Move unit tests, one `aptos move test` run per participant count.
+
+    The Move test runner does not report gas, so these rows carry wall time only. Runs are
+    sequential so the timings do not compete for CPU.
+    """
+    results = run_commands(
+        [[aptos_cli, "move", "test", "--package-dir", package_dir,
+          "--filter", f"scaling_bench::scaling_basic_{count}"] for count in counts],
+        timeout=timeout, max_concurrency=1,
+    )
+    measurements = []
+    for count, result in zip(counts, results):
+        if result.returncode < 0:
+            print(f"⚠️  Move scaling test for {count} participants did not run: {result.stderr}")
+            continue
+        if not result.success:
+            print(f"❌ Move scaling test for {count} participants failed")
+            continue
+        measurements.append(Measurement("bill_splitter", "move_test_lifecycle", count, None,
+                                        result.duration * 1000, 1, "move-test"))
+    return measurements
+
+
+def write_csv(measurements: List[Measurement], path: str):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(asdict(measurements[0]).keys()) if measurements else [])
+        writer.writeheader()
+        for measurement in measurements:
+            writer.writerow(asdict(measurement))
+
+
+def write_json(measurements: List[Measurement], path: str):
+    with open(path, "w") as f:
+        json.dump({"measurements": [asdict(m) for m in measurements]}, f, indent=2)
+
+
+def load_json(path: str) -> List[Measurement]:
+    with open(path) as f:
+        return [Measurement(**row) for row in json.load(f)["measurements"]]
+
+
+def check_regressions(
+    current: List[Measurement],
+    baseline: List[Measurement],
+    gas_threshold: float = 0.10,
+    time_threshold: Optional[float] = None,
+) -> List[Regression]:
+    """Gas and model cost (deterministic) are always compared; wall time only when a threshold is given"""
+    previous = {m.key: m for m in baseline}
+    regressions = []
+    for measurement in current:
+        before = previous.get(measurement.key)
+        if before is None:
+            continue
+        for metric in ("gas_used", "model_cost"):
+            now, then = getattr(measurement, metric), getattr(before, metric)
+            if now is not None and then and now > then * (1 + gas_threshold):
+                regressions.append(Regression(measurement, metric, then, now))
+        if (time_threshold is not None and before.time_ms
+                and measurement.time_ms > before.time_ms * (1 + time_threshold)):
+            regressions.append(Regression(measurement, "time_ms", round(before.time_ms, 3),
+                                          round(measurement.time_ms, 3)))
+    return regressions
+
+
+def growth_table(measurements: List[Measurement], metric: str = "gas_used") -> str:
+    """One metric per operation across participant counts, with the largest/smallest ratio"""
+    rows: Dict[Tuple[str, str], Dict[int, Measurement]] = {}
+    measurements = [m for m in measurements if getattr(m, metric) is not None]
+    counts = sorted({m.participants for m in measurements})
+    for m in measurements:
+        rows.setdefault((m.module, m.operation), {})[m.participants] = m
+    header = f"{metric + ' by operation':<52}" + "".join(f"{count:>10}" for count in counts) + f"{'growth':>10}"
+    lines = [header]
+    for (module, operation), by_count in rows.items():
+        values = [getattr(by_count[c], metric) if c in by_count else None for c in counts]
+        cells = "".join(f"{v if v is not None else '-':>10}" for v in values)
+        known = [v for v in values if v]
+        growth = f"{known[-1] / known[0]:.1f}x" if len(known) > 1 else "-"
+        lines.append(f"{module + '::' + operation:<52}{cells}{growth:>10}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Participant scaling benchmark for both bill splitter modules")
+    parser.add_argument("--counts", default=",".join(str(c) for c in PARTICIPANT_COUNTS))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--csv", help="write measurements as CSV")
+    parser.add_argument("--json", help="write measurements as JSON (usable as a --baseline)")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed gas or model cost increase (0.10 = 10%%)")
+    parser.add_argument("--time-threshold", type=float, help="allowed time increase; off by default")
+    parser.add_argument("--move-tests", action="store_true", help="also time the scaling_bench Move tests")
+    args = parser.parse_args()
+
+    counts = [int(c) for c in args.counts.split(",")]
+    print(f"📏 Scaling benchmark for {counts} participants ({args.repeats} repeats)")
+    measurements = ScalingBenchmark(repeats=args.repeats).run(counts)
+    if args.move_tests:
+        measurements += run_move_tests(counts)
+    print("ℹ️  model_cost is the simulator's step model, not gas measured on a chain")
+    print(growth_table(measurements, "model_cost"))
+    if any(m.gas_used is not None for m in measurements):
+        print(growth_table(measurements, "gas_used"))
+
+    if args.csv:
+        write_csv(measurements, args.csv)
+        print(f"✅ Wrote {args.csv}")
+    if args.json:
+        write_json(measurements, args.json)
+        print(f"✅ Wrote {args.json}")
+    if args.baseline:
+        regressions = check_regressions(measurements, load_json(args.baseline),
+                                        args.threshold, args.time_threshold)
+        for regression in regressions:
+            print(f"❌ {regression.describe()}")
+        if regressions:
+            sys.exit(1)
+        print("✅ No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Sequence Number Management
+Hands out sequence numbers locally so one sender can keep many transactions in flight
+instead of waiting for each to commit before building the next.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_MAX_IN_FLIGHT = 64  # Mempool accepts up to 100 parked transactions per account
+DEFAULT_EXPIRATION_SECS = 60
+
+
+class SequenceError(Exception):
+    """No sequence number became available within the timeout"""
+
+
+class _SenderState:
+    __slots__ = ("next", "in_flight", "free", "synced")
+
+    def __init__(self):
+        self.next = 0
+        self.in_flight: Dict[int, float] = {}  # sequence number -> allocation time
+        self.free: List[int] = []  # released numbers below `next`, reused first to close gaps
+        self.synced = False
+
+
+class SequenceNumberManager:
+    """Monotonic per-sender sequence allocator with gap filling and chain resync.
+
+    `fetch` returns the on-chain sequence number of an account (the next one it will accept).
+    Numbers are allocated locally; `committed` retires them, `release` returns a number that
+    was never accepted by the node so the next allocation fills the gap, and `resync`
+    reconciles with the chain after errors or expiry.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], int],
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        expiration_secs: float = DEFAULT_EXPIRATION_SECS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.fetch = fetch
+        self.max_in_flight = max_in_flight
+        self.expiration_secs = expiration_secs
+        self.clock = clock
+        self._senders: Dict[str, _SenderState] = {}
+        self._condition = threading.Condition()
+        self.resyncs = 0
+
+    def allocate(self, sender: str, timeout: Optional[float] = None) -> int:
+        """Reserve the next sequence number, blocking while the sender is at its in-flight limit"""
+        state = self._state(sender)
+        with self._condition:
+            if not self._condition.wait_for(lambda: len(state.in_flight) < self.max_in_flight, timeout):
+                raise SequenceError(f"{sender} has {len(state.in_flight)} transactions in flight")
+            if state.free:
+                sequence_number = state.free.pop(0)
+            else:
+                sequence_number = state.next
+                state.next += 1
+            state.in_flight[sequence_number] = self.clock()
+            return sequence_number
+
+    def committed(self, sender: str, sequence_number: int):
+        """The transaction was executed (successfully or not) and consumed its number"""
+        state = self._state(sender)
+        with self._condition:
+            state.in_flight.pop(sequence_number, None)
+            self._condition.notify_all()
+
+    def release(self, sender: str, sequence_number: int):
+        """The node rejected the transaction, so its number is still unused"""
+        state = self._state(sender)
+        with self._condition:
+            state.in_flight.pop(sequence_number, None)
+            if sequence_number == state.next - 1 and not state.free:
+                state.next = sequence_number
+            elif sequence_number < state.next:
+                state.free.append(sequence_number)
+                state.free.sort()
+            self._condition.notify_all()
+
+    def at_capacity(self, sender: str) -> bool:
+        state = self._state(sender)
+        with self._condition:
+            return len(state.in_flight) >= self.max_in_flight
+
+    def in_flight(self, sender: str) -> int:
+        state = self._state(sender)
+        with self._condition:
+            return len(state.in_flight)
+
+    def expired(self, sender: str) -> List[int]:
+        """In-flight numbers older than the transaction expiration window"""
+        state = self._state(sender)
+        cutoff = self.clock() - self.expiration_secs
+        with self._condition:
+            return sorted(n for n, issued in state.in_flight.items() if issued < cutoff)
+
+    def resync(self, sender: str) -> int:
+        """Reconcile with the chain: retire committed numbers and abandon expired ones.
+
+        Anything below the on-chain number has committed. An expired number at or above it
+        can no longer commit, and everything after it would stay parked behind the gap, so
+        allocation restarts from the lowest expired number.
+        """
+        state = self._state(sender)
+        on_chain = self.fetch(sender)
+        cutoff = self.clock() - self.expiration_secs
+        with self._condition:
+            self.resyncs += 1
+            for sequence_number in [n for n in state.in_flight if n < on_chain]:
+                del state.in_flight[sequence_number]
+            state.free = [n for n in state.free if n >= on_chain]
+
+            expired = [n for n, issued in state.in_flight.items() if issued < cutoff]
+            if expired:
+                restart = min(expired)
+                for sequence_number in [n for n in state.in_flight if n >= restart]:
+                    del state.in_flight[sequence_number]
+                state.next = restart
+                state.free = [n for n in state.free if n < restart]
+            elif not state.in_flight:
+                state.next = on_chain
+                state.free = []
+            else:
+                state.next = max(state.next, on_chain)
+
+            self._condition.notify_all()
+            return state.next
+
+    def _state(self, sender: str) -> _SenderState:
+        with self._condition:
+            state = self._senders.get(sender)
+            if state is None:
+                state = self._senders[sender] = _SenderState()
+        if not state.synced:
+            on_chain = self.fetch(sender)
+            with self._condition:
+                if not state.synced:
+                    state.next = on_chain
+                    state.synced = True
+        return state
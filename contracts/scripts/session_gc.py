@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Session Garbage Collector
+Sweeps settled bill_splitter (or enhanced_bill_splitter) sessions found by the event indexer into
+prune_sessions calls of bounded size, confirms each pruned session with get_session_summary,
+records it next to the indexer's tables, and reports the storage refund of every batch
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from accounts import TestAccount
+from backends import CliBackend
+from event_indexer import DEFAULT_DB_PATH, STATUS_SETTLED, EventStore
+from storage_benchmark import (
+    ADDRESS, FEE_PER_BYTE, U64, session_header, string_size, uleb128_size, vector_size,
+)
+from submission import HttpTransport, RestBackend, SubmissionEngine
+
+MAX_PRUNE_BATCH = 50  # bill_splitter::MAX_PRUNE_BATCH, enhanced_bill_splitter::MAX_BATCH_SIZE
+STATUS_CANCELLED = 4
+FEE_STATEMENT = "0x1::transaction_fee::FeeStatement"
+
+# Pruned sessions of each module; the two registries have separate session ids
+PRUNED_TABLES = {
+    "bill_splitter": "pruned_sessions",
+    "enhanced_bill_splitter": "pruned_enhanced_sessions",
+}
+PRUNED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    session_id TEXT PRIMARY KEY,
+    reclaimed_bytes INTEGER NOT NULL,
+    pruned_at INTEGER NOT NULL
+);
+"""
+
+
+@dataclass
+class SweepReport:
+    batches: int = 0
+    pruned: int = 0
+    failed_batches: int = 0
+    reclaimed_bytes: int = 0
+    refund_octas: int = 0  # storage_fee_refund_octas of the batches' FeeStatements
+    refunds_reported: int = 0  # batches whose transaction carried a FeeStatement
+    gas_used: int = 0
+    duration: float = 0.0
+
+    @property
+    def estimated_refund_octas(self) -> int:
+        """Storage fee of the estimated freed bytes, at the rate charged when they were written"""
+        return self.reclaimed_bytes * FEE_PER_BYTE
+
+    def describe(self) -> str:
+        if self.refunds_reported:
+            refund = f"{self.refund_octas:,} octas refunded ({self.refunds_reported} FeeStatements)"
+        else:
+            refund = f"no FeeStatement, ~{self.estimated_refund_octas:,} octas estimated"
+        return (f"{self.pruned} sessions pruned in {self.batches} batches ({self.failed_batches} failed), "
+                f"{self.reclaimed_bytes:,} bytes reclaimed, {refund}, "
+                f"{self.gas_used:,} gas, {self.duration:.2f}s")
+
+
+def summary_bytes(session_id: str) -> int:
+    """SessionSummary: id, merchant, total, received, participant count, status, created/settled"""
+    return string_size(session_id) + ADDRESS + 3 * U64 + 1 + 2 * U64
+
+
+def reclaimable_bytes(session_id: str, names: List[Optional[str]], description: str = "") -> int:
+    """BillSession and ParticipantNames bytes a prune frees, net of the summary it writes.
+    Descriptions and names the indexer has not seen count as empty, so this is a lower bound"""
+    count = len(names)
+    bitmap = vector_size((count + 7) // 8, 1)
+    session = (session_header(session_id, description) + vector_size(count, ADDRESS)
+               + vector_size(count, U64) + 2 * bitmap)
+    cold = uleb128_size(count) + sum(string_size(name or "") for name in names)
+    return session + cold - summary_bytes(session_id)
+
+
+def event_type(event) -> str:
+    """Type of a simulator event or of an event of the REST API's transaction JSON"""
+    return event.get("type", "") if isinstance(event, dict) else getattr(event, "type", "")
+
+
+def event_data(event) -> Dict[str, Any]:
+    return event.get("data", {}) if isinstance(event, dict) else getattr(event, "data", {})
+
+
+def storage_refund(events: List[Any]) -> Optional[int]:
+    """storage_fee_refund_octas of the transaction's FeeStatement, None when it carried none"""
+    for event in events:
+        if event_type(event) == FEE_STATEMENT:
+            return int(event_data(event)["storage_fee_refund_octas"])
+    return None
+
+
+class SessionCollector:
+    """Prunes settled sessions of the event store through a transaction backend.
+
+    bill_splitter candidates are the sessions the indexer saw settle. enhanced_bill_splitter
+    sessions are only known from their BatchPaymentEvents, so those are checked with
+    get_session_summary first and only settled or cancelled ones are sent.
+    """
+
+    def __init__(self, backend, admin: TestAccount, store: EventStore, batch_size: int = MAX_PRUNE_BATCH,
+                 module: str = "bill_splitter"):
+        if not 0 < batch_size <= MAX_PRUNE_BATCH:
+            raise ValueError(f"batch size must be between 1 and {MAX_PRUNE_BATCH}")
+        if module not in PRUNED_TABLES:
+            raise ValueError(f"module must be one of {', '.join(PRUNED_TABLES)}")
+        self.backend = backend
+        self.admin = admin
+        self.store = store
+        self.batch_size = batch_size
+        self.module = module
+        self.table = PRUNED_TABLES[module]
+        self.store.conn.executescript(PRUNED_SCHEMA.format(table=self.table))
+
+    def _pending_query(self) -> str:
+        if self.module == "bill_splitter":
+            return (f"FROM sessions WHERE status = {STATUS_SETTLED} AND session_id NOT IN "
+                    f"(SELECT session_id FROM {self.table})")
+        return f"FROM enhanced_sessions WHERE session_id NOT IN (SELECT session_id FROM {self.table})"
+
+    def candidates(self, limit: int, skip: Set[str] = frozenset()) -> List[str]:
+        """Oldest sessions that have not been pruned yet, leaving out `skip`"""
+        order = "settled_at" if self.module == "bill_splitter" else "last_payment_at"
+        rows = self.store.conn.execute(
+            f"SELECT session_id {self._pending_query()} ORDER BY {order}, session_id LIMIT ?",
+            (limit + len(skip),))
+        return [row[0] for row in rows if row[0] not in skip][:limit]
+
+    def pending_count(self) -> int:
+        return self.store.conn.execute(f"SELECT COUNT(*) {self._pending_query()}").fetchone()[0]
+
+    def pruned_count(self) -> int:
+        return self.store.conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def _names(self, session_id: str) -> List[Optional[str]]:
+        return [row[0] for row in self.store.conn.execute(
+            "SELECT name FROM participants WHERE session_id = ?", (session_id,))]
+
+    def _summary(self, session_id: str) -> Optional[List[Any]]:
+        """get_session_summary of a session: (..., status, created_at, settled_at, pruned)"""
+        try:
+            return list(self.backend.view(f"{self.module}::get_session_summary", [f"string:{session_id}"]))
+        except Exception:
+            return None
+
+    def _finished(self, session_id: str) -> bool:
+        summary = self._summary(session_id)
+        return summary is not None and int(summary[4]) in (STATUS_SETTLED, STATUS_CANCELLED)
+
+    def _confirmed(self, session_id: str) -> bool:
+        summary = self._summary(session_id)
+        return summary is not None and summary[-1] in (True, "true")
+
+    def _reclaimable(self, session_id: str) -> int:
+        # Only bill_splitter's layout is modelled; the enhanced refund is known from the FeeStatement
+        if self.module != "bill_splitter":
+            return 0
+        return reclaimable_bytes(session_id, self._names(session_id))
+
+    def prune_batch(self, session_ids: List[str]) -> Tuple[Optional[List[str]], int, Optional[int]]:
+        """One prune_sessions call: the sessions it pruned (None if the transaction failed), its gas
+        and the storage refund of its FeeStatement (None if the backend reported no events)"""
+        result = self.backend.run(self.admin, f"{self.module}::prune_sessions",
+                                  [f"vector<string>:{','.join(session_ids)}"])
+        if not result.success:
+            return None, result.gas_used, None
+        pruned = [event_data(event)["session_ids"] for event in result.events
+                  if event_type(event).endswith(f"::{self.module}::SessionsPrunedEvent")]
+        if not pruned:
+            # The CLI backend returns no events: prune_sessions skips sessions it cannot prune,
+            # so ask the chain which ones it did
+            pruned = [[session_id for session_id in session_ids if self._confirmed(session_id)]]
+        return pruned[0], result.gas_used, storage_refund(result.events)
+
+    def sweep(self, max_batches: Optional[int] = None, verbose: bool = False) -> SweepReport:
+        """Prune batch after batch until no candidates are left or `max_batches` ran"""
+        report = SweepReport()
+        started = time.perf_counter()
+        skipped = set()  # Failed batches and sessions not pruned, left for the next run
+        while max_batches is None or report.batches < max_batches:
+            batch = self.candidates(self.batch_size, skipped)
+            if self.module != "bill_splitter":
+                unfinished = [session_id for session_id in batch if not self._finished(session_id)]
+                skipped.update(unfinished)
+                batch = [session_id for session_id in batch if session_id not in unfinished]
+                if unfinished and not batch:
+                    continue
+            if not batch:
+                break
+            report.batches += 1
+            pruned, gas_used, refund = self.prune_batch(batch)
+            report.gas_used += gas_used
+            if pruned is None:
+                report.failed_batches += 1
+                skipped.update(batch)  # Left for the next run instead of retried in a loop
+                if verbose:
+                    print(f"⚠️ Batch {report.batches} failed; {len(batch)} sessions left for the next run")
+                continue
+            if refund is not None:
+                report.refund_octas += refund
+                report.refunds_reported += 1
+            skipped.update(set(batch) - set(pruned))
+
+            now = int(time.time())
+            with self.store.conn:
+                for session_id in pruned:
+                    reclaimed = self._reclaimable(session_id)
+                    self.store.conn.execute(
+                        f"INSERT OR IGNORE INTO {self.table} (session_id, reclaimed_bytes, pruned_at) "
+                        "VALUES (?, ?, ?)", (session_id, reclaimed, now))
+                    report.reclaimed_bytes += reclaimed
+            report.pruned += len(pruned)
+            if verbose:
+                print(f"📝 Batch {report.batches}: pruned {len(pruned)}/{len(batch)} sessions")
+        report.duration = time.perf_counter() - started
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prune settled bill splitter sessions in bounded batches")
+    parser.add_argument("--module-address", required=True, help="Address the bill_split package is published at")
+    parser.add_argument("--private-key", required=True, help="Key of the module account (prune_sessions is admin-only)")
+    parser.add_argument("--module", choices=sorted(PRUNED_TABLES), default="bill_splitter")
+    parser.add_argument("--network", default="devnet")
+    parser.add_argument("--node-url", help="REST endpoint (ending in /v1); defaults to the network's fullnode")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="SQLite store written by event_indexer.py")
+    parser.add_argument("--batch-size", type=int, default=MAX_PRUNE_BATCH)
+    parser.add_argument("--max-batches", type=int, help="Stop after this many transactions")
+    args = parser.parse_args()
+
+    store = EventStore(args.db)
+    # REST results carry the events (SessionsPrunedEvent, FeeStatement); the CLI is the fallback
+    node_url = args.node_url or f"https://fullnode.{args.network}.aptoslabs.com/v1"
+    backend = RestBackend(SubmissionEngine(HttpTransport(node_url), args.module_address),
+                          fallback=CliBackend(args.network, args.module_address))
+    collector = SessionCollector(backend, TestAccount(args.module_address, args.private_key), store,
+                                 args.batch_size, args.module)
+    print(f"🔎 {collector.pending_count()} {args.module} sessions waiting to be pruned")
+    try:
+        report = collector.sweep(args.max_batches, verbose=True)
+    finally:
+        total = collector.pruned_count()
+        store.close()
+    print(f"✅ {report.describe()}")
+    print(f"📊 {total} sessions pruned so far")
+    if report.failed_batches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Batched Payment Settlement
+Pays a bill_splitter session to settlement, where payments wait in the session escrow and the
+settling payment deposits them to the merchant at once, and sets it against the submit_payment
+it replaced, which deposited every payment straight to the merchant
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from accounts import TestAccount
+from backends import TxRequest, TxResult
+from storage_benchmark import ADDRESS, U64, io_gas
+
+PAY_FUNCTION = "bill_splitter::submit_payment"
+SESSION_VIEW = "bill_splitter::get_bill_session"
+STATUS_SETTLED = 3
+
+ESCROW_BYTES = U64  # SessionEscrow { coins: Coin { value } }
+# CoinStore { coin, frozen, deposit_events, withdraw_events }, each handle a counter and a GUID
+COIN_STORE_BYTES = U64 + 1 + 2 * (U64 + U64 + ADDRESS)
+
+
+@dataclass
+class SettlementReport:
+    path: str
+    payers: int
+    settled: bool
+    transactions: int
+    failed_transactions: int
+    deposits: int  # writes of the merchant's CoinStore
+    events: int
+    gas_used: int  # simulator execution cost of the transactions
+    coin_io_gas: float  # storage IO of moving the payments: escrow slots and merchant CoinStore
+
+    def describe(self) -> str:
+        state = "settled" if self.settled else "not settled"
+        return (
+            f"{self.path}: {self.payers} payments {state} in {self.transactions} transactions "
+            f"({self.failed_transactions} failed), {self.deposits} merchant deposits, {self.events} events, "
+            f"{self.gas_used} execution gas + {self.coin_io_gas:.1f} coin IO gas"
+        )
+
+
+def compare(batched: SettlementReport, individual: SettlementReport) -> str:
+    """One-line summary of the escrow path against a deposit per payment, per settled bill"""
+    return (
+        f"{batched.deposits} vs {individual.deposits} merchant deposits, "
+        f"{batched.events} vs {individual.events} events, "
+        f"{batched.coin_io_gas:.1f} vs {individual.coin_io_gas:.1f} coin IO gas per settled bill "
+        f"(both {batched.transactions} transactions, {batched.gas_used} execution gas)"
+    )
+
+
+def escrow_io_gas(payers: int) -> float:
+    """Every payment rewrites the session escrow; the settling one also writes the merchant's CoinStore"""
+    return payers * io_gas([ESCROW_BYTES], [ESCROW_BYTES]) + io_gas([COIN_STORE_BYTES], [COIN_STORE_BYTES])
+
+
+def direct_io_gas(payers: int) -> float:
+    """Every payment rewrites the merchant's CoinStore"""
+    return payers * io_gas([COIN_STORE_BYTES], [COIN_STORE_BYTES])
+
+
+class SettlementDriver:
+    """Pay a bill_splitter session to settlement and account for both ways of paying the merchant"""
+
+    def __init__(self, backend, merchant: TestAccount):
+        self.backend = backend
+        self.merchant = merchant
+
+    def settle(self, session_id: str, payers: List[TestAccount],
+               share: int) -> Tuple[SettlementReport, SettlementReport]:
+        """Submit every payment and report the escrow path that ran, next to the direct deposit
+        path. The old submit_payment ran the same checks and updates and emitted the same
+        PaymentReceivedEvents, so the same transactions stand for it, with one deposit per
+        payment and no BatchPaymentEvent"""
+        results = self.backend.run_many([
+            TxRequest(payer, PAY_FUNCTION, [f"string:{session_id}", f"u64:{share}"]) for payer in payers
+        ])
+        settled = self._settled(session_id)
+        executed = dict(
+            payers=len(payers),
+            settled=settled,
+            transactions=len(results),
+            failed_transactions=sum(1 for result in results if not result.success),
+            gas_used=sum(result.gas_used for result in results),
+        )
+        paid = sum(1 for result in results if result.success)
+        batched = SettlementReport(
+            path="escrow swept at settlement",
+            deposits=sum(1 for result in results for event in result.events
+                         if getattr(event, "name", "") == "BatchPaymentEvent"),
+            events=sum(len(result.events) for result in results),
+            coin_io_gas=escrow_io_gas(paid),
+            **executed,
+        )
+        individual = SettlementReport(
+            path="deposit per payment",
+            deposits=paid,
+            events=paid + (1 if settled else 0),  # PaymentReceivedEvents and BillSettledEvent
+            coin_io_gas=direct_io_gas(paid),
+            **executed,
+        )
+        return batched, individual
+
+    def _settled(self, session_id: str) -> bool:
+        view = getattr(self.backend, "view", None)
+        if view is None:
+            return False
+        try:
+            return int(view(SESSION_VIEW, [f"string:{session_id}"])[5]) == STATUS_SETTLED
+        except Exception:
+            return False
+
+
+def create_session(backend, merchant: TestAccount, session_id: str, payers: List[TestAccount],
+                   share: int) -> str:
+    """Approved bill_splitter session splitting `share` per payer; payers hold APT already"""
+    args = [f"string:{session_id}"]
+    results = [
+        backend.run(merchant, "bill_splitter::create_bill_session", args + [
+            f"u64:{share * len(payers)}", "string:Settlement",
+            f"vector<address>:{','.join(payer.address for payer in payers)}",
+            f"vector<string>:{','.join('P' for _ in payers)}", "u64:1"]),
+        backend.run(merchant, "bill_splitter::confirm_participants", args),
+        backend.run(payers[0], "bill_splitter::sign_bill_agreement", args),
+    ]
+    failed = [result.vm_status for result in results if not result.success]
+    if failed:
+        raise RuntimeError(f"session setup failed: {failed[0]}")
+    return session_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Escrowed settlement against one merchant deposit per payment "
+                                                 "(in-process simulator)")
+    parser.add_argument("--participants", type=int, default=50)
+    parser.add_argument("--share", type=int, default=1_000)
+    args = parser.parse_args()
+
+    from bill_simulator import SimulatorBackend
+
+    backend = SimulatorBackend()
+    merchant = backend.new_account()
+    payers = [backend.new_account() for _ in range(args.participants)]
+    started = time.perf_counter()
+    batched, individual = SettlementDriver(backend, merchant).settle(
+        create_session(backend, merchant, "SETTLE", payers, args.share), payers, args.share)
+
+    print(f"📊 {batched.describe()}")
+    print(f"📊 {individual.describe()}")
+    if not batched.settled or batched.failed_transactions:
+        print("❌ The bill did not settle")
+        sys.exit(1)
+    print(f"✅ {compare(batched, individual)} in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
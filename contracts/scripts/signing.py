@@ -0,0 +1,137 @@
+"""
+Batch Signature Collection
+Drives enhanced_bill_splitter::batch_sign_agreements in MAX_BATCH_SIZE chunks, submitted
+concurrently, and measures it against one sign_bill_agreement transaction per participant
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from accounts import TestAccount
+from backends import TxRequest, TxResult
+
+MAX_BATCH_SIZE = 50  # enhanced_bill_splitter::MAX_BATCH_SIZE
+BATCH_SIGN_FUNCTION = "enhanced_bill_splitter::batch_sign_agreements"
+SIGN_FUNCTION = "bill_splitter::sign_bill_agreement"
+SESSION_STATS_VIEW = "enhanced_bill_splitter::get_session_stats"
+
+
+@dataclass
+class SigningReport:
+    path: str
+    participants: int
+    required: int
+    signatures: int
+    transactions: int
+    failed_transactions: int
+    gas_used: int
+    elapsed: float
+
+    @property
+    def approved(self) -> bool:
+        return self.signatures >= self.required
+
+    @property
+    def signatures_per_second(self) -> float:
+        return self.signatures / self.elapsed if self.elapsed > 0 else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"{self.path}: {self.signatures}/{self.required} signatures "
+            f"({self.participants} participants) in {self.transactions} transactions, "
+            f"{self.gas_used} gas, {self.elapsed:.2f}s -> {self.signatures_per_second:.1f} signatures/s"
+        )
+
+
+def compare(batched: SigningReport, individual: SigningReport) -> str:
+    """One-line summary of the batched path against the per-participant path"""
+    speedup = (batched.signatures_per_second / individual.signatures_per_second
+               if individual.signatures_per_second else float("inf"))
+    return (
+        f"batched {batched.signatures_per_second:.1f} vs individual "
+        f"{individual.signatures_per_second:.1f} signatures/s ({speedup:.1f}x), "
+        f"{batched.transactions} vs {individual.transactions} transactions, "
+        f"{batched.gas_used} vs {individual.gas_used} gas"
+    )
+
+
+class BatchSigningDriver:
+    """Collect signatures for an enhanced session with as few batch transactions as needed"""
+
+    def __init__(self, backend, submitter: TestAccount, batch_size: int = MAX_BATCH_SIZE,
+                 concurrency: int = 8):
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}")
+        self.backend = backend
+        self.submitter = submitter
+        self.batch_size = batch_size
+        self.concurrency = max(1, concurrency)
+
+    def sign(self, session_id: str, addresses: List[str], required_signatures: int) -> SigningReport:
+        """Submit batch_sign_agreements chunks until the session has `required_signatures`.
+
+        Each round only sends the addresses that could still be needed (at most `concurrency`
+        chunks), so nothing is signed or spent past the threshold. Addresses that turn out not
+        to count (unknown or already signed) are made up for from the rest in the next round.
+        """
+        start = time.perf_counter()
+        unique = list(dict.fromkeys(addresses))
+        pending = unique
+        results: List[TxResult] = []
+        signatures = self._signatures(session_id) or 0
+
+        while pending and signatures < required_signatures:
+            take = min(required_signatures - signatures, self.batch_size * self.concurrency)
+            wave, pending = pending[:take], pending[take:]
+            chunks = [wave[i:i + self.batch_size] for i in range(0, len(wave), self.batch_size)]
+            chunk_results = self.backend.run_many([
+                TxRequest(self.submitter, BATCH_SIGN_FUNCTION,
+                          [f"string:{session_id}", "vector<address>:" + ",".join(chunk)])
+                for chunk in chunks
+            ])
+            results.extend(chunk_results)
+            counted = self._signatures(session_id)
+            if counted is None:
+                counted = signatures + sum(len(chunk) for chunk, result in zip(chunks, chunk_results)
+                                           if result.success)
+            signatures = counted
+
+        return self._report("batch_sign_agreements", len(unique), required_signatures,
+                            signatures, results, start)
+
+    def sign_individually(self, session_id: str, participants: List[TestAccount],
+                          required_signatures: int) -> SigningReport:
+        """Baseline: one bill_splitter::sign_bill_agreement per participant, up to the threshold"""
+        start = time.perf_counter()
+        results = self.backend.run_many([
+            TxRequest(participant, SIGN_FUNCTION, [f"string:{session_id}"])
+            for participant in participants[:required_signatures]
+        ])
+        signatures = sum(1 for result in results if result.success)
+        return self._report("sign_bill_agreement", len(participants), required_signatures,
+                            signatures, results, start)
+
+    def _signatures(self, session_id: str) -> Optional[int]:
+        """Current signature count from the chain, when the backend can call views"""
+        view = getattr(self.backend, "view", None)
+        if view is None:
+            return None
+        try:
+            stats = view(SESSION_STATS_VIEW, [f"string:{session_id}"])
+        except Exception:
+            return None
+        return int(stats[1])
+
+    def _report(self, path: str, participants: int, required: int, signatures: int,
+                results: List[TxResult], start: float) -> SigningReport:
+        return SigningReport(
+            path=path,
+            participants=participants,
+            required=required,
+            signatures=signatures,
+            transactions=len(results),
+            failed_transactions=sum(1 for result in results if not result.success),
+            gas_used=sum(result.gas_used for result in results),
+            elapsed=time.perf_counter() - start,
+        )
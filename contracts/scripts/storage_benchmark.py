@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Participant Storage Benchmark
+Compares the state bytes, storage IO gas and view payload sizes of the original
+vector<Participant> session layout with the column layout (packed signed/paid bitmaps,
+vector<u64> amounts, names in a separate cold slot, payment times only in payment events)
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass
+from typing import List, Tuple
+
+PARTICIPANT_COUNTS = (5, 100, 1000)
+
+# Storage parameters of the Aptos gas schedule (internal gas units; octas for the fee). Only used
+# to compare layouts with each other; the storage fee is charged for new slots and byte growth only.
+IO_READ_PER_SLOT = 302_385
+IO_READ_PER_BYTE = 151
+IO_WRITE_PER_SLOT = 89_568
+IO_WRITE_PER_BYTE = 89
+INTERNAL_GAS_PER_UNIT = 1_000_000
+FEE_PER_SLOT = 40_000
+FEE_PER_BYTE = 40
+
+ADDRESS = 32
+U64 = 8
+
+
+@dataclass
+class LayoutCost:
+    layout: str
+    participants: int
+    session_bytes: int  # the state slot every sign/pay rewrites
+    cold_bytes: int  # separate slot for the names (0 for the struct layout)
+    create_fee_octas: int
+    update_io_gas: float  # a signature or payment: read and rewrite the session slot
+    participants_view_bytes: int
+    flags_view_bytes: int  # polling every participant's signed and paid flags
+
+
+def uleb128_size(value: int) -> int:
+    size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+def string_size(text: str) -> int:
+    data = text.encode()
+    return uleb128_size(len(data)) + len(data)
+
+
+def vector_size(count: int, item_size: int) -> int:
+    return uleb128_size(count) + count * item_size
+
+
+def names(count: int) -> List[str]:
+    return [f"Participant {i}" for i in range(count)]
+
+
+def session_header(session_id: str, description: str) -> int:
+    """BillSession fields other than the participants: ids, addresses, amounts, status, timestamps"""
+    return (string_size(session_id) + 2 * ADDRESS + U64 + string_size(description)
+            + 2 * U64 + 1 + 4 * U64)
+
+
+def struct_layout(count: int, session_id: str, description: str) -> Tuple[int, int]:
+    participants = sum(ADDRESS + string_size(name) + U64 + 1 + 1 + U64 for name in names(count))
+    return session_header(session_id, description) + uleb128_size(count) + participants, 0
+
+
+def column_layout(count: int, session_id: str, description: str) -> Tuple[int, int]:
+    bitmap = vector_size((count + 7) // 8, 1)
+    hot = (session_header(session_id, description) + vector_size(count, ADDRESS)
+           + vector_size(count, U64) + 2 * bitmap)
+    cold = string_size(session_id) + uleb128_size(count) + sum(string_size(name) for name in names(count))
+    return hot, cold
+
+
+def io_gas(reads: List[int], writes: List[int]) -> float:
+    internal = sum(IO_READ_PER_SLOT + IO_READ_PER_BYTE * size for size in reads)
+    internal += sum(IO_WRITE_PER_SLOT + IO_WRITE_PER_BYTE * size for size in writes)
+    return internal / INTERNAL_GAS_PER_UNIT
+
+
+def json_size(value) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def participants_payload(count: int, payment_timestamps: bool) -> int:
+    """get_participants REST response; the column layout assembles the structs on read and
+    no longer has payment times to report"""
+    participant = {"address": "0x" + "ab" * ADDRESS, "amount_owed": "1000000",
+                   "has_signed": True, "has_paid": False}
+    if payment_timestamps:
+        participant["payment_timestamp"] = "1700000000"
+    return json_size([[dict(participant, name=name) for name in names(count)]])
+
+
+def measure(count: int, session_id: str = "BILL_000001", description: str = "Team dinner") -> List[LayoutCost]:
+    results = []
+    for layout, (hot, cold) in (("struct", struct_layout(count, session_id, description)),
+                                ("columns", column_layout(count, session_id, description))):
+        slots = 2 if cold else 1
+        if layout == "struct":
+            # One has_participant_signed and one has_participant_paid call per participant
+            flags_view = 2 * count * json_size([True])
+        else:
+            bitmap = "0x" + "ff" * ((count + 7) // 8)
+            flags_view = json_size([str(count), bitmap, bitmap])
+        results.append(LayoutCost(
+            layout=layout,
+            participants=count,
+            session_bytes=hot,
+            cold_bytes=cold,
+            create_fee_octas=slots * FEE_PER_SLOT + (hot + cold) * FEE_PER_BYTE,
+            update_io_gas=io_gas([hot], [hot]),
+            participants_view_bytes=participants_payload(count, payment_timestamps=layout == "struct"),
+            flags_view_bytes=flags_view,
+        ))
+    return results
+
+
+def run(counts=PARTICIPANT_COUNTS) -> List[LayoutCost]:
+    return [cost for count in counts for cost in measure(count)]
+
+
+def table(costs: List[LayoutCost]) -> str:
+    lines = [f"{'participants':>12} {'layout':>8} {'session B':>10} {'cold B':>8} {'create fee':>11} "
+             f"{'update io':>10} {'flags view B':>13}"]
+    for cost in costs:
+        lines.append(f"{cost.participants:>12} {cost.layout:>8} {cost.session_bytes:>10} {cost.cold_bytes:>8} "
+                     f"{cost.create_fee_octas:>11} {cost.update_io_gas:>10.2f} "
+                     f"{cost.flags_view_bytes:>13}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare participant storage layouts")
+    parser.add_argument("--counts", default=",".join(str(c) for c in PARTICIPANT_COUNTS))
+    parser.add_argument("--json", help="write results as JSON")
+    args = parser.parse_args()
+
+    costs = run([int(c) for c in args.counts.split(",")])
+    print("📏 Participant storage: struct vector vs bitmap columns")
+    print(table(costs))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([asdict(cost) for cost in costs], f, indent=2)
+        print(f"✅ Wrote {args.json}")
+    largest = [cost for cost in costs if cost.participants == max(c.participants for c in costs)]
+    before, after = largest
+    if after.update_io_gas >= before.update_io_gas:
+        print("❌ Column layout does not reduce the per-signature/payment rewrite")
+        sys.exit(1)
+    saved = 1 - after.session_bytes / before.session_bytes
+    print(f"✅ {after.participants} participants: session slot {saved:.0%} smaller, "
+          f"flag polling {before.flags_view_bytes} -> {after.flags_view_bytes} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,403 @@
+"""
+REST Transaction Submission
+Builds, signs and submits entry-function transactions straight to a fullnode over pooled
+HTTP connections. Transactions from one sender are pipelined with consecutive sequence
+numbers and independent senders are submitted concurrently.
+"""
+
+import http.client
+import json
+import queue
+import threading
+import time
+import urllib.parse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from accounts import TestAccount
+from backends import TxRequest, TxResult, normalize_address, parse_cli_arg
+from ed25519 import SigningKey
+from instrumentation import carry_steps, record_transactions
+from sequence import DEFAULT_MAX_IN_FLIGHT, SequenceNumberManager
+
+DEFAULT_MAX_GAS_AMOUNT = 200_000
+DEFAULT_GAS_UNIT_PRICE = 100
+DEFAULT_EXPIRATION_SECS = 60
+
+# vm_status prefixes for requests that never reached the node (safe to retry elsewhere)
+# and for accepted transactions whose outcome was never observed
+NOT_SUBMITTED = "NOT_SUBMITTED"
+PENDING_TIMEOUT = "PENDING_TIMEOUT"
+
+
+class TransportError(Exception):
+    """The node could not be reached or answered with an error status. `delivered` is set when
+    a request was sent but no answer came back, so the node may have acted on it"""
+
+    def __init__(self, message: str, status: int = 0, body: Any = None, delivered: bool = False):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+        self.delivered = delivered
+
+    @property
+    def retryable(self) -> bool:
+        """Connection failures and server errors; 4xx responses are real rejections"""
+        return self.status == 0 or self.status >= 500
+
+    @property
+    def rejected(self) -> bool:
+        """The node certainly did not act on the request: it never arrived or a 4xx refused it"""
+        return 400 <= self.status < 500 or (self.status == 0 and not self.delivered)
+
+
+class OutcomeUnknown(TransportError):
+    """A transaction was sent but neither its acceptance nor its rejection could be confirmed"""
+
+
+class HttpTransport:
+    """JSON over HTTP(S) with a pool of keep-alive connections shared by all worker threads"""
+
+    def __init__(self, base_url: str, pool_size: int = 16, timeout: float = 30.0):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.prefix = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self._pool: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self.requests = 0
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.request("GET", path, params=params)
+
+    def post(self, path: str, body: Any = None, params: Optional[Dict[str, Any]] = None) -> Any:
+        return self.request("POST", path, body=body, params=params)
+
+    def request(self, method: str, path: str, body: Any = None,
+                params: Optional[Dict[str, Any]] = None) -> Any:
+        url = self.prefix + path
+        if params:
+            url += "?" + urllib.parse.urlencode(params)
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+
+        with self._slots:
+            # A pooled connection may have been closed by the server; retry once on a fresh one
+            delivered = False
+            for attempt in range(2):
+                conn = self._checkout()
+                sent = False
+                try:
+                    conn.request(method, url, body=payload, headers=headers)
+                    sent = True
+                    response = conn.getresponse()
+                    data = response.read()
+                except (http.client.HTTPException, OSError) as error:
+                    conn.close()
+                    # Sent without an answer (e.g. a read timeout): the server may have acted on it
+                    delivered = delivered or sent
+                    if attempt == 1:
+                        raise TransportError(f"{method} {url} failed: {error}", delivered=delivered) from error
+                    continue
+                self._pool.put(conn)
+                break
+
+        self.requests += 1
+        try:
+            parsed = json.loads(data) if data else None
+        except ValueError:
+            parsed = data.decode(errors="replace")
+        if response.status >= 400:
+            message = parsed.get("message", data) if isinstance(parsed, dict) else data
+            raise TransportError(f"{method} {url} -> {response.status}: {message}", response.status, parsed)
+        return parsed
+
+    def close(self):
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+
+    def _checkout(self) -> http.client.HTTPConnection:
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            return cls(self.host, self.port, timeout=self.timeout)
+
+
+def json_argument(arg: str) -> Any:
+    """Encode a CLI-typed argument the way the REST API expects it in JSON payloads"""
+    arg_type = arg.partition(":")[0]
+    value = parse_cli_arg(arg)
+    if arg_type.startswith("vector<") and arg_type[len("vector<"):-1] in ("u64", "u128", "u256"):
+        return [str(item) for item in value]
+    if arg_type in ("u64", "u128", "u256"):
+        return str(value)
+    return value
+
+
+def entry_function_payload(module_address: str, function: str, args: Optional[List[str]]) -> Dict[str, Any]:
+    return {
+        "type": "entry_function_payload",
+        "function": f"{module_address}::{function}",
+        "type_arguments": [],
+        "arguments": [json_argument(arg) for arg in (args or [])],
+    }
+
+
+class SubmissionEngine:
+    """Pipeline signed transactions per sender and submit senders in parallel"""
+
+    def __init__(
+        self,
+        transport: HttpTransport,
+        module_address: str,
+        max_workers: int = 16,
+        max_gas_amount: int = DEFAULT_MAX_GAS_AMOUNT,
+        gas_unit_price: int = DEFAULT_GAS_UNIT_PRICE,
+        expiration_secs: int = DEFAULT_EXPIRATION_SECS,
+        wait_timeout: float = 60.0,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        sequence: Optional[SequenceNumberManager] = None,
+    ):
+        self.transport = transport
+        self.module_address = module_address
+        self.max_workers = max_workers
+        self.max_gas_amount = max_gas_amount
+        self.gas_unit_price = gas_unit_price
+        self.expiration_secs = expiration_secs
+        self.wait_timeout = wait_timeout
+        self.sequence = sequence or SequenceNumberManager(
+            self._fetch_sequence_number, max_in_flight=max_in_flight, expiration_secs=expiration_secs
+        )
+        self._keys: Dict[str, SigningKey] = {}
+
+    def submit_batch(self, requests: List[TxRequest]) -> List[TxResult]:
+        """Submit all requests and wait for them; results are returned in request order"""
+        by_sender: Dict[str, List[int]] = {}
+        for index, request in enumerate(requests):
+            by_sender.setdefault(normalize_address(request.sender.address), []).append(index)
+
+        results: List[Optional[TxResult]] = [None] * len(requests)
+        workers = max(1, min(self.max_workers, len(by_sender)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(carry_steps(self._submit_sender), sender, [requests[i] for i in indexes])
+                for sender, indexes in by_sender.items()
+            ]
+            for (sender, indexes), future in zip(by_sender.items(), futures):
+                for index, result in zip(indexes, future.result()):
+                    results[index] = result
+        return results
+
+    def _submit_sender(self, sender: str, requests: List[TxRequest]) -> List[TxResult]:
+        """Keep up to max_in_flight transactions outstanding for one sender.
+
+        Transactions are sent back to back; the oldest is only waited for once the sender's
+        in-flight window is full, and the rest are collected at the end.
+        """
+        results: List[Optional[TxResult]] = [None] * len(requests)
+        window = deque()
+        unreachable = None
+        for index, request in enumerate(requests):
+            start = time.perf_counter()
+            if unreachable is not None:
+                results[index] = self._failed(request, sender, start, f"{NOT_SUBMITTED}: {unreachable}")
+                continue
+            while window and self.sequence.at_capacity(sender):
+                self._collect(sender, window.popleft(), results)
+            try:
+                tx_hash, sequence_number = self._submit_with_resync(sender, request)
+            except OutcomeUnknown as error:
+                # It may still commit, so it must not be sent again elsewhere; the sender's later
+                # requests were never sent and stay safe to retry
+                unreachable = error
+                results[index] = self._failed(request, sender, start, f"{PENDING_TIMEOUT}: {error}")
+                continue
+            except TransportError as error:
+                if error.retryable:
+                    unreachable = error
+                    results[index] = self._failed(request, sender, start, f"{NOT_SUBMITTED}: {error}")
+                else:
+                    results[index] = self._failed(request, sender, start, str(error))
+                continue
+            window.append((index, request, tx_hash, sequence_number, start))
+
+        while window:
+            self._collect(sender, window.popleft(), results)
+        return results
+
+    def _submit_with_resync(self, sender: str, request: TxRequest):
+        """Submit once, resyncing and retrying if the node disagrees about the sequence number"""
+        try:
+            return self._sign_and_submit(sender, request)
+        except TransportError as error:
+            if isinstance(error, OutcomeUnknown) or "SEQUENCE_NUMBER" not in str(error):
+                raise
+            self.sequence.resync(sender)
+            return self._sign_and_submit(sender, request)
+
+    def _sign_and_submit(self, sender: str, request: TxRequest):
+        key = self._signing_key(request.sender.private_key)
+        sequence_number = self.sequence.allocate(sender)
+        transaction = {
+            "sender": sender,
+            "sequence_number": str(sequence_number),
+            "max_gas_amount": str(self.max_gas_amount),
+            "gas_unit_price": str(self.gas_unit_price),
+            "expiration_timestamp_secs": str(int(time.time()) + self.expiration_secs),
+            "payload": entry_function_payload(self.module_address, request.function, request.args),
+        }
+        try:
+            signing_message = self.transport.post("/transactions/encode_submission", transaction)
+        except TransportError:
+            # Nothing was submitted, so the number is still unused
+            self.sequence.release(sender, sequence_number)
+            raise
+        signature = key.sign(bytes.fromhex(signing_message[2:]))
+        transaction["signature"] = {
+            "type": "ed25519_signature",
+            "public_key": "0x" + key.public_key.hex(),
+            "signature": "0x" + signature.hex(),
+        }
+        try:
+            pending = self.transport.post("/transactions", transaction)
+        except TransportError as error:
+            if error.rejected:
+                # A transaction that was not accepted never consumes its sequence number
+                self.sequence.release(sender, sequence_number)
+                raise
+            return self._recover(sender, transaction, sequence_number, error), sequence_number
+        return pending["hash"], sequence_number
+
+    def _recover(self, sender: str, transaction: Dict[str, Any], sequence_number: int,
+                 error: TransportError) -> str:
+        """Settle a submission the node may have accepted without saying so (a timeout or 5xx).
+
+        The number is never re-signed with a new transaction: if the chain has not used it yet,
+        the same signed bytes are sent again, which the mempool takes as the same transaction.
+        Returns its hash, or raises OutcomeUnknown with the number left in flight.
+        """
+        tx_hash = self._hash_by_sequence(sender, sequence_number)
+        if tx_hash is not None:
+            return tx_hash
+        try:
+            return self.transport.post("/transactions", transaction)["hash"]
+        except TransportError as retry:
+            if "SEQUENCE_NUMBER_TOO_OLD" in str(retry):
+                # The first attempt committed in the meantime
+                tx_hash = self._hash_by_sequence(sender, sequence_number)
+                if tx_hash is not None:
+                    return tx_hash
+            elif 400 <= retry.status < 500:
+                # The same bytes were refused, so the first attempt was not accepted either
+                self.sequence.release(sender, sequence_number)
+                raise
+            raise OutcomeUnknown(f"{error}; resubmitting: {retry}", retry.status, retry.body,
+                                 delivered=True) from retry
+
+    def _hash_by_sequence(self, sender: str, sequence_number: int) -> Optional[str]:
+        """Hash of the sender's committed transaction with this sequence number, if any"""
+        try:
+            sent = self.transport.get(f"/accounts/{sender}/transactions",
+                                      params={"start": sequence_number, "limit": 1})
+        except TransportError:
+            return None
+        if sent and int(sent[0]["sequence_number"]) == sequence_number:
+            return sent[0]["hash"]
+        return None
+
+    def _collect(self, sender: str, entry, results: List[Optional[TxResult]]):
+        index, request, tx_hash, sequence_number, start = entry
+        result = self._wait(sender, request, tx_hash, start)
+        if result.vm_status.startswith(PENDING_TIMEOUT):
+            # Never saw it commit: let the chain tell us what happened to this number
+            self.sequence.resync(sender)
+        else:
+            self.sequence.committed(sender, sequence_number)
+        results[index] = result
+
+    def _failed(self, request: TxRequest, sender: str, start: float, status: str) -> TxResult:
+        return TxResult(False, request.function, sender, vm_status=status,
+                        duration=time.perf_counter() - start)
+
+    def _wait(self, sender: str, request: TxRequest, tx_hash: str, start: float) -> TxResult:
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            try:
+                tx = self.transport.get(f"/transactions/wait_by_hash/{tx_hash}")
+            except TransportError as error:
+                if error.status != 404 or time.monotonic() > deadline:
+                    return TxResult(False, request.function, sender, hash=tx_hash,
+                                    vm_status=f"{PENDING_TIMEOUT}: {error}",
+                                    duration=time.perf_counter() - start)
+                tx = {"type": "pending_transaction"}
+            if tx.get("type") != "pending_transaction":
+                break
+            if time.monotonic() > deadline:
+                return TxResult(False, request.function, sender, hash=tx_hash,
+                                vm_status=f"{PENDING_TIMEOUT}: not committed after {self.wait_timeout}s",
+                                duration=time.perf_counter() - start)
+            time.sleep(0.2)
+
+        return TxResult(
+            success=bool(tx.get("success")),
+            function=request.function,
+            sender=sender,
+            hash=tx_hash,
+            gas_used=int(tx.get("gas_used", 0)),
+            vm_status=tx.get("vm_status", ""),
+            events=tx.get("events", []),
+            duration=time.perf_counter() - start,
+        )
+
+    def _signing_key(self, private_key: str) -> SigningKey:
+        key = self._keys.get(private_key)
+        if key is None:
+            key = self._keys[private_key] = SigningKey.from_hex(private_key)
+        return key
+
+    def _fetch_sequence_number(self, sender: str) -> int:
+        try:
+            account = self.transport.get(f"/accounts/{sender}")
+        except TransportError as error:
+            if error.status == 404:
+                return 0
+            raise
+        return int(account["sequence_number"])
+
+
+class RestBackend:
+    """Backend that submits through a SubmissionEngine, falling back to another backend (the CLI)
+    when the node cannot be reached"""
+
+    local = False
+
+    def __init__(self, engine: SubmissionEngine, fallback=None):
+        self.engine = engine
+        self.module_address = engine.module_address
+        self.fallback = fallback
+
+    def run(self, sender: TestAccount, function: str, args: List[str] = None) -> TxResult:
+        return self.run_many([TxRequest(sender, function, args)])[0]
+
+    def run_many(self, requests: List[TxRequest]) -> List[TxResult]:
+        """Submit independent transactions together; one confirmation round for the batch"""
+        results = self.engine.submit_batch(requests)
+        unsent = [i for i, result in enumerate(results) if result.vm_status.startswith(NOT_SUBMITTED)]
+        record_transactions(result for result in results if not result.vm_status.startswith(NOT_SUBMITTED))
+        if unsent and self.fallback is not None:
+            print(f"⚠️  REST submission unavailable for {len(unsent)} transactions; falling back to CLI")
+            retried = self.fallback.run_many([requests[i] for i in unsent])
+            for index, result in zip(unsent, retried):
+                results[index] = result
+        return results
+
+    def view(self, function: str, args: List[str] = None) -> Any:
+        return self.engine.transport.post("/view", {
+            "function": f"{self.module_address}::{function}",
+            "type_arguments": [],
+            "arguments": [json_argument(arg) for arg in (args or [])],
+        })
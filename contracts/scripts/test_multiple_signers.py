@@ -4,17 +4,26 @@ Bill Splitter Testing Script
 Comprehensive testing for multiple signers with test tokens
 """
 
+import argparse
+import copy
 import json
-import subprocess
 import time
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-@dataclass
-class TestAccount:
-    address: str
-    private_key: str
-    balance: int = 0
+from accounts import TestAccount, parse_account_output
+from backends import CliBackend, TxRequest, TxResult, normalize_address
+from bill_simulator import SimulatorBackend
+from cli_runner import run_command
+from fake_node import FakeAptosNode
+from instrumentation import FAILED, Recorder, add_output_arguments
+from keystore import AccountKeystore, DEFAULT_KEYSTORE_PATH, FAUCET_AMOUNT
+from minting import BatchMinter, MintReport
+from move_cache import CONTRACTS_DIR
+from participant_reader import ParticipantReader
+from provisioning import AccountProvisioner, FaucetProvisioner
+from signing import BatchSigningDriver, compare
+from submission import HttpTransport, RestBackend, SubmissionEngine
 
 @dataclass
 class TestScenario:
@@ -25,70 +34,146 @@ class TestScenario:
     description: str
 
 class BillSplitterTester:
-    def __init__(self, network: str = "testnet"):
+    def __init__(
+        self,
+        network: str = "testnet",
+        provision_concurrency: int = 8,
+        keystore: Optional[AccountKeystore] = None,
+        backend=None,
+        submission: str = "rest",
+        node_url: Optional[str] = None,
+        faucet_url: Optional[str] = None,
+        module_address: Optional[str] = None,
+    ):
         self.network = network
-        self.base_url = f"https://fullnode.{network}.aptoslabs.com"
+        self.node_url = node_url or f"https://fullnode.{network}.aptoslabs.com/v1"
+        # Set when the modules are already published (e.g. a local fake node); otherwise the
+        # admin account publishes them
+        self.module_address = module_address
         self.admin_account = None
         self.merchant_account = None
         self.test_accounts = []
+        if faucet_url:
+            self.provisioner = FaucetProvisioner(self.node_url, faucet_url, concurrency=provision_concurrency)
+        else:
+            self.provisioner = AccountProvisioner(network, concurrency=provision_concurrency)
+        self.keystore = keystore
+        self.backend = backend
+        self.submission = submission
         
     def setup_test_environment(self):
         """Setup admin, merchant, and test accounts"""
         print("🚀 Setting up test environment...")
         
-        # Create admin account
-        result = subprocess.run([
-            "aptos", "account", "create", 
-            "--network", self.network
-        ], capture_output=True, text=True)
+        if self.backend is not None and self.backend.local:
+            self.admin_account = self.backend.new_account()
+            self.merchant_account = self.backend.new_account()
+            print("✅ Admin and merchant accounts created in simulator")
+            return
         
-        if result.returncode == 0:
-            print("✅ Admin account created")
-            self.admin_account = self._parse_account_output(result.stdout)
+        if self.keystore:
+            evicted = self.keystore.evict_stale()
+            if evicted:
+                print(f"🧹 Evicted {evicted} stale cached accounts")
         
-        # Create merchant account
-        result = subprocess.run([
-            "aptos", "account", "create",
-            "--network", self.network
-        ], capture_output=True, text=True)
+        self.admin_account = self._role_account("admin")
+        self.merchant_account = self._role_account("merchant")
         
-        if result.returncode == 0:
-            print("✅ Merchant account created")
-            self.merchant_account = self._parse_account_output(result.stdout)
-            
-        # Fund accounts from faucet
-        self._fund_from_faucet(self.admin_account.address)
-        self._fund_from_faucet(self.merchant_account.address)
-        
-    def create_test_accounts(self, count: int) -> List[TestAccount]:
-        """Create multiple test accounts for participants"""
-        print(f"👥 Creating {count} test accounts...")
-        
-        test_accounts = []
-        for i in range(count):
-            result = subprocess.run([
-                "aptos", "account", "create",
-                "--network", self.network
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                account = self._parse_account_output(result.stdout)
-                test_accounts.append(account)
-                self._fund_from_faucet(account.address)
-                print(f"  ✅ Created test account {i+1}: {account.address[:10]}...")
-            
-        self.test_accounts = test_accounts
-        return test_accounts
+        if self.keystore:
+            self._top_up([self.admin_account, self.merchant_account])
+            self.keystore.save()
+        else:
+            # Fund accounts from faucet
+            self._fund_from_faucet(self.admin_account.address)
+            self._fund_from_faucet(self.merchant_account.address)
+        
+    def create_test_accounts(self, count: int, concurrency: int = None) -> List[TestAccount]:
+        """Create and fund multiple test accounts for participants concurrently"""
+        provisioner = self.provisioner
+        if concurrency is not None:
+            provisioner = copy.copy(provisioner)
+            provisioner.concurrency = concurrency
+        
+        if self.backend is not None and self.backend.local:
+            self.test_accounts = [self.backend.new_account() for _ in range(count)]
+            print(f"👥 Created {count} simulator accounts")
+            return self.test_accounts
+        
+        cached = self.keystore.participants(count) if self.keystore else []
+        if cached:
+            print(f"♻️  Reusing {len(cached)} cached test accounts")
+            self._top_up(cached, provisioner)
+        
+        missing = count - len(cached)
+        created = []
+        if missing > 0:
+            print(f"👥 Creating {missing} test accounts ({provisioner.concurrency} concurrent)...")
+            created, summary = provisioner.provision(missing)
+            print(f"📈 Provisioning: {summary.describe()}")
+            if self.keystore:
+                self.keystore.add_participants(created, apt_balance=FAUCET_AMOUNT)
+        
+        if self.keystore:
+            self.keystore.save()
+        
+        self.test_accounts = cached + created
+        return self.test_accounts
+    
+    def _role_account(self, role: str) -> TestAccount:
+        """Load a cached admin/merchant account or create a new one"""
+        if self.keystore:
+            account = self.keystore.get_role(role)
+            if account:
+                print(f"♻️  Reusing cached {role} account {account.address[:10]}...")
+                return account
+        
+        account, _ = self.provisioner.create_account()
+        if account is None:
+            raise RuntimeError(f"Failed to create {role} account")
+        print(f"✅ {role.title()} account created")
+        if self.keystore:
+            self.keystore.put_role(role, account)
+        return account
+    
+    def _top_up(self, accounts: List[TestAccount], provisioner: AccountProvisioner = None):
+        """Fund only the cached accounts whose last known APT balance is below the threshold"""
+        provisioner = provisioner or self.provisioner
+        low = [a.address for a in accounts if self.keystore.needs_top_up(a.address)]
+        if not low:
+            return
+        print(f"  💰 Topping up {len(low)}/{len(accounts)} accounts below threshold")
+        for address, funded in provisioner.fund_many(low).items():
+            if funded:
+                self.keystore.record_funding(address)
+    
+    def refresh_cached_balances(self):
+        """Re-read on-chain APT balances for every cached account in use"""
+        accounts = [self.admin_account, self.merchant_account] + self.test_accounts
+        for account in accounts:
+            if account is None:
+                continue
+            balance = self.provisioner.fetch_apt_balance(account.address)
+            if balance is not None:
+                self.keystore.record_apt_balance(account.address, balance)
+        self.keystore.save()
     
     def deploy_contracts(self):
         """Deploy bill splitter contracts"""
         print("📦 Deploying contracts...")
         
-        result = subprocess.run([
+        if self._backend().local:
+            print("✅ Using in-process simulator, nothing to deploy")
+            return True
+        if self.module_address:
+            print(f"✅ Modules already published at {self.module_address[:10]}...")
+            return True
+        
+        result = run_command([
             "aptos", "move", "publish",
             "--network", self.network,
-            "--private-key", self.admin_account.private_key
-        ], capture_output=True, text=True)
+            "--private-key", self.admin_account.private_key,
+            "--assume-yes",
+        ], cwd=CONTRACTS_DIR, timeout=300)
         
         if result.returncode == 0:
             print("✅ Contracts deployed successfully")
@@ -98,47 +183,32 @@ class BillSplitterTester:
             return False
     
     def initialize_system(self):
-        """Initialize bill splitter and USDC systems"""
+        """Initialize the USDC system; the bill splitter modules set themselves up on publish"""
         print("🔧 Initializing systems...")
         
-        # Initialize bill splitter
-        result = subprocess.run([
-            "aptos", "move", "run",
-            "--function-id", f"{self.admin_account.address}::bill_splitter::initialize",
-            "--private-key", self.admin_account.private_key,
-            "--network", self.network
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("✅ Bill splitter initialized")
-        
         # Initialize USDC for testing
-        result = subprocess.run([
-            "aptos", "move", "run",
-            "--function-id", f"{self.admin_account.address}::usdc_utils::initialize_usdc",
-            "--private-key", self.admin_account.private_key,
-            "--network", self.network
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        result = self._run(self.admin_account, "usdc_utils::initialize_usdc")
+        if result.success:
             print("✅ USDC system initialized")
     
-    def mint_test_tokens(self, accounts: List[TestAccount], amount_per_account: int = 1000_000_000):
+    def mint_test_tokens(self, accounts: List[TestAccount], amount_per_account: int = 1000_000_000) -> MintReport:
         """Mint test USDC tokens for all test accounts"""
         print(f"💰 Minting {amount_per_account/1_000_000} USDC for each test account...")
         
+        report = BatchMinter(self._backend(), self.admin_account).mint(accounts, amount_per_account)
+        minted = {outcome.address for outcome in report.outcomes if outcome.success}
         for account in accounts:
-            result = subprocess.run([
-                "aptos", "move", "run",
-                "--function-id", f"{self.admin_account.address}::usdc_utils::mint_usdc_for_testing",
-                "--args", f"address:{account.address}", f"u64:{amount_per_account}",
-                "--private-key", self.admin_account.private_key,
-                "--network", self.network
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
+            if account.address in minted:
                 account.balance = amount_per_account
-                print(f"  ✅ Minted for {account.address[:10]}...")
+                if self.keystore:
+                    self.keystore.update_balance(account)
+        for outcome in report.failed:
+            print(f"  ❌ Mint failed for {outcome.address[:10]}...: {outcome.vm_status}")
+        print(f"  ✅ {report.describe()}")
+        
+        if self.keystore:
+            self.keystore.save()
+        return report
     
     def run_small_group_test(self, participants: List[TestAccount]):
         """Test scenario: 3-5 participants"""
@@ -173,20 +243,28 @@ class BillSplitterTester:
         """Test scenario: Large group stress test"""
         print(f"🧪 Running Large Group Stress Test ({num_participants} participants)...")
         
+        backend = self._backend()
+        if backend.local:
+            # The simulator has no test_suite module; drive the enhanced splitter directly
+            scenario = TestScenario(
+                name="large_group_stress_test",
+                participants=[backend.new_account() for _ in range(num_participants)],
+                total_amount=num_participants * 10_000_000,  # $10 per participant
+                required_signatures=num_participants // 2,
+                description="Large Group Stress Test"
+            )
+            return self._execute_enhanced_test_scenario(scenario, max_participants=1000)
+        
         # For stress test, we simulate without actual accounts
-        result = subprocess.run([
-            "aptos", "move", "run",
-            "--function-id", f"{self.admin_account.address}::test_suite::test_large_group_stress_test",
-            "--args", f"u64:{num_participants}",
-            "--private-key", self.admin_account.private_key,
-            "--network", self.network
-        ], capture_output=True, text=True)
+        result = self._run(self.admin_account, "test_suite::test_large_group_stress_test", [
+            f"u64:{num_participants}"
+        ])
         
-        if result.returncode == 0:
+        if result.success:
             print(f"✅ Large group stress test completed ({num_participants} participants)")
             return True
         else:
-            print(f"❌ Large group stress test failed: {result.stderr}")
+            print(f"❌ Large group stress test failed: {result.vm_status}")
             return False
     
     def _execute_test_scenario(self, scenario: TestScenario) -> bool:
@@ -198,58 +276,57 @@ class BillSplitterTester:
         names = [f"Participant_{i}" for i in range(len(scenario.participants))]
         
         # Create bill session
-        result = subprocess.run([
-            "aptos", "move", "run",
-            "--function-id", f"{self.admin_account.address}::bill_splitter::create_bill_session",
-            "--args", 
+        result = self._run(self.merchant_account, "bill_splitter::create_bill_session", [
             f"string:{session_id}",
             f"u64:{scenario.total_amount}",
             f"string:{scenario.description}",
             f"vector<address>:{','.join(addresses)}",
             f"vector<string>:{','.join(names)}",
             f"u64:{scenario.required_signatures}",
-            "--private-key", self.merchant_account.private_key,
-            "--network", self.network
-        ], capture_output=True, text=True)
+        ])
         
-        if result.returncode != 0:
-            print(f"❌ Failed to create bill session: {result.stderr}")
+        if not result.success:
+            print(f"❌ Failed to create bill session: {result.vm_status}")
             return False
         
         # Confirm participants
-        result = subprocess.run([
-            "aptos", "move", "run",
-            "--function-id", f"{self.admin_account.address}::bill_splitter::confirm_participants",
-            "--args", f"string:{session_id}",
-            "--private-key", self.merchant_account.private_key,
-            "--network", self.network
-        ], capture_output=True, text=True)
-        
-        # Participants sign
-        for participant in scenario.participants:
-            result = subprocess.run([
-                "aptos", "move", "run",
-                "--function-id", f"{self.admin_account.address}::bill_splitter::sign_bill_agreement",
-                "--args", f"string:{session_id}",
-                "--private-key", participant.private_key,
-                "--network", self.network
-            ], capture_output=True, text=True)
-        
-        # Participants pay
-        individual_amount = scenario.total_amount // len(scenario.participants)
-        for participant in scenario.participants:
-            result = subprocess.run([
-                "aptos", "move", "run",
-                "--function-id", f"{self.admin_account.address}::bill_splitter::submit_payment",
-                "--args", f"string:{session_id}", f"u64:{individual_amount}",
-                "--private-key", participant.private_key,
-                "--network", self.network
-            ], capture_output=True, text=True)
+        result = self._run(self.merchant_account, "bill_splitter::confirm_participants", [
+            f"string:{session_id}"
+        ])
+        if not result.success:
+            print(f"❌ Failed to confirm participants: {result.vm_status}")
+            return False
+        
+        # Participants sign (independent senders, submitted together)
+        signatures = self._backend().run_many([
+            TxRequest(participant, "bill_splitter::sign_bill_agreement", [f"string:{session_id}"])
+            for participant in scenario.participants
+        ])
+        signed = sum(1 for r in signatures if r.success)
+        if signed < scenario.required_signatures:
+            print(f"❌ {scenario.name} got {signed}/{scenario.required_signatures} signatures")
+            return False
         
+        # Participants pay what the session says they owe: the first total % count owe one unit more
+        owed = {state.address: state.amount_owed
+                for state in ParticipantReader(self._backend(), ttl=0).participants(session_id)}
+        payments = self._backend().run_many([
+            TxRequest(participant, "bill_splitter::submit_payment", [
+                f"string:{session_id}", f"u64:{owed[normalize_address(participant.address)]}"
+            ])
+            for participant in scenario.participants
+        ])
+        
+        paid = sum(1 for r in payments if r.success)
+        print(f"  ✍️  {signed}/{len(signatures)} signatures, 💸 {paid}/{len(payments)} payments")
+        for failed in (r for r in payments if not r.success):
+            print(f"  ❌ Payment from {failed.sender[:10]}... failed: {failed.vm_status}")
+        if paid < len(payments):
+            return False
         print(f"✅ {scenario.name} completed successfully")
         return True
     
-    def _execute_enhanced_test_scenario(self, scenario: TestScenario) -> bool:
+    def _execute_enhanced_test_scenario(self, scenario: TestScenario, max_participants: int = 100) -> bool:
         """Execute a test scenario using the enhanced bill splitter"""
         session_id = f"ENHANCED_TEST_{scenario.name.upper()}_{int(time.time())}"
         
@@ -257,51 +334,93 @@ class BillSplitterTester:
         addresses = [p.address for p in scenario.participants]
         names = [f"Enhanced_Participant_{i}" for i in range(len(scenario.participants))]
         
-        result = subprocess.run([
-            "aptos", "move", "run",
-            "--function-id", f"{self.admin_account.address}::enhanced_bill_splitter::create_enhanced_bill_session",
-            "--args",
+        result = self._run(self.merchant_account, "enhanced_bill_splitter::create_enhanced_bill_session", [
             f"string:{session_id}",
             f"u64:{scenario.total_amount}",
             f"string:{scenario.description}",
             f"vector<address>:{','.join(addresses)}",
             f"vector<string>:{','.join(names)}",
             f"u64:{scenario.required_signatures}",
-            f"u64:100",  # max_participants
-            "--private-key", self.merchant_account.private_key,
-            "--network", self.network
-        ], capture_output=True, text=True)
+            f"u64:{max_participants}",
+        ])
         
-        if result.returncode != 0:
-            print(f"❌ Failed to create enhanced bill session: {result.stderr}")
+        if not result.success:
+            print(f"❌ Failed to create enhanced bill session: {result.vm_status}")
+            return False
+        
+        # Collect signatures in MAX_BATCH_SIZE chunks, stopping at the threshold
+        report = BatchSigningDriver(self._backend(), self.merchant_account).sign(
+            session_id, addresses, scenario.required_signatures
+        )
+        print(f"  ✍️  {report.describe()}")
+        if not report.approved:
+            print(f"❌ {scenario.name} did not reach {scenario.required_signatures} signatures")
             return False
         
         print(f"✅ Enhanced {scenario.name} completed successfully")
         return True
     
+    def compare_signing_paths(self, participants: List[TestAccount], required_signatures: int = None):
+        """Collect the same signatures with batch_sign_agreements and with one
+        sign_bill_agreement per participant, and report signatures/second for both"""
+        print(f"🧪 Comparing signing paths ({len(participants)} participants)...")
+        required = required_signatures or len(participants)
+        addresses = [p.address for p in participants]
+        names = [f"Participant_{i}" for i in range(len(participants))]
+        total_amount = len(participants) * 1_000_000
+        suffix = int(time.time())
+        driver = BatchSigningDriver(self._backend(), self.merchant_account)
+        
+        batch_session = f"SIGNING_BATCH_{suffix}"
+        self._run(self.merchant_account, "enhanced_bill_splitter::create_enhanced_bill_session", [
+            f"string:{batch_session}", f"u64:{total_amount}", "string:Signing comparison",
+            f"vector<address>:{','.join(addresses)}", f"vector<string>:{','.join(names)}",
+            f"u64:{required}", f"u64:{max(len(participants), 100)}",
+        ])
+        batched = driver.sign(batch_session, addresses, required)
+        
+        individual_session = f"SIGNING_INDIVIDUAL_{suffix}"
+        self._run(self.merchant_account, "bill_splitter::create_bill_session", [
+            f"string:{individual_session}", f"u64:{total_amount}", "string:Signing comparison",
+            f"vector<address>:{','.join(addresses)}", f"vector<string>:{','.join(names)}",
+            f"u64:{required}",
+        ])
+        self._run(self.merchant_account, "bill_splitter::confirm_participants", [
+            f"string:{individual_session}"
+        ])
+        individual = driver.sign_individually(individual_session, participants, required)
+        
+        print(f"  ✍️  {batched.describe()}")
+        print(f"  ✍️  {individual.describe()}")
+        print(f"  📊 {compare(batched, individual)}")
+        return batched, individual
+    
+    def _backend(self):
+        """Backend used for entry function calls; defaults to direct REST submission against the
+        admin's modules with the CLI as fallback"""
+        if self.backend is None:
+            module_address = self.module_address or self.admin_account.address
+            cli = CliBackend(self.network, module_address)
+            if self.submission == "rest":
+                engine = SubmissionEngine(HttpTransport(self.node_url), module_address)
+                # The CLI only knows the public networks, so a custom node gets no fallback
+                custom_node = self.node_url != f"https://fullnode.{self.network}.aptoslabs.com/v1"
+                self.backend = RestBackend(engine, fallback=None if custom_node else cli)
+            else:
+                self.backend = cli
+        return self.backend
+    
+    def _run(self, sender: TestAccount, function: str, args: List[str] = None) -> TxResult:
+        return self._backend().run(sender, function, args)
+    
     def _parse_account_output(self, output: str) -> TestAccount:
         """Parse account creation output to extract address and private key"""
-        lines = output.strip().split('\n')
-        address = None
-        private_key = None
-        
-        for line in lines:
-            if 'Account address:' in line:
-                address = line.split(':')[-1].strip()
-            elif 'Private key:' in line:
-                private_key = line.split(':')[-1].strip()
-        
-        return TestAccount(address=address, private_key=private_key)
+        return parse_account_output(output)
     
     def _fund_from_faucet(self, address: str):
-        """Fund account from testnet faucet"""
-        result = subprocess.run([
-            "aptos", "account", "fund-with-faucet",
-            "--account", address,
-            "--network", self.network
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        """Fund account from the faucet"""
+        funded, _ = self.provisioner.fund_account(address)
+        if funded:
             print(f"  💰 Funded {address[:10]}... from faucet")
 
 def main():
@@ -309,36 +428,93 @@ def main():
     print("🎯 Bill Splitter Multi-Signer Testing Suite")
     print("=" * 50)
     
-    tester = BillSplitterTester("testnet")
+    parser = argparse.ArgumentParser(description="Bill splitter multi-signer tests")
+    parser.add_argument("--network", default="testnet")
+    parser.add_argument("--accounts", type=int, default=20, help="number of participant accounts")
+    parser.add_argument("--concurrency", type=int, default=8, help="concurrent account provisioning calls")
+    parser.add_argument("--keystore", default=DEFAULT_KEYSTORE_PATH, help="account cache file")
+    parser.add_argument("--no-cache", action="store_true", help="always provision fresh accounts")
+    parser.add_argument("--refresh-balances", action="store_true", help="re-read cached APT balances")
+    parser.add_argument("--compare-signing", action="store_true",
+                        help="also compare batched and per-participant signature collection")
+    parser.add_argument("--backend", choices=["rest", "cli", "simulator", "local"], default="rest",
+                        help="submit over REST (CLI fallback), only via the aptos CLI, use the in-process "
+                             "simulator, or submit over REST to a local fake node started for this run")
+    parser.add_argument("--node-url", help="REST endpoint (ending in /v1) instead of the public fullnode")
+    parser.add_argument("--faucet-url", help="faucet endpoint; accounts are then created without the CLI")
+    parser.add_argument("--module-address", help="address the modules are already published at")
+    add_output_arguments(parser)
+    args = parser.parse_args()
+    
+    simulate = args.backend == "simulator"
+    node = None
+    if args.backend == "local":
+        node = FakeAptosNode()
+        node.start()
+        args.node_url, args.faucet_url, args.module_address = node.url, node.root_url, node.module_address
+        print(f"🛰️  Local fake node at {node.url}")
+    custom_node = args.node_url is not None
+    keystore = (None if args.no_cache or simulate or custom_node
+                else AccountKeystore(args.keystore, network=args.network))
+    tester = BillSplitterTester(
+        args.network,
+        provision_concurrency=args.concurrency,
+        keystore=keystore,
+        backend=SimulatorBackend() if simulate else None,
+        submission="cli" if args.backend == "cli" else "rest",
+        node_url=args.node_url,
+        faucet_url=args.faucet_url,
+        module_address=args.module_address,
+    )
+    
+    recorder = Recorder.from_args("multi_signer_integration", args)
     
     # Setup environment
-    tester.setup_test_environment()
+    with recorder.step("setup_environment"):
+        tester.setup_test_environment()
     
     # Create test accounts
-    test_accounts = tester.create_test_accounts(20)  # Create 20 test accounts
+    with recorder.step("create_test_accounts"):
+        test_accounts = tester.create_test_accounts(args.accounts)
+        if keystore and args.refresh_balances:
+            tester.refresh_cached_balances()
     
     # Deploy contracts
-    if not tester.deploy_contracts():
+    if not recorder.run_test("deploy_contracts", tester.deploy_contracts).passed:
+        recorder.write()
         return
     
     # Initialize systems
-    tester.initialize_system()
+    with recorder.step("initialize_system"):
+        tester.initialize_system()
     
     # Mint test tokens
-    tester.mint_test_tokens(test_accounts)
+    with recorder.step("mint_test_tokens") as step:
+        report = tester.mint_test_tokens(test_accounts)
+        if report.failed:
+            step.status, step.message = FAILED, f"{len(report.failed)} mints failed"
     
     # Run test scenarios
     print("\n🧪 STARTING TEST SCENARIOS")
     print("-" * 30)
     
     # Small group test
-    tester.run_small_group_test(test_accounts)
+    recorder.run_test("small_group", lambda: tester.run_small_group_test(test_accounts))
     
     # Medium group test
-    tester.run_medium_group_test(test_accounts)
+    recorder.run_test("medium_group", lambda: tester.run_medium_group_test(test_accounts))
     
     # Large group stress test
-    tester.run_large_group_stress_test(100)
+    recorder.run_test("large_group_stress", lambda: tester.run_large_group_stress_test(100))
+    
+    if args.compare_signing:
+        recorder.run_test("compare_signing", lambda: tester.compare_signing_paths(test_accounts))
+    
+    print("\n📊 STEP TIMINGS")
+    print(recorder.summary())
+    recorder.write()
+    if node is not None:
+        node.stop()
     
     print("\n🎉 All tests completed!")
     print("Check the blockchain for transaction results.")
@@ -3,59 +3,91 @@
 /// Handles stablecoin settlements and bill management
 module bill_split::bill_splitter {
     use std::signer;
-    use std::string::String;
+    use std::string::{Self, String};
     use std::vector;
-    use aptos_framework::coin;
+    use aptos_framework::aggregator_v2::{Self, Aggregator};
+    use aptos_framework::coin::{Self, Coin};
     use aptos_framework::timestamp;
-    use aptos_framework::event::{Self, EventHandle};
-    use aptos_framework::account;
-    use aptos_std::smart_table::{Self, SmartTable};
+    use aptos_framework::event;
+    use aptos_framework::object::{Self, ExtendRef};
     use aptos_framework::aptos_coin::AptosCoin;
+    use bill_split::participant_bitmap;
 
     // USDC coin type from usdc_utils module
 
-    // Participant information
-    struct Participant has store, copy, drop {
+    // Participant information as returned by get_participants; sessions store it by column
+    struct Participant has copy, drop {
         address: address,
         name: String,
         amount_owed: u64,
         has_signed: bool,
         has_paid: bool,
-        payment_timestamp: u64,
     }
 
-    // Bill session structure
-    struct BillSession has key, store {
+    // Bill session structure, stored in its own object (see session_address) so transactions
+    // on different sessions never write the same resource
+    struct BillSession has key {
         session_id: String,
         merchant_address: address,
         multisig_address: address, // Aptos native multisig account for approvals
         total_amount: u64,
         description: String,
-        participants: vector<Participant>,
+        // Hot participant columns, indexed by participant position
+        participant_addresses: vector<address>,
+        amounts_owed: vector<u64>,
+        signed_bits: vector<u8>, // participant_bitmap layout
+        paid_bits: vector<u8>,
         required_signatures: u64,
-        current_signatures: u64,
+        current_signatures: u64, // participants that have signed
         status: u8, // 0: created, 1: participants_added, 2: approved, 3: settled, 4: cancelled
         created_at: u64,
         approved_at: u64,
         settled_at: u64,
         payments_received: u64,
+        paid_count: u64, // participants that have paid
+    }
+
+    // Names are only read by get_participants, so they sit in a second resource of the
+    // session object and signing or paying never rewrites them
+    struct ParticipantNames has key {
+        names: vector<String>,
+    }
+
+    // Payments held until the session settles, then swept to the merchant in one deposit
+    struct SessionEscrow has key {
+        coins: Coin<AptosCoin>,
+    }
+
+    // Kept in every session object so prune_sessions can write its summary there
+    struct SessionRefs has key {
+        extend_ref: ExtendRef,
+    }
+
+    // What remains of a settled or cancelled session after prune_sessions reclaims it
+    struct SessionSummary has key {
+        session_id: String,
+        merchant_address: address,
+        total_amount: u64,
+        payments_received: u64,
+        participant_count: u64,
+        status: u8,
+        created_at: u64,
+        settled_at: u64,
     }
 
-    // Global registry for bill sessions
+    // Global session counter; aggregator updates from concurrent creates do not conflict
     struct BillRegistry has key {
-        sessions: SmartTable<String, BillSession>,
-        session_counter: u64,
+        session_counter: Aggregator<u64>,
     }
 
-    // Events for frontend/backend sync
-    struct BillEvents has key {
-        session_created: EventHandle<SessionCreatedEvent>,
-        participant_added: EventHandle<ParticipantAddedEvent>,
-        bill_approved: EventHandle<BillApprovedEvent>,
-        payment_received: EventHandle<PaymentReceivedEvent>,
-        bill_settled: EventHandle<BillSettledEvent>,
+    // Owns the session objects. Creates only read it, so it is never a write hotspot
+    struct SessionFactory has key {
+        extend_ref: ExtendRef,
     }
 
+    // Module events for frontend/backend sync; unlike handle events they share no counter
+
+    #[event]
     struct SessionCreatedEvent has drop, store {
         session_id: String,
         merchant_address: address,
@@ -64,6 +96,7 @@ module bill_split::bill_splitter {
         required_signatures: u64,
     }
 
+    #[event]
     struct ParticipantAddedEvent has drop, store {
         session_id: String,
         participant_address: address,
@@ -71,19 +104,35 @@ module bill_split::bill_splitter {
         amount_owed: u64,
     }
 
+    #[event]
     struct BillApprovedEvent has drop, store {
         session_id: String,
         multisig_address: address,
         signatures_collected: u64,
     }
 
+    // One per payment as it enters the escrow, so open sessions show who has paid. Sessions
+    // keep no payment times; paid_at is only reported here
+    #[event]
     struct PaymentReceivedEvent has drop, store {
         session_id: String,
         participant_address: address,
         amount_paid: u64,
         remaining_amount: u64,
+        paid_at: u64,
     }
 
+    // Escrowed payments of a session moved to the merchant by one deposit
+    #[event]
+    struct BatchPaymentEvent has drop, store {
+        session_id: String,
+        payments: vector<address>,
+        amounts: vector<u64>,
+        total_amount_paid: u64,
+        timestamp: u64,
+    }
+
+    #[event]
     struct BillSettledEvent has drop, store {
         session_id: String,
         total_collected: u64,
@@ -91,6 +140,12 @@ module bill_split::bill_splitter {
         settled_at: u64,
     }
 
+    #[event]
+    struct SessionsPrunedEvent has drop, store {
+        session_ids: vector<String>,
+        pruned_at: u64,
+    }
+
     // Error codes
     const E_BILL_SESSION_NOT_FOUND: u64 = 1;
     const E_UNAUTHORIZED: u64 = 2;
@@ -101,6 +156,9 @@ module bill_split::bill_splitter {
     const E_NOT_ALL_SIGNATURES_COLLECTED: u64 = 7;
     const E_INVALID_AMOUNT: u64 = 8;
     const E_MULTISIG_CREATION_FAILED: u64 = 9;
+    const E_BATCH_TOO_LARGE: u64 = 11;
+
+    const MAX_PRUNE_BATCH: u64 = 50;
 
     // Status constants
     const STATUS_CREATED: u8 = 0;
@@ -109,26 +167,44 @@ module bill_split::bill_splitter {
     const STATUS_SETTLED: u8 = 3;
     const STATUS_CANCELLED: u8 = 4;
 
+    // Seed of the factory object that session objects are created under
+    const FACTORY_SEED: vector<u8> = b"bill_splitter::sessions";
+
+    fun init_module(deployer: &signer) {
+        ensure_initialized(deployer);
+    }
+
     /// Initialize the bill splitting module (auto-initialize on first use)
     fun ensure_initialized(admin: &signer) {
         if (!exists<BillRegistry>(@bill_split)) {
             move_to(admin, BillRegistry {
-                sessions: smart_table::new(),
-                session_counter: 0,
+                session_counter: aggregator_v2::create_unbounded_aggregator(),
             });
-        };
-        
-        if (!exists<BillEvents>(@bill_split)) {
-            move_to(admin, BillEvents {
-                session_created: account::new_event_handle<SessionCreatedEvent>(admin),
-                participant_added: account::new_event_handle<ParticipantAddedEvent>(admin),
-                bill_approved: account::new_event_handle<BillApprovedEvent>(admin),
-                payment_received: account::new_event_handle<PaymentReceivedEvent>(admin),
-                bill_settled: account::new_event_handle<BillSettledEvent>(admin),
+            let constructor = object::create_named_object(admin, FACTORY_SEED);
+            move_to(admin, SessionFactory {
+                extend_ref: object::generate_extend_ref(&constructor),
             });
         };
     }
 
+    /// Object address of a session: derived from its id alone, so no shared index is read or written
+    fun session_address(session_id: String): address {
+        let factory = object::create_object_address(&@bill_split, FACTORY_SEED);
+        object::create_object_address(&factory, *string::bytes(&session_id))
+    }
+
+    fun borrow_session(session_id: String): &BillSession acquires BillSession {
+        let session_addr = session_address(session_id);
+        assert!(exists<BillSession>(session_addr), E_BILL_SESSION_NOT_FOUND);
+        borrow_global<BillSession>(session_addr)
+    }
+
+    fun borrow_session_mut(session_id: String): &mut BillSession acquires BillSession {
+        let session_addr = session_address(session_id);
+        assert!(exists<BillSession>(session_addr), E_BILL_SESSION_NOT_FOUND);
+        borrow_global_mut<BillSession>(session_addr)
+    }
+
     /// Create a new bill session with native multisig
     public entry fun create_bill_session(
         merchant: &signer,
@@ -138,7 +214,7 @@ module bill_split::bill_splitter {
         participant_addresses: vector<address>,
         participant_names: vector<String>,
         required_signatures: u64,
-    ) acquires BillRegistry, BillEvents {
+    ) acquires BillRegistry, SessionFactory {
         // Auto-initialize if needed
         ensure_initialized(merchant);
         
@@ -147,27 +223,11 @@ module bill_split::bill_splitter {
         assert!(vector::length(&participant_addresses) > 0, E_INVALID_AMOUNT);
         assert!(required_signatures > 0 && required_signatures <= vector::length(&participant_addresses), E_INVALID_AMOUNT);
 
-        let registry = borrow_global_mut<BillRegistry>(@bill_split);
-        
-        // Calculate individual amounts (equal split for MVP)
+        // Calculate individual amounts (equal split for MVP); the first `remainder` participants
+        // owe one extra unit so the shares always add up to total_amount
         let participant_count = vector::length(&participant_addresses);
-        let individual_amount = total_amount / (participant_count as u64);
-
-        // Create participants vector
-        let participants = vector::empty<Participant>();
-        let i = 0;
-        while (i < participant_count) {
-            let participant = Participant {
-                address: *vector::borrow(&participant_addresses, i),
-                name: *vector::borrow(&participant_names, i),
-                amount_owed: individual_amount,
-                has_signed: false,
-                has_paid: false,
-                payment_timestamp: 0,
-            };
-            vector::push_back(&mut participants, participant);
-            i = i + 1;
-        };
+        let individual_amount = total_amount / participant_count;
+        let remainder = total_amount % participant_count;
 
         // Create multisig account for this bill (using Aptos native multisig)
         let multisig_address = create_multisig_account(
@@ -176,13 +236,44 @@ module bill_split::bill_splitter {
             required_signatures
         );
 
+        // Emit event
+        event::emit(SessionCreatedEvent {
+            session_id,
+            merchant_address: merchant_addr,
+            multisig_address,
+            total_amount,
+            required_signatures,
+        });
+
+        // Create participant columns; each participant is announced so indexers know the
+        // session's members and shares before anyone pays
+        let amounts_owed = vector::empty<u64>();
+        let names = vector::empty<String>();
+        let i = 0;
+        while (i < participant_count) {
+            let share = if (i < remainder) { individual_amount + 1 } else { individual_amount };
+            let name = *vector::borrow(&participant_names, i);
+            event::emit(ParticipantAddedEvent {
+                session_id,
+                participant_address: *vector::borrow(&participant_addresses, i),
+                participant_name: name,
+                amount_owed: share,
+            });
+            vector::push_back(&mut amounts_owed, share);
+            vector::push_back(&mut names, name);
+            i = i + 1;
+        };
+
         let bill_session = BillSession {
             session_id: session_id,
             merchant_address: merchant_addr,
             multisig_address,
             total_amount,
             description,
-            participants,
+            participant_addresses,
+            amounts_owed,
+            signed_bits: participant_bitmap::new(participant_count),
+            paid_bits: participant_bitmap::new(participant_count),
             required_signatures,
             current_signatures: 0,
             status: STATUS_CREATED,
@@ -190,19 +281,23 @@ module bill_split::bill_splitter {
             approved_at: 0,
             settled_at: 0,
             payments_received: 0,
+            paid_count: 0,
         };
 
-        smart_table::add(&mut registry.sessions, session_id, bill_session);
+        // Aborts with object::EOBJECT_EXISTS if the session id is taken
+        let factory = borrow_global<SessionFactory>(@bill_split);
+        let constructor = object::create_named_object(
+            &object::generate_signer_for_extending(&factory.extend_ref),
+            *string::bytes(&session_id)
+        );
+        let session_signer = object::generate_signer(&constructor);
+        move_to(&session_signer, bill_session);
+        move_to(&session_signer, ParticipantNames { names });
+        move_to(&session_signer, SessionEscrow { coins: coin::zero<AptosCoin>() });
+        move_to(&session_signer, SessionRefs { extend_ref: object::generate_extend_ref(&constructor) });
 
-        // Emit event
-        let events = borrow_global_mut<BillEvents>(@bill_split);
-        event::emit_event(&mut events.session_created, SessionCreatedEvent {
-            session_id,
-            merchant_address: merchant_addr,
-            multisig_address,
-            total_amount,
-            required_signatures,
-        });
+        let registry = borrow_global_mut<BillRegistry>(@bill_split);
+        aggregator_v2::add(&mut registry.session_counter, 1);
     }
 
     /// Helper function to create a simple multisig identifier
@@ -224,42 +319,29 @@ module bill_split::bill_splitter {
         session_id: String,
         participant_address: address,
         new_amount: u64,
-    ) acquires BillRegistry {
+    ) acquires BillSession {
         let merchant_addr = signer::address_of(merchant);
-        let registry = borrow_global_mut<BillRegistry>(@bill_split);
-        
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        let bill_session = smart_table::borrow_mut(&mut registry.sessions, session_id);
+        let bill_session = borrow_session_mut(session_id);
         
         assert!(bill_session.merchant_address == merchant_addr, E_UNAUTHORIZED);
         assert!(bill_session.status == STATUS_CREATED, E_INVALID_STATUS);
 
         // Find and update participant
-        let participants = &mut bill_session.participants;
-        let i = 0;
-        let found = false;
-        while (i < vector::length(participants)) {
-            let participant = vector::borrow_mut(participants, i);
-            if (participant.address == participant_address) {
-                participant.amount_owed = new_amount;
-                found = true;
-                break
-            };
-            i = i + 1;
-        };
+        let (found, i) = vector::index_of(&bill_session.participant_addresses, &participant_address);
         assert!(found, E_PARTICIPANT_NOT_FOUND);
+        let old_amount = *vector::borrow(&bill_session.amounts_owed, i);
+        *vector::borrow_mut(&mut bill_session.amounts_owed, i) = new_amount;
+        // total_amount stays the sum of the shares, so paying every share settles the bill
+        bill_session.total_amount = bill_session.total_amount - old_amount + new_amount;
     }
 
     /// Confirm participants and move to approval phase
     public entry fun confirm_participants(
         merchant: &signer,
         session_id: String,
-    ) acquires BillRegistry {
+    ) acquires BillSession {
         let merchant_addr = signer::address_of(merchant);
-        let registry = borrow_global_mut<BillRegistry>(@bill_split);
-        
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        let bill_session = smart_table::borrow_mut(&mut registry.sessions, session_id);
+        let bill_session = borrow_session_mut(session_id);
         
         assert!(bill_session.merchant_address == merchant_addr, E_UNAUTHORIZED);
         assert!(bill_session.status == STATUS_CREATED, E_INVALID_STATUS);
@@ -271,31 +353,18 @@ module bill_split::bill_splitter {
     public entry fun sign_bill_agreement(
         participant: &signer,
         session_id: String,
-    ) acquires BillRegistry, BillEvents {
+    ) acquires BillSession {
         let participant_addr = signer::address_of(participant);
-        let registry = borrow_global_mut<BillRegistry>(@bill_split);
-        
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        let bill_session = smart_table::borrow_mut(&mut registry.sessions, session_id);
+        let bill_session = borrow_session_mut(session_id);
         
         assert!(bill_session.status == STATUS_PARTICIPANTS_ADDED, E_INVALID_STATUS);
 
         // Find participant and mark as signed
-        let participants = &mut bill_session.participants;
-        let i = 0;
-        let found = false;
-        while (i < vector::length(participants)) {
-            let participant_data = vector::borrow_mut(participants, i);
-            if (participant_data.address == participant_addr) {
-                assert!(!participant_data.has_signed, E_ALREADY_PAID);
-                participant_data.has_signed = true;
-                bill_session.current_signatures = bill_session.current_signatures + 1;
-                found = true;
-                break
-            };
-            i = i + 1;
-        };
+        let (found, i) = vector::index_of(&bill_session.participant_addresses, &participant_addr);
         assert!(found, E_PARTICIPANT_NOT_FOUND);
+        assert!(!participant_bitmap::is_set(&bill_session.signed_bits, i), E_ALREADY_PAID);
+        participant_bitmap::set(&mut bill_session.signed_bits, i);
+        bill_session.current_signatures = bill_session.current_signatures + 1;
 
         // Check if we have enough signatures
         if (bill_session.current_signatures >= bill_session.required_signatures) {
@@ -303,8 +372,7 @@ module bill_split::bill_splitter {
             bill_session.approved_at = timestamp::now_seconds();
 
             // Emit approval event
-            let events = borrow_global_mut<BillEvents>(@bill_split);
-            event::emit_event(&mut events.bill_approved, BillApprovedEvent {
+            event::emit(BillApprovedEvent {
                 session_id,
                 multisig_address: bill_session.multisig_address,
                 signatures_collected: bill_session.current_signatures,
@@ -312,67 +380,62 @@ module bill_split::bill_splitter {
         };
     }
 
-    /// Submit payment in USDC stablecoin
+    /// Submit payment in USDC stablecoin. Payments wait in the session escrow and the
+    /// payment that settles the bill sweeps them to the merchant in one deposit
     public entry fun submit_payment(
         participant: &signer,
         session_id: String,
         payment_amount: u64
-    ) acquires BillRegistry, BillEvents {
+    ) acquires BillSession, SessionEscrow {
         let participant_addr = signer::address_of(participant);
-        let registry = borrow_global_mut<BillRegistry>(@bill_split);
-        
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        let bill_session = smart_table::borrow_mut(&mut registry.sessions, session_id);
+        let bill_session = borrow_session_mut(session_id);
         
         assert!(bill_session.status == STATUS_APPROVED, E_INVALID_STATUS);
 
         // Find participant and validate payment
-        let participants = &mut bill_session.participants;
-        let i = 0;
-        let found = false;
-        let amount_owed = 0;
-        while (i < vector::length(participants)) {
-            let participant_data = vector::borrow_mut(participants, i);
-            if (participant_data.address == participant_addr) {
-                assert!(!participant_data.has_paid, E_ALREADY_PAID);
-                amount_owed = participant_data.amount_owed;
-                found = true;
-                break
-            };
-            i = i + 1;
-        };
+        let (found, i) = vector::index_of(&bill_session.participant_addresses, &participant_addr);
         assert!(found, E_PARTICIPANT_NOT_FOUND);
+        assert!(!participant_bitmap::is_set(&bill_session.paid_bits, i), E_ALREADY_PAID);
+        let amount_owed = *vector::borrow(&bill_session.amounts_owed, i);
 
         assert!(payment_amount >= amount_owed, E_INSUFFICIENT_PAYMENT);
 
-        // Withdraw payment from participant
+        // Withdraw payment from participant into the session escrow
         let payment_coin = coin::withdraw<AptosCoin>(participant, payment_amount);
-
-        // Handle payment - send to merchant
-        coin::deposit(bill_session.merchant_address, payment_coin);
+        let escrow = borrow_global_mut<SessionEscrow>(session_address(session_id));
+        coin::merge(&mut escrow.coins, payment_coin);
 
         // Mark as paid
-        let participant_data = vector::borrow_mut(participants, i);
-        participant_data.has_paid = true;
-        participant_data.payment_timestamp = timestamp::now_seconds();
+        participant_bitmap::set(&mut bill_session.paid_bits, i);
         bill_session.payments_received = bill_session.payments_received + amount_owed;
+        bill_session.paid_count = bill_session.paid_count + 1;
 
-        // Emit payment event
-        let events = borrow_global_mut<BillEvents>(@bill_split);
-        event::emit_event(&mut events.payment_received, PaymentReceivedEvent {
+        event::emit(PaymentReceivedEvent {
             session_id,
             participant_address: participant_addr,
             amount_paid: amount_owed,
             remaining_amount: bill_session.total_amount - bill_session.payments_received,
+            paid_at: timestamp::now_seconds(),
         });
 
         // Check if all payments received
-        if (bill_session.payments_received >= bill_session.total_amount) {
+        if (bill_session.paid_count == vector::length(&bill_session.participant_addresses)) {
             bill_session.status = STATUS_SETTLED;
             bill_session.settled_at = timestamp::now_seconds();
 
+            // One deposit and one event for every payment of the bill
+            let total_amount_paid = coin::value(&escrow.coins);
+            coin::deposit(bill_session.merchant_address, coin::extract_all(&mut escrow.coins));
+            event::emit(BatchPaymentEvent {
+                session_id,
+                payments: bill_session.participant_addresses,
+                amounts: bill_session.amounts_owed,
+                total_amount_paid,
+                timestamp: bill_session.settled_at,
+            });
+
             // Emit settled event
-            event::emit_event(&mut events.bill_settled, BillSettledEvent {
+            event::emit(BillSettledEvent {
                 session_id,
                 total_collected: bill_session.payments_received,
                 merchant_address: bill_session.merchant_address,
@@ -381,15 +444,78 @@ module bill_split::bill_splitter {
         };
     }
 
+    /// Replace up to MAX_PRUNE_BATCH settled or cancelled sessions with their SessionSummary,
+    /// freeing the participant columns and names. Missing, already pruned and unfinished
+    /// sessions, and sessions still holding escrow, are skipped, so a sweep can be retried
+    public entry fun prune_sessions(
+        admin: &signer,
+        session_ids: vector<String>
+    ) acquires BillSession, ParticipantNames, SessionEscrow, SessionRefs {
+        let batch_size = vector::length(&session_ids);
+        assert!(batch_size <= MAX_PRUNE_BATCH, E_BATCH_TOO_LARGE);
+        assert!(signer::address_of(admin) == @bill_split, E_UNAUTHORIZED);
+
+        let pruned = vector::empty<String>();
+        let i = 0;
+        while (i < batch_size) {
+            let session_id = *vector::borrow(&session_ids, i);
+            let session_addr = session_address(session_id);
+            if (exists<BillSession>(session_addr)) {
+                let status = borrow_global<BillSession>(session_addr).status;
+                let escrowed = coin::value(&borrow_global<SessionEscrow>(session_addr).coins);
+                if ((status == STATUS_SETTLED || status == STATUS_CANCELLED) && escrowed == 0) {
+                    let BillSession {
+                        session_id: _,
+                        merchant_address,
+                        multisig_address: _,
+                        total_amount,
+                        description: _,
+                        participant_addresses,
+                        amounts_owed: _,
+                        signed_bits: _,
+                        paid_bits: _,
+                        required_signatures: _,
+                        current_signatures: _,
+                        status,
+                        created_at,
+                        approved_at: _,
+                        settled_at,
+                        payments_received,
+                        paid_count: _,
+                    } = move_from<BillSession>(session_addr);
+                    let ParticipantNames { names: _ } = move_from<ParticipantNames>(session_addr);
+                    let SessionEscrow { coins } = move_from<SessionEscrow>(session_addr);
+                    coin::destroy_zero(coins);
+
+                    let refs = borrow_global<SessionRefs>(session_addr);
+                    move_to(&object::generate_signer_for_extending(&refs.extend_ref), SessionSummary {
+                        session_id,
+                        merchant_address,
+                        total_amount,
+                        payments_received,
+                        participant_count: vector::length(&participant_addresses),
+                        status,
+                        created_at,
+                        settled_at,
+                    });
+                    vector::push_back(&mut pruned, session_id);
+                };
+            };
+            i = i + 1;
+        };
+
+        event::emit(SessionsPrunedEvent {
+            session_ids: pruned,
+            pruned_at: timestamp::now_seconds(),
+        });
+    }
+
     #[view]
     /// Get bill session details
     public fun get_bill_session(session_id: String): (
         String, address, address, u64, String, u8, u64, u64, u64, u64
-    ) acquires BillRegistry {
-        let registry = borrow_global<BillRegistry>(@bill_split);
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        
-        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+    ) acquires BillSession {
+        let bill_session = borrow_session(session_id);
         (
             bill_session.session_id,
             bill_session.merchant_address,
@@ -405,50 +531,107 @@ module bill_split::bill_splitter {
     }
 
     #[view]
-    /// Get participant details for a bill
-    public fun get_participants(session_id: String): vector<Participant> acquires BillRegistry {
-        let registry = borrow_global<BillRegistry>(@bill_split);
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        
-        let bill_session = smart_table::borrow(&registry.sessions, session_id);
-        bill_session.participants
+    /// Signing and payment progress from the session counters:
+    /// (participants, signed, paid, remaining amount)
+    public fun get_session_progress(session_id: String): (u64, u64, u64, u64) acquires BillSession {
+        let bill_session = borrow_session(session_id);
+        (
+            vector::length(&bill_session.participant_addresses),
+            bill_session.current_signatures,
+            bill_session.paid_count,
+            bill_session.total_amount - bill_session.payments_received
+        )
     }
 
     #[view]
-    /// Check if participant has signed
-    public fun has_participant_signed(session_id: String, participant_address: address): bool acquires BillRegistry {
-        let registry = borrow_global<BillRegistry>(@bill_split);
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        
-        let bill_session = smart_table::borrow(&registry.sessions, session_id);
-        let participants = &bill_session.participants;
+    /// Get participant details for a bill
+    public fun get_participants(session_id: String): vector<Participant> acquires BillSession, ParticipantNames {
+        let bill_session = borrow_session(session_id);
+        let names = &borrow_global<ParticipantNames>(session_address(session_id)).names;
+        let participants = vector::empty<Participant>();
         let i = 0;
-        while (i < vector::length(participants)) {
-            let participant = vector::borrow(participants, i);
-            if (participant.address == participant_address) {
-                return participant.has_signed
-            };
+        while (i < vector::length(&bill_session.participant_addresses)) {
+            vector::push_back(&mut participants, Participant {
+                address: *vector::borrow(&bill_session.participant_addresses, i),
+                name: *vector::borrow(names, i),
+                amount_owed: *vector::borrow(&bill_session.amounts_owed, i),
+                has_signed: participant_bitmap::is_set(&bill_session.signed_bits, i),
+                has_paid: participant_bitmap::is_set(&bill_session.paid_bits, i),
+            });
             i = i + 1;
         };
-        false
+        participants
+    }
+
+    #[view]
+    /// Check if participant has signed
+    public fun has_participant_signed(session_id: String, participant_address: address): bool acquires BillSession {
+        let bill_session = borrow_session(session_id);
+        let (found, i) = vector::index_of(&bill_session.participant_addresses, &participant_address);
+        found && participant_bitmap::is_set(&bill_session.signed_bits, i)
     }
 
     #[view]
     /// Check if participant has paid
-    public fun has_participant_paid(session_id: String, participant_address: address): bool acquires BillRegistry {
-        let registry = borrow_global<BillRegistry>(@bill_split);
-        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        
-        let bill_session = smart_table::borrow(&registry.sessions, session_id);
-        let participants = &bill_session.participants;
-        let i = 0;
-        while (i < vector::length(participants)) {
-            let participant = vector::borrow(participants, i);
-            if (participant.address == participant_address) {
-                return participant.has_paid
-            };
-            i = i + 1;
+    public fun has_participant_paid(session_id: String, participant_address: address): bool acquires BillSession {
+        let bill_session = borrow_session(session_id);
+        let (found, i) = vector::index_of(&bill_session.participant_addresses, &participant_address);
+        found && participant_bitmap::is_set(&bill_session.paid_bits, i)
+    }
+
+    #[view]
+    /// Signed and paid flags of every participant as bitmaps in participant order
+    /// (bit i % 8 of byte i / 8), so a whole session is polled in one call
+    public fun get_participant_bitmaps(session_id: String): (u64, vector<u8>, vector<u8>) acquires BillSession {
+        let bill_session = borrow_session(session_id);
+        (vector::length(&bill_session.participant_addresses), bill_session.signed_bits, bill_session.paid_bits)
+    }
+
+    #[view]
+    /// Outcome of a live or pruned session: (merchant, total amount, payments received,
+    /// participants, status, created_at, settled_at, pruned)
+    public fun get_session_summary(session_id: String): (
+        address, u64, u64, u64, u8, u64, u64, bool
+    ) acquires BillSession, SessionSummary {
+        let session_addr = session_address(session_id);
+        if (exists<SessionSummary>(session_addr)) {
+            let summary = borrow_global<SessionSummary>(session_addr);
+            return (
+                summary.merchant_address,
+                summary.total_amount,
+                summary.payments_received,
+                summary.participant_count,
+                summary.status,
+                summary.created_at,
+                summary.settled_at,
+                true
+            )
         };
-        false
+        let bill_session = borrow_session(session_id);
+        (
+            bill_session.merchant_address,
+            bill_session.total_amount,
+            bill_session.payments_received,
+            vector::length(&bill_session.participant_addresses),
+            bill_session.status,
+            bill_session.created_at,
+            bill_session.settled_at,
+            false
+        )
+    }
+
+    #[view]
+    /// Sessions created so far
+    public fun get_session_count(): u64 acquires BillRegistry {
+        if (!exists<BillRegistry>(@bill_split)) {
+            return 0
+        };
+        aggregator_v2::read(&borrow_global<BillRegistry>(@bill_split).session_counter)
+    }
+
+    #[view]
+    /// Address of the object holding a session, for reading its resources directly
+    public fun get_session_address(session_id: String): address {
+        session_address(session_id)
     }
-}
\ No newline at end of file
+}
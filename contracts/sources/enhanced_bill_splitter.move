@@ -1,26 +1,22 @@
 /// Enhanced Bill Splitting Smart Contract with Better Scalability
 /// Optimized for handling large numbers of participants
 module bill_split::enhanced_bill_splitter {
+    use std::features;
     use std::signer;
     use std::string::String;
     use std::vector;
-    use aptos_framework::coin;
+    use aptos_framework::aggregator_v2::{Self, Aggregator};
+    use aptos_framework::coin::{Self, Coin};
+    use aptos_framework::event;
+    use aptos_framework::object::{Self, DeleteRef};
     use aptos_framework::timestamp;
     use aptos_framework::multisig_account;
     use aptos_std::smart_table::{Self, SmartTable};
     use aptos_std::table::{Self, Table};
+    use aptos_std::table_with_length::{Self, TableWithLength};
+    use bill_split::participant_bitmap;
     use bill_split::usdc_utils::USDC;
 
-    // Enhanced participant information with indexing
-    struct Participant has store, copy, drop {
-        address: address,
-        name: String,
-        amount_owed: u64,
-        has_signed: bool,
-        has_paid: bool,
-        payment_timestamp: u64,
-    }
-
     // Enhanced bill session with participant lookup table for O(1) access
     struct EnhancedBillSession has key, store {
         session_id: String,
@@ -28,42 +24,140 @@ module bill_split::enhanced_bill_splitter {
         multisig_address: address,
         total_amount: u64,
         description: String,
-        participants: vector<Participant>,
-        participant_lookup: Table<address, u64>, // address -> index mapping for O(1) lookup
+        // Hot participant columns, indexed by participant position
+        participant_addresses: vector<address>,
+        amounts_owed: vector<u64>,
+        signed_bits: vector<u8>, // participant_bitmap layout
+        // address -> index mapping for O(1) lookup; counted so prune_sessions can destroy it
+        participant_lookup: TableWithLength<address, u64>,
+        payment_ledger: address, // object holding the session's PaymentLedger
         required_signatures: u64,
         current_signatures: u64,
         status: u8,
         created_at: u64,
         approved_at: u64,
         settled_at: u64,
-        payments_received: u64,
         max_participants: u64, // Configurable limit
     }
 
+    // A participant's payment, held in escrow until the bill settles or the merchant collects it
+    struct PaymentReceipt has store {
+        amount_owed: u64,
+        paid_at: u64,
+        escrow: Coin<USDC>,
+    }
+
+    // Payment state of one session, kept apart from the session so payments only read it.
+    // Each payment adds its own receipt slot and bumps the aggregators, so payments from
+    // different participants do not conflict and execute in parallel. Receipts are counted
+    // so prune_sessions can destroy the table and delete the ledger object
+    struct PaymentLedger has key {
+        receipts: TableWithLength<address, PaymentReceipt>,
+        paid_count: Aggregator<u64>, // bounded by the participant count
+        payments_received: Aggregator<u64>,
+        escrowed: Aggregator<u64>, // paid but not yet swept to the merchant
+        delete_ref: DeleteRef,
+    }
+
     // Registry with enhanced indexing
     struct EnhancedBillRegistry has key {
         sessions: SmartTable<String, EnhancedBillSession>,
+        // Names are never read on the hot path, so they live outside the session
+        // and signing or paying never rewrites them
+        participant_names: Table<String, vector<String>>,
         session_counter: u64,
-        participant_sessions: Table<address, vector<String>>, // Track sessions per participant
+        // Per-participant session index, split into pages of at most INDEX_PAGE_SIZE entries
+        // so joining a session only rewrites the participant's newest page
+        participant_index: Table<address, ParticipantIndex>,
+        index_pages: Table<IndexPageKey, vector<IndexEntry>>,
+        session_summaries: SmartTable<String, SessionSummary>, // sessions removed by prune_sessions
+    }
+
+    // What remains of a settled or cancelled session after prune_sessions reclaims it
+    struct SessionSummary has store, drop {
+        merchant_address: address,
+        total_amount: u64,
+        payments_received: u64,
+        participant_count: u64,
+        status: u8,
+        created_at: u64,
+        settled_at: u64,
+    }
+
+    // Page counters of one participant; pages are numbered in the order they were filled
+    struct ParticipantIndex has store, drop {
+        active_tail: u64,
+        archive_tail: u64,
+        active_count: u64,
+        archived_count: u64,
+    }
+
+    struct IndexPageKey has copy, drop, store {
+        participant: address,
+        archived: bool,
+        page: u64,
+    }
+
+    struct IndexEntry has copy, drop, store {
+        session_id: String,
+        created_at: u64,
     }
 
-    // Batch operations for efficiency
+    // Escrowed payments moved to the merchant by one deposit, from collect_payments or
+    // from the payment that settles the session
+    #[event]
     struct BatchPaymentEvent has drop, store {
         session_id: String,
         payments: vector<address>,
+        amounts: vector<u64>,
         total_amount_paid: u64,
         timestamp: u64,
     }
 
+    #[event]
+    struct SessionsPrunedEvent has drop, store {
+        session_ids: vector<String>,
+        pruned_at: u64,
+    }
+
     // Constants for scalability limits
     const MAX_PARTICIPANTS_DEFAULT: u64 = 1000;
     const MAX_BATCH_SIZE: u64 = 50;
+    const INDEX_PAGE_SIZE: u64 = 50;
+    // Participants one prune_sessions call may release. Each rewrites about five slots (lookup
+    // entry, receipt, active and archive index pages, index counters), so a full batch stays
+    // near 2,500 of the 8,192 write ops a transaction may make, with room for the sessions' own
+    const MAX_PRUNE_PARTICIPANTS: u64 = 500;
     
     // Error codes
     const E_BILL_SESSION_NOT_FOUND: u64 = 1;
+    const E_UNAUTHORIZED: u64 = 2;
+    const E_INVALID_STATUS: u64 = 3;
     const E_PARTICIPANT_NOT_FOUND: u64 = 4;
     const E_TOO_MANY_PARTICIPANTS: u64 = 10;
     const E_BATCH_TOO_LARGE: u64 = 11;
+    const E_SESSION_PRUNED: u64 = 12;
+
+    fun init_module(deployer: &signer) {
+        move_to(deployer, EnhancedBillRegistry {
+            sessions: smart_table::new(),
+            participant_names: table::new(),
+            session_counter: 0,
+            participant_index: table::new(),
+            index_pages: table::new(),
+            session_summaries: smart_table::new(),
+        });
+    }
+
+    #[test_only]
+    public fun init_module_for_test(deployer: &signer) {
+        init_module(deployer);
+    }
+
+    #[test_only]
+    public fun payment_ledger_of(session_id: String): address acquires EnhancedBillRegistry {
+        smart_table::borrow(&borrow_global<EnhancedBillRegistry>(@bill_split).sessions, session_id).payment_ledger
+    }
 
     /// Create enhanced bill session with optimized participant management
     public entry fun create_enhanced_bill_session(
@@ -81,32 +175,28 @@ module bill_split::enhanced_bill_splitter {
         assert!(max_participants <= MAX_PARTICIPANTS_DEFAULT, E_TOO_MANY_PARTICIPANTS);
 
         let registry = borrow_global_mut<EnhancedBillRegistry>(@bill_split);
+        // A pruned id stays taken so its participants' index entries stay unambiguous
+        assert!(!smart_table::contains(&registry.session_summaries, session_id), E_SESSION_PRUNED);
         
-        // Create participants with O(1) lookup table
-        let participants = vector::empty<Participant>();
-        let participant_lookup = table::new<address, u64>();
-        let individual_amount = total_amount / (participant_count as u64);
+        // Create participant columns with O(1) lookup table
+        let amounts_owed = vector::empty<u64>();
+        let names = vector::empty<String>();
+        let participant_lookup = table_with_length::new<address, u64>();
+        // Equal split; the first `remainder` participants owe one extra unit
+        let individual_amount = total_amount / participant_count;
+        let remainder = total_amount % participant_count;
 
         let i = 0;
         while (i < participant_count) {
             let participant_addr = *vector::borrow(&participant_addresses, i);
-            let participant = Participant {
-                address: participant_addr,
-                name: *vector::borrow(&participant_names, i),
-                amount_owed: individual_amount,
-                has_signed: false,
-                has_paid: false,
-                payment_timestamp: 0,
-            };
-            vector::push_back(&mut participants, participant);
-            table::add(&mut participant_lookup, participant_addr, i);
+            let share = if (i < remainder) { individual_amount + 1 } else { individual_amount };
+            vector::push_back(&mut amounts_owed, share);
+            vector::push_back(&mut names, *vector::borrow(&participant_names, i));
+            table_with_length::add(&mut participant_lookup, participant_addr, i);
             
             // Track sessions per participant
-            if (!table::contains(&registry.participant_sessions, participant_addr)) {
-                table::add(&mut registry.participant_sessions, participant_addr, vector::empty<String>());
-            };
-            let sessions = table::borrow_mut(&mut registry.participant_sessions, participant_addr);
-            vector::push_back(sessions, session_id);
+            let entry = IndexEntry { session_id, created_at: timestamp::now_seconds() };
+            index_append(registry, participant_addr, entry, false);
             
             i = i + 1;
         };
@@ -124,57 +214,160 @@ module bill_split::enhanced_bill_splitter {
             vector::empty<vector<u8>>()
         );
 
+        let ledger_constructor = object::create_object(signer::address_of(merchant));
+        move_to(&object::generate_signer(&ledger_constructor), PaymentLedger {
+            receipts: table_with_length::new(),
+            paid_count: aggregator_v2::create_aggregator(participant_count),
+            payments_received: aggregator_v2::create_unbounded_aggregator(),
+            escrowed: aggregator_v2::create_unbounded_aggregator(),
+            delete_ref: object::generate_delete_ref(&ledger_constructor),
+        });
+
         let enhanced_session = EnhancedBillSession {
             session_id,
             merchant_address: signer::address_of(merchant),
             multisig_address,
             total_amount,
             description,
-            participants,
+            participant_addresses,
+            amounts_owed,
+            signed_bits: participant_bitmap::new(participant_count),
             participant_lookup,
+            payment_ledger: object::address_from_constructor_ref(&ledger_constructor),
             required_signatures,
             current_signatures: 0,
             status: 0, // STATUS_CREATED
             created_at: timestamp::now_seconds(),
             approved_at: 0,
             settled_at: 0,
-            payments_received: 0,
             max_participants,
         };
 
         smart_table::add(&mut registry.sessions, session_id, enhanced_session);
+        table::add(&mut registry.participant_names, session_id, names);
     }
 
     /// Optimized participant lookup with O(1) complexity
+    /// Only reads the session; the payment lands in the participant's own escrow slot
     public entry fun submit_payment_optimized(
         participant: &signer,
         session_id: String,
         payment_amount: u64
-    ) acquires EnhancedBillRegistry {
+    ) acquires EnhancedBillRegistry, PaymentLedger {
         let participant_addr = signer::address_of(participant);
-        let registry = borrow_global_mut<EnhancedBillRegistry>(@bill_split);
+        let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
         
         assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
-        let bill_session = smart_table::borrow_mut(&mut registry.sessions, session_id);
+        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        assert!(bill_session.status == 2, E_INVALID_STATUS); // STATUS_APPROVED
         
         // O(1) participant lookup instead of O(n) linear search
-        assert!(table::contains(&bill_session.participant_lookup, participant_addr), E_PARTICIPANT_NOT_FOUND);
-        let participant_index = *table::borrow(&bill_session.participant_lookup, participant_addr);
+        assert!(table_with_length::contains(&bill_session.participant_lookup, participant_addr), E_PARTICIPANT_NOT_FOUND);
+        let participant_index = *table_with_length::borrow(&bill_session.participant_lookup, participant_addr);
+        let participant_count = vector::length(&bill_session.participant_addresses);
+        let ledger = borrow_global_mut<PaymentLedger>(bill_session.payment_ledger);
         
-        let participant_data = vector::borrow_mut(&mut bill_session.participants, participant_index);
-        assert!(!participant_data.has_paid, 6); // E_ALREADY_PAID
+        assert!(!table_with_length::contains(&ledger.receipts, participant_addr), 6); // E_ALREADY_PAID
         
-        let amount_owed = participant_data.amount_owed;
+        let amount_owed = *vector::borrow(&bill_session.amounts_owed, participant_index);
         assert!(payment_amount >= amount_owed, 5); // E_INSUFFICIENT_PAYMENT
 
-        // Process payment
-        let payment_coin = coin::withdraw<USDC>(participant, payment_amount);
-        coin::deposit(bill_session.merchant_address, payment_coin);
+        // Process payment into escrow
+        let escrow = coin::withdraw<USDC>(participant, payment_amount);
+        table_with_length::add(&mut ledger.receipts, participant_addr, PaymentReceipt {
+            amount_owed,
+            paid_at: timestamp::now_seconds(),
+            escrow,
+        });
+        aggregator_v2::add(&mut ledger.paid_count, 1);
+        aggregator_v2::add(&mut ledger.payments_received, amount_owed);
+        aggregator_v2::add(&mut ledger.escrowed, payment_amount);
 
-        // Update participant status
-        participant_data.has_paid = true;
-        participant_data.payment_timestamp = timestamp::now_seconds();
-        bill_session.payments_received = bill_session.payments_received + amount_owed;
+        // Settlement comes from the aggregated count; only the payment that completes it
+        // sees the threshold, writes the session and sweeps the escrow to the merchant
+        if (all_paid(ledger, participant_count)) {
+            let registry = borrow_global_mut<EnhancedBillRegistry>(@bill_split);
+            let bill_session = smart_table::borrow_mut(&mut registry.sessions, session_id);
+            bill_session.status = 3; // STATUS_SETTLED
+            bill_session.settled_at = timestamp::now_seconds();
+            sweep_escrow(ledger, session_id, bill_session.merchant_address, &bill_session.participant_addresses);
+        };
+    }
+
+    /// Whether every participant has paid, without reading the count. is_at_least is behind
+    /// its own feature flag; without it, paid_count is at its bound exactly when one more
+    /// increment fails, and a successful probe is undone
+    fun all_paid(ledger: &mut PaymentLedger, participant_count: u64): bool {
+        if (features::aggregator_v2_is_at_least_api_enabled()) {
+            return aggregator_v2::is_at_least(&ledger.paid_count, participant_count)
+        };
+        if (aggregator_v2::try_add(&mut ledger.paid_count, 1)) {
+            aggregator_v2::sub(&mut ledger.paid_count, 1);
+            false
+        } else {
+            true
+        }
+    }
+
+    /// Move escrowed payments of up to MAX_BATCH_SIZE payers to the merchant in one deposit
+    /// before the session settles; settlement sweeps whatever is left
+    public entry fun collect_payments(
+        merchant: &signer,
+        session_id: String,
+        payers: vector<address>
+    ) acquires EnhancedBillRegistry, PaymentLedger {
+        let batch_size = vector::length(&payers);
+        assert!(batch_size <= MAX_BATCH_SIZE, E_BATCH_TOO_LARGE);
+
+        let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
+        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
+        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        assert!(bill_session.merchant_address == signer::address_of(merchant), E_UNAUTHORIZED);
+        let ledger = borrow_global_mut<PaymentLedger>(bill_session.payment_ledger);
+        sweep_escrow(ledger, session_id, bill_session.merchant_address, &payers);
+    }
+
+    /// Deposit the escrow of `payers` to the merchant at once and report it in one
+    /// BatchPaymentEvent. Unpaid and already swept payers are skipped, so a sweep can be
+    /// retried; nothing is deposited or emitted when no escrow is left
+    fun sweep_escrow(
+        ledger: &mut PaymentLedger,
+        session_id: String,
+        merchant_addr: address,
+        payers: &vector<address>
+    ) {
+        let collected = coin::zero<USDC>();
+        let collected_from = vector::empty<address>();
+        let amounts = vector::empty<u64>();
+        let i = 0;
+        while (i < vector::length(payers)) {
+            let payer = *vector::borrow(payers, i);
+            if (table_with_length::contains(&ledger.receipts, payer)) {
+                let receipt = table_with_length::borrow_mut(&mut ledger.receipts, payer);
+                let amount = coin::value(&receipt.escrow);
+                if (amount > 0) {
+                    coin::merge(&mut collected, coin::extract_all(&mut receipt.escrow));
+                    vector::push_back(&mut collected_from, payer);
+                    vector::push_back(&mut amounts, amount);
+                };
+            };
+            i = i + 1;
+        };
+
+        let total_amount_paid = coin::value(&collected);
+        if (total_amount_paid == 0) {
+            coin::destroy_zero(collected);
+            return
+        };
+        aggregator_v2::sub(&mut ledger.escrowed, total_amount_paid);
+        coin::deposit(merchant_addr, collected);
+        event::emit(BatchPaymentEvent {
+            session_id,
+            payments: collected_from,
+            amounts,
+            total_amount_paid,
+            timestamp: timestamp::now_seconds(),
+        });
     }
 
     /// Batch signature collection for efficiency - takes addresses instead of signers
@@ -188,54 +381,407 @@ module bill_split::enhanced_bill_splitter {
         let registry = borrow_global_mut<EnhancedBillRegistry>(@bill_split);
         assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
         let bill_session = smart_table::borrow_mut(&mut registry.sessions, session_id);
+        // Settled and cancelled sessions take no more signatures
+        assert!(bill_session.status < 3, E_INVALID_STATUS);
 
         let i = 0;
         while (i < batch_size) {
             let signer_addr = *vector::borrow(&signer_addresses, i);
             
-            if (table::contains(&bill_session.participant_lookup, signer_addr)) {
-                let participant_index = *table::borrow(&bill_session.participant_lookup, signer_addr);
-                let participant_data = vector::borrow_mut(&mut bill_session.participants, participant_index);
-                
-                if (!participant_data.has_signed) {
-                    participant_data.has_signed = true;
+            if (table_with_length::contains(&bill_session.participant_lookup, signer_addr)) {
+                let participant_index = *table_with_length::borrow(&bill_session.participant_lookup, signer_addr);
+                if (!participant_bitmap::is_set(&bill_session.signed_bits, participant_index)) {
+                    participant_bitmap::set(&mut bill_session.signed_bits, participant_index);
                     bill_session.current_signatures = bill_session.current_signatures + 1;
                 };
             };
             i = i + 1;
         };
 
-        // Check if bill is approved
-        if (bill_session.current_signatures >= bill_session.required_signatures) {
+        // Check if bill is approved; only a created session moves to approved
+        if (bill_session.status < 2 && bill_session.current_signatures >= bill_session.required_signatures) {
             bill_session.status = 2; // STATUS_APPROVED
             bill_session.approved_at = timestamp::now_seconds();
         };
     }
 
+    /// Move a settled or cancelled session from up to MAX_BATCH_SIZE participants' active
+    /// index into their archive bucket; participants already archived are skipped
+    public entry fun archive_session(
+        session_id: String,
+        participants: vector<address>
+    ) acquires EnhancedBillRegistry {
+        let batch_size = vector::length(&participants);
+        assert!(batch_size <= MAX_BATCH_SIZE, E_BATCH_TOO_LARGE);
+
+        let registry = borrow_global_mut<EnhancedBillRegistry>(@bill_split);
+        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
+        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        let (status, created_at) = (bill_session.status, bill_session.created_at);
+        assert!(status == 3 || status == 4, E_INVALID_STATUS); // STATUS_SETTLED, STATUS_CANCELLED
+
+        let i = 0;
+        while (i < batch_size) {
+            index_archive(registry, *vector::borrow(&participants, i), session_id, created_at);
+            i = i + 1;
+        };
+    }
+
+    /// Replace up to MAX_BATCH_SIZE settled or cancelled sessions with their SessionSummary:
+    /// frees the participant columns, names, lookup entries and the PaymentLedger object with
+    /// its emptied receipts, and archives the session for every participant still indexing it
+    /// as active. Missing,
+    /// unfinished and not fully collected sessions are skipped, so a sweep can be retried.
+    /// Sessions that would take the batch past MAX_PRUNE_PARTICIPANTS are skipped too and
+    /// left for the next call
+    public entry fun prune_sessions(
+        admin: &signer,
+        session_ids: vector<String>
+    ) acquires EnhancedBillRegistry, PaymentLedger {
+        let batch_size = vector::length(&session_ids);
+        assert!(batch_size <= MAX_BATCH_SIZE, E_BATCH_TOO_LARGE);
+        assert!(signer::address_of(admin) == @bill_split, E_UNAUTHORIZED);
+
+        let registry = borrow_global_mut<EnhancedBillRegistry>(@bill_split);
+        let pruned = vector::empty<String>();
+        let budget = MAX_PRUNE_PARTICIPANTS;
+        let i = 0;
+        while (i < batch_size) {
+            let session_id = *vector::borrow(&session_ids, i);
+            if (prunable(registry, session_id) && participant_count_of(registry, session_id) <= budget) {
+                budget = budget - participant_count_of(registry, session_id);
+                let EnhancedBillSession {
+                    session_id: _,
+                    merchant_address,
+                    multisig_address: _,
+                    total_amount,
+                    description: _,
+                    participant_addresses,
+                    amounts_owed: _,
+                    signed_bits: _,
+                    participant_lookup,
+                    payment_ledger,
+                    required_signatures: _,
+                    current_signatures: _,
+                    status,
+                    created_at,
+                    approved_at: _,
+                    settled_at,
+                    max_participants: _,
+                } = smart_table::remove(&mut registry.sessions, session_id);
+                table::remove(&mut registry.participant_names, session_id);
+
+                let PaymentLedger { receipts, paid_count: _, payments_received, escrowed: _, delete_ref } =
+                    move_from<PaymentLedger>(payment_ledger);
+                let participant_count = vector::length(&participant_addresses);
+                let j = 0;
+                while (j < participant_count) {
+                    let participant_addr = *vector::borrow(&participant_addresses, j);
+                    table_with_length::remove(&mut participant_lookup, participant_addr);
+                    if (table_with_length::contains(&receipts, participant_addr)) {
+                        let PaymentReceipt { amount_owed: _, paid_at: _, escrow } =
+                            table_with_length::remove(&mut receipts, participant_addr);
+                        coin::destroy_zero(escrow);
+                    };
+                    index_archive(registry, participant_addr, session_id, created_at);
+                    j = j + 1;
+                };
+                table_with_length::destroy_empty(participant_lookup);
+                // Only participants pay, so every receipt is gone and the ledger object can go too
+                table_with_length::destroy_empty(receipts);
+                object::delete(delete_ref);
+
+                smart_table::add(&mut registry.session_summaries, session_id, SessionSummary {
+                    merchant_address,
+                    total_amount,
+                    payments_received: aggregator_v2::read(&payments_received),
+                    participant_count,
+                    status,
+                    created_at,
+                    settled_at,
+                });
+                vector::push_back(&mut pruned, session_id);
+            };
+            i = i + 1;
+        };
+
+        event::emit(SessionsPrunedEvent {
+            session_ids: pruned,
+            pruned_at: timestamp::now_seconds(),
+        });
+    }
+
+    fun participant_count_of(registry: &EnhancedBillRegistry, session_id: String): u64 {
+        vector::length(&smart_table::borrow(&registry.sessions, session_id).participant_addresses)
+    }
+
+    /// Settled or cancelled, with every escrowed payment collected
+    fun prunable(registry: &EnhancedBillRegistry, session_id: String): bool acquires PaymentLedger {
+        if (!smart_table::contains(&registry.sessions, session_id)) {
+            return false
+        };
+        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        let finished = bill_session.status == 3 || bill_session.status == 4; // STATUS_SETTLED, STATUS_CANCELLED
+        finished && aggregator_v2::read(&borrow_global<PaymentLedger>(bill_session.payment_ledger).escrowed) == 0
+    }
+
+    /// Move a session from the participant's active index to the archive bucket, if still active
+    fun index_archive(
+        registry: &mut EnhancedBillRegistry,
+        participant_addr: address,
+        session_id: String,
+        created_at: u64
+    ) {
+        let (found, page, position) = index_find(registry, participant_addr, session_id, created_at);
+        if (found) {
+            let entry = index_remove(registry, participant_addr, page, position);
+            index_append(registry, participant_addr, entry, true);
+        };
+    }
+
+    /// Locate a session in the participant's active pages as (found, page, position). Pages are
+    /// filled in creation order, so walk back from the newest page to the one spanning
+    /// `created_at` and scan only that page (and its neighbours created in the same second).
+    /// No per-entry page is stored, so the walk reads every page newer than the session:
+    /// O(active pages) for a participant's oldest sessions, O(1) for recent ones
+    fun index_find(
+        registry: &EnhancedBillRegistry,
+        participant_addr: address,
+        session_id: String,
+        created_at: u64
+    ): (bool, u64, u64) {
+        if (!table::contains(&registry.participant_index, participant_addr)) {
+            return (false, 0, 0)
+        };
+        let page = table::borrow(&registry.participant_index, participant_addr).active_tail + 1;
+        while (page > 0) {
+            page = page - 1;
+            let key = IndexPageKey { participant: participant_addr, archived: false, page };
+            if (table::contains(&registry.index_pages, key)) {
+                let entries = table::borrow(&registry.index_pages, key);
+                let length = vector::length(entries);
+                if (length > 0) {
+                    // Every older page was created before this session, so it is not active
+                    if (vector::borrow(entries, length - 1).created_at < created_at) {
+                        return (false, 0, 0)
+                    };
+                    let first = vector::borrow(entries, 0).created_at;
+                    if (first <= created_at) {
+                        let i = 0;
+                        while (i < length) {
+                            if (vector::borrow(entries, i).session_id == session_id) {
+                                return (true, page, i)
+                            };
+                            i = i + 1;
+                        };
+                        if (first < created_at) {
+                            return (false, 0, 0)
+                        };
+                    };
+                };
+            };
+        };
+        (false, 0, 0)
+    }
+
+    /// Append to the participant's newest page of a bucket, opening a new page when it is full
+    fun index_append(
+        registry: &mut EnhancedBillRegistry,
+        participant_addr: address,
+        entry: IndexEntry,
+        archived: bool
+    ) {
+        if (!table::contains(&registry.participant_index, participant_addr)) {
+            table::add(&mut registry.participant_index, participant_addr, ParticipantIndex {
+                active_tail: 0,
+                archive_tail: 0,
+                active_count: 0,
+                archived_count: 0,
+            });
+        };
+        let index = table::borrow(&registry.participant_index, participant_addr);
+        let page = if (archived) { index.archive_tail } else { index.active_tail };
+        let key = IndexPageKey { participant: participant_addr, archived, page };
+        if (table::contains(&registry.index_pages, key)
+            && vector::length(table::borrow(&registry.index_pages, key)) >= INDEX_PAGE_SIZE) {
+            page = page + 1;
+            key.page = page;
+        };
+
+        let index = table::borrow_mut(&mut registry.participant_index, participant_addr);
+        if (archived) {
+            index.archive_tail = page;
+            index.archived_count = index.archived_count + 1;
+        } else {
+            index.active_tail = page;
+            index.active_count = index.active_count + 1;
+        };
+        if (!table::contains(&registry.index_pages, key)) {
+            table::add(&mut registry.index_pages, key, vector::empty<IndexEntry>());
+        };
+        vector::push_back(table::borrow_mut(&mut registry.index_pages, key), entry);
+    }
+
+    /// Remove the entry at `position` of one of the participant's active pages, keeping the
+    /// page's order. Emptied pages other than the newest are deleted for their storage refund
+    fun index_remove(
+        registry: &mut EnhancedBillRegistry,
+        participant_addr: address,
+        page: u64,
+        position: u64
+    ): IndexEntry {
+        let index = table::borrow_mut(&mut registry.participant_index, participant_addr);
+        index.active_count = index.active_count - 1;
+        let active_tail = index.active_tail;
+
+        let key = IndexPageKey { participant: participant_addr, archived: false, page };
+        let entries = table::borrow_mut(&mut registry.index_pages, key);
+        let entry = vector::remove(entries, position);
+        if (vector::is_empty(entries) && page != active_tail) {
+            vector::destroy_empty(table::remove(&mut registry.index_pages, key));
+        };
+        entry
+    }
+
     #[view]
-    /// Get sessions for a specific participant (useful for dashboards)
-    public fun get_participant_sessions(participant_addr: address): vector<String> acquires EnhancedBillRegistry {
+    /// One page of a participant's sessions, newest first, from the active or the archive bucket.
+    /// Pass cursor 0 for the newest page and the returned cursor for the next one; a returned
+    /// cursor of 0 means there are no more pages. Returns (session ids, created_at, next cursor)
+    public fun get_participant_sessions_page(
+        participant_addr: address,
+        archived: bool,
+        cursor: u64
+    ): (vector<String>, vector<u64>, u64) acquires EnhancedBillRegistry {
         let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
-        if (table::contains(&registry.participant_sessions, participant_addr)) {
-            *table::borrow(&registry.participant_sessions, participant_addr)
+        let session_ids = vector::empty<String>();
+        let created = vector::empty<u64>();
+        if (!table::contains(&registry.participant_index, participant_addr)) {
+            return (session_ids, created, 0)
+        };
+        let index = table::borrow(&registry.participant_index, participant_addr);
+        let page = if (cursor == 0) {
+            (if (archived) { index.archive_tail } else { index.active_tail }) + 1
         } else {
-            vector::empty<String>()
-        }
+            cursor
+        };
+        // Pages emptied by archiving are dropped, so skip the gaps
+        while (page > 0) {
+            page = page - 1;
+            let key = IndexPageKey { participant: participant_addr, archived, page };
+            if (table::contains(&registry.index_pages, key)) {
+                let entries = table::borrow(&registry.index_pages, key);
+                let i = vector::length(entries);
+                if (i > 0) {
+                    while (i > 0) {
+                        i = i - 1;
+                        let entry = vector::borrow(entries, i);
+                        vector::push_back(&mut session_ids, entry.session_id);
+                        vector::push_back(&mut created, entry.created_at);
+                    };
+                    return (session_ids, created, page)
+                };
+            };
+        };
+        (session_ids, created, 0)
+    }
+
+    #[view]
+    /// Number of a participant's (active, archived) sessions
+    public fun get_participant_session_counts(participant_addr: address): (u64, u64) acquires EnhancedBillRegistry {
+        let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
+        if (!table::contains(&registry.participant_index, participant_addr)) {
+            return (0, 0)
+        };
+        let index = table::borrow(&registry.participant_index, participant_addr);
+        (index.active_count, index.archived_count)
+    }
+
+    #[view]
+    /// Outcome of a live or pruned session: (merchant, total amount, payments received,
+    /// participants, status, created_at, settled_at, pruned)
+    public fun get_session_summary(session_id: String): (
+        address, u64, u64, u64, u8, u64, u64, bool
+    ) acquires EnhancedBillRegistry, PaymentLedger {
+        let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
+        if (smart_table::contains(&registry.session_summaries, session_id)) {
+            let summary = smart_table::borrow(&registry.session_summaries, session_id);
+            return (
+                summary.merchant_address,
+                summary.total_amount,
+                summary.payments_received,
+                summary.participant_count,
+                summary.status,
+                summary.created_at,
+                summary.settled_at,
+                true
+            )
+        };
+        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
+        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        let ledger = borrow_global<PaymentLedger>(bill_session.payment_ledger);
+        (
+            bill_session.merchant_address,
+            bill_session.total_amount,
+            aggregator_v2::read(&ledger.payments_received),
+            vector::length(&bill_session.participant_addresses),
+            bill_session.status,
+            bill_session.created_at,
+            bill_session.settled_at,
+            false
+        )
     }
 
     #[view]
     /// Get bill session statistics for monitoring
-    public fun get_session_stats(session_id: String): (u64, u64, u64, u64, u8) acquires EnhancedBillRegistry {
+    public fun get_session_stats(session_id: String): (u64, u64, u64, u64, u8) acquires EnhancedBillRegistry, PaymentLedger {
         let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
         assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
         
         let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        let ledger = borrow_global<PaymentLedger>(bill_session.payment_ledger);
         (
-            vector::length(&bill_session.participants), // total participants
+            vector::length(&bill_session.participant_addresses), // total participants
             bill_session.current_signatures,            // current signatures
             bill_session.required_signatures,           // required signatures
-            bill_session.payments_received,             // total payments received
+            aggregator_v2::read(&ledger.payments_received), // total payments received
             bill_session.status                         // current status
         )
     }
+
+    #[view]
+    /// Aggregated payment state: (participants paid, amount received, amount still in escrow)
+    public fun get_payment_totals(session_id: String): (u64, u64, u64) acquires EnhancedBillRegistry, PaymentLedger {
+        let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
+        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
+
+        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        let ledger = borrow_global<PaymentLedger>(bill_session.payment_ledger);
+        (
+            aggregator_v2::read(&ledger.paid_count),
+            aggregator_v2::read(&ledger.payments_received),
+            aggregator_v2::read(&ledger.escrowed)
+        )
+    }
+
+    #[view]
+    /// Signed and paid flags of every participant as bitmaps in participant order
+    /// (bit i % 8 of byte i / 8), so a whole session is polled in one call
+    public fun get_participant_bitmaps(session_id: String): (u64, vector<u8>, vector<u8>) acquires EnhancedBillRegistry, PaymentLedger {
+        let registry = borrow_global<EnhancedBillRegistry>(@bill_split);
+        assert!(smart_table::contains(&registry.sessions, session_id), E_BILL_SESSION_NOT_FOUND);
+
+        let bill_session = smart_table::borrow(&registry.sessions, session_id);
+        let ledger = borrow_global<PaymentLedger>(bill_session.payment_ledger);
+        let count = vector::length(&bill_session.participant_addresses);
+        // Paid flags are the participants' receipt slots
+        let paid_bits = participant_bitmap::new(count);
+        let i = 0;
+        while (i < count) {
+            if (table_with_length::contains(&ledger.receipts, *vector::borrow(&bill_session.participant_addresses, i))) {
+                participant_bitmap::set(&mut paid_bits, i);
+            };
+            i = i + 1;
+        };
+        (count, bill_session.signed_bits, paid_bits)
+    }
 }
@@ -0,0 +1,27 @@
+/// Packed per-participant flags
+/// One bit per participant (bit i % 8 of byte i / 8), used for the signed/paid columns
+/// of bill sessions and returned as-is by the bitmap view functions
+module bill_split::participant_bitmap {
+    use std::vector;
+
+    /// Bitmap with `count` cleared bits
+    public fun new(count: u64): vector<u8> {
+        let bits = vector::empty<u8>();
+        let bytes = (count + 7) / 8;
+        let i = 0;
+        while (i < bytes) {
+            vector::push_back(&mut bits, 0);
+            i = i + 1;
+        };
+        bits
+    }
+
+    public fun is_set(bits: &vector<u8>, index: u64): bool {
+        (*vector::borrow(bits, index / 8) >> ((index % 8) as u8)) & 1 == 1
+    }
+
+    public fun set(bits: &mut vector<u8>, index: u64) {
+        let byte = vector::borrow_mut(bits, index / 8);
+        *byte = *byte | (1u8 << ((index % 8) as u8));
+    }
+}
@@ -0,0 +1,123 @@
+#[test_only]
+/// Correctness tests for bill_splitter: remainder splits, per-session objects, escrow
+/// settlement and pruning
+module bill_split::bill_splitter_tests {
+    use std::bcs;
+    use std::signer;
+    use std::string::{Self, String};
+    use std::vector;
+    use aptos_framework::account;
+    use aptos_framework::aptos_coin::{Self, AptosCoin};
+    use aptos_framework::coin;
+    use aptos_framework::timestamp;
+    use aptos_std::from_bcs;
+    use bill_split::bill_splitter;
+
+    const SHARE: u64 = 1000;
+
+    fun participants(count: u64): (vector<address>, vector<String>) {
+        let addresses = vector::empty<address>();
+        let names = vector::empty<String>();
+        let i = 0;
+        while (i < count) {
+            let seed = ((0x1000 + i) as u256);
+            vector::push_back(&mut addresses, from_bcs::to_address(bcs::to_bytes(&seed)));
+            vector::push_back(&mut names, string::utf8(b"Participant"));
+            i = i + 1;
+        };
+        (addresses, names)
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    /// 1000 split three ways leaves a remainder of 1; the bill must still settle
+    fun remainder_split_settles(framework: &signer, merchant: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        let (burn_cap, mint_cap) = aptos_coin::initialize_for_test(framework);
+        account::create_account_for_test(@bill_split);
+        coin::register<AptosCoin>(merchant);
+
+        let (addresses, names) = participants(3);
+        let session_id = string::utf8(b"REMAINDER");
+        bill_splitter::create_bill_session(merchant, session_id, 1000, string::utf8(b"Remainder"), addresses, names, 3);
+        bill_splitter::confirm_participants(merchant, session_id);
+
+        let payers = vector::empty<signer>();
+        let i = 0;
+        while (i < 3) {
+            let payer = account::create_account_for_test(*vector::borrow(&addresses, i));
+            coin::register<AptosCoin>(&payer);
+            coin::deposit(signer::address_of(&payer), coin::mint(SHARE, &mint_cap));
+            bill_splitter::sign_bill_agreement(&payer, session_id);
+            vector::push_back(&mut payers, payer);
+            i = i + 1;
+        };
+        i = 0;
+        while (i < 3) {
+            let owed = if (i == 0) { 334 } else { 333 };
+            bill_splitter::submit_payment(vector::borrow(&payers, i), session_id, owed);
+            i = i + 1;
+        };
+
+        let (count, signed, paid, remaining) = bill_splitter::get_session_progress(session_id);
+        assert!(count == 3 && signed == 3 && paid == 3 && remaining == 0, 1);
+        let (_, _, _, _, _, status, _, _, received, _) = bill_splitter::get_bill_session(session_id);
+        assert!(status == 3 && received == 1000, 2);
+        // The settling payment swept the escrow to the merchant in one deposit
+        assert!(coin::balance<AptosCoin>(@bill_split) == 1000, 3);
+
+        coin::destroy_burn_cap(burn_cap);
+        coin::destroy_mint_cap(mint_cap);
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    /// Sessions live in their own objects and the aggregator counts them
+    fun sessions_are_separate_objects(framework: &signer, merchant: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        account::create_account_for_test(@bill_split);
+
+        let (addresses, names) = participants(2);
+        let first = string::utf8(b"FIRST");
+        let second = string::utf8(b"SECOND");
+        bill_splitter::create_bill_session(merchant, first, 100, string::utf8(b"One"), addresses, names, 2);
+        bill_splitter::create_bill_session(merchant, second, 200, string::utf8(b"Two"), addresses, names, 2);
+        bill_splitter::confirm_participants(merchant, second);
+
+        assert!(bill_splitter::get_session_count() == 2, 1);
+        assert!(bill_splitter::get_session_address(first) != bill_splitter::get_session_address(second), 2);
+        let (_, _, _, total, _, status, _, _, _, _) = bill_splitter::get_bill_session(first);
+        assert!(total == 100 && status == 0, 3);
+        let (_, _, _, total, _, status, _, _, _, _) = bill_splitter::get_bill_session(second);
+        assert!(total == 200 && status == 1, 4);
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    /// Pruning keeps a summary of settled sessions and skips open ones
+    fun settled_sessions_are_pruned(framework: &signer, merchant: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        let (burn_cap, mint_cap) = aptos_coin::initialize_for_test(framework);
+        account::create_account_for_test(@bill_split);
+        coin::register<AptosCoin>(merchant);
+
+        let (addresses, names) = participants(1);
+        let payer = account::create_account_for_test(*vector::borrow(&addresses, 0));
+        coin::register<AptosCoin>(&payer);
+        coin::deposit(signer::address_of(&payer), coin::mint(SHARE, &mint_cap));
+
+        let settled = string::utf8(b"SETTLED");
+        let open = string::utf8(b"OPEN");
+        bill_splitter::create_bill_session(merchant, settled, SHARE, string::utf8(b"Paid"), addresses, names, 1);
+        bill_splitter::create_bill_session(merchant, open, SHARE, string::utf8(b"Open"), addresses, names, 1);
+        bill_splitter::confirm_participants(merchant, settled);
+        bill_splitter::sign_bill_agreement(&payer, settled);
+        bill_splitter::submit_payment(&payer, settled, SHARE);
+
+        bill_splitter::prune_sessions(merchant, vector[settled, open]);
+        let (_, total, received, count, status, _, _, pruned) = bill_splitter::get_session_summary(settled);
+        assert!(total == SHARE && received == SHARE && count == 1 && status == 3 && pruned, 1);
+        let (_, _, _, _, status, _, _, pruned) = bill_splitter::get_session_summary(open);
+        assert!(status == 0 && !pruned, 2);
+
+        coin::destroy_burn_cap(burn_cap);
+        coin::destroy_mint_cap(mint_cap);
+    }
+}
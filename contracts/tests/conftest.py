@@ -0,0 +1,13 @@
+"""
+Shared pytest configuration for the Python test harnesses
+Makes the helper modules in ../scripts importable from the tests
+"""
+
+import os
+import sys
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts")
+
+# Appended rather than prepended so tests/test_multiple_signers.py keeps its module name
+if SCRIPTS_DIR not in sys.path:
+    sys.path.append(SCRIPTS_DIR)
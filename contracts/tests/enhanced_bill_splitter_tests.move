@@ -0,0 +1,321 @@
+#[test_only]
+/// Correctness tests for enhanced_bill_splitter: escrowed payments, settlement, sweeps, pruning
+/// and the paged participant index
+module bill_split::enhanced_bill_splitter_tests {
+    use std::bcs;
+    use std::features;
+    use std::signer;
+    use std::string::{Self, String};
+    use std::vector;
+    use aptos_framework::account;
+    use aptos_framework::aptos_coin;
+    use aptos_framework::coin;
+    use aptos_framework::object;
+    use aptos_framework::timestamp;
+    use aptos_std::from_bcs;
+    use aptos_std::string_utils;
+    use bill_split::enhanced_bill_splitter;
+    use bill_split::usdc_utils;
+
+    const SHARE: u64 = 1000;
+    const AGGREGATOR_V2_IS_AT_LEAST_API: u64 = 66;
+    const INDEX_PAGE_SIZE: u64 = 50; // enhanced_bill_splitter::INDEX_PAGE_SIZE
+
+    /// Framework, registry and test coin as a published package has them. is_at_least stays
+    /// off unless a test turns it on, so settlement takes the try_add path by default
+    fun setup(framework: &signer, admin: &signer) {
+        timestamp::set_time_has_started_for_testing(framework);
+        features::change_feature_flags_for_testing(framework, vector[features::get_multisig_accounts_feature()], vector[]);
+        // Multisig accounts register for APT when they are created
+        let (burn_cap, mint_cap) = aptos_coin::initialize_for_test(framework);
+        coin::destroy_burn_cap(burn_cap);
+        coin::destroy_mint_cap(mint_cap);
+        account::create_account_for_test(@bill_split);
+        enhanced_bill_splitter::init_module_for_test(admin);
+        usdc_utils::initialize_usdc(admin);
+    }
+
+    /// `count` participants holding two shares of USDC each
+    fun participants(admin: &signer, count: u64): (vector<signer>, vector<address>, vector<String>) {
+        let signers = vector::empty<signer>();
+        let addresses = vector::empty<address>();
+        let names = vector::empty<String>();
+        let i = 0;
+        while (i < count) {
+            let seed = ((0x2000 + i) as u256);
+            let addr = from_bcs::to_address(bcs::to_bytes(&seed));
+            let participant = account::create_account_for_test(addr);
+            usdc_utils::register_usdc(&participant);
+            usdc_utils::mint_usdc_for_testing(admin, addr, 2 * SHARE);
+            vector::push_back(&mut signers, participant);
+            vector::push_back(&mut addresses, addr);
+            vector::push_back(&mut names, string::utf8(b"Participant"));
+            i = i + 1;
+        };
+        (signers, addresses, names)
+    }
+
+    /// Session of SHARE per participant that `required` participants have to sign
+    fun create_session(
+        merchant: &signer,
+        session_id: String,
+        addresses: vector<address>,
+        names: vector<String>,
+        required: u64
+    ) {
+        let count = vector::length(&addresses);
+        // The multisig address derives from the merchant's sequence number
+        account::increment_sequence_number_for_test(signer::address_of(merchant));
+        enhanced_bill_splitter::create_enhanced_bill_session(
+            merchant, session_id, SHARE * count, string::utf8(b"Bill"), addresses, names, required, count);
+    }
+
+    fun approved_session(merchant: &signer, session_id: String, addresses: vector<address>, names: vector<String>) {
+        create_session(merchant, session_id, addresses, names, vector::length(&addresses));
+        enhanced_bill_splitter::batch_sign_agreements(session_id, addresses);
+    }
+
+    fun pay_all(payers: &vector<signer>, session_id: String) {
+        let i = 0;
+        while (i < vector::length(payers)) {
+            enhanced_bill_splitter::submit_payment_optimized(vector::borrow(payers, i), session_id, SHARE);
+            i = i + 1;
+        };
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// Payments wait in escrow; the last one settles the bill and deposits them all at once
+    fun payments_escrow_until_the_last_one_settles(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 3);
+        let session_id = string::utf8(b"ESCROW");
+        approved_session(admin, session_id, addresses, names);
+
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 0), session_id, SHARE);
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 1), session_id, SHARE);
+        let (paid, received, escrowed) = enhanced_bill_splitter::get_payment_totals(session_id);
+        assert!(paid == 2 && received == 2 * SHARE && escrowed == 2 * SHARE, 1);
+        let (_, _, _, _, status) = enhanced_bill_splitter::get_session_stats(session_id);
+        assert!(status == 2 && usdc_utils::get_usdc_balance(@bill_split) == 0, 2);
+
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 2), session_id, SHARE);
+        let (paid, received, escrowed) = enhanced_bill_splitter::get_payment_totals(session_id);
+        assert!(paid == 3 && received == 3 * SHARE && escrowed == 0, 3);
+        let (_, _, _, _, status) = enhanced_bill_splitter::get_session_stats(session_id);
+        assert!(status == 3 && usdc_utils::get_usdc_balance(@bill_split) == 3 * SHARE, 4);
+        // Every participant's receipt is recorded
+        let (count, _, paid_bits) = enhanced_bill_splitter::get_participant_bitmaps(session_id);
+        assert!(count == 3 && paid_bits == vector[7u8], 5);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// With is_at_least available, settlement reads the threshold through it instead
+    fun settles_through_is_at_least_when_enabled(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        features::change_feature_flags_for_testing(framework, vector[AGGREGATOR_V2_IS_AT_LEAST_API], vector[]);
+        let (payers, addresses, names) = participants(admin, 2);
+        let session_id = string::utf8(b"AT_LEAST");
+        approved_session(admin, session_id, addresses, names);
+
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 0), session_id, SHARE);
+        let (_, _, _, _, status) = enhanced_bill_splitter::get_session_stats(session_id);
+        assert!(status == 2, 1);
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 1), session_id, SHARE);
+        let (_, _, _, _, status) = enhanced_bill_splitter::get_session_stats(session_id);
+        assert!(status == 3 && usdc_utils::get_usdc_balance(@bill_split) == 2 * SHARE, 2);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    #[expected_failure(abort_code = 6, location = bill_split::enhanced_bill_splitter)]
+    /// A participant's receipt slot is taken by their first payment
+    fun paying_twice_aborts(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 2);
+        let session_id = string::utf8(b"TWICE");
+        approved_session(admin, session_id, addresses, names);
+
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 0), session_id, SHARE);
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 0), session_id, SHARE);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// The settling sweep only deposits escrow the merchant has not collected already
+    fun collected_escrow_is_not_swept_again(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 2);
+        let session_id = string::utf8(b"COLLECTED");
+        approved_session(admin, session_id, addresses, names);
+
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 0), session_id, SHARE);
+        enhanced_bill_splitter::collect_payments(admin, session_id, vector[*vector::borrow(&addresses, 0)]);
+        let (_, _, escrowed) = enhanced_bill_splitter::get_payment_totals(session_id);
+        assert!(escrowed == 0 && usdc_utils::get_usdc_balance(@bill_split) == SHARE, 1);
+
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 1), session_id, SHARE);
+        let (paid, received, escrowed) = enhanced_bill_splitter::get_payment_totals(session_id);
+        assert!(paid == 2 && received == 2 * SHARE && escrowed == 0, 2);
+        assert!(usdc_utils::get_usdc_balance(@bill_split) == 2 * SHARE, 3);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// Collecting from addresses with no escrow (strangers, unpaid participants) moves nothing
+    fun collecting_from_payers_without_escrow_moves_nothing(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 3);
+        let session_id = string::utf8(b"COLLECT");
+        approved_session(admin, session_id, addresses, names);
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 0), session_id, SHARE);
+
+        enhanced_bill_splitter::collect_payments(admin, session_id, vector[@0xBEEF, *vector::borrow(&addresses, 1)]);
+        let (paid, _, escrowed) = enhanced_bill_splitter::get_payment_totals(session_id);
+        assert!(paid == 1 && escrowed == SHARE && usdc_utils::get_usdc_balance(@bill_split) == 0, 1);
+
+        // Mixed in with them, the paid participant's escrow is still collected
+        enhanced_bill_splitter::collect_payments(admin, session_id, vector[@0xBEEF, *vector::borrow(&addresses, 0)]);
+        let (_, _, escrowed) = enhanced_bill_splitter::get_payment_totals(session_id);
+        assert!(escrowed == 0 && usdc_utils::get_usdc_balance(@bill_split) == SHARE, 2);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// Late signatures of an approved session still count but do not approve it again
+    fun signing_after_approval_keeps_the_session_approved(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (_, addresses, names) = participants(admin, 3);
+        let session_id = string::utf8(b"LATE_SIGNER");
+        create_session(admin, session_id, addresses, names, 2);
+
+        enhanced_bill_splitter::batch_sign_agreements(
+            session_id, vector[*vector::borrow(&addresses, 0), *vector::borrow(&addresses, 1)]);
+        let (_, signatures, required, _, status) = enhanced_bill_splitter::get_session_stats(session_id);
+        assert!(signatures == 2 && required == 2 && status == 2, 1);
+
+        // Repeated and late signers alike; only the new one is counted
+        enhanced_bill_splitter::batch_sign_agreements(session_id, addresses);
+        let (_, signatures, _, _, status) = enhanced_bill_splitter::get_session_stats(session_id);
+        assert!(signatures == 3 && status == 2, 2);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    #[expected_failure(abort_code = 3, location = bill_split::enhanced_bill_splitter)]
+    /// A settled session takes no more signatures
+    fun signing_after_settlement_aborts(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 1);
+        let session_id = string::utf8(b"SIGN_SETTLED");
+        approved_session(admin, session_id, addresses, names);
+        enhanced_bill_splitter::submit_payment_optimized(vector::borrow(&payers, 0), session_id, SHARE);
+
+        enhanced_bill_splitter::batch_sign_agreements(session_id, addresses);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// Pruning a settled session deletes its payment ledger, keeps a summary and archives it for
+    /// its participants; open sessions in the same batch are skipped
+    fun pruning_deletes_the_ledger_and_keeps_a_summary(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 2);
+        let settled = string::utf8(b"PRUNE_SETTLED");
+        let open = string::utf8(b"PRUNE_OPEN");
+        approved_session(admin, settled, addresses, names);
+        approved_session(admin, open, addresses, names);
+        pay_all(&payers, settled);
+        let ledger = enhanced_bill_splitter::payment_ledger_of(settled);
+        assert!(object::is_object(ledger), 1);
+
+        enhanced_bill_splitter::prune_sessions(admin, vector[settled, open]);
+        assert!(!object::is_object(ledger), 2);
+        let (_, total, received, count, status, _, _, pruned) = enhanced_bill_splitter::get_session_summary(settled);
+        assert!(total == 2 * SHARE && received == 2 * SHARE && count == 2 && status == 3 && pruned, 3);
+        let (_, _, _, _, status, _, _, pruned) = enhanced_bill_splitter::get_session_summary(open);
+        assert!(status == 2 && !pruned, 4);
+        let (active, archived) = enhanced_bill_splitter::get_participant_session_counts(*vector::borrow(&addresses, 1));
+        assert!(active == 1 && archived == 1, 5);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    #[expected_failure(abort_code = 12, location = bill_split::enhanced_bill_splitter)]
+    /// A pruned id stays taken
+    fun pruned_ids_cannot_be_reused(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 1);
+        let session_id = string::utf8(b"REUSED");
+        approved_session(admin, session_id, addresses, names);
+        pay_all(&payers, session_id);
+        enhanced_bill_splitter::prune_sessions(admin, vector[session_id]);
+
+        create_session(admin, session_id, addresses, names, 1);
+    }
+
+    fun indexed_id(i: u64): String {
+        let id = string::utf8(b"IDX_");
+        string::append(&mut id, string_utils::to_string(&i));
+        id
+    }
+
+    /// Approved sessions IDX_<from>..IDX_<to - 1>, one second apart if `advance` is set
+    fun indexed_sessions(merchant: &signer, addresses: vector<address>, names: vector<String>, from: u64, to: u64, advance: bool) {
+        while (from < to) {
+            if (advance) {
+                timestamp::fast_forward_seconds(1);
+            };
+            approved_session(merchant, indexed_id(from), addresses, names);
+            from = from + 1;
+        };
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// The 51st session opens a second page; paging newest first ends on cursor 0
+    fun index_rolls_over_after_a_full_page(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 1);
+        let participant = *vector::borrow(&addresses, 0);
+        // All created in the same second, so archiving IDX_0 has to scan both pages
+        indexed_sessions(admin, addresses, names, 0, INDEX_PAGE_SIZE + 1, false);
+
+        let (ids, _, cursor) = enhanced_bill_splitter::get_participant_sessions_page(participant, false, 0);
+        assert!(ids == vector[indexed_id(INDEX_PAGE_SIZE)] && cursor == 1, 1);
+        let (ids, _, cursor) = enhanced_bill_splitter::get_participant_sessions_page(participant, false, cursor);
+        assert!(vector::length(&ids) == INDEX_PAGE_SIZE && cursor == 0, 2);
+        assert!(*vector::borrow(&ids, 0) == indexed_id(INDEX_PAGE_SIZE - 1), 3);
+        assert!(*vector::borrow(&ids, INDEX_PAGE_SIZE - 1) == indexed_id(0), 4);
+
+        pay_all(&payers, indexed_id(0));
+        enhanced_bill_splitter::archive_session(indexed_id(0), addresses);
+        let (active, archived) = enhanced_bill_splitter::get_participant_session_counts(participant);
+        assert!(active == INDEX_PAGE_SIZE && archived == 1, 5);
+        let (ids, _, cursor) = enhanced_bill_splitter::get_participant_sessions_page(participant, true, 0);
+        assert!(ids == vector[indexed_id(0)] && cursor == 0, 6);
+    }
+
+    #[test(framework = @aptos_framework, admin = @bill_split)]
+    /// Archiving from a middle page keeps that page in order, the gap is not back-filled (new
+    /// sessions still go to the newest page) and archiving twice is a no-op
+    fun archiving_from_a_middle_page_keeps_the_order(framework: &signer, admin: &signer) {
+        setup(framework, admin);
+        let (payers, addresses, names) = participants(admin, 1);
+        let participant = *vector::borrow(&addresses, 0);
+        indexed_sessions(admin, addresses, names, 0, 2 * INDEX_PAGE_SIZE + 1, true);
+        let middle = INDEX_PAGE_SIZE + 10;
+        pay_all(&payers, indexed_id(middle));
+
+        enhanced_bill_splitter::archive_session(indexed_id(middle), addresses);
+        enhanced_bill_splitter::archive_session(indexed_id(middle), addresses);
+        let (active, archived) = enhanced_bill_splitter::get_participant_session_counts(participant);
+        assert!(active == 2 * INDEX_PAGE_SIZE && archived == 1, 1);
+
+        let (_, _, cursor) = enhanced_bill_splitter::get_participant_sessions_page(participant, false, 0);
+        assert!(cursor == 2, 2);
+        let (ids, _, cursor) = enhanced_bill_splitter::get_participant_sessions_page(participant, false, cursor);
+        assert!(vector::length(&ids) == INDEX_PAGE_SIZE - 1 && cursor == 1, 3);
+        assert!(!vector::contains(&ids, &indexed_id(middle)), 4);
+        // Newest first: IDX_99 .. IDX_61, IDX_59 .. IDX_50
+        assert!(*vector::borrow(&ids, 38) == indexed_id(middle + 1), 5);
+        assert!(*vector::borrow(&ids, 39) == indexed_id(middle - 1), 6);
+
+        indexed_sessions(admin, addresses, names, 2 * INDEX_PAGE_SIZE + 1, 2 * INDEX_PAGE_SIZE + 2, true);
+        let (ids, _, cursor) = enhanced_bill_splitter::get_participant_sessions_page(participant, false, 0);
+        assert!(ids == vector[indexed_id(2 * INDEX_PAGE_SIZE + 1), indexed_id(2 * INDEX_PAGE_SIZE)] && cursor == 2, 7);
+        let (ids, _, cursor) = enhanced_bill_splitter::get_participant_sessions_page(participant, true, 0);
+        assert!(ids == vector[indexed_id(middle)] && cursor == 0, 8);
+    }
+}
@@ -9,8 +9,7 @@ module bill_split::multi_address_test {
 
     /// Create a realistic test scenario with multiple unique addresses
     public entry fun test_multiple_real_addresses(admin: &signer) {
-        // Initialize systems
-        bill_splitter::initialize(admin);
+        // bill_splitter sets up its registry in init_module
         usdc_utils::initialize_usdc(admin);
         
         // Define realistic test addresses (these would be real user wallets)
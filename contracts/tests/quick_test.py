@@ -2,35 +2,34 @@
 Windows-optimized Bill Splitter Test Script
 """
 
-import subprocess
+import argparse
 import os
+import shlex
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from cli_runner import run_command as run_cli
+from instrumentation import Recorder, add_output_arguments
+from move_cache import CONTRACTS_DIR, MoveBuildCache
+
+move_cache = MoveBuildCache()
+
 def run_command(command, timeout=30):
     """Run a command and return success status and output."""
-    try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            capture_output=True, 
-            text=True, 
-            timeout=timeout,
-            cwd=os.path.dirname(os.path.abspath(__file__)) + "/.."
-        )
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return False, "", "Command timed out"
-    except Exception as e:
-        return False, "", str(e)
+    result = run_cli(shlex.split(command) if isinstance(command, str) else command,
+                     cwd=CONTRACTS_DIR, timeout=timeout)
+    return result.success, result.stdout, result.stderr
 
 def test_compilation():
     """Test contract compilation."""
     print("🔨 Testing contract compilation...")
     
-    success, stdout, stderr = run_command("aptos move compile --dev")
+    result = move_cache.run(["aptos", "move", "compile", "--dev"], CONTRACTS_DIR, timeout=30)
+    success, stdout, stderr = result.success, result.stdout, result.stderr
     
     if success:
-        print("✓ Contracts compiled successfully!")
+        print("✓ Contracts compiled successfully!" + (" (cached)" if result.cached else ""))
         if "Result" in stdout:
             print("✓ Modules found in compilation result")
         return True
@@ -44,10 +43,11 @@ def test_move_tests():
     """Test Move unit tests."""
     print("🧪 Testing Move unit tests...")
     
-    success, stdout, stderr = run_command("aptos move test --dev")
+    result = move_cache.run(["aptos", "move", "test", "--dev"], CONTRACTS_DIR, timeout=30)
+    success, stdout, stderr = result.success, result.stdout, result.stderr
     
     if success:
-        print("✓ Move tests passed!")
+        print("✓ Move tests passed!" + (" (cached)" if result.cached else ""))
         if "Total tests:" in stdout:
             print(f"✓ {stdout.split('Total tests:')[1].split(';')[0].strip()} tests found")
         return True
@@ -75,8 +75,10 @@ def test_specific_functions():
     
     return True
 
-def main():
+def main(argv=None):
     """Run comprehensive tests."""
+    args = add_output_arguments(argparse.ArgumentParser(description=__doc__)).parse_args(argv)
+    recorder = Recorder.from_args("quick_test", args)
     print("🚀 Bill Splitter Test Suite for Windows")
     print("=" * 50)
     
@@ -91,16 +93,11 @@ def main():
         ("Function Logic", test_specific_functions)
     ]
     
-    results = {}
-    
     for test_name, test_func in tests:
         print(f"\n📋 {test_name}")
         print("-" * 30)
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"✗ {test_name} failed with error: {e}")
-            results[test_name] = False
+        recorder.run_test(test_name, test_func)
+    results = recorder.results
     
     # Summary
     print("\n" + "=" * 50)
@@ -115,6 +112,8 @@ def main():
         print(f"{test_name}: {status}")
         
     print(f"\nOverall: {passed_tests}/{total_tests} tests passed")
+    print(recorder.summary())
+    recorder.write()
     
     if passed_tests == total_tests:
         print("🎉 All tests passed! Ready for deployment.")
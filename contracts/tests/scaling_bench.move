@@ -0,0 +1,88 @@
+#[test_only]
+/// Participant-count sweeps for the scaling benchmark
+/// Run via `aptos move test --filter scaling_bench::scaling_basic_<n>`; every operation
+/// targets the last participant, the worst case for the linear participant scans
+module bill_split::scaling_bench {
+    use std::bcs;
+    use std::string::{Self, String};
+    use std::vector;
+    use aptos_framework::account;
+    use aptos_framework::aptos_coin::{Self, AptosCoin};
+    use aptos_framework::coin;
+    use aptos_framework::timestamp;
+    use aptos_std::from_bcs;
+    use bill_split::bill_splitter;
+
+    const SHARE: u64 = 1000;
+
+    fun participants(count: u64): (vector<address>, vector<String>) {
+        let addresses = vector::empty<address>();
+        let names = vector::empty<String>();
+        let i = 0;
+        while (i < count) {
+            let seed = ((0x1000 + i) as u256);
+            vector::push_back(&mut addresses, from_bcs::to_address(bcs::to_bytes(&seed)));
+            vector::push_back(&mut names, string::utf8(b"Participant"));
+            i = i + 1;
+        };
+        (addresses, names)
+    }
+
+    fun run_basic(framework: &signer, merchant: &signer, count: u64) {
+        timestamp::set_time_has_started_for_testing(framework);
+        let (burn_cap, mint_cap) = aptos_coin::initialize_for_test(framework);
+        account::create_account_for_test(@bill_split);
+        coin::register<AptosCoin>(merchant);
+
+        let (addresses, names) = participants(count);
+        let last = *vector::borrow(&addresses, count - 1);
+        let payer = account::create_account_for_test(last);
+        coin::register<AptosCoin>(&payer);
+        coin::deposit(last, coin::mint(SHARE, &mint_cap));
+
+        let session_id = string::utf8(b"SCALING");
+        bill_splitter::create_bill_session(
+            merchant, session_id, SHARE * count, string::utf8(b"Scaling"), addresses, names, 1
+        );
+        bill_splitter::update_participant_amount(merchant, session_id, last, SHARE);
+        bill_splitter::confirm_participants(merchant, session_id);
+        bill_splitter::sign_bill_agreement(&payer, session_id);
+        assert!(bill_splitter::has_participant_signed(session_id, last), 1);
+        bill_splitter::submit_payment(&payer, session_id, SHARE);
+        assert!(bill_splitter::has_participant_paid(session_id, last), 2);
+        let (seen, signed, paid) = bill_splitter::get_participant_bitmaps(session_id);
+        let bit = (((count - 1) % 8) as u8);
+        assert!(seen == count && vector::length(&signed) == (count + 7) / 8, 3);
+        assert!((*vector::borrow(&signed, (count - 1) / 8) >> bit) & 1 == 1, 4);
+        assert!((*vector::borrow(&paid, (count - 1) / 8) >> bit) & 1 == 1, 5);
+        assert!(count == 1 || *vector::borrow(&paid, 0) & 1 == 0, 6);
+
+        coin::destroy_burn_cap(burn_cap);
+        coin::destroy_mint_cap(mint_cap);
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    fun scaling_basic_5(framework: &signer, merchant: &signer) {
+        run_basic(framework, merchant, 5);
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    fun scaling_basic_20(framework: &signer, merchant: &signer) {
+        run_basic(framework, merchant, 20);
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    fun scaling_basic_100(framework: &signer, merchant: &signer) {
+        run_basic(framework, merchant, 100);
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    fun scaling_basic_500(framework: &signer, merchant: &signer) {
+        run_basic(framework, merchant, 500);
+    }
+
+    #[test(framework = @aptos_framework, merchant = @bill_split)]
+    fun scaling_basic_1000(framework: &signer, merchant: &signer) {
+        run_basic(framework, merchant, 1000);
+    }
+}
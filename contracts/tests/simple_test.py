@@ -3,90 +3,60 @@ Simple Bill Splitter Test Script
 A lightweight version for quick testing without complex account setup.
 """
 
-import subprocess
+import argparse
 import os
 import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from cli_runner import run_command
+from instrumentation import Recorder, add_output_arguments
+from move_cache import CONTRACTS_DIR, MoveBuildCache
+
+move_cache = MoveBuildCache()
+
 def check_aptos_cli():
     """Check if Aptos CLI is available."""
-    try:
-        result = subprocess.run(["aptos", "--version"], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            print(f"✓ Aptos CLI found: {result.stdout.strip()}")
-            return True
-        else:
-            print("✗ Aptos CLI not working properly")
-            return False
-    except subprocess.TimeoutExpired:
+    result = run_command(["aptos", "--version"], timeout=5)
+    if result.success:
+        print(f"✓ Aptos CLI found: {result.stdout.strip()}")
+        return True
+    if result.timed_out:
         print("✗ Aptos CLI check timed out")
-        return False
-    except FileNotFoundError:
+    elif result.returncode < 0:
         print("✗ Aptos CLI not found. Please install it first.")
-        return False
-    except Exception as e:
-        print(f"✗ Error checking Aptos CLI: {e}")
-        return False
+    else:
+        print("✗ Aptos CLI not working properly")
+    return False
 
 def compile_contracts():
     """Compile the Move contracts."""
     print("🔨 Compiling contracts...")
     
-    try:
-        # Change to contracts directory
-        original_dir = os.getcwd()
-        os.chdir("..")  # Go up to contracts directory
-        
-        result = subprocess.run([
-            "aptos", "move", "compile", "--dev"
-        ], capture_output=True, text=True, timeout=30)
-        
-        os.chdir(original_dir)  # Return to tests directory
-        
-        if result.returncode == 0:
-            print("✓ Contracts compiled successfully!")
-            return True
-        else:
-            print(f"✗ Compilation failed:")
-            print(result.stderr)
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print("✗ Compilation timed out")
-        return False
-    except Exception as e:
-        print(f"✗ Error during compilation: {e}")
+    result = move_cache.run(["aptos", "move", "compile", "--dev"], CONTRACTS_DIR, timeout=30)
+    
+    if result.returncode == 0:
+        print("✓ Contracts compiled successfully!" + (" (cached)" if result.cached else ""))
+        return True
+    else:
+        print(f"✗ Compilation failed:")
+        print(result.stderr)
         return False
 
 def test_move_syntax():
     """Test Move syntax and imports."""
     print("🧪 Testing Move syntax...")
     
-    try:
-        # Change to contracts directory
-        original_dir = os.getcwd()
-        os.chdir("..")
-        
-        # Test compilation with dev flag
-        result = subprocess.run([
-            "aptos", "move", "test", "--dev"
-        ], capture_output=True, text=True, timeout=45)
-        
-        os.chdir(original_dir)
-        
-        if result.returncode == 0:
-            print("✓ Move tests passed!")
-            print(result.stdout)
-            return True
-        else:
-            print("✗ Move tests failed:")
-            print(result.stderr)
-            return False
-            
-    except subprocess.TimeoutExpired:
-        print("✗ Move tests timed out")
-        return False
-    except Exception as e:
-        print(f"✗ Error running Move tests: {e}")
+    # Test compilation with dev flag
+    result = move_cache.run(["aptos", "move", "test", "--dev"], CONTRACTS_DIR, timeout=45)
+    
+    if result.returncode == 0:
+        print("✓ Move tests passed!" + (" (cached)" if result.cached else ""))
+        print(result.stdout)
+        return True
+    else:
+        print("✗ Move tests failed:")
+        print(result.stderr)
         return False
 
 def test_basic_functionality():
@@ -107,8 +77,10 @@ def test_basic_functionality():
     
     return True
 
-def main():
+def main(argv=None):
     """Run the simple test suite."""
+    args = add_output_arguments(argparse.ArgumentParser(description=__doc__)).parse_args(argv)
+    recorder = Recorder.from_args("simple_test", args)
     print("🚀 Simple Bill Splitter Test Suite")
     print("=" * 50)
     
@@ -119,16 +91,11 @@ def main():
         ("Basic Functionality", test_basic_functionality)
     ]
     
-    results = {}
-    
     for test_name, test_func in tests:
         print(f"\n📋 {test_name}")
         print("-" * 30)
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"✗ {test_name} failed with error: {e}")
-            results[test_name] = False
+        recorder.run_test(test_name, test_func)
+    results = recorder.results
     
     # Summary
     print("\n" + "=" * 50)
@@ -143,6 +110,8 @@ def main():
         print(f"{test_name}: {status}")
         
     print(f"\nOverall: {passed_tests}/{total_tests} tests passed")
+    print(recorder.summary())
+    recorder.write()
     
     if passed_tests == total_tests:
         print("🎉 All tests passed! Ready for deployment.")
@@ -0,0 +1,253 @@
+"""
+Tests for the in-process bill splitter simulator.
+"""
+
+import pytest
+
+from accounts import TestAccount
+from bill_simulator import (
+    APTOS_COIN, E_ALREADY_PAID, E_BATCH_TOO_LARGE, E_INVALID_STATUS, E_PARTICIPANT_NOT_FOUND,
+    E_SESSION_PRUNED, E_UNAUTHORIZED, INDEX_PAGE_SIZE, MAX_PRUNE_PARTICIPANTS, STATUS_APPROVED, STATUS_SETTLED, USDC, BillSplitterSimulator, MoveAbort,
+    SimulatorBackend,
+)
+
+MERCHANT = "0x" + "m".encode().hex().rjust(64, "0")
+ALICE, BOB, CAROL = ("0x" + hex(n)[2:].rjust(64, "0") for n in (0xa, 0xb, 0xc))
+
+
+@pytest.fixture
+def sim():
+    simulator = BillSplitterSimulator(clock=lambda: 1_700_000_000)
+    for address in (ALICE, BOB, CAROL):
+        simulator.ledger.deposit(APTOS_COIN, address, 1_000)
+    simulator.bill_splitter.create_bill_session(
+        MERCHANT, "S1", 300, "dinner", [ALICE, BOB, CAROL], ["a", "b", "c"], 2)
+    return simulator
+
+
+def test_lifecycle_reaches_settled_with_events(sim):
+    bill = sim.bill_splitter
+    bill.confirm_participants(MERCHANT, "S1")
+    bill.sign_bill_agreement(ALICE, "S1")
+    bill.sign_bill_agreement(BOB, "S1")
+    assert bill.sessions["S1"].status == STATUS_APPROVED
+
+    for address in (ALICE, BOB):
+        bill.submit_payment(address, "S1", 100)
+    assert sim.ledger.balance(APTOS_COIN, MERCHANT) == 0  # Held in the session escrow
+    bill.submit_payment(CAROL, "S1", 100)
+
+    assert bill.sessions["S1"].status == STATUS_SETTLED
+    assert sim.ledger.balance(APTOS_COIN, MERCHANT) == 300
+    assert [event.name for event in bill.events] == (
+        ["SessionCreatedEvent"] + ["ParticipantAddedEvent"] * 3 + ["BillApprovedEvent"]
+        + ["PaymentReceivedEvent"] * 3 + ["BatchPaymentEvent", "BillSettledEvent"])
+    assert [event.data["remaining_amount"] for event in bill.events[5:8]] == [200, 100, 0]
+    # Payment times are reported by the events only; the participant view carries none
+    assert [event.data["paid_at"] for event in bill.events[5:8]] == [1_700_000_000] * 3
+    assert "payment_timestamp" not in bill.get_participants("S1")[0]
+    assert bill.events[-2].data["payments"] == [ALICE, BOB, CAROL]
+    assert bill.events[-2].data["amounts"] == [100] * 3
+    assert bill.get_session_count() == 1
+
+
+def test_abort_codes_follow_the_move_module(sim):
+    bill = sim.bill_splitter
+    with pytest.raises(MoveAbort) as abort:
+        bill.sign_bill_agreement(ALICE, "S1")
+    assert abort.value.code == E_INVALID_STATUS
+
+    with pytest.raises(MoveAbort) as abort:
+        bill.confirm_participants(ALICE, "S1")
+    assert abort.value.code == E_UNAUTHORIZED
+
+    bill.confirm_participants(MERCHANT, "S1")
+    bill.sign_bill_agreement(ALICE, "S1")
+    with pytest.raises(MoveAbort) as abort:
+        bill.sign_bill_agreement(ALICE, "S1")
+    assert abort.value.code == E_ALREADY_PAID
+
+    with pytest.raises(MoveAbort) as abort:
+        bill.sign_bill_agreement(MERCHANT, "S1")
+    assert abort.value.code == E_PARTICIPANT_NOT_FOUND
+
+
+def test_enhanced_batch_signing_respects_batch_limit(sim):
+    enhanced = sim.enhanced_bill_splitter
+    enhanced.create_enhanced_bill_session(MERCHANT, "E1", 300, "d", [ALICE, BOB, CAROL], ["a", "b", "c"], 2, 10)
+    enhanced.batch_sign_agreements("E1", [ALICE, ALICE, MERCHANT])
+    assert enhanced.get_session_stats("E1") == (3, 1, 2, 0, 0)
+    enhanced.batch_sign_agreements("E1", [BOB])
+    assert enhanced.get_session_stats("E1")[4] == STATUS_APPROVED
+
+    with pytest.raises(MoveAbort) as abort:
+        enhanced.batch_sign_agreements("E1", [ALICE] * 51)
+    assert abort.value.code == E_BATCH_TOO_LARGE
+    assert enhanced.get_participant_sessions_page(ALICE, False, 0) == (["E1"], [1_700_000_000], 0)
+
+
+def test_enhanced_payments_wait_in_escrow_until_settled(sim):
+    enhanced = sim.enhanced_bill_splitter
+    for address in (ALICE, BOB):
+        sim.ledger.deposit(USDC, address, 500)
+    enhanced.create_enhanced_bill_session(MERCHANT, "E2", 301, "d", [ALICE, BOB], ["a", "b"], 2, 10)
+    enhanced.batch_sign_agreements("E2", [ALICE, BOB])
+
+    enhanced.submit_payment_optimized(ALICE, "E2", 200)  # Overpays her 151 share
+    assert enhanced.get_payment_totals("E2") == (1, 151, 200)
+    assert sim.ledger.balance(USDC, MERCHANT) == 0
+
+    with pytest.raises(MoveAbort) as abort:
+        enhanced.collect_payments(ALICE, "E2", [ALICE])
+    assert abort.value.code == E_UNAUTHORIZED
+    enhanced.collect_payments(MERCHANT, "E2", [ALICE, CAROL])  # Early sweep of Alice's escrow
+    enhanced.collect_payments(MERCHANT, "E2", [ALICE, CAROL])  # Nothing left: no deposit, no event
+    assert sim.ledger.balance(USDC, MERCHANT) == 200
+
+    enhanced.submit_payment_optimized(BOB, "E2", 150)  # Settles and sweeps the rest
+    assert enhanced.get_session_stats("E2")[3:] == (301, STATUS_SETTLED)
+    assert sim.ledger.balance(USDC, MERCHANT) == 350
+    assert enhanced.get_payment_totals("E2") == (2, 301, 0)
+    batches = [(event.data["payments"], event.data["amounts"]) for event in sim.events
+               if event.name == "BatchPaymentEvent"]
+    assert batches == [([ALICE], [200]), ([BOB], [150])]
+
+
+def test_enhanced_payments_and_signatures_follow_the_status(sim):
+    enhanced = sim.enhanced_bill_splitter
+    sim.ledger.deposit(USDC, ALICE, 500)
+    enhanced.create_enhanced_bill_session(MERCHANT, "E3", 100, "d", [ALICE], ["a"], 1, 10)
+
+    with pytest.raises(MoveAbort) as abort:
+        enhanced.submit_payment_optimized(ALICE, "E3", 100)  # Nobody approved the bill
+    assert abort.value.code == E_INVALID_STATUS
+    assert sim.ledger.balance(USDC, ALICE) == 500 and "E3" not in enhanced.escrow
+
+    enhanced.batch_sign_agreements("E3", [ALICE])
+    approved_at = enhanced.sessions["E3"].approved_at
+    enhanced.batch_sign_agreements("E3", [])  # Still approved, approval time kept
+    assert enhanced.sessions["E3"].approved_at == approved_at
+    enhanced.submit_payment_optimized(ALICE, "E3", 100)
+    with pytest.raises(MoveAbort) as abort:
+        enhanced.batch_sign_agreements("E3", [])  # Would have reopened the settled bill
+    assert abort.value.code == E_INVALID_STATUS
+    assert enhanced.get_session_stats("E3")[4] == STATUS_SETTLED
+
+
+def test_participant_index_pages_newest_first_and_archives(sim):
+    enhanced = sim.enhanced_bill_splitter
+    for address in (ALICE, BOB):
+        sim.ledger.deposit(USDC, address, 100)
+    total = INDEX_PAGE_SIZE + 5
+    for n in range(total):
+        enhanced.create_enhanced_bill_session(MERCHANT, f"E{n}", 10, "d", [ALICE, BOB], ["a", "b"], 1, 10)
+
+    pages, cursor = [], 0
+    while True:
+        ids, _, cursor = enhanced.get_participant_sessions_page(ALICE, False, cursor)
+        pages.append(ids)
+        if cursor == 0:
+            break
+    assert [len(page) for page in pages] == [5, INDEX_PAGE_SIZE]
+    assert sum(pages, []) == [f"E{n}" for n in reversed(range(total))]
+
+    with pytest.raises(MoveAbort) as abort:
+        enhanced.archive_session("E0", [ALICE])
+    assert abort.value.code == E_INVALID_STATUS
+    # Settle E0..E2 and archive them for Alice only
+    for n in range(3):
+        enhanced.batch_sign_agreements(f"E{n}", [ALICE])
+        for address in (ALICE, BOB):
+            enhanced.submit_payment_optimized(address, f"E{n}", 5)
+        enhanced.archive_session(f"E{n}", [ALICE, CAROL])
+    enhanced.archive_session("E0", [ALICE])  # Already archived: skipped
+
+    assert enhanced.get_participant_session_counts(ALICE) == (total - 3, 3)
+    assert enhanced.get_participant_session_counts(BOB) == (total, 0)
+    assert enhanced.get_participant_sessions_page(ALICE, True, 0)[0] == ["E2", "E1", "E0"]
+    ids, _, cursor = enhanced.get_participant_sessions_page(ALICE, False, 1)
+    assert ids[-1] == "E3" and len(ids) == INDEX_PAGE_SIZE - 3 and cursor == 0
+
+
+def test_archive_finds_the_page_by_creation_time():
+    now = [1_700_000_000]
+    simulator = BillSplitterSimulator(clock=lambda: now[0])
+    enhanced = simulator.enhanced_bill_splitter
+    simulator.ledger.deposit(USDC, ALICE, 1_000)
+    total = 2 * INDEX_PAGE_SIZE + 3
+    for n in range(total):
+        now[0] += 1
+        enhanced.create_enhanced_bill_session(MERCHANT, f"T{n}", 1, "d", [ALICE], ["a"], 1, 10)
+    for n in (0, INDEX_PAGE_SIZE + 1, total - 1):
+        enhanced.batch_sign_agreements(f"T{n}", [ALICE])
+        enhanced.submit_payment_optimized(ALICE, f"T{n}", 1)
+        enhanced.archive_session(f"T{n}", [ALICE, BOB])  # Bob never joined: skipped
+    enhanced.archive_session("T0", [ALICE])
+
+    assert enhanced.get_participant_session_counts(ALICE) == (total - 3, 3)
+    archived = enhanced.get_participant_sessions_page(ALICE, True, 0)[0]
+    assert archived == [f"T{total - 1}", f"T{INDEX_PAGE_SIZE + 1}", "T0"]
+
+def test_enhanced_prune_waits_for_settlement_and_keeps_a_summary(sim):
+    enhanced = sim.enhanced_bill_splitter
+    admin = sim.module_address
+    for address in (ALICE, BOB):
+        sim.ledger.deposit(USDC, address, 500)
+    for session_id in ("P1", "P2"):
+        enhanced.create_enhanced_bill_session(MERCHANT, session_id, 300, "d", [ALICE, BOB], ["a", "b"], 2, 10)
+    enhanced.batch_sign_agreements("P1", [ALICE, BOB])
+    enhanced.submit_payment_optimized(ALICE, "P1", 150)
+
+    with pytest.raises(MoveAbort) as abort:
+        enhanced.prune_sessions(MERCHANT, ["P1"])
+    assert abort.value.code == E_UNAUTHORIZED
+    enhanced.prune_sessions(admin, ["P1", "P2", "MISSING"])  # P1 still holds escrow, P2 is open
+    assert sim.events[-1].data["session_ids"] == []
+
+    enhanced.submit_payment_optimized(BOB, "P1", 150)  # Settling sweeps the escrow
+    enhanced.prune_sessions(admin, ["P1", "P2"])
+    assert sim.events[-1].data["session_ids"] == ["P1"]
+    assert enhanced.get_session_summary("P1") == (MERCHANT, 300, 300, 2, STATUS_SETTLED, 1_700_000_000,
+                                                  1_700_000_000, True)
+    assert enhanced.get_session_summary("P2")[-1] is False
+    assert enhanced.get_participant_sessions_page(ALICE, True, 0)[0] == ["P1"]
+    assert enhanced.get_participant_sessions_page(ALICE, False, 0)[0] == ["P2"]
+
+    with pytest.raises(MoveAbort) as abort:
+        enhanced.create_enhanced_bill_session(MERCHANT, "P1", 300, "d", [ALICE], ["a"], 1, 10)
+    assert abort.value.code == E_SESSION_PRUNED
+
+
+def test_enhanced_prune_batches_are_capped_by_participants(sim):
+    enhanced = sim.enhanced_bill_splitter
+    size = MAX_PRUNE_PARTICIPANTS * 2 // 5  # Two sessions fit a call, the third waits
+    people = ["0x" + hex(0x1000 + n)[2:].rjust(64, "0") for n in range(size)]
+    for address in people:
+        sim.ledger.deposit(USDC, address, 3)
+    for session_id in ("L1", "L2", "L3"):
+        enhanced.create_enhanced_bill_session(MERCHANT, session_id, size, "d", people, ["p"] * size, 1, 1000)
+        enhanced.batch_sign_agreements(session_id, people[:1])
+        for address in people:
+            enhanced.submit_payment_optimized(address, session_id, 1)
+
+    enhanced.prune_sessions(sim.module_address, ["L1", "L2", "L3"])
+    assert sim.events[-1].data["session_ids"] == ["L1", "L2"]
+    enhanced.prune_sessions(sim.module_address, ["L3"])
+    assert sim.events[-1].data["session_ids"] == ["L3"]
+
+
+def test_backend_reports_failures_without_side_effects():
+    backend = SimulatorBackend()
+    merchant, alice = backend.new_account(), backend.new_account()
+    ok = backend.run(merchant, "bill_splitter::create_bill_session", [
+        "string:S", "u64:100", "string:d", f"vector<address>:{alice.address}", "vector<string>:a", "u64:1"])
+    assert ok.success and ok.events[0].data["session_id"] == "S"
+
+    duplicate = backend.run(merchant, "bill_splitter::create_bill_session", [
+        "string:S", "u64:100", "string:d", f"vector<address>:{alice.address}", "vector<string>:a", "u64:1"])
+    assert not duplicate.success and duplicate.events == []
+    assert duplicate.vm_status == "Move abort in object: 524289"  # EOBJECT_EXISTS
+
+    missing = backend.run(merchant, "bill_splitter::initialize")
+    assert missing.vm_status == "FUNCTION_RESOLUTION_FAILURE"
+    assert backend.view("bill_splitter::get_bill_session", ["string:S"])[3] == 100
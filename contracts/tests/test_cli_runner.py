@@ -0,0 +1,83 @@
+"""
+Tests for the async CLI runner.
+"""
+
+import asyncio
+import os
+import sys
+
+from cli_runner import AsyncCliRunner, parse_json_output, run_command, run_commands
+from instrumentation import Recorder
+
+
+def python(code):
+    return [sys.executable, "-c", code]
+
+
+def test_runs_in_the_given_cwd_without_touching_the_process_cwd(tmp_path):
+    before = os.getcwd()
+
+    result = run_command(python("import os; print(os.getcwd())"), cwd=str(tmp_path))
+
+    assert result.success and result.stdout.strip() == str(tmp_path)
+    assert os.getcwd() == before
+
+
+def test_arguments_are_not_shell_interpreted(tmp_path):
+    result = run_command(python("import sys; print(sys.argv[1])") + ["$HOME; echo hi"], cwd=str(tmp_path))
+
+    assert result.stdout.strip() == "$HOME; echo hi"
+
+
+def test_concurrency_is_bounded_by_the_semaphore(monkeypatch):
+    runner = AsyncCliRunner(max_concurrency=2)
+    active = {"now": 0, "peak": 0}
+    original = asyncio.create_subprocess_exec
+
+    async def counting(*args, **kwargs):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        process = await original(*args, **kwargs)
+        wait = process.communicate
+
+        async def communicate(*a):
+            try:
+                return await wait(*a)
+            finally:
+                active["now"] -= 1
+        process.communicate = communicate
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", counting)
+    results = asyncio.run(runner.run_all([python("import time; time.sleep(0.2)")] * 5))
+
+    assert all(result.success for result in results)
+    assert active["peak"] == 2
+
+
+def test_timeouts_missing_executables_and_failures_are_results():
+    slow, missing, failing = run_commands([
+        python("import time; time.sleep(5)"),
+        ["definitely-not-an-aptos-cli"],
+        python("import sys; sys.stderr.write('boom'); sys.exit(3)"),
+    ], timeout=0.5)
+
+    assert slow.timed_out and not slow.success and slow.duration < 5
+    assert missing.returncode == -1 and not missing.success
+    assert failing.returncode == 3 and failing.error == "boom"
+
+
+def test_parses_cli_json_after_progress_lines():
+    output = 'Compiling, may take a little while...\n{\n  "Result": {"success": true, "gas_used": 12}\n}\n'
+    result = run_command(python(f"print({output!r})"), parse_json=True)
+
+    assert parse_json_output(output) == {"Result": {"success": True, "gas_used": 12}}
+    assert result.payload["gas_used"] == 12
+
+
+def test_cli_time_is_charged_to_the_active_step():
+    recorder = Recorder("cli")
+    with recorder.step("concurrent"):
+        run_commands([python("pass")] * 3)
+
+    assert recorder.records[0].subprocesses == 3
@@ -0,0 +1,136 @@
+"""
+Tests for the bill_splitter module event indexer against the local fake node.
+"""
+
+import pytest
+
+from backends import TxRequest
+from event_indexer import STATUS_APPROVED, STATUS_SETTLED, EventIndexer, EventStore, GraphqlEventSource
+from fake_node import FakeAptosNode
+from provisioning import FaucetProvisioner
+from submission import HttpTransport, RestBackend, SubmissionEngine
+
+
+@pytest.fixture
+def node():
+    with FakeAptosNode() as node:
+        yield node
+
+
+def create_bills(node, count, pay=True):
+    accounts, _ = FaucetProvisioner(node.url, node.root_url, concurrency=4).provision(3)
+    merchant, alice, bob = accounts
+    backend = RestBackend(SubmissionEngine(HttpTransport(node.url), node.module_address))
+    addresses = f"vector<address>:{alice.address},{bob.address}"
+    for index in range(count):
+        session = f"string:BILL_{index:03d}"
+        backend.run(merchant, "bill_splitter::create_bill_session", [
+            session, "u64:2000", "string:Dinner", addresses, "vector<string>:Alice,Bob", "u64:2"])
+        backend.run(merchant, "bill_splitter::confirm_participants", [session])
+        backend.run_many([
+            TxRequest(alice, "bill_splitter::sign_bill_agreement", [session]),
+            TxRequest(bob, "bill_splitter::sign_bill_agreement", [session]),
+        ])
+        if pay:
+            backend.run(alice, "bill_splitter::submit_payment", [session, "u64:1000"])
+    return merchant, alice, bob, backend
+
+
+def indexer_for(node, store, page_size=100):
+    source = GraphqlEventSource(HttpTransport(f"{node.url}/graphql"), node.module_address)
+    return EventIndexer(source, store, page_size=page_size)
+
+
+def test_materializes_sessions_from_events(node, tmp_path):
+    merchant, alice, bob, backend = create_bills(node, 2)
+    backend.run(bob, "bill_splitter::submit_payment", ["string:BILL_000", "u64:1000"])
+    store = EventStore(str(tmp_path / "events.db"))
+
+    summary = indexer_for(node, store).poll()
+
+    assert summary.applied["session_created"] == 2 and summary.applied["bill_settled"] == 1
+    assert summary.applied["participant_added"] == 4 and summary.applied["payment_received"] == 3
+    assert summary.applied["batch_payment"] == 1
+    settled = store.session("BILL_000")
+    assert settled["status"] == STATUS_SETTLED and settled["remaining_amount"] == 0
+    # Payments seen one by one are not counted again by the settling BatchPaymentEvent
+    assert settled["merchant_address"] == merchant.address and settled["payments_received"] == 2000
+    assert [p["amount_paid"] for p in settled["participants"]] == [1000, 1000]
+    # Participants are known from creation, and Alice's escrowed payment shows before settlement
+    pending = store.session("BILL_001")
+    assert pending["status"] == STATUS_APPROVED and pending["remaining_amount"] == 1000
+    assert {p["name"]: p["has_paid"] for p in pending["participants"]} == {"Alice": 1, "Bob": 0}
+    assert store.participant_sessions(alice.address) == ["BILL_000", "BILL_001"]
+    assert store.participant_sessions(bob.address) == ["BILL_000", "BILL_001"]
+
+
+def test_pages_resume_from_persisted_cursors(node, tmp_path):
+    create_bills(node, 7, pay=False)
+    path = str(tmp_path / "events.db")
+
+    first = indexer_for(node, EventStore(path), page_size=3)
+    source = first.source
+    calls = []
+
+    def crash_after_two_pages(after, limit):
+        calls.append(after)
+        if len(calls) > 2:
+            raise ConnectionError("indexer killed")
+        return GraphqlEventSource.fetch(source, after, limit)
+    source.fetch = crash_after_two_pages
+    with pytest.raises(ConnectionError):
+        first.poll()
+    indexed = first.store.event_count("session_created")
+    first.store.close()
+
+    store = EventStore(path)
+    assert store.event_count() == 6 and store.position() == calls[2]
+    resumed = indexer_for(node, store, page_size=3)
+    summary = resumed.poll()
+
+    assert summary.applied["session_created"] == 7 - indexed  # Only the unseen tail, nothing replayed
+    assert store.event_count("session_created") == 7 and len(store.sessions()) == 7
+    assert resumed.poll().total == 0
+
+
+def test_overlapping_pages_are_not_applied_twice(tmp_path):
+    store = EventStore(str(tmp_path / "events.db"))
+    event = {"version": 4, "event_index": 1, "type": "0x42::bill_splitter::PaymentReceivedEvent",
+             "data": {"session_id": "S", "participant_address": "0xa", "amount_paid": "5", "remaining_amount": "0"}}
+    other = {"version": 4, "event_index": 0, "type": "0x43::bill_splitter::PaymentReceivedEvent", "data": {}}
+
+    assert store.apply_page([other, event], "0x42") == {"payment_received": 1}
+    assert store.apply_page([other, event], "0x42") == {}
+    assert store.position() == (4, 1)
+    # A payment indexed ahead of its session's creation still leaves a usable row
+    assert store.session("S")["payments_received"] == 5
+
+
+def test_pages_split_inside_one_transaction(node, tmp_path):
+    accounts, _ = FaucetProvisioner(node.url, node.root_url, concurrency=4).provision(6)
+    merchant, payers = accounts[0], accounts[1:]
+    backend = RestBackend(SubmissionEngine(HttpTransport(node.url), node.module_address))
+    backend.run(merchant, "bill_splitter::create_bill_session", [
+        "string:PARTY", "u64:5000", "string:Party", f"vector<address>:{','.join(p.address for p in payers)}",
+        "vector<string>:A,B,C,D,E", "u64:1"])
+    store = EventStore(str(tmp_path / "events.db"))
+
+    summary = indexer_for(node, store, page_size=2).poll()
+
+    # One transaction, six events, three pages: the position is an event, not a version
+    assert summary.pages == 3 and summary.applied["participant_added"] == 5
+    assert len(store.session("PARTY")["participants"]) == 5
+
+
+def test_history_the_indexer_pruned_is_skipped(node, tmp_path):
+    create_bills(node, 3, pay=False)
+    node.indexer_oldest_version = next(
+        int(tx["version"]) for tx in node.transactions for event in tx["events"]
+        if event["type"].endswith("SessionCreatedEvent") and event["data"]["session_id"] == "BILL_002")
+    store = EventStore(str(tmp_path / "events.db"))
+
+    summary = indexer_for(node, store).poll()
+
+    # A fresh store resumes from the oldest event still served instead of stalling before it
+    assert summary.applied["session_created"] == 1
+    assert [session["session_id"] for session in store.sessions()] == ["BILL_002"]
@@ -0,0 +1,128 @@
+"""
+Tests for the local fake Aptos node, driven through the real REST submission path.
+"""
+
+import pytest
+
+from accounts import TestAccount, generate_account
+from backends import TxRequest
+from fake_node import FakeAptosNode, load_abi
+from provisioning import FaucetProvisioner
+from sequence import SequenceNumberManager
+from submission import HttpTransport, RestBackend, SubmissionEngine
+
+
+@pytest.fixture
+def node():
+    with FakeAptosNode() as node:
+        yield node
+
+
+def rest_backend(node):
+    return RestBackend(SubmissionEngine(HttpTransport(node.url), node.module_address))
+
+
+def funded(node, count):
+    accounts, summary = FaucetProvisioner(node.url, node.root_url, concurrency=4).provision(count)
+    assert summary.funded == count
+    return accounts
+
+
+def test_abi_comes_from_the_move_sources():
+    abi = load_abi()
+
+    assert abi["bill_splitter::create_bill_session"].params == [
+        "String", "u64", "String", "vector<address>", "vector<String>", "u64"]
+    assert abi["bill_splitter::create_bill_session"].signer
+    assert not abi["enhanced_bill_splitter::batch_sign_agreements"].signer
+    assert abi["enhanced_bill_splitter::get_session_stats"].view
+
+
+def test_bill_lifecycle_over_rest(node):
+    merchant, alice, bob = funded(node, 3)
+    backend = rest_backend(node)
+    addresses = f"vector<address>:{alice.address},{bob.address}"
+
+    created = backend.run(merchant, "bill_splitter::create_bill_session", [
+        "string:DINNER", "u64:2000", "string:Dinner, with dessert", addresses, "vector<string>:Alice,Bob", "u64:2"])
+    # Transactions of different senders have no order, so signing waits for the confirmation
+    confirmed = backend.run(merchant, "bill_splitter::confirm_participants", ["string:DINNER"])
+    results = [confirmed] + backend.run_many([
+        TxRequest(alice, "bill_splitter::sign_bill_agreement", ["string:DINNER"]),
+        TxRequest(bob, "bill_splitter::sign_bill_agreement", ["string:DINNER"]),
+    ])
+    payments = backend.run_many([
+        TxRequest(alice, "bill_splitter::submit_payment", ["string:DINNER", "u64:1000"]),
+        TxRequest(bob, "bill_splitter::submit_payment", ["string:DINNER", "u64:1000"]),
+    ])
+
+    assert created.success and created.gas_used > 0
+    assert all(result.success for result in results + payments)
+    session = backend.view("bill_splitter::get_bill_session", ["string:DINNER"])
+    assert session[4] == "Dinner, with dessert" and session[5] == "3"  # STATUS_SETTLED
+    transport = HttpTransport(node.url)
+    events = [event for tx in transport.get("/transactions", params={"start": 0, "limit": 100})
+              for event in tx["events"]]
+    names = [event["type"].rsplit("::", 1)[-1] for event in events]
+    # Both payments reach the merchant in one deposit, reported by one event
+    assert names.count("BatchPaymentEvent") == 1 and names.count("PaymentReceivedEvent") == 2
+    assert names.count("ParticipantAddedEvent") == 2
+    assert names[-2:] == ["BatchPaymentEvent", "BillSettledEvent"]
+    assert events[-2]["data"]["payments"] == [alice.address, bob.address]
+    assert events[-2]["data"]["total_amount_paid"] == "2000"
+    assert events[-1]["data"]["total_collected"] == "2000"
+    assert events[-1]["guid"]["account_address"] == "0x0"  # Module events have no handle
+    assert int(transport.get(f"/accounts/{alice.address}")["sequence_number"]) == 2
+
+
+def test_aborts_commit_as_failed_transactions(node):
+    merchant, = funded(node, 1)
+    backend = rest_backend(node)
+
+    result = backend.run(merchant, "bill_splitter::confirm_participants", ["string:MISSING"])
+    missing = backend.run(merchant, "test_suite::test_large_group_stress_test", ["u64:100"])
+
+    assert not result.success and "bill_splitter: 1" in result.vm_status
+    assert missing.vm_status == "LINKER_ERROR"
+    # Failed transactions still consume the sequence number and pay gas
+    account = HttpTransport(node.url).get(f"/accounts/{merchant.address}")
+    assert account["sequence_number"] == "2"
+
+
+def test_mempool_parks_gaps_and_rejects_stale_or_foreign_transactions(node):
+    sender, = funded(node, 1)
+    engine = SubmissionEngine(HttpTransport(node.url), node.module_address)
+    mint = TxRequest(sender, "usdc_utils::mint_usdc_for_testing", [f"address:{sender.address}", "u64:5"])
+
+    engine.sequence.allocate(sender.address)  # skip number 0: the next transaction has to wait
+    parked_hash, _ = engine._sign_and_submit(sender.address, mint)
+    assert node.transaction_by_hash(parked_hash)["type"] == "pending_transaction"
+
+    engine.sequence.release(sender.address, 0)
+    engine._sign_and_submit(sender.address, mint)
+    assert node.transaction_by_hash(parked_hash)["success"] is True
+
+    stale = SubmissionEngine(HttpTransport(node.url), node.module_address,
+                             sequence=SequenceNumberManager(lambda address: 0))
+    assert "SEQUENCE_NUMBER_TOO_OLD" in stale.submit_batch([mint])[0].vm_status
+
+    impostor = TestAccount(sender.address, generate_account().private_key)
+    forged = engine.submit_batch([TxRequest(impostor, "usdc_utils::register_usdc", [])])[0]
+    assert "INVALID_AUTH_KEY" in forged.vm_status
+
+
+def test_bad_arguments_are_rejected_at_submission(node):
+    sender, = funded(node, 1)
+
+    result = rest_backend(node).run(sender, "bill_splitter::submit_payment", ["string:X"])
+
+    assert not result.success and "expects 2 arguments" in result.vm_status
+
+
+def test_faucet_and_balances(node):
+    provisioner = FaucetProvisioner(node.url, node.root_url, amount=12345)
+    account = generate_account()
+
+    assert provisioner.fetch_apt_balance(account.address) is None
+    assert provisioner.fund_account(account.address) == (True, 1)
+    assert provisioner.fetch_apt_balance(account.address) == 12345
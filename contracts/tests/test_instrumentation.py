@@ -0,0 +1,93 @@
+"""
+Tests for per-step harness instrumentation and its JSON Lines / JUnit output.
+"""
+
+import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from bill_simulator import SimulatorBackend
+from cli_runner import run_command
+from instrumentation import ERROR, FAILED, PASSED, Recorder, carry_steps
+
+
+def test_steps_collect_subprocesses_and_transactions():
+    recorder = Recorder("unit")
+    backend = SimulatorBackend()
+    admin = backend.new_account()
+
+    with recorder.step("mint") as step:
+        run_command([sys.executable, "-c", "pass"])
+        backend.run(admin, "usdc_utils::mint_usdc_for_testing", [f"address:{admin.address}", "u64:5"])
+    run_command([sys.executable, "-c", "pass"])  # Outside any step
+
+    assert step.status == PASSED
+    assert step.subprocesses == 1
+    assert 0 < step.cli_time <= step.wall_time
+    assert step.python_time == pytest.approx(step.wall_time - step.cli_time)
+    assert step.transactions == 1 and step.gas_used > 0 and len(step.tx_hashes) == 1
+
+
+def test_steps_in_other_threads_are_charged_separately():
+    recorder = Recorder("unit")
+    inside, release = threading.Event(), threading.Event()
+
+    def worker():
+        with recorder.step("worker"):
+            inside.set()
+            release.wait(5)
+
+    with recorder.step("main") as step:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        inside.wait(5)  # The worker's step is now the newest one open
+        run_command([sys.executable, "-c", "pass"])
+        release.set()
+        thread.join()
+
+    counts = {record.name: record.subprocesses for record in recorder.records}
+    assert step.subprocesses == 1 and counts == {"main": 1, "worker": 0}
+
+
+def test_pool_workers_charge_the_step_that_submitted_them():
+    recorder = Recorder("unit")
+    with recorder.step("pool") as step:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(carry_steps(lambda _: run_command([sys.executable, "-c", "pass"])), range(3)))
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(run_command, [sys.executable, "-c", "pass"]).result()  # Not carried
+
+    assert step.subprocesses == 3 and step.cli_time > 0
+
+
+def test_failures_and_errors_are_recorded():
+    recorder = Recorder("unit")
+
+    recorder.run_test("ok", lambda: True)
+    recorder.run_test("bad", lambda: False)
+    recorder.run_test("boom", lambda: 1 / 0)
+
+    assert [r.status for r in recorder.records] == [PASSED, FAILED, ERROR]
+    assert "ZeroDivisionError" in recorder.records[2].message
+    assert recorder.results == {"ok": True, "bad": False, "boom": False}
+
+
+def test_jsonl_appends_and_junit_is_well_formed(tmp_path):
+    jsonl, junit = tmp_path / "results.jsonl", tmp_path / "reports" / "junit.xml"
+    for _ in range(2):
+        recorder = Recorder("unit", str(jsonl), str(junit))
+        recorder.run_test("ok", lambda: True)
+        recorder.run_test("bad", lambda: False)
+        recorder.write()
+
+    lines = [json.loads(line) for line in jsonl.read_text().splitlines()]
+    assert len(lines) == 4 and len({line["run_id"] for line in lines}) == 2
+    assert {"wall_time", "cli_time", "python_time", "subprocesses", "gas_used", "tx_hashes"} <= set(lines[0])
+
+    suite = ET.parse(junit).getroot()
+    assert suite.get("tests") == "2" and suite.get("failures") == "1"
+    assert suite.find("testcase[@name='bad']/failure") is not None
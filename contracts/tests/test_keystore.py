@@ -0,0 +1,51 @@
+"""
+Tests for the persistent test account keystore.
+"""
+
+from accounts import TestAccount
+from keystore import AccountKeystore, FAUCET_AMOUNT
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_accounts_survive_reload(tmp_path):
+    path = str(tmp_path / "keystore.json")
+    store = AccountKeystore(path, network="devnet")
+    store.put_role("admin", TestAccount("0xa1", "0xk1"), apt_balance=FAUCET_AMOUNT)
+    store.add_participants([TestAccount("0xb1", "0xk2"), TestAccount("0xb2", "0xk3")])
+    store.save()
+
+    reloaded = AccountKeystore(path, network="devnet")
+    assert reloaded.get_role("admin") == TestAccount("0xa1", "0xk1")
+    assert [a.address for a in reloaded.participants(5)] == ["0xb1", "0xb2"]
+    assert AccountKeystore(path, network="testnet").participants(5) == []
+
+
+def test_only_low_balances_need_top_up(tmp_path):
+    store = AccountKeystore(str(tmp_path / "ks.json"), min_balance=50)
+    store.add_participants([TestAccount("0x1", "k")], apt_balance=10)
+    store.add_participants([TestAccount("0x2", "k")], apt_balance=100)
+
+    assert store.needs_top_up("0x1")
+    assert not store.needs_top_up("0x2")
+    store.record_funding("0x1", 60)
+    assert not store.needs_top_up("0x1")
+
+
+def test_evicts_entries_unused_past_max_age(tmp_path):
+    clock = FakeClock()
+    store = AccountKeystore(str(tmp_path / "ks.json"), max_age=100, clock=clock)
+    store.add_participants([TestAccount("0xold", "k")])
+    clock.now += 60
+    store.put_role("merchant", TestAccount("0xnew", "k"))
+    clock.now += 60
+
+    assert store.evict_stale() == 1
+    assert store.participants(5) == []
+    assert store.get_role("merchant").address == "0xnew"
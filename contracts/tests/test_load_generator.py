@@ -0,0 +1,71 @@
+"""
+Tests for the bill session load generator.
+"""
+
+import random
+
+import pytest
+
+from bill_simulator import SimulatorBackend
+from load_generator import Distribution, LoadConfig, LoadGenerator, percentile
+
+
+def test_distribution_specs():
+    rng = random.Random(1)
+    assert Distribution.parse("5", integer=True).sample(rng) == 5
+    assert all(3 <= Distribution.parse("uniform:3-8", integer=True).sample(rng) <= 8 for _ in range(100))
+    assert {Distribution.parse("choice:2,10", integer=True).sample(rng) for _ in range(100)} == {2, 10}
+    assert Distribution.parse("exp:0").sample(rng) == 0.0
+    with pytest.raises(ValueError):
+        Distribution.parse("normal:1")
+
+
+def test_percentiles_use_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_lifecycles_complete_and_report_every_stage():
+    backend = SimulatorBackend()
+    config = LoadConfig(rate=2_000.0, sessions=60, participants=Distribution.parse("choice:3,10", integer=True),
+                        threshold_ratio=0.5, seed=3)
+
+    report = LoadGenerator(backend, backend.new_account(), config, account_factory=backend.new_account).run()
+
+    assert report.completed == report.started == 60
+    assert not report.failures
+    assert all(stats.count == 60 for stats in report.stages.values())
+    assert report.stages["lifecycle"].p50 <= report.stages["lifecycle"].p99
+    assert report.throughput > 0
+    assert report.to_dict()["config"]["participants"].startswith("choice")
+
+
+def test_failed_stage_is_counted():
+    backend = SimulatorBackend(initial_apt=10)
+    config = LoadConfig(rate=1_000.0, sessions=5, participants=Distribution.parse("fixed:3", integer=True),
+                        share=1_000)
+
+    report = LoadGenerator(backend, backend.new_account(), config, account_factory=backend.new_account).run()
+
+    assert report.completed == 0
+    assert report.failures == {"pay": 5}
+
+
+def test_backend_exceptions_count_as_failures_of_their_stage():
+    backend = SimulatorBackend()
+    run_many = backend.run_many
+
+    def flaky(requests):
+        if requests[0].function == "bill_splitter::confirm_participants":
+            raise ConnectionError("node went away")
+        return run_many(requests)
+    backend.run_many = flaky
+    config = LoadConfig(rate=1_000.0, sessions=4, participants=Distribution.parse("fixed:2", integer=True))
+
+    report = LoadGenerator(backend, backend.new_account(), config, account_factory=backend.new_account).run()
+
+    assert report.completed == 0
+    assert report.failures == {"confirm": 4}
+    assert report.stages["create"].count == 4 and report.stages["confirm"].count == 0
@@ -0,0 +1,67 @@
+"""
+Tests for chunked batch minting with bisection of failed chunks.
+"""
+
+from backends import TxResult, parse_cli_arg
+from bill_simulator import SimulatorBackend
+from minting import BATCH_MINT_FUNCTION, BatchMinter, choose_chunk_size
+
+
+class RejectingBackend:
+    """Aborts any batch that includes one of the `bad` recipients, like an unregistered coin store"""
+
+    def __init__(self, backend, bad):
+        self.backend = backend
+        self.bad = set(bad)
+        self.batches = []
+
+    def run_many(self, requests):
+        results = []
+        for request in requests:
+            recipients = parse_cli_arg(request.args[0])
+            self.batches.append(len(recipients))
+            if self.bad.intersection(recipients):
+                results.append(TxResult(False, request.function, request.sender.address,
+                                        vm_status="ECOIN_STORE_NOT_PUBLISHED"))
+            else:
+                results.append(self.backend.run(request.sender, request.function, request.args))
+        return results
+
+
+def test_chunk_size_respects_gas_and_size_limits():
+    assert choose_chunk_size(max_gas_amount=200_000) == 330
+    assert choose_chunk_size(max_gas_amount=2_000_000) == 500
+    assert choose_chunk_size(max_gas_amount=2_000_000, max_transaction_bytes=8 * 1024) == 179
+    assert choose_chunk_size(max_gas_amount=1_000) == 1
+
+
+def test_thousand_accounts_take_a_handful_of_transactions():
+    backend = SimulatorBackend()
+    admin = backend.new_account()
+    accounts = [backend.new_account() for _ in range(1000)]
+
+    report = BatchMinter(backend, admin).mint(accounts, 5_000_000)
+
+    assert report.minted == 1000
+    assert report.transactions == 4
+    assert report.bisections == 0
+    usdc = backend.simulator.usdc_utils
+    assert all(usdc.get_usdc_balance(account.address) == 5_000_000 for account in accounts)
+
+
+def test_failed_chunk_is_bisected_down_to_bad_recipients():
+    simulator = SimulatorBackend()
+    admin = simulator.new_account()
+    accounts = [simulator.new_account() for _ in range(64)]
+    bad = {accounts[5].address, accounts[40].address}
+    backend = RejectingBackend(simulator, bad)
+
+    report = BatchMinter(backend, admin, chunk_size=32).mint(accounts, 1_000)
+
+    assert report.minted == 62
+    assert {outcome.address for outcome in report.failed} == bad
+    assert all(outcome.vm_status == "ECOIN_STORE_NOT_PUBLISHED" for outcome in report.failed)
+    assert [outcome.address for outcome in report.outcomes] == [a.address for a in accounts]
+    # 2 initial chunks, then 2 halves per level for each bad recipient down to single accounts
+    assert report.transactions == 2 + 2 * 2 * 5
+    assert all(result.function == BATCH_MINT_FUNCTION for result in report.results)
@@ -0,0 +1,102 @@
+"""
+Tests for the content-addressed Move compile/test cache, using a stand-in CLI.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+from move_cache import MoveBuildCache, source_fingerprint
+
+# Writes build/ output and counts invocations; fails like the compiler when a source has "BROKEN"
+FAKE_CLI = """
+import glob, os, sys
+with open("invocations", "a") as f:
+    f.write(" ".join(sys.argv[1:]) + "\\n")
+if any("BROKEN" in open(path).read() for path in glob.glob("sources/*.move")):
+    print("error[E01002]: unexpected token")
+    sys.exit(1)
+os.makedirs("build/BillSplitApp", exist_ok=True)
+with open("build/BillSplitApp/module.mv", "w") as f:
+    f.write(str(len(open("sources/a.move").read())))
+print("Test result: OK. Total tests: 1; passed: 1; failed: 0")
+"""
+
+
+@pytest.fixture
+def package(tmp_path):
+    package_dir = tmp_path / "package"
+    (package_dir / "sources").mkdir(parents=True)
+    (package_dir / "tests").mkdir()
+    (package_dir / "Move.toml").write_text("[package]\nname = \"BillSplitApp\"\n")
+    (package_dir / "sources" / "a.move").write_text("module 0x1::a {}\n")
+    (package_dir / "tests" / "t.move").write_text("#[test_only] module 0x1::t {}\n")
+    (tmp_path / "cli.py").write_text(FAKE_CLI)
+    return package_dir
+
+
+def command(package, *args):
+    return [sys.executable, str(package.parent / "cli.py"), *args]
+
+
+def invocations(package):
+    path = package / "invocations"
+    return path.read_text().splitlines() if path.exists() else []
+
+
+def test_unchanged_sources_skip_the_cli_and_restore_build(package, tmp_path):
+    cache = MoveBuildCache(str(tmp_path / "cache"))
+
+    first = cache.run(command(package, "move", "compile", "--dev"), str(package))
+    shutil.rmtree(package / "build")
+    second = cache.run(command(package, "move", "compile", "--dev"), str(package))
+
+    assert first.success and not first.cached
+    assert second.success and second.cached and second.stdout == first.stdout
+    assert len(invocations(package)) == 1
+    assert (package / "build" / "BillSplitApp" / "module.mv").exists()
+
+    cache.run(command(package, "move", "test", "--dev"), str(package))  # Different command, own verdict
+    assert len(invocations(package)) == 2
+
+
+def test_source_edits_and_invalidation_rerun_the_cli(package, tmp_path):
+    cache = MoveBuildCache(str(tmp_path / "cache"))
+    compile_cmd = command(package, "move", "compile", "--dev")
+    cache.run(compile_cmd, str(package))
+
+    (package / "tests" / "t.move").write_text("#[test_only] module 0x1::t { fun f() {} }\n")
+    assert not cache.run(compile_cmd, str(package)).cached
+
+    cache.invalidate(package_dir=str(package))
+    assert not cache.run(compile_cmd, str(package)).cached
+    assert len(invocations(package)) == 3
+
+    (package / "sources" / "a.move").write_text("BROKEN\n")
+    failed = cache.run(compile_cmd, str(package))
+    again = cache.run(compile_cmd, str(package))
+    assert not failed.success and again.cached and "error[E01002]" in again.stdout
+
+
+def test_missing_cli_is_not_cached(package, tmp_path):
+    cache = MoveBuildCache(str(tmp_path / "cache"))
+    result = cache.run([str(tmp_path / "no-such-aptos"), "move", "compile"], str(package))
+
+    assert not result.success
+    assert cache.entries() == []
+
+
+def test_lru_cap_evicts_least_recently_used(package, tmp_path):
+    cache = MoveBuildCache(str(tmp_path / "cache"), max_entries=2)
+    compile_cmd = command(package, "move", "compile", "--dev")
+    fingerprints = []
+    for n in range(3):
+        (package / "sources" / "a.move").write_text(f"module 0x1::a{n} {{}}\n")
+        cache.run(compile_cmd, str(package))
+        fingerprints.append(source_fingerprint(str(package)))
+
+    remaining = {entry["fingerprint"] for entry in cache.entries()}
+    assert remaining == set(fingerprints[1:])
+    assert all(os.path.isdir(os.path.join(cache.root, f, "build")) for f in remaining)
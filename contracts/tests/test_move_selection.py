@@ -0,0 +1,79 @@
+"""
+Tests for dependency-aware Move test selection.
+"""
+
+import pytest
+
+from move_selection import IncrementalSelector, dependency_closure, module_graph
+from move_sharding import ShardedRun, ShardResult, Shard
+
+SOURCES = {
+    "sources/usdc_utils.move": "module bill_split::usdc_utils {\n    public fun mint() {}\n}\n",
+    "sources/bill_splitter.move": "module bill_split::bill_splitter {\n    use std::vector;\n}\n",
+    "sources/enhanced.move": (
+        "module bill_split::enhanced {\n    use bill_split::usdc_utils::USDC;\n}\n"
+    ),
+    "tests/basic_tests.move": (
+        "#[test_only]\nmodule bill_split::basic_tests {\n    use bill_split::bill_splitter;\n\n"
+        "    #[test]\n    fun creates() {}\n}\n"
+    ),
+    "tests/enhanced_tests.move": (
+        "#[test_only]\nmodule bill_split::enhanced_tests {\n"
+        "    // bill_split::bill_splitter is only mentioned in a comment\n\n"
+        "    #[test(admin = @bill_split)]\n    fun pays(admin: &signer) { bill_split::enhanced::pay(admin); }\n}\n"
+    ),
+}
+
+
+@pytest.fixture
+def package(tmp_path):
+    package_dir = tmp_path / "package"
+    for relative, text in SOURCES.items():
+        path = package_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    (package_dir / "Move.toml").write_text("[package]\nname = \"BillSplitApp\"\n")
+    return package_dir
+
+
+def green(selection):
+    """A sharded run in which every selected test passed"""
+    names = [test.name for test in selection.tests]
+    return ShardedRun([ShardResult(Shard("", names), passed=names)], 0.0, 1)
+
+
+def selected(selector):
+    return sorted(test.name for test in selector.select().tests)
+
+
+def test_builds_the_module_graph_from_uses_and_inline_paths(package):
+    graph = module_graph(str(package))
+
+    assert graph["enhanced"].uses == {"usdc_utils"}
+    assert graph["enhanced_tests"].uses == {"enhanced"}
+    assert dependency_closure(graph, "enhanced_tests") == {"enhanced_tests", "enhanced", "usdc_utils"}
+
+
+def test_only_dependents_of_a_changed_module_are_selected(package, tmp_path):
+    selector = IncrementalSelector(str(package), str(tmp_path / "state.json"))
+    assert selected(selector) == ["basic_tests::creates", "enhanced_tests::pays"]
+    selector.record(green(selector.select()))
+    assert selected(selector) == []
+
+    usdc = package / "sources" / "usdc_utils.move"
+    usdc.write_text(usdc.read_text().replace("mint() {}", "mint() { }"))
+
+    selection = selector.select()
+    assert [test.name for test in selection.tests] == ["enhanced_tests::pays"]
+    assert selection.changed_modules == ["usdc_utils"]
+
+
+def test_failed_tests_stay_selected_and_manifest_changes_select_everything(package, tmp_path):
+    selector = IncrementalSelector(str(package), str(tmp_path / "state.json"))
+    run = ShardedRun([ShardResult(Shard("", ["basic_tests::creates", "enhanced_tests::pays"]),
+                                  passed=["basic_tests::creates"], failed=["enhanced_tests::pays"])], 0.0, 1)
+    selector.record(run)
+    assert selected(selector) == ["enhanced_tests::pays"]
+
+    (package / "Move.toml").write_text("[package]\nname = \"BillSplitApp\"\nversion = \"1.0.1\"\n")
+    assert selected(selector) == ["basic_tests::creates", "enhanced_tests::pays"]
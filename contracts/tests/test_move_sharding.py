@@ -0,0 +1,107 @@
+"""
+Tests for the sharded Move test runner, using a stand-in CLI.
+"""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from move_cache import CONTRACTS_DIR, MoveBuildCache
+from move_sharding import MoveTest, ShardedTestRunner, discover_tests, parse_results, plan_shards
+
+# Reports PASS for every discovered test matching --filter; "fails" and "hangs" behave as named
+FAKE_CLI = """#!{python}
+import re, sys, time
+args = sys.argv[1:]
+pattern = args[args.index("--filter") + 1]
+with open("invocations", "a") as f:
+    f.write(pattern + "\\n")
+names = ["bills::creates", "bills::fails", "bills::hangs", "bench::run_5", "bench::run_500"]
+failed = False
+for name in (n for n in names if pattern in n):
+    if name.endswith("hangs"):
+        time.sleep(30)
+    verdict = "FAIL" if name.endswith("fails") else "PASS"
+    failed |= verdict == "FAIL"
+    print(f"[ {{verdict}}    ] 0x42::{{name}}")
+print("Test result: FAILED" if failed else "Test result: OK")
+sys.exit(1 if failed else 0)
+"""
+
+
+@pytest.fixture
+def cli(tmp_path):
+    path = tmp_path / "aptos"
+    path.write_text(FAKE_CLI.format(python=sys.executable))
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    package_dir = tmp_path / "package"
+    (package_dir / "sources").mkdir(parents=True)
+    (package_dir / "Move.toml").write_text("[package]\nname = \"BillSplitApp\"\n")
+    return str(path), package_dir
+
+
+def _tests_named(*names):
+    return [MoveTest(*name.split("::"), path="tests/t.move") for name in names]
+
+
+def test_discovers_the_repository_move_tests():
+    names = [test.name for test in discover_tests(CONTRACTS_DIR)]
+
+    assert "test_suite::test_suite_init" in names
+    assert "scaling_bench::scaling_basic_500" in names
+    assert "bill_splitter_tests::remainder_split_settles" in names
+    assert not any(name.startswith("scaling_bench::") and "scaling_basic" not in name for name in names)
+    # #[test_only] helpers and modules are not tests
+    assert not any(name.endswith("::create_test_account") for name in names)
+    assert len(names) == len(set(names))
+
+
+def test_overlapping_filters_never_run_a_test_twice():
+    tests = _tests_named("bench::run_5", "bench::run_500", "bench::run_20")
+
+    shards = plan_shards(tests)
+    modules = plan_shards(tests, granularity="module")
+
+    assert [shard.filter for shard in shards] == ["bench::run_5", "bench::run_20"]
+    assert shards[0].tests == ["bench::run_5", "bench::run_500"]
+    assert [(shard.filter, len(shard.tests)) for shard in modules] == [("bench::", 3)]
+
+
+def test_parses_per_test_lines():
+    output = "[ PASS    ] 0x42::bills::creates\n[ FAIL    ] 0x42::bills::fails\nTest result: FAILED"
+
+    assert parse_results(output) == {"bills::creates": "PASS", "bills::fails": "FAIL"}
+
+
+def test_merges_shards_and_reports_failures_and_timeouts(cli):
+    aptos, package_dir = cli
+    runner = ShardedTestRunner(str(package_dir), aptos_cli=aptos, jobs=4, shard_timeout=2)
+
+    result = runner.run(_tests_named("bills::creates", "bills::fails", "bills::hangs",
+                                    "bench::run_5", "bench::run_500"))
+
+    assert result.passed == ["bench::run_5", "bench::run_500", "bills::creates"]
+    assert result.failed == ["bills::fails"]
+    assert result.missing == ["bills::hangs"]
+    assert [shard.shard.filter for shard in result.timed_out] == ["bills::hangs"]
+    assert result.slowest(1)[0].shard.filter == "bills::hangs"
+    assert not result.ok
+    assert "timed out" in result.describe()
+    # run_500 rode along with the run_5 shard instead of getting its own
+    assert sorted((package_dir / "invocations").read_text().split()) == [
+        "bench::run_5", "bills::creates", "bills::fails", "bills::hangs"]
+
+
+def test_cached_shards_skip_the_cli(cli, tmp_path):
+    aptos, package_dir = cli
+    cache = MoveBuildCache(str(tmp_path / "cache"))
+    tests = _tests_named("bills::creates", "bench::run_5")
+
+    first = ShardedTestRunner(str(package_dir), aptos_cli=aptos, jobs=2, cache=cache).run(tests)
+    second = ShardedTestRunner(str(package_dir), aptos_cli=aptos, jobs=2, cache=cache).run(tests)
+
+    assert first.ok and second.ok
+    assert all(shard.cached for shard in second.shards)
+    assert len((package_dir / "invocations").read_text().split()) == 2
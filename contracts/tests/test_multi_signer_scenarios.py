@@ -0,0 +1,48 @@
+"""
+Tests for the integration tester's bill_splitter scenario on the in-process simulator.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+from bill_simulator import APTOS_COIN, STATUS_SETTLED, SimulatorBackend
+from conftest import SCRIPTS_DIR
+
+# Loaded by path: tests/test_multiple_signers.py holds the module name
+_spec = importlib.util.spec_from_file_location(
+    "multi_signer_tester", os.path.join(SCRIPTS_DIR, "test_multiple_signers.py"))
+multi_signer_tester = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(multi_signer_tester)
+
+
+@pytest.fixture
+def tester():
+    tester = multi_signer_tester.BillSplitterTester(backend=SimulatorBackend())
+    tester.setup_test_environment()
+    return tester
+
+
+def scenario(participants, total_amount):
+    return multi_signer_tester.TestScenario(
+        name="remainder", participants=participants, total_amount=total_amount,
+        required_signatures=len(participants), description="Remainder bill")
+
+
+def test_participants_pay_their_share_of_the_remainder(tester):
+    participants = tester.create_test_accounts(3)
+
+    assert tester._execute_test_scenario(scenario(participants, 100))
+
+    (session,) = tester.backend.simulator.bill_splitter.sessions.values()
+    assert session.status == STATUS_SETTLED
+    assert [p.amount_owed for p in session.participants] == [34, 33, 33]
+
+
+def test_a_failed_payment_fails_the_scenario(tester):
+    participants = tester.create_test_accounts(3)
+    ledger = tester.backend.simulator.ledger
+    ledger.withdraw(APTOS_COIN, participants[1].address, ledger.balance(APTOS_COIN, participants[1].address))
+
+    assert not tester._execute_test_scenario(scenario(participants, 90))
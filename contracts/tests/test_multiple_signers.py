@@ -3,94 +3,64 @@ Test script for multiple signers in the bill splitter contract.
 Simulates various scenarios with different numbers of participants and signature requirements.
 """
 
-import subprocess
+import argparse
 import json
 import time
 import os
 import sys
 from typing import List, Dict, Any
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts"))
+
+from accounts import TestAccount
+from bill_simulator import APTOS_COIN, STATUS_APPROVED, STATUS_PARTICIPANTS_ADDED, STATUS_SETTLED, SimulatorBackend
+from instrumentation import Recorder, add_output_arguments
+from load_generator import Distribution, LoadConfig, LoadGenerator
+from move_cache import CONTRACTS_DIR, MoveBuildCache
+from move_selection import IncrementalSelector, run_changed
+from move_sharding import ShardedTestRunner
+
 class BillSplitterTest:
-    def __init__(self, aptos_cli_path: str = "aptos"):
+    def __init__(self, aptos_cli_path: str = "aptos", backend=None, recorder: Recorder = None,
+                 move_cache: MoveBuildCache = None, test_selector: IncrementalSelector = None):
         self.aptos_cli = aptos_cli_path
         self.test_accounts = []
         self.deployed_address = None
+        # Scenario tests execute against this backend; the simulator keeps them network-free
+        self.backend = backend or SimulatorBackend(module_address="0x42")
+        self.recorder = recorder or Recorder("multi_signer")
+        self.move_cache = move_cache or MoveBuildCache()
+        self.test_selector = test_selector or IncrementalSelector(CONTRACTS_DIR)
         
     def test_compilation(self) -> bool:
         """Test contract compilation."""
         print("🔨 Testing contract compilation...")
         
-        try:
-            # Change to parent directory for compilation
-            original_dir = os.getcwd()
-            if os.path.basename(original_dir) == "tests":
-                os.chdir("..")  # Go to contracts directory
-            
-            result = subprocess.run([
-                self.aptos_cli, "move", "compile", "--dev"
-            ], capture_output=True, text=True, timeout=60)
-            
-            os.chdir(original_dir)  # Return to original directory
-            
-            if result.returncode == 0:
-                print("✓ Contracts compiled successfully!")
-                return True
-            else:
-                print(f"✗ Compilation failed: {result.stderr}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            print("✗ Compilation timed out")
-            os.chdir(original_dir)
-            return False
-        except Exception as e:
-            print(f"✗ Error during compilation: {e}")
-            os.chdir(original_dir)
-            return False
+        result = self.move_cache.run([self.aptos_cli, "move", "compile", "--dev"], CONTRACTS_DIR, timeout=60)
+        if result.success:
+            print("✓ Contracts compiled successfully!" + (" (cached)" if result.cached else ""))
+            return True
+        print(f"✗ Compilation failed: {result.stderr}")
+        return False
     
     def test_move_unit_tests(self) -> bool:
         """Test Move unit tests."""
         print("🧪 Testing Move unit tests...")
         
-        try:
-            # Change to parent directory for testing
-            original_dir = os.getcwd()
-            if os.path.basename(original_dir) == "tests":
-                os.chdir("..")  # Go to contracts directory
-            
-            result = subprocess.run([
-                self.aptos_cli, "move", "test", "--dev"
-            ], capture_output=True, text=True, timeout=60)
-            
-            os.chdir(original_dir)  # Return to original directory
-            
-            if result.returncode == 0:
-                # Parse test results
-                if "Test result: OK" in result.stdout:
-                    lines = result.stdout.split('\n')
-                    for line in lines:
-                        if "Total tests:" in line:
-                            print(f"✓ {line.strip()}")
-                            break
-                    else:
-                        print("✓ Move tests passed!")
-                    return True
-                else:
-                    print("✗ Move tests failed")
-                    return False
-            else:
-                print(f"✗ Move test execution failed: {result.stderr}")
-                return False
-                
-        except subprocess.TimeoutExpired:
-            print("✗ Move tests timed out")
-            os.chdir(original_dir)
-            return False
-        except Exception as e:
-            print(f"✗ Error during Move tests: {e}")
-            os.chdir(original_dir)
-            return False
-        
+        # One --filter shard per test across a process pool, each with its own timeout; only
+        # tests whose module dependencies changed since they last passed are re-run
+        runner = ShardedTestRunner(CONTRACTS_DIR, aptos_cli=self.aptos_cli, shard_timeout=60,
+                                   cache=self.move_cache)
+        result = run_changed(runner, self.test_selector)
+        if result is None:
+            print("✓ Move tests unchanged since the last green run")
+            return True
+        if result.ok:
+            print(f"✓ {result.describe()}")
+            return True
+        print(f"✗ Move tests failed\n{result.describe()}")
+        return False
+    
     def setup_test_accounts(self, num_accounts: int = 5) -> List[str]:
         """Create mock test accounts for testing without network calls."""
         print(f"Creating {num_accounts} mock test accounts...")
@@ -118,7 +88,8 @@ class BillSplitterTest:
         success_count = 0
         
         for account in self.test_accounts:
-            # Mock funding for testing
+            if self.backend.local:
+                self.backend.simulator.ledger.deposit(APTOS_COIN, account["address"], amount * 100_000_000)
             print(f"✓ Mock funded {account['profile']}: {amount} APT")
             success_count += 1
                 
@@ -134,10 +105,39 @@ class BillSplitterTest:
             return False
         
         # Mock deployment for testing
-        self.deployed_address = "0x42"  # Use the dev address
+        self.deployed_address = self.backend.module_address
         print(f"✓ Mock contracts deployed successfully to {self.deployed_address}")
         return True
     
+    def _signer(self, account: Dict[str, str]) -> TestAccount:
+        return TestAccount(address=account["address"], private_key=account.get("private_key", ""))
+    
+    def _run(self, account: Dict[str, str], function: str, args: List[str]) -> bool:
+        result = self.backend.run(self._signer(account), function, args)
+        if not result.success:
+            print(f"✗ {function} failed: {result.vm_status}")
+        return result.success
+    
+    def _session_status(self, session_id: str) -> int:
+        return self.backend.view("bill_splitter::get_bill_session", [f"string:{session_id}"])[5]
+    
+    def _create_session(self, merchant, participants, session_id, total_amount, required_signatures) -> bool:
+        addresses = ",".join(acc["address"] for acc in participants)
+        names = ",".join(acc["profile"] for acc in participants)
+        return (
+            self._run(merchant, "bill_splitter::create_bill_session", [
+                f"string:{session_id}", f"u64:{total_amount}", f"string:{session_id} bill",
+                f"vector<address>:{addresses}", f"vector<string>:{names}", f"u64:{required_signatures}",
+            ])
+            and self._run(merchant, "bill_splitter::confirm_participants", [f"string:{session_id}"])
+        )
+    
+    def _pay_all(self, participants, session_id, amount) -> bool:
+        return all(
+            self._run(acc, "bill_splitter::submit_payment", [f"string:{session_id}", f"u64:{amount}"])
+            for acc in participants
+        )
+    
     def test_small_group_scenario(self) -> bool:
         """Test with 3-5 participants."""
         print("\n=== Testing Small Group Scenario (3-5 participants) ===")
@@ -154,11 +154,29 @@ class BillSplitterTest:
             participant_addresses = [acc["address"] for acc in participants]
             total_bill_amount = 90000000  # $90 in micro-USDC
             required_signatures = 2  # 2-of-3 multisig
+            session_id = f"SMALL_GROUP_{int(time.time() * 1000)}"
             
             print(f"✓ Merchant: {merchant['address']}")
             print(f"✓ Participants: {len(participant_addresses)}")
             print(f"✓ Bill amount: ${total_bill_amount / 1000000}")
             print(f"✓ Required signatures: {required_signatures}")
+            
+            if not self._create_session(merchant, participants, session_id, total_bill_amount, required_signatures):
+                return False
+            for acc in participants[:required_signatures]:
+                if not self._run(acc, "bill_splitter::sign_bill_agreement", [f"string:{session_id}"]):
+                    return False
+            if self._session_status(session_id) != STATUS_APPROVED:
+                print("✗ Bill was not approved after reaching the signature threshold")
+                return False
+            print("✓ Bill approved with 2 of 3 signatures")
+            
+            if not self._pay_all(participants, session_id, total_bill_amount // len(participants)):
+                return False
+            if self._session_status(session_id) != STATUS_SETTLED:
+                print("✗ Bill was not settled after all payments")
+                return False
+            print("✓ All payments received, bill settled")
             print("✓ Small group scenario test completed")
             return True
             
@@ -177,6 +195,26 @@ class BillSplitterTest:
         print(f"✓ Simulating {total_participants} participants")
         print(f"✓ Required signatures: {required_signatures}")
         print(f"✓ Signature threshold: {(required_signatures/total_participants)*100}%")
+        
+        merchant = self.test_accounts[0] if self.test_accounts else {"profile": "merchant", "address": "0x42"}
+        session_id = f"MEDIUM_GROUP_{int(time.time() * 1000)}"
+        addresses = [f"0x{0x100 + i:064x}" for i in range(total_participants)]
+        names = [f"Participant_{i}" for i in range(total_participants)]
+        if not self._run(merchant, "enhanced_bill_splitter::create_enhanced_bill_session", [
+            f"string:{session_id}", "u64:200000000", "string:Medium group bill",
+            f"vector<address>:{','.join(addresses)}", f"vector<string>:{','.join(names)}",
+            f"u64:{required_signatures}", "u64:100",
+        ]):
+            return False
+        if not self._run(merchant, "enhanced_bill_splitter::batch_sign_agreements", [
+            f"string:{session_id}", f"vector<address>:{','.join(addresses[:required_signatures])}"
+        ]):
+            return False
+        stats = self.backend.view("enhanced_bill_splitter::get_session_stats", [f"string:{session_id}"])
+        if stats[1] != required_signatures or stats[4] != STATUS_APPROVED:
+            print(f"✗ Unexpected session stats after batch signing: {stats}")
+            return False
+        print(f"✓ Batch signed {stats[1]}/{stats[0]} participants, bill approved")
         print("✓ Medium group scenario test completed")
         return True
     
@@ -190,25 +228,54 @@ class BillSplitterTest:
             {"participants": 7, "threshold": 4, "name": "4-of-7 multisig"},
         ]
         
+        merchant = {"profile": "merchant", "address": "0x42"}
         for case in test_cases:
             percentage = (case["threshold"] / case["participants"]) * 100
+            participants = [
+                {"profile": f"signer_{i}", "address": f"0x{0x200 + i:064x}"}
+                for i in range(case["participants"])
+            ]
+            session_id = f"THRESHOLD_{case['threshold']}_OF_{case['participants']}_{int(time.time() * 1000)}"
+            if not self._create_session(merchant, participants, session_id, 100000000, case["threshold"]):
+                return False
+            
+            for acc in participants[:case["threshold"] - 1]:
+                self._run(acc, "bill_splitter::sign_bill_agreement", [f"string:{session_id}"])
+            if self._session_status(session_id) != STATUS_PARTICIPANTS_ADDED:
+                print(f"✗ {case['name']} approved before reaching its threshold")
+                return False
+            self._run(participants[case["threshold"] - 1], "bill_splitter::sign_bill_agreement", [f"string:{session_id}"])
+            if self._session_status(session_id) != STATUS_APPROVED:
+                print(f"✗ {case['name']} not approved at its threshold")
+                return False
             print(f"✓ Testing {case['name']} ({percentage:.1f}% threshold)")
                 
         return True
     
-    def test_concurrent_sessions(self) -> bool:
-        """Test multiple concurrent bill sessions."""
+    def test_concurrent_sessions(self, config: LoadConfig = None) -> bool:
+        """Run many overlapping bill lifecycles through the load generator."""
         print("\n=== Testing Concurrent Sessions ===")
         
-        sessions = [
-            {"id": "RESTAURANT_001", "amount": 120, "participants": 4},
-            {"id": "COFFEE_002", "amount": 45, "participants": 3}, 
-            {"id": "BAR_003", "amount": 85, "participants": 5}
-        ]
+        config = config or LoadConfig(
+            rate=200.0,
+            sessions=200,
+            participants=Distribution.parse("uniform:3-6", integer=True),
+            threshold_ratio=0.67,
+            payment_delay=Distribution.parse("uniform:0-0.005"),
+            seed=7,
+        )
+        merchant = self._signer({"address": "0x42"})
+        if self.backend.local:
+            generator = LoadGenerator(self.backend, merchant, config, account_factory=self.backend.new_account)
+        else:
+            generator = LoadGenerator(self.backend, merchant, config,
+                                      accounts=[self._signer(acc) for acc in self.test_accounts])
+        report = generator.run()
+        print(report.describe())
         
-        for session in sessions:
-            print(f"✓ Session {session['id']}: ${session['amount']} with {session['participants']} participants")
-            
+        if report.completed != report.started:
+            print(f"✗ {report.started - report.completed} lifecycles failed")
+            return False
         print("✓ Concurrent sessions test completed")
         return True
     
@@ -217,35 +284,31 @@ class BillSplitterTest:
         print("🚀 Starting Bill Splitter Multi-Signer Test Suite")
         print("=" * 60)
         
-        results = {}
+        record = self.recorder.run_test
         
         # Core testing phase
         print("📋 Core Testing Phase")
         print("-" * 20)
         
         # Test 1: Compilation
-        results["compilation"] = self.test_compilation()
+        record("compilation", self.test_compilation)
         
         # Test 2: Move Unit Tests  
-        results["move_tests"] = self.test_move_unit_tests()
+        record("move_tests", self.test_move_unit_tests)
         
         # Setup phase with mock data
         print("\n📋 Setup Phase")
         print("-" * 20)
         
-        if not self.setup_test_accounts(5):
+        if not record("setup", lambda: self.setup_test_accounts(5)).passed:
             print("✗ Failed to setup test accounts")
             return {"setup": False}
             
-        if len(self.test_accounts) == 0:
-            print("✗ No test accounts created")
-            return {"setup": False}
-            
-        if not self.fund_accounts():
+        if not record("funding", self.fund_accounts).passed:
             print("✗ Failed to fund accounts")
             return {"funding": False}
             
-        if not self.deploy_contracts():
+        if not record("deployment", self.deploy_contracts).passed:
             print("✗ Failed to deploy contracts")
             return {"deployment": False}
             
@@ -255,10 +318,13 @@ class BillSplitterTest:
         print("\n🧪 Scenario Testing Phase")
         print("-" * 20)
         
-        results["small_group"] = self.test_small_group_scenario()
-        results["medium_group"] = self.test_medium_group_scenario()
-        results["signature_thresholds"] = self.test_signature_thresholds()
-        results["concurrent_sessions"] = self.test_concurrent_sessions()
+        record("small_group", self.test_small_group_scenario)
+        record("medium_group", self.test_medium_group_scenario)
+        record("signature_thresholds", self.test_signature_thresholds)
+        record("concurrent_sessions", self.test_concurrent_sessions)
+        
+        setup_steps = ("setup", "funding", "deployment")
+        results = {name: passed for name, passed in self.recorder.results.items() if name not in setup_steps}
         
         # Summary
         print("\n" + "=" * 60)
@@ -274,6 +340,9 @@ class BillSplitterTest:
             
         print(f"\nOverall: {passed_tests}/{total_tests} tests passed")
         
+        print(self.recorder.summary())
+        self.recorder.write()
+        
         if passed_tests == total_tests:
             print("🎉 All tests passed! Bill splitter is ready for multi-signer scenarios.")
         else:
@@ -283,7 +352,8 @@ class BillSplitterTest:
 
 def main():
     """Main test execution."""
-    tester = BillSplitterTest()
+    args = add_output_arguments(argparse.ArgumentParser(description="Bill splitter multi-signer tests")).parse_args()
+    tester = BillSplitterTest(recorder=Recorder.from_args("multi_signer", args))
     results = tester.run_all_tests()
     
     # Exit with appropriate code
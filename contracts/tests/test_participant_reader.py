@@ -0,0 +1,80 @@
+"""
+Tests for the batched participant reader.
+"""
+
+from bill_simulator import SimulatorBackend, pack_participant_flags
+from fake_node import FakeAptosNode
+from participant_reader import ParticipantReader, unpack_bitmap
+from provisioning import FaucetProvisioner
+from submission import HttpTransport, RestBackend, SubmissionEngine
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def open_session(backend, merchant, participants, session_id="READER"):
+    addresses = ",".join(account.address for account in participants)
+    names = ",".join(f"P{i}" for i in range(len(participants)))
+    backend.run(merchant, "bill_splitter::create_bill_session", [
+        f"string:{session_id}", f"u64:{100 * len(participants)}", "string:Reader",
+        f"vector<address>:{addresses}", f"vector<string>:{names}", f"u64:{len(participants)}"])
+    backend.run(merchant, "bill_splitter::confirm_participants", [f"string:{session_id}"])
+
+
+def test_bitmaps_round_trip():
+    count, signed, paid = pack_participant_flags([])
+    assert (count, signed, paid) == (0, "0x", "0x")
+    flags = [i % 3 == 0 for i in range(19)]
+    packed = bytes(sum(1 << (i % 8) for i in range(j * 8, min(j * 8 + 8, 19)) if flags[i]) for j in range(3))
+    assert unpack_bitmap("0x" + packed.hex(), 19) == flags
+
+
+def test_polling_every_participant_costs_one_view_per_ttl():
+    backend = SimulatorBackend()
+    merchant = backend.new_account()
+    participants = [backend.new_account() for _ in range(20)]
+    open_session(backend, merchant, participants)
+    clock = Clock()
+    reader = ParticipantReader(backend, ttl=2.0, clock=clock)
+
+    assert not any(reader.has_signed("READER", account.address) for account in participants)
+    assert reader.views == 1  # one get_participants decode for all 20 queries
+
+    backend.run(participants[7], "bill_splitter::sign_bill_agreement", ["string:READER"])
+    assert not reader.has_signed("READER", participants[7].address)  # still within the TTL
+    clock.now = 2.5
+    states = reader.states("READER", [account.address for account in participants])
+    assert [account.address for account in participants if states[account.address].signed] == [
+        participants[7].address]
+    assert reader.views == 2
+
+    steps = backend.simulator.steps
+    reader.invalidate("READER")
+    reader.has_paid("READER", participants[19].address)
+    assert backend.simulator.steps - steps == 20  # one pass over the session, not 20 scans
+    assert reader.state("READER", merchant.address) is None
+
+
+def test_reads_bitmaps_over_rest():
+    with FakeAptosNode() as node:
+        accounts, _ = FaucetProvisioner(node.url, node.root_url, concurrency=4).provision(10)
+        merchant, participants = accounts[0], accounts[1:]
+        backend = RestBackend(SubmissionEngine(HttpTransport(node.url), node.module_address))
+        open_session(backend, merchant, participants)
+        backend.run(participants[8], "bill_splitter::sign_bill_agreement", ["string:READER"])
+        clock = Clock()
+        reader = ParticipantReader(backend, clock=clock)
+
+        assert reader.has_signed("READER", participants[8].address)
+        backend.run(participants[0], "bill_splitter::sign_bill_agreement", ["string:READER"])
+        clock.now = 10
+        roster = reader.participants("READER")
+
+        assert [state.signed for state in roster] == [True] + [False] * 7 + [True]
+        assert roster[3].name == "P3" and roster[3].amount_owed == 100
+        assert reader.views == 2
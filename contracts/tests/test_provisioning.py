@@ -0,0 +1,93 @@
+"""
+Tests for concurrent account provisioning against a fake `aptos` executable on PATH.
+"""
+
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+from instrumentation import Recorder
+from provisioning import AccountProvisioner
+
+FAKE_APTOS = textwrap.dedent('''\
+    #!{python}
+    import os, sys, time, uuid
+
+    args = sys.argv[1:]
+    state_dir = os.environ["FAKE_APTOS_STATE"]
+    delay = float(os.environ.get("FAKE_APTOS_DELAY", "0"))
+    fail_first = int(os.environ.get("FAKE_APTOS_FAIL_FIRST", "0"))
+
+    # Every invocation gets a unique ticket so failures can be injected deterministically
+    ticket = len(os.listdir(state_dir))
+    open(os.path.join(state_dir, uuid.uuid4().hex), "w").close()
+    time.sleep(delay)
+
+    if ticket < fail_first:
+        sys.stderr.write("transient faucet error\\n")
+        sys.exit(1)
+
+    if args[:2] == ["account", "create"]:
+        print("Account address: 0x" + uuid.uuid4().hex + uuid.uuid4().hex)
+        print("Private key: 0x" + uuid.uuid4().hex + uuid.uuid4().hex)
+    elif args[:2] == ["account", "fund-with-faucet"]:
+        print("Funded account " + args[3])
+    else:
+        sys.exit(2)
+''')
+
+
+@pytest.fixture
+def fake_aptos(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    state_dir = tmp_path / "calls"
+    bin_dir.mkdir()
+    state_dir.mkdir()
+    script = bin_dir / "aptos"
+    script.write_text(FAKE_APTOS.format(python=sys.executable))
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_APTOS_STATE", str(state_dir))
+    return state_dir
+
+
+def test_provisions_accounts_concurrently(fake_aptos):
+    provisioner = AccountProvisioner("local", concurrency=4, retry_delay=0)
+    accounts, summary = provisioner.provision(12)
+
+    assert len(accounts) == 12
+    assert len({account.address for account in accounts}) == 12
+    assert all(account.private_key.startswith("0x") for account in accounts)
+    assert summary.created == summary.funded == 12
+    assert summary.attempts == 24
+    assert summary.accounts_per_second > 0
+    assert len(os.listdir(fake_aptos)) == 24
+
+
+def test_worker_cli_calls_are_charged_to_the_active_step(fake_aptos):
+    recorder = Recorder("provisioning")
+    with recorder.step("provision") as step:
+        AccountProvisioner("devnet", concurrency=4, retry_delay=0).provision(6)
+
+    assert step.subprocesses == 12 and step.cli_time > 0
+
+
+def test_retries_transient_failures(fake_aptos, monkeypatch):
+    monkeypatch.setenv("FAKE_APTOS_FAIL_FIRST", "2")
+    provisioner = AccountProvisioner("local", concurrency=1, retries=2, retry_delay=0)
+    accounts, summary = provisioner.provision(1)
+
+    assert len(accounts) == 1
+    assert summary.attempts == 4
+
+
+def test_timeout_marks_account_failed(fake_aptos, monkeypatch):
+    monkeypatch.setenv("FAKE_APTOS_DELAY", "2")
+    provisioner = AccountProvisioner("local", concurrency=2, retries=0, timeout=0.5, retry_delay=0)
+    accounts, summary = provisioner.provision(2)
+
+    assert accounts == []
+    assert summary.failed == 2
@@ -0,0 +1,46 @@
+"""
+Tests for the participant scaling benchmark.
+"""
+
+import csv
+from dataclasses import replace
+
+from scaling_benchmark import ScalingBenchmark, check_regressions, load_json, write_csv, write_json
+
+
+def by_key(measurements):
+    return {(m.module, m.operation, m.participants): m for m in measurements}
+
+
+def test_simulator_rows_carry_model_cost_not_gas():
+    results = by_key(ScalingBenchmark(repeats=1).run([5, 100]))
+
+    # The simulator charges per scanned element, so this only checks its model of each operation
+    assert all(m.gas_used is None and m.model_cost and m.source == "simulator" for m in results.values())
+    for operation in ("sign_bill_agreement", "submit_payment", "update_participant_amount",
+                      "has_participant_signed", "has_participant_paid"):
+        small = results[("bill_splitter", operation, 5)]
+        large = results[("bill_splitter", operation, 100)]
+        assert large.model_cost > small.model_cost
+    for operation in ("batch_sign_agreements", "submit_payment_optimized"):
+        small = results[("enhanced_bill_splitter", operation, 5)]
+        large = results[("enhanced_bill_splitter", operation, 100)]
+        assert large.model_cost == small.model_cost
+
+
+def test_results_round_trip_and_regressions_are_flagged(tmp_path):
+    baseline = ScalingBenchmark(repeats=1).run([5, 20])
+    write_json(baseline, tmp_path / "baseline.json")
+    write_csv(baseline, tmp_path / "baseline.csv")
+
+    assert load_json(tmp_path / "baseline.json") == baseline
+    with open(tmp_path / "baseline.csv") as f:
+        assert len(list(csv.DictReader(f))) == len(baseline)
+
+    assert check_regressions(baseline, baseline) == []
+    worse = [replace(m, model_cost=m.model_cost * 2) if m.operation == "submit_payment" else m for m in baseline]
+    regressions = check_regressions(worse, baseline, gas_threshold=0.10)
+    assert {(r.measurement.operation, r.measurement.participants) for r in regressions} == {
+        ("submit_payment", 5), ("submit_payment", 20)
+    }
+    assert all(r.metric == "model_cost" for r in regressions)
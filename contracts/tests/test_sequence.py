@@ -0,0 +1,163 @@
+"""
+Tests for per-sender sequence number management against an in-memory node.
+"""
+
+import hashlib
+import json
+import threading
+
+from accounts import TestAccount
+from backends import TxRequest
+from sequence import SequenceNumberManager
+from submission import SubmissionEngine, TransportError
+
+SENDER = "0x" + "ab" * 32
+PRIVATE_KEY = "0x" + "11" * 32
+
+
+class FakeNode:
+    """Mempool that parks transactions until every lower sequence number has arrived.
+
+    Parked transactions only commit when someone waits on a hash, like blocks that are
+    produced while clients poll.
+    """
+
+    def __init__(self, reject=()):
+        self.sequence_numbers = {}
+        self.mempool = {}  # (sender, sequence number) -> hash
+        self.committed = {}  # hash -> sequence number
+        self.order = []
+        self.reject = set(reject)  # submission attempts (0-based) to reject with a 400
+        self.attempts = 0
+        self.peak_pending = 0
+        self.lock = threading.Lock()
+
+    def get(self, path, params=None):
+        with self.lock:
+            if path.startswith("/accounts/"):
+                return {"sequence_number": str(self.sequence_numbers.get(path.split("/")[2], 0))}
+            tx_hash = path.rsplit("/", 1)[-1]
+            self._produce_block()
+            if tx_hash in self.committed:
+                return {"type": "user_transaction", "success": True, "vm_status": "Executed successfully",
+                        "gas_used": "5", "hash": tx_hash, "events": []}
+            return {"type": "pending_transaction", "hash": tx_hash}
+
+    def post(self, path, body=None, params=None):
+        if path == "/transactions/encode_submission":
+            return "0x" + hashlib.sha3_256(json.dumps(body, sort_keys=True).encode()).hexdigest()
+        with self.lock:
+            attempt = self.attempts
+            self.attempts += 1
+            sender, number = body["sender"], int(body["sequence_number"])
+            if attempt in self.reject:
+                raise TransportError("Invalid transaction: Code: INVALID_ARGUMENT", 400)
+            if number < self.sequence_numbers.get(sender, 0):
+                raise TransportError("Invalid transaction: Code: SEQUENCE_NUMBER_TOO_OLD", 400)
+            tx_hash = "0x" + hashlib.sha3_256(f"{sender}:{number}:{attempt}".encode()).hexdigest()
+            self.mempool[(sender, number)] = tx_hash
+            self.peak_pending = max(self.peak_pending, len(self.mempool))
+            return {"hash": tx_hash}
+
+    def advance(self, sender, count):
+        """Commit transactions sent by some other client"""
+        with self.lock:
+            self.sequence_numbers[sender] = self.sequence_numbers.get(sender, 0) + count
+
+    def _produce_block(self):
+        progressed = True
+        while progressed:
+            progressed = False
+            for (sender, number), tx_hash in list(self.mempool.items()):
+                if number == self.sequence_numbers.get(sender, 0):
+                    del self.mempool[(sender, number)]
+                    self.committed[tx_hash] = number
+                    self.order.append(number)
+                    self.sequence_numbers[sender] = number + 1
+                    progressed = True
+
+
+def mint_requests(count):
+    admin = TestAccount(SENDER, PRIVATE_KEY)
+    return [
+        TxRequest(admin, "usdc_utils::mint_usdc_for_testing", [f"address:0x{i + 1:x}", "u64:1000"])
+        for i in range(count)
+    ]
+
+
+def test_single_sender_keeps_dozens_in_flight():
+    node = FakeNode()
+    engine = SubmissionEngine(node, "0x42", max_in_flight=64)
+
+    results = engine.submit_batch(mint_requests(50))
+
+    assert all(result.success for result in results)
+    assert node.order == list(range(50))
+    assert node.peak_pending == 50
+    assert engine.sequence.in_flight(SENDER) == 0
+
+
+def test_in_flight_window_is_bounded():
+    node = FakeNode()
+    engine = SubmissionEngine(node, "0x42", max_in_flight=8)
+
+    results = engine.submit_batch(mint_requests(30))
+
+    assert all(result.success for result in results)
+    assert node.order == list(range(30))
+    assert node.peak_pending <= 8
+
+
+def test_rejected_transaction_gap_is_filled():
+    node = FakeNode(reject={2})
+    engine = SubmissionEngine(node, "0x42")
+
+    results = engine.submit_batch(mint_requests(6))
+
+    assert [result.success for result in results] == [True, True, False, True, True, True]
+    assert "INVALID_ARGUMENT" in results[2].vm_status
+    assert node.order == list(range(5))
+
+
+def test_stale_sequence_number_is_resynced():
+    node = FakeNode()
+    engine = SubmissionEngine(node, "0x42")
+    assert all(result.success for result in engine.submit_batch(mint_requests(3)))
+
+    node.advance(SENDER, 4)  # Another client used the admin account meanwhile
+    results = engine.submit_batch(mint_requests(3))
+
+    assert all(result.success for result in results)
+    assert node.order == [0, 1, 2, 7, 8, 9]
+    assert engine.sequence.resyncs == 1
+
+
+def test_expired_transactions_restart_from_the_gap():
+    now = [0.0]
+    on_chain = {"value": 0}
+    manager = SequenceNumberManager(lambda sender: on_chain["value"], max_in_flight=4,
+                                    expiration_secs=60, clock=lambda: now[0])
+
+    assert [manager.allocate(SENDER) for _ in range(4)] == [0, 1, 2, 3]
+    assert manager.at_capacity(SENDER)
+    manager.committed(SENDER, 0)
+    on_chain["value"] = 1
+
+    now[0] = 61.0  # 1..3 expired in the mempool without committing
+    assert manager.expired(SENDER) == [1, 2, 3]
+    assert manager.resync(SENDER) == 1
+    assert manager.in_flight(SENDER) == 0
+    assert manager.allocate(SENDER) == 1
+
+
+def test_release_reuses_lowest_free_number():
+    manager = SequenceNumberManager(lambda sender: 10)
+
+    numbers = [manager.allocate(SENDER) for _ in range(4)]
+    manager.release(SENDER, 11)
+    manager.release(SENDER, 13)
+
+    assert numbers == [10, 11, 12, 13]
+    assert manager.allocate(SENDER) == 11
+    assert manager.allocate(SENDER) == 13
+    assert manager.allocate(SENDER) == 14
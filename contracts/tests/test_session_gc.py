@@ -0,0 +1,135 @@
+"""
+Tests for the session garbage collector against the in-process simulator.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from accounts import TestAccount
+from bill_simulator import SimulatorBackend
+from event_indexer import STATUS_SETTLED, EventStore
+from session_gc import FEE_STATEMENT, SessionCollector, reclaimable_bytes
+
+
+def settle_bills(backend, count, settled):
+    merchant, alice, bob = backend.new_account(), backend.new_account(), backend.new_account()
+    addresses = f"vector<address>:{alice.address},{bob.address}"
+    for index in range(count):
+        session = f"string:BILL_{index:03d}"
+        backend.run(merchant, "bill_splitter::create_bill_session", [
+            session, "u64:2000", "string:Dinner", addresses, "vector<string>:Alice,Bob", "u64:2"])
+        backend.run(merchant, "bill_splitter::confirm_participants", [session])
+        for payer in (alice, bob):
+            backend.run(payer, "bill_splitter::sign_bill_agreement", [session])
+        payers = (alice, bob) if index < settled else (alice,)
+        for payer in payers:
+            backend.run(payer, "bill_splitter::submit_payment", [session, "u64:1000"])
+
+
+def indexed_store(backend):
+    """Event store fed with the simulator's events, one transaction per event"""
+    store = EventStore(":memory:")
+    store.apply_page([{"version": version, "event_index": 0, "type": event.type, "data": event.data}
+                      for version, event in enumerate(backend.simulator.events)], backend.module_address)
+    return store
+
+
+class EventlessBackend:
+    """The simulator reporting transactions like the CLI, without events, or with only a FeeStatement"""
+
+    def __init__(self, backend, refund=None):
+        self.backend = backend
+        self.refund = refund
+
+    def run(self, sender, function, args=None):
+        result = self.backend.run(sender, function, args)
+        fees = [{"type": FEE_STATEMENT, "data": {"storage_fee_refund_octas": str(self.refund)}}]
+        return replace(result, events=fees if self.refund is not None and result.success else [])
+
+    def view(self, function, args=None):
+        return self.backend.view(function, args)
+
+
+@pytest.fixture
+def backend():
+    return SimulatorBackend()
+
+
+def test_sweeps_settled_sessions_in_bounded_batches(backend):
+    settle_bills(backend, 7, settled=5)
+    store = indexed_store(backend)
+    admin = TestAccount(backend.module_address, "0x0")
+    collector = SessionCollector(backend, admin, store, batch_size=2)
+    assert collector.pending_count() == 5
+
+    report = collector.sweep(max_batches=2)
+    assert (report.batches, report.pruned, report.failed_batches) == (2, 4, 0)
+    report = collector.sweep()
+    assert (report.batches, report.pruned) == (1, 1)
+    assert collector.sweep().batches == 0
+    assert collector.pruned_count() == 5
+
+    bill = backend.simulator.bill_splitter
+    assert set(bill.summaries) == {f"BILL_{index:03d}" for index in range(5)}
+    assert bill.get_session_summary("BILL_000")[-1] is True
+    assert bill.get_session_summary("BILL_006")[-1] is False  # Unpaid sessions stay live
+    # ParticipantAddedEvents carry the names, so the estimate counts the names resource too
+    assert report.reclaimed_bytes == reclaimable_bytes("BILL_004", ["Alice", "Bob"]) > 0
+
+
+def test_failed_batches_are_left_for_the_next_run(backend):
+    settle_bills(backend, 3, settled=3)
+    store = indexed_store(backend)
+    intruder = backend.new_account()  # prune_sessions is admin-only
+
+    report = SessionCollector(backend, intruder, store, batch_size=2).sweep()
+    assert (report.batches, report.failed_batches, report.pruned) == (2, 2, 0)
+    assert backend.simulator.bill_splitter.summaries == {}
+
+    with pytest.raises(ValueError):
+        SessionCollector(backend, intruder, store, batch_size=51)
+
+
+def test_batches_without_events_are_confirmed_on_chain(backend):
+    settle_bills(backend, 3, settled=2)
+    store = indexed_store(backend)
+    # A store that wrongly has the unpaid session as settled: prune_sessions skips it
+    store.conn.execute("UPDATE sessions SET status = ? WHERE session_id = 'BILL_002'", (STATUS_SETTLED,))
+    admin = TestAccount(backend.module_address, "0x0")
+    collector = SessionCollector(EventlessBackend(backend, refund=4_200), admin, store)
+
+    report = collector.sweep()
+    assert (report.batches, report.pruned, report.failed_batches) == (1, 2, 0)
+    assert (report.refund_octas, report.refunds_reported) == (4_200, 1)
+    assert "4,200 octas refunded" in report.describe()
+    assert collector.pruned_count() == 2 and collector.pending_count() == 1
+
+
+def test_sweeps_settled_enhanced_sessions(backend):
+    merchant, alice, bob = backend.new_account(), backend.new_account(), backend.new_account()
+    for payer in (alice, bob):
+        backend.run(merchant, "usdc_utils::mint_usdc_for_testing", [f"address:{payer.address}", "u64:10000"])
+    for index in range(4):
+        session = f"string:ENH_{index}"
+        backend.run(merchant, "enhanced_bill_splitter::create_enhanced_bill_session", [
+            session, "u64:2000", "string:Dinner", f"vector<address>:{alice.address},{bob.address}",
+            "vector<string>:Alice,Bob", "u64:2", "u64:10"])
+        backend.run(merchant, "enhanced_bill_splitter::batch_sign_agreements",
+                    [session, f"vector<address>:{alice.address},{bob.address}"])
+        for payer in ((alice, bob) if index < 3 else (alice,)):
+            backend.run(payer, "enhanced_bill_splitter::submit_payment_optimized", [session, "u64:1000"])
+        if index == 3:  # Collected but not settled: known to the store, not prunable
+            backend.run(merchant, "enhanced_bill_splitter::collect_payments",
+                        [session, f"vector<address>:{alice.address}"])
+    store = indexed_store(backend)
+    admin = TestAccount(backend.module_address, "0x0")
+    collector = SessionCollector(backend, admin, store, batch_size=2, module="enhanced_bill_splitter")
+    assert collector.pending_count() == 4
+
+    report = collector.sweep()
+    assert (report.batches, report.pruned, report.failed_batches) == (2, 3, 0)
+    enhanced = backend.simulator.enhanced_bill_splitter
+    assert set(enhanced.summaries) == {"ENH_0", "ENH_1", "ENH_2"}
+    assert collector.pending_count() == 1  # ENH_3 is checked again next run
+    assert SessionCollector(backend, admin, store).pruned_count() == 0  # bill_splitter's table
@@ -0,0 +1,43 @@
+"""
+Tests for the batched settlement driver on the in-process simulator.
+"""
+
+import pytest
+
+from bill_simulator import APTOS_COIN, SimulatorBackend
+from settlement import SettlementDriver, compare, create_session, direct_io_gas, escrow_io_gas
+
+
+@pytest.fixture
+def backend():
+    return SimulatorBackend()
+
+
+def test_settling_payment_deposits_the_escrow_once(backend):
+    merchant = backend.new_account()
+    payers = [backend.new_account() for _ in range(60)]
+    session_id = create_session(backend, merchant, "BATCHED", payers, 1_000)
+    before = backend.simulator.ledger.balance(APTOS_COIN, merchant.address)
+
+    batched, _ = SettlementDriver(backend, merchant).settle(session_id, payers, 1_000)
+
+    assert batched.settled and batched.failed_transactions == 0
+    assert (batched.transactions, batched.deposits, batched.events) == (60, 1, 62)
+    assert backend.simulator.ledger.balance(APTOS_COIN, merchant.address) - before == 60_000
+    batches = [event for event in backend.simulator.events if event.name == "BatchPaymentEvent"]
+    assert len(batches) == 1 and batches[0].data["payments"] == [p.address for p in payers]
+
+
+def test_baseline_is_one_deposit_per_payment_at_equal_transactions(backend):
+    merchant = backend.new_account()
+    payers = [backend.new_account() for _ in range(20)]
+    session_id = create_session(backend, merchant, "BOTH", payers, 500)
+
+    batched, individual = SettlementDriver(backend, merchant).settle(session_id, payers, 500)
+
+    # The old submit_payment made the same calls; only the coin moves and events differ
+    assert (batched.transactions, batched.gas_used) == (individual.transactions, individual.gas_used)
+    assert (batched.deposits, individual.deposits) == (1, 20)
+    assert (batched.events, individual.events) == (22, 21)
+    assert batched.coin_io_gas == escrow_io_gas(20) and individual.coin_io_gas == direct_io_gas(20)
+    assert "1 vs 20 merchant deposits" in compare(batched, individual)
@@ -0,0 +1,110 @@
+"""
+Property tests: the incremental session counters always match a brute-force rescan
+of the participants, and every session whose shares are all paid settles.
+"""
+
+import random
+
+import pytest
+
+from bill_simulator import STATUS_APPROVED, STATUS_SETTLED, SimulatorBackend, split_amount
+
+
+def rescan(session):
+    participants = session.participants
+    return {
+        "signed": sum(p.has_signed for p in participants),
+        "paid": sum(p.has_paid for p in participants),
+        "owed": sum(p.amount_owed for p in participants),
+        "received": sum(p.amount_owed for p in participants if p.has_paid),
+    }
+
+
+def check_invariants(backend, module, session):
+    truth = rescan(session)
+    assert session.current_signatures == truth["signed"]
+    assert session.paid_count == truth["paid"]
+    assert session.total_amount == truth["owed"]
+    assert session.payments_received == truth["received"]
+    assert (session.status == STATUS_SETTLED) == (truth["paid"] == len(session.participants))
+    if module == "bill_splitter":
+        progress = backend.view("bill_splitter::get_session_progress", [f"string:{session.session_id}"])
+        assert progress == (len(session.participants), truth["signed"], truth["paid"],
+                            truth["owed"] - truth["received"])
+
+
+def test_split_amount_hands_out_the_remainder():
+    assert split_amount(1000, 3) == [334, 333, 333]
+    assert split_amount(2, 5) == [1, 1, 0, 0, 0]
+    for total, count in ((1, 1), (999_999, 7), (10 ** 12 + 3, 1000)):
+        shares = split_amount(total, count)
+        assert sum(shares) == total and max(shares) - min(shares) <= 1
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_bill_splitter_counters_match_a_rescan(seed):
+    rng = random.Random(seed)
+    backend = SimulatorBackend()
+    merchant = backend.new_account()
+    people = [backend.new_account() for _ in range(rng.randint(1, 12))]
+    outsider = backend.new_account()
+    count = len(people)
+    session_id = f"PROP_{seed}"
+    args = [f"string:{session_id}"]
+
+    backend.run(merchant, "bill_splitter::create_bill_session", args + [
+        f"u64:{rng.randint(1, 10_000)}", "string:Property",
+        f"vector<address>:{','.join(p.address for p in people)}",
+        f"vector<string>:{','.join('P' * (i + 1) for i in range(count))}",
+        f"u64:{rng.randint(1, count)}"])
+    session = backend.simulator.bill_splitter.sessions[session_id]
+    check_invariants(backend, "bill_splitter", session)
+
+    for _ in range(rng.randint(0, 4)):
+        target = rng.choice(people + [outsider])
+        backend.run(merchant, "bill_splitter::update_participant_amount",
+                    args + [f"address:{target.address}", f"u64:{rng.randint(0, 5_000)}"])
+        check_invariants(backend, "bill_splitter", session)
+    backend.run(merchant, "bill_splitter::confirm_participants", args)
+
+    # Signatures and payments in random order, with repeats, outsiders and short payments
+    while session.status != STATUS_SETTLED:
+        actor = rng.choice(people + [outsider])
+        if session.status < STATUS_APPROVED:
+            backend.run(actor, "bill_splitter::sign_bill_agreement", args)
+        else:
+            owed = next((p.amount_owed for p in session.participants if p.address == actor.address), 0)
+            short = rng.random() < 0.2 and owed > 0
+            backend.run(actor, "bill_splitter::submit_payment", args + [f"u64:{owed - 1 if short else owed}"])
+        check_invariants(backend, "bill_splitter", session)
+
+    assert session.payments_received == session.total_amount
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_enhanced_counters_match_a_rescan(seed):
+    rng = random.Random(1000 + seed)
+    backend = SimulatorBackend()
+    merchant = backend.new_account()
+    people = [backend.new_account() for _ in range(rng.randint(1, 12))]
+    count = len(people)
+    session_id = f"ENH_{seed}"
+    args = [f"string:{session_id}"]
+    for person in people:
+        backend.run(merchant, "usdc_utils::mint_usdc_for_testing", [f"address:{person.address}", "u64:100000"])
+
+    backend.run(merchant, "enhanced_bill_splitter::create_enhanced_bill_session", args + [
+        f"u64:{rng.randint(1, 10_000)}", "string:Property",
+        f"vector<address>:{','.join(p.address for p in people)}",
+        f"vector<string>:{','.join('P' for _ in range(count))}", f"u64:{count}", "u64:1000"])
+    session = backend.simulator.enhanced_bill_splitter.sessions[session_id]
+    backend.run(merchant, "enhanced_bill_splitter::batch_sign_agreements",
+                args + [f"vector<address>:{','.join(p.address for p in people)}"])
+
+    while session.status != STATUS_SETTLED:
+        actor = rng.choice(people)
+        owed = session.participants[session.participant_lookup[actor.address]].amount_owed
+        backend.run(actor, "enhanced_bill_splitter::submit_payment_optimized", args + [f"u64:{owed}"])
+        check_invariants(backend, "enhanced_bill_splitter", session)
+
+    assert session.payments_received == session.total_amount
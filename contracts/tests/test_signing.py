@@ -0,0 +1,88 @@
+"""
+Tests for the batch signing driver on the in-process simulator.
+"""
+
+import pytest
+
+from backends import TxRequest
+from bill_simulator import STATUS_APPROVED, SimulatorBackend
+from signing import BatchSigningDriver, compare
+
+
+def create_session(backend, merchant, participants, required, enhanced=True):
+    session_id = f"SIGN_{'E' if enhanced else 'B'}_{len(participants)}_{required}"
+    addresses = ",".join(p.address for p in participants)
+    names = ",".join(f"P{i}" for i in range(len(participants)))
+    args = [f"string:{session_id}", f"u64:{len(participants) * 1_000}", "string:Signing",
+            f"vector<address>:{addresses}", f"vector<string>:{names}", f"u64:{required}"]
+    if enhanced:
+        result = backend.run(merchant, "enhanced_bill_splitter::create_enhanced_bill_session",
+                             args + ["u64:1000"])
+    else:
+        result = backend.run(merchant, "bill_splitter::create_bill_session", args)
+        assert result.success
+        result = backend.run(merchant, "bill_splitter::confirm_participants", [f"string:{session_id}"])
+    assert result.success, result.vm_status
+    return session_id
+
+
+@pytest.fixture
+def backend():
+    return SimulatorBackend()
+
+
+def test_stops_once_threshold_is_reached(backend):
+    merchant = backend.new_account()
+    participants = [backend.new_account() for _ in range(300)]
+    session_id = create_session(backend, merchant, participants, required=120)
+
+    report = BatchSigningDriver(backend, merchant).sign(
+        session_id, [p.address for p in participants], 120
+    )
+
+    assert report.approved
+    assert report.signatures == 120
+    assert report.transactions == 3  # 50 + 50 + 20 addresses
+    stats = backend.view("enhanced_bill_splitter::get_session_stats", [f"string:{session_id}"])
+    assert stats[1] == 120 and stats[4] == STATUS_APPROVED
+
+
+def test_addresses_that_do_not_count_are_made_up_for(backend):
+    merchant = backend.new_account()
+    participants = [backend.new_account() for _ in range(60)]
+    session_id = create_session(backend, merchant, participants, required=40)
+    strangers = [backend.new_account().address for _ in range(10)]
+
+    report = BatchSigningDriver(backend, merchant, batch_size=20, concurrency=1).sign(
+        session_id, strangers + [p.address for p in participants], 40
+    )
+
+    assert report.signatures == 40
+    assert report.transactions == 3  # the first chunk only signs 10 real participants
+
+
+def test_batched_path_beats_individual_signatures(backend):
+    merchant = backend.new_account()
+    participants = [backend.new_account() for _ in range(100)]
+    driver = BatchSigningDriver(backend, merchant)
+
+    batched = driver.sign(create_session(backend, merchant, participants, 100),
+                          [p.address for p in participants], 100)
+    individual = driver.sign_individually(
+        create_session(backend, merchant, participants, 100, enhanced=False), participants, 100
+    )
+
+    assert batched.signatures == individual.signatures == 100
+    assert (batched.transactions, individual.transactions) == (2, 100)
+    assert batched.gas_used < individual.gas_used
+    assert "2 vs 100 transactions" in compare(batched, individual)
+
+
+def test_batch_size_is_capped_at_the_contract_limit(backend):
+    with pytest.raises(ValueError):
+        BatchSigningDriver(backend, backend.new_account(), batch_size=51)
+    # The contract itself rejects oversized batches
+    merchant = backend.new_account()
+    result = backend.run_many([TxRequest(merchant, "enhanced_bill_splitter::batch_sign_agreements",
+                                         ["string:missing", "vector<address>:" + ",".join(["0x1"] * 51)])])[0]
+    assert not result.success
@@ -0,0 +1,32 @@
+"""
+Tests for the participant storage layout benchmark.
+"""
+
+from storage_benchmark import column_layout, measure, struct_layout, uleb128_size
+
+
+def test_bcs_sizes():
+    assert [uleb128_size(n) for n in (0, 127, 128, 16383, 16384)] == [1, 1, 2, 2, 3]
+    # One participant "Participant 0": address, name, amount, two bools, timestamp
+    hot, cold = struct_layout(1, "S", "D")
+    assert hot - struct_layout(0, "S", "D")[0] == 32 + 14 + 8 + 1 + 1 + 8
+    assert cold == 0
+    # Columns: address, amount and one byte of each bitmap; no timestamp
+    assert column_layout(1, "S", "D")[0] - column_layout(0, "S", "D")[0] == 32 + 8 + 1 + 1
+    assert column_layout(9, "S", "D")[1] == 2 + 1 + sum(len(f"Participant {i}") + 1 for i in range(9))
+
+
+def test_columns_shrink_the_hot_slot_and_flag_polling():
+    struct, columns = measure(1000)
+
+    assert columns.session_bytes < struct.session_bytes * 0.75
+    assert columns.update_io_gas < struct.update_io_gas
+    assert columns.flags_view_bytes * 20 < struct.flags_view_bytes
+    # get_participants keeps its fields except the payment time, which only the event reports
+    assert columns.participants_view_bytes < struct.participants_view_bytes
+
+
+def test_small_sessions_pay_for_the_extra_names_slot():
+    struct, columns = measure(5)
+
+    assert columns.create_fee_octas > struct.create_fee_octas
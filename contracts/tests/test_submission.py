@@ -0,0 +1,182 @@
+"""
+Tests for REST submission: signing, per-sender pipelining and pooled connections.
+"""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from accounts import TestAccount
+from backends import TxRequest, TxResult, normalize_address
+from ed25519 import SigningKey, verify
+from fake_node import FakeAptosNode
+from provisioning import FaucetProvisioner
+from submission import (
+    PENDING_TIMEOUT, HttpTransport, RestBackend, SubmissionEngine, TransportError, json_argument,
+)
+
+RFC8032_SEED = "9d61b19deffd5a60ba844af492ec2cc44449c5697b326919703bac031cae7f60"
+RFC8032_SIGNATURE = (
+    "e5564300c360ac729086e2cc806e828a84877f1eb8e5d974d873e065224901555fb8821590a33bacc61e39701cf9b46bd25bf5f0595bbe24655141438e7a100b"
+)
+
+
+class StubNode(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    submitted = []
+    connections = set()
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, body, status=200):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        with self.lock:
+            self.connections.add(self.client_address)
+        if self.path.startswith("/v1/accounts/"):
+            self._reply({"sequence_number": "7", "authentication_key": "0x0"})
+        elif self.path.startswith("/v1/transactions/wait_by_hash/"):
+            self._reply({"type": "user_transaction", "success": True, "vm_status": "Executed successfully",
+                         "gas_used": "12", "hash": self.path.rsplit("/", 1)[-1], "events": []})
+        else:
+            self._reply({"message": "not found"}, 404)
+
+    def do_POST(self):
+        with self.lock:
+            self.connections.add(self.client_address)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.path == "/v1/transactions/encode_submission":
+            self._reply("0x" + hashlib.sha3_256(json.dumps(body, sort_keys=True).encode()).hexdigest())
+        elif self.path == "/v1/transactions":
+            signature = body.pop("signature")
+            message = hashlib.sha3_256(json.dumps(body, sort_keys=True).encode()).digest()
+            if not verify(bytes.fromhex(signature["public_key"][2:]), message, bytes.fromhex(signature["signature"][2:])):
+                return self._reply({"message": "INVALID_SIGNATURE"}, 400)
+            with self.lock:
+                self.submitted.append(body)
+            self._reply({"hash": "0x%064x" % len(self.submitted)}, 202)
+        else:
+            self._reply({"message": "not found"}, 404)
+
+
+@pytest.fixture
+def node():
+    StubNode.submitted = []
+    StubNode.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubNode)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+
+
+def test_ed25519_matches_rfc8032_vector():
+    key = SigningKey.from_hex(RFC8032_SEED)
+    assert key.sign(b"").hex() == RFC8032_SIGNATURE
+    assert verify(key.public_key, b"", key.sign(b""))
+
+
+def test_json_arguments_follow_rest_encoding():
+    assert json_argument("u64:5") == "5"
+    assert json_argument("vector<u64>:1,2") == ["1", "2"]
+    assert json_argument("address:0x1") == "0x" + "0" * 63 + "1"
+    assert json_argument("string:hi") == "hi"
+
+
+def test_pipelines_sequence_numbers_per_sender(node):
+    alice = TestAccount("0xa", "0x" + "11" * 32)
+    bob = TestAccount("0xb", "0x" + "22" * 32)
+    engine = SubmissionEngine(HttpTransport(node, pool_size=4), "0x42", max_workers=2)
+    requests = [TxRequest(alice, "bill_splitter::sign_bill_agreement", ["string:S"]) for _ in range(3)]
+    requests += [TxRequest(bob, "bill_splitter::submit_payment", ["string:S", "u64:10"])]
+
+    results = engine.submit_batch(requests)
+
+    assert all(r.success and r.gas_used == 12 for r in results)
+    alice_seq = sorted(int(tx["sequence_number"]) for tx in StubNode.submitted if tx["sender"].endswith("a"))
+    assert alice_seq == [7, 8, 9]
+    payment = next(tx for tx in StubNode.submitted if tx["sender"].endswith("b"))
+    assert payment["payload"]["arguments"] == ["S", "10"]
+    assert len(StubNode.connections) <= 4
+
+
+class RecordingFallback:
+    def __init__(self):
+        self.calls = []
+
+    def run_many(self, requests):
+        self.calls.extend(requests)
+        return [TxResult(True, r.function, r.sender.address) for r in requests]
+
+
+class LostAnswers:
+    """Transport that loses the node's answer to the first `lose` transaction submissions,
+    delivering them to the node first when `deliver` is set"""
+
+    def __init__(self, transport: HttpTransport, lose: int, deliver: bool):
+        self.transport = transport
+        self.lose = lose
+        self.deliver = deliver
+
+    def get(self, path, params=None):
+        return self.transport.get(path, params)
+
+    def post(self, path, body=None, params=None):
+        if path == "/transactions" and self.lose:
+            self.lose -= 1
+            if self.deliver:
+                self.transport.post(path, body, params)
+            raise TransportError(f"POST {path} failed: timed out", delivered=True)
+        return self.transport.post(path, body, params)
+
+
+def test_falls_back_when_node_unreachable():
+    fallback = RecordingFallback()
+    engine = SubmissionEngine(HttpTransport("http://127.0.0.1:9/v1", timeout=1), "0x42")
+    backend = RestBackend(engine, fallback=fallback)
+    result = backend.run(TestAccount("0xa", "0x" + "11" * 32), "bill_splitter::confirm_participants", ["string:S"])
+
+    assert result.success
+    assert len(fallback.calls) == 1
+
+
+@pytest.mark.parametrize("deliver", [True, False])
+def test_lost_answers_are_settled_without_a_second_transaction(deliver):
+    with FakeAptosNode() as node:
+        (merchant,), _ = FaucetProvisioner(node.url, node.root_url).provision(1)
+        fallback = RecordingFallback()
+        engine = SubmissionEngine(LostAnswers(HttpTransport(node.url), lose=1, deliver=deliver), node.module_address)
+
+        result = RestBackend(engine, fallback=fallback).run(
+            merchant, "bill_splitter::create_bill_session",
+            ["string:LOST", "u64:100", "string:Lost", f"vector<address>:{merchant.address}", "vector<string>:M", "u64:1"])
+
+        # Found on chain by its sequence number, or resent as the same signed bytes
+        assert result.success and not fallback.calls
+        sent = HttpTransport(node.url).get(f"/accounts/{merchant.address}/transactions")
+        assert [tx["sequence_number"] for tx in sent] == ["0"]
+
+
+def test_unconfirmed_submissions_are_not_sent_elsewhere():
+    with FakeAptosNode() as node:
+        (merchant,), _ = FaucetProvisioner(node.url, node.root_url).provision(1)
+        fallback = RecordingFallback()
+        engine = SubmissionEngine(LostAnswers(HttpTransport(node.url), lose=2, deliver=False), node.module_address)
+
+        result = RestBackend(engine, fallback=fallback).run(
+            merchant, "bill_splitter::confirm_participants", ["string:UNKNOWN"])
+
+        assert result.vm_status.startswith(PENDING_TIMEOUT)
+        assert not fallback.calls
+        assert engine.sequence.in_flight(normalize_address(merchant.address)) == 1
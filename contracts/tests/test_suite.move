@@ -28,8 +28,7 @@ module bill_split::test_suite {
         admin: &signer,
         _num_test_accounts: u64
     ) {
-        // Initialize bill splitter modules
-        bill_splitter::initialize(admin);
+        // bill_splitter sets up its registry in init_module; only the test coin needs it
         usdc_utils::initialize_usdc(admin);
         
         // Setup test configuration
@@ -0,0 +1,28 @@
+import { NextResponse } from 'next/server';
+import aptosService from '@/lib/aptos-service';
+
+// One page of a participant's on-chain session index; pass nextCursor back to load the next page
+export async function GET(request, { params }) {
+  try {
+    const { address } = params;
+    const { searchParams } = new URL(request.url);
+    const archived = searchParams.get('archived') === 'true';
+    const cursor = Number(searchParams.get('cursor') || 0);
+
+    if (!Number.isInteger(cursor) || cursor < 0) {
+      return NextResponse.json(
+        { error: 'Invalid cursor' },
+        { status: 400 }
+      );
+    }
+
+    const page = await aptosService.getParticipantSessionsPage(address, archived, cursor);
+    return NextResponse.json({ address, archived, ...page });
+  } catch (err) {
+    console.error('History page error:', err);
+    return NextResponse.json(
+      { error: 'Failed to read participant sessions' },
+      { status: 502 }
+    );
+  }
+}
@@ -1,20 +1,50 @@
 "use client";
 
-import React, { useState } from 'react';
+import React, { useCallback, useEffect, useState } from 'react';
 import { useRouter } from 'next/navigation';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
-import { CheckCircle, Clock, X, ArrowLeft, Filter, Search } from 'lucide-react';
+import { CheckCircle, Clock, X, ArrowLeft, Filter, Search, Archive } from 'lucide-react';
 import { useApp } from '@/contexts/AppContext';
 import { formatAmount, formatAddress } from '@/lib/utils';
+import { ApiService } from '@/lib/api-service';
 import { BillSession, BillStatus } from '@/types';
 
+interface IndexedSession {
+  sessionId: string;
+  createdAt: number; // seconds, as stored on-chain
+}
+
 export default function HistoryPage() {
   const router = useRouter();
   const { wallet, sessions } = useApp();
   const [selectedSession, setSelectedSession] = useState<BillSession | null>(null);
   const [filterStatus, setFilterStatus] = useState<BillStatus | 'all'>('all');
   const [searchTerm, setSearchTerm] = useState('');
+  // On-chain participant index, loaded one page at a time
+  const [showArchived, setShowArchived] = useState(false);
+  const [indexedSessions, setIndexedSessions] = useState<IndexedSession[]>([]);
+  const [nextCursor, setNextCursor] = useState<number | null>(null);
+  const [loadingPage, setLoadingPage] = useState(false);
+
+  const loadPage = useCallback(async (cursor: number) => {
+    if (!wallet?.address) return;
+    setLoadingPage(true);
+    try {
+      const page = await ApiService.getHistoryPage(wallet.address, { archived: showArchived, cursor });
+      setIndexedSessions(previous => cursor === 0 ? page.sessions : [...previous, ...page.sessions]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      setNextCursor(null);
+    } finally {
+      setLoadingPage(false);
+    }
+  }, [wallet?.address, showArchived]);
+
+  useEffect(() => {
+    setIndexedSessions([]);
+    loadPage(0);
+  }, [loadPage]);
 
   const filteredSessions = sessions.filter(session => {
     const matchesStatus = filterStatus === 'all' || session.status === filterStatus;
@@ -149,6 +179,70 @@ export default function HistoryPage() {
               </CardContent>
             </Card>
 
+            {/* On-chain participant index */}
+            {wallet?.address && (
+              <Card>
+                <CardHeader>
+                  <CardTitle className="flex items-center gap-2">
+                    <Archive className="h-5 w-5" />
+                    On-chain Sessions
+                  </CardTitle>
+                  <CardDescription>
+                    {indexedSessions.length} {showArchived ? 'archived' : 'active'} session{indexedSessions.length !== 1 ? 's' : ''} loaded
+                  </CardDescription>
+                </CardHeader>
+                <CardContent className="space-y-3">
+                  <div className="flex gap-2">
+                    <Button
+                      variant={!showArchived ? "default" : "outline"}
+                      size="sm"
+                      onClick={() => setShowArchived(false)}
+                    >
+                      Active
+                    </Button>
+                    <Button
+                      variant={showArchived ? "default" : "outline"}
+                      size="sm"
+                      onClick={() => setShowArchived(true)}
+                    >
+                      Archived
+                    </Button>
+                  </div>
+                  {indexedSessions.map((entry) => {
+                    const known = sessions.find(session => session.session_id === entry.sessionId);
+                    return (
+                      <div
+                        key={entry.sessionId}
+                        className={`p-3 border rounded-lg ${known ? 'cursor-pointer hover:bg-gray-50' : ''}`}
+                        onClick={() => known && handleSelectSession(known)}
+                      >
+                        <div className="flex justify-between items-center">
+                          <div>
+                            <p className="font-medium">{known?.description || 'Bill session'}</p>
+                            <p className="text-xs text-gray-500 font-mono">ID: {entry.sessionId}</p>
+                          </div>
+                          <p className="text-sm text-gray-500">
+                            {new Date(entry.createdAt * 1000).toLocaleDateString()}
+                          </p>
+                        </div>
+                      </div>
+                    );
+                  })}
+                  {nextCursor !== null && nextCursor !== 0 && (
+                    <Button
+                      variant="outline"
+                      size="sm"
+                      className="w-full"
+                      disabled={loadingPage}
+                      onClick={() => loadPage(nextCursor)}
+                    >
+                      {loadingPage ? 'Loading...' : 'Load more'}
+                    </Button>
+                  )}
+                </CardContent>
+              </Card>
+            )}
+
             {/* Sessions List */}
             <Card>
               <CardHeader>
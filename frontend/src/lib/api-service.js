@@ -79,6 +79,22 @@ export class ApiService {
     }
   }
 
+  static async getHistoryPage(address, { archived = false, cursor = 0 } = {}) {
+    try {
+      const query = new URLSearchParams({ archived: String(archived), cursor: String(cursor) });
+      const response = await fetch(`${API_BASE_URL}/payments/history/${address}?${query}`);
+
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`);
+      }
+
+      return await response.json();
+    } catch (error) {
+      console.error('Error getting history page:', error);
+      throw error;
+    }
+  }
+
   static async checkHealth() {
     try {
       const response = await fetch(`${API_BASE_URL}/health`);
@@ -182,8 +182,7 @@ class AptosService {
         name: participant[1],
         amountOwed: participant[2],
         hasSigned: participant[3],
-        hasPaid: participant[4],
-        paymentTimestamp: participant[5]
+        hasPaid: participant[4]
       }));
     } catch (error) {
       console.error('Error getting participants:', error);
@@ -191,6 +190,29 @@ class AptosService {
     }
   }
 
+  async getParticipantSessionsPage(address, archived = false, cursor = 0) {
+    try {
+      const result = await this.client.view({
+        payload: {
+          function: `${this.contractAddress}::enhanced_bill_splitter::get_participant_sessions_page`,
+          arguments: [address, archived, String(cursor)],
+          type_arguments: []
+        }
+      });
+
+      return {
+        sessions: result[0].map((sessionId, i) => ({
+          sessionId,
+          createdAt: Number(result[1][i])
+        })),
+        nextCursor: Number(result[2])
+      };
+    } catch (error) {
+      console.error('Error getting participant sessions:', error);
+      throw error;
+    }
+  }
+
   async checkHealth() {
     try {
       const result = await this.client.getLedgerInfo();